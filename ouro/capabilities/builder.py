@@ -14,6 +14,7 @@ using familiar surfaces without reaching into loop or memory internals.
 from __future__ import annotations
 
 import base64
+import os
 from collections.abc import Sequence
 from dataclasses import dataclass, field
 from typing import Any, Iterable, Protocol
@@ -22,7 +23,7 @@ from ouro.core.llm import (
     LLMAdapter,
     LLMMessage,
     ModelManager,
-    create_llm_adapter,
+    create_routed_adapter,
     display_reasoning_effort,
 )
 from ouro.core.log import get_logger
@@ -36,6 +37,7 @@ from ouro.core.loop import (
     Rule,
     ScopedProgressSink,
 )
+from ouro.core.runtime import get_sessions_dir
 from ouro.core.tracing import Tracer
 
 from .compaction.hook import CompactionHook
@@ -68,6 +70,7 @@ from .tools.builtins.task_list import TaskListTool
 from .tools.builtins.task_update import TaskUpdateTool
 from .tools.builtins.todo_tool import TodoTool
 from .tools.executor import ToolExecutor
+from .tools.spill import SpillStore
 from .verification.hook import VerificationHook
 from .verification.verifier import Verifier
 
@@ -126,6 +129,13 @@ class AgentBuilder:
     model_manager: ModelManager | None = None
     tools: list[BaseTool] = field(default_factory=list)
     max_iterations: int = 1000
+    stream_tool_calls: bool = False
+    tool_max_concurrency: int | None = None
+    # Oversized tool outputs spill to ``<sessions_dir>/.spill`` (see tools.spill).
+    tool_output_spill: bool = False
+    tool_output_budgets: dict[str, int] = field(default_factory=dict)
+    # Token budget per LLM request; older messages are stubbed to fit (0 = off).
+    context_token_budget: int = 0
     sessions_dir: str | None = None
     memory_dir: str | None = None
     memory_enabled: bool = True
@@ -169,6 +179,11 @@ class AgentBuilder:
         self.max_iterations = n
         return self
 
+    def with_streaming(self, enabled: bool = True) -> AgentBuilder:
+        """Stream LLM responses and start readonly tool calls early."""
+        self.stream_tool_calls = enabled
+        return self
+
     # ---- Tools --------------------------------------------------------------
 
     def with_tool(self, tool: BaseTool) -> AgentBuilder:
@@ -179,6 +194,30 @@ class AgentBuilder:
         self.tools.extend(tools)
         return self
 
+    def with_tool_concurrency(self, max_concurrency: int | None) -> AgentBuilder:
+        """Cap tool calls in flight across all tools (``None``/0 = unlimited)."""
+        self.tool_max_concurrency = max_concurrency
+        return self
+
+    def with_tool_output_spill(
+        self, enabled: bool = True, *, budgets: dict[str, int] | None = None
+    ) -> AgentBuilder:
+        """Spill tool outputs over budget to disk instead of failing.
+
+        ``budgets`` overrides the ``MAX_TOKENS`` output budget of the named tools.
+        """
+        self.tool_output_spill = enabled
+        self.tool_output_budgets = dict(budgets or {})
+        return self
+
+    def with_context_budget(self, tokens: int) -> AgentBuilder:
+        """Keep each LLM request under ``tokens`` by stubbing older messages (0 = off).
+
+        Only the outgoing request is trimmed; the session history is not.
+        """
+        self.context_token_budget = tokens
+        return self
+
     # ---- Memory -------------------------------------------------------------
 
     def with_memory(
@@ -351,8 +390,6 @@ class AgentBuilder:
         # Task V2 store + tools
         task_store: TaskStore | None = None
         if self.enable_agent_swarm:
-            import os
-
             store_path = self.task_store_path or os.path.expanduser("~/.ouro/tasks/default.db")
             os.makedirs(os.path.dirname(store_path), exist_ok=True)
             task_store = TaskStore(store_path)
@@ -368,7 +405,17 @@ class AgentBuilder:
                 ]
             )
 
-        tool_executor = ToolExecutor(tools)
+        tool_executor = ToolExecutor(
+            tools,
+            max_concurrency=self.tool_max_concurrency,
+            progress=progress_sink,
+            spill_store=(
+                SpillStore(os.path.join(self.sessions_dir or get_sessions_dir(), ".spill"))
+                if self.tool_output_spill
+                else None
+            ),
+            tool_output_budgets=self.tool_output_budgets,
+        )
 
         # Memory + hook (optional but typically on).
         # `Hook` is a structural Protocol with method-level optionality —
@@ -385,7 +432,7 @@ class AgentBuilder:
                 progress=progress_sink,
             )
             memory.set_todo_context_provider(_make_todo_context_provider(todo_list))
-            hooks.append(CompactionHook(memory.compaction))
+            hooks.append(CompactionHook(memory.compaction, tracer=self.tracer))
             hooks.append(SessionPersistenceHook(memory))
 
         # Verification hook (off by default).
@@ -421,6 +468,9 @@ class AgentBuilder:
             usage_callback=(memory.token_tracker.record_usage if memory is not None else None),
             rules=rules,
             tracer=self.tracer,
+            stream_tool_calls=self.stream_tool_calls,
+            context_budget=self.context_token_budget or None,
+            count_tokens=memory.count_message_tokens if memory is not None else None,
         )
 
         dispatcher_factory = self.dispatcher_factory
@@ -770,13 +820,7 @@ class ComposedAgent:
         if not new_profile:
             logger.error(f"Failed to switch to model '{model_id}'")
             return False
-        new_llm = create_llm_adapter(
-            model=new_profile.model_id,
-            api_key=new_profile.api_key,
-            api_base=new_profile.api_base,
-            timeout=new_profile.timeout,
-            drop_params=new_profile.drop_params,
-        )
+        new_llm = create_routed_adapter(self.model_manager, new_profile)
         self.llm = new_llm
         self._core.llm = new_llm
         if self.memory is not None:
@@ -1,18 +1,36 @@
 """Compaction / compression capability.
 
-Provides working-memory compression (sliding-window, selective, deletion)
-and the types used by compaction decisions.
+Provides working-memory compression (sliding-window, selective, deletion),
+a deterministic tier that stubs superseded tool outputs, the hierarchical
+store of compaction summaries, and the types used by compaction decisions.
 """
 
+from .calibration import TokenCalibrator, get_token_calibrator
 from .compressor import WorkingMemoryCompressor
 from .hook import CompactionHook
 from .manager import CompactionManager
-from .types import CompressedMemory, CompressionStrategy
+from .pruning import prune_superseded_tool_results
+from .summaries import SummaryHierarchy, SummaryNode
+from .types import (
+    CompactionPlan,
+    CompressedMemory,
+    CompressionStrategy,
+    PrunedToolResult,
+    ToolPairIndex,
+)
 
 __all__ = [
     "CompressedMemory",
     "CompactionHook",
     "CompactionManager",
+    "CompactionPlan",
     "CompressionStrategy",
+    "PrunedToolResult",
+    "SummaryHierarchy",
+    "SummaryNode",
+    "TokenCalibrator",
+    "ToolPairIndex",
     "WorkingMemoryCompressor",
+    "get_token_calibrator",
+    "prune_superseded_tool_results",
 ]
@@ -0,0 +1,185 @@
+"""Per-model calibration of token estimates against billed input tokens.
+
+The compaction threshold is checked against a local estimate
+(``litellm.token_counter`` or a character heuristic), which drifts from what
+the provider bills: tokenizers differ, and the estimate does not see the tool
+schemas or provider-side framing.  ``TokenCalibrator`` fits
+``billed ≈ slope * estimate + intercept`` per model from
+``(estimate, usage["input_tokens"])`` pairs, with older samples decaying so
+the fit follows prompt changes.  Fits persist to
+``~/.ouro/token_calibration.json`` so a new session starts calibrated; the
+file is written in a worker thread every ``SAVE_EVERY`` samples and at the
+end of each run, not on every sample.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import suppress
+from dataclasses import asdict, dataclass
+
+from ouro.core.runtime import get_token_calibration_file
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Fit:
+    """Exponentially weighted least-squares sums for one model."""
+
+    n: float = 0.0
+    sx: float = 0.0
+    sy: float = 0.0
+    sxx: float = 0.0
+    sxy: float = 0.0
+    samples: int = 0
+
+    def update(self, x: float, y: float, decay: float) -> None:
+        self.samples += 1
+        self.n = self.n * decay + 1.0
+        self.sx = self.sx * decay + x
+        self.sy = self.sy * decay + y
+        self.sxx = self.sxx * decay + x * x
+        self.sxy = self.sxy * decay + x * y
+
+    def line(self, min_slope: float, max_slope: float) -> tuple[float, float]:
+        """Return ``(slope, intercept)``; a pure ratio when x barely varies."""
+        mean_x, mean_y = self.sx / self.n, self.sy / self.n
+        var_x = self.sxx / self.n - mean_x * mean_x
+        if var_x <= (0.05 * mean_x) ** 2:
+            slope = mean_y / mean_x if mean_x > 0 else 1.0
+            return min(max(slope, min_slope), max_slope), 0.0
+        slope = (self.sxy / self.n - mean_x * mean_y) / var_x
+        slope = min(max(slope, min_slope), max_slope)
+        return slope, mean_y - slope * mean_x
+
+
+class TokenCalibrator:
+    """Corrects token estimates per model using observed provider usage.
+
+    Until a model has ``MIN_SAMPLES`` observations, ``correct`` returns the
+    estimate unchanged.  Samples whose billed/estimated ratio falls outside
+    ``SAMPLE_RATIO_RANGE`` are dropped as mismatched pairs.
+    """
+
+    DECAY = 0.9
+    MIN_SAMPLES = 3
+    SLOPE_RANGE = (0.5, 2.0)
+    SAMPLE_RATIO_RANGE = (0.2, 5.0)
+    # Samples collected before ``save_async(force=False)`` writes the file.
+    SAVE_EVERY = 10
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self._fits: dict[str, _Fit] | None = None
+        self._unsaved = 0
+        # Writes may overlap in worker threads; a snapshot older than the
+        # one already written is skipped.
+        self._write_lock = threading.Lock()
+        self._snapshots = 0
+        self._written = 0
+
+    def correct(self, model: str, estimate: int) -> int:
+        """Return ``estimate`` mapped onto the provider's billed token scale."""
+        fit = self._load().get(model)
+        if fit is None or fit.samples < self.MIN_SAMPLES or estimate <= 0:
+            return estimate
+        slope, intercept = fit.line(*self.SLOPE_RANGE)
+        return max(0, round(slope * estimate + intercept))
+
+    def observe(self, model: str, estimate: int, actual: int) -> None:
+        """Record that a request estimated at ``estimate`` billed ``actual``."""
+        if estimate <= 0 or actual <= 0:
+            return
+        low, high = self.SAMPLE_RATIO_RANGE
+        if not low <= actual / estimate <= high:
+            logger.debug(f"Ignoring token calibration sample {estimate} -> {actual} for {model}")
+            return
+        fits = self._load()
+        fits.setdefault(model, _Fit()).update(estimate, actual, self.DECAY)
+        self._unsaved += 1
+
+    def save(self) -> None:
+        """Write samples not yet persisted to the file, blocking."""
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            self._write(*snapshot)
+
+    async def save_async(self, *, force: bool = True) -> None:
+        """Write unsaved samples in a worker thread.
+
+        Without ``force``, nothing is written until ``SAVE_EVERY`` samples
+        have accumulated.
+        """
+        if not force and self._unsaved < self.SAVE_EVERY:
+            return
+        snapshot = self._snapshot()
+        if snapshot is not None:
+            await asyncio.to_thread(self._write, *snapshot)
+
+    def _load(self) -> dict[str, _Fit]:
+        if self._fits is not None:
+            return self._fits
+        self._fits = {}
+        if not self.path or not os.path.exists(self.path):
+            return self._fits
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            for model, sums in (data.get("models") or {}).items():
+                self._fits[model] = _Fit(**sums)
+        except (OSError, ValueError, TypeError) as e:
+            logger.debug(f"Could not read token calibration from {self.path}: {e}")
+        return self._fits
+
+    def _snapshot(self) -> tuple[int, str, str] | None:
+        """``(seq, path, json)`` of the fits if a sample is unsaved, else None."""
+        if not self.path or self._fits is None or not self._unsaved:
+            return None
+        self._unsaved = 0
+        self._snapshots += 1
+        content = json.dumps(
+            {"models": {model: asdict(fit) for model, fit in self._fits.items()}}, indent=2
+        )
+        return self._snapshots, self.path, content
+
+    def _write(self, seq: int, path: str, content: str) -> None:
+        with self._write_lock:
+            if seq <= self._written:
+                return
+            self._written = seq
+            directory = os.path.dirname(path) or "."
+            try:
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(
+                    prefix=".calibration.", suffix=".tmp", dir=directory
+                )
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        f.write(content)
+                    os.replace(tmp_path, path)
+                finally:
+                    with suppress(OSError):
+                        os.unlink(tmp_path)
+            except OSError as e:
+                logger.debug(f"Could not write token calibration to {path}: {e}")
+
+
+_default_calibrator: TokenCalibrator | None = None
+
+
+def get_token_calibrator() -> TokenCalibrator:
+    """Return the process-wide calibrator backed by ``~/.ouro``.
+
+    Shared so concurrent sessions (bot mode, sub-agents) update one fit per
+    model instead of overwriting each other's file.
+    """
+    global _default_calibrator
+    if _default_calibrator is None:
+        _default_calibrator = TokenCalibrator(get_token_calibration_file())
+    return _default_calibrator
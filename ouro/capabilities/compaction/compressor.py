@@ -3,13 +3,12 @@
 import logging
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
-import litellm
-
 from ouro.config import Config
-from ouro.core.llm.content_utils import extract_text
+from ouro.core.llm.content_utils import content_has_tool_calls, extract_text
+from ouro.core.llm.litellm_adapter import load_litellm
 from ouro.core.llm.message_types import LLMMessage
 
-from .types import CompressedMemory, CompressionStrategy
+from .types import CompressedMemory, CompressionStrategy, ToolPairIndex
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +62,11 @@ Original messages ({count} messages, ~{tokens} tokens):
         "Target length: {target_tokens} tokens. Be concise but include concrete details."
     )
 
+    COMPACTION_PROMPT_PRIOR_SUMMARY_SUFFIX = (
+        "\nThe earlier summary messages in the conversation (starting with the summary "
+        "prefix) are stored separately; summarize only the other messages."
+    )
+
     COMPACTION_PROMPT_SELECTIVE_SUFFIX = (
         "\nFocus on summarizing earlier messages. The most recent {preserved_count} messages "
         "will be kept verbatim and don't need to be in your summary."
@@ -75,6 +79,9 @@ Original messages ({count} messages, ~{tokens} tokens):
             llm: LLM instance to use for summarization
         """
         self.llm = llm
+        # Tool-pair index of the list being compacted, reused between the
+        # prompt build and applying the summary: (list, length, last message, index).
+        self._pair_index: Optional[Tuple[List[LLMMessage], int, LLMMessage, ToolPairIndex]] = None
 
     async def compress(
         self,
@@ -137,6 +144,11 @@ Original messages ({count} messages, ~{tokens} tokens):
         """
         prompt = self.COMPACTION_PROMPT.format(target_tokens=target_tokens)
 
+        # A full compaction puts its summary first, a keep_prefix one after
+        # the kept messages, so look at every message.
+        if any(self.is_summary_message(m) for m in messages):
+            prompt += self.COMPACTION_PROMPT_PRIOR_SUMMARY_SUFFIX
+
         if strategy == CompressionStrategy.SELECTIVE:
             preserved, _ = self._separate_messages(messages)
             non_system_preserved = [m for m in preserved if m.role != "system"]
@@ -378,6 +390,11 @@ Original messages ({count} messages, ~{tokens} tokens):
         Returns:
             Tuple of (preserved, to_compress)
         """
+        index = self.tool_pair_index(messages)
+        cached = index.separated.get(Config.MEMORY_SHORT_TERM_MIN_SIZE)
+        if cached is not None:
+            return list(cached[0]), list(cached[1])
+
         preserve_indices = set()
 
         # Step 1: Mark system messages for preservation
@@ -386,7 +403,7 @@ Original messages ({count} messages, ~{tokens} tokens):
                 preserve_indices.add(i)
 
         # Step 2: Find tool pairs and orphaned tool_use messages
-        tool_pairs, orphaned_tool_use_indices = self._find_tool_pairs(messages)
+        tool_pairs, orphaned_tool_use_indices = index.pairs, index.orphaned
 
         # Step 2a: CRITICAL - Preserve orphaned tool_use (waiting for tool_result)
         # These must NEVER be compressed, or we'll lose the tool_use without its result
@@ -394,7 +411,7 @@ Original messages ({count} messages, ~{tokens} tokens):
             preserve_indices.add(orphan_idx)
 
         # Step 2b: Mark protected tools for preservation (CRITICAL for stateful tools)
-        protected_pairs = self._find_protected_tool_pairs(messages, tool_pairs)
+        protected_pairs = index.protected
         for assistant_idx, user_idx in protected_pairs:
             preserve_indices.add(assistant_idx)
             preserve_indices.add(user_idx)
@@ -416,22 +433,13 @@ Original messages ({count} messages, ~{tokens} tokens):
             if i >= 0:
                 preserve_indices.add(i)
 
-        # Step 4: Ensure tool pairs stay together (iterate until stable)
-        # A single pass can miss pairs: e.g. pair [A, T1] is skipped because
-        # neither is preserved, then pair [A, T2] preserves A because T2 is in
-        # the recent window — but T1 was already skipped.  Fixed-point loop
-        # ensures all pairs containing a preserved index are fully preserved.
-        changed = True
-        while changed:
-            changed = False
-            for assistant_idx, user_idx in tool_pairs:
-                if assistant_idx in preserve_indices or user_idx in preserve_indices:
-                    if assistant_idx not in preserve_indices:
-                        preserve_indices.add(assistant_idx)
-                        changed = True
-                    if user_idx not in preserve_indices:
-                        preserve_indices.add(user_idx)
-                        changed = True
+        # Step 4: Ensure tool pairs stay together.  Pairs sharing a message
+        # form one group (e.g. [A, T1] and [A, T2]), so preserving any member
+        # of a group preserves all of it.
+        for i in list(preserve_indices):
+            group = index.groups.get(i)
+            if group is not None:
+                preserve_indices.update(group)
 
         # Step 5: Build preserved and to_compress lists
         preserved = []
@@ -448,7 +456,8 @@ Original messages ({count} messages, ~{tokens} tokens):
             f"{len(orphaned_tool_use_indices)} orphaned tool_use, "
             f"{preserve_count} recent)"
         )
-        return preserved, to_compress
+        index.separated[Config.MEMORY_SHORT_TERM_MIN_SIZE] = (preserved, to_compress)
+        return list(preserved), list(to_compress)
 
     def _find_latest_user_query(self, messages: List[LLMMessage]) -> int | None:
         """Return the index of the most recent user message that isn't a
@@ -461,15 +470,19 @@ Original messages ({count} messages, ~{tokens} tokens):
         """
         for i in range(len(messages) - 1, -1, -1):
             msg = messages[i]
-            if msg.role != "user":
-                continue
-            content = msg.content
-            text = content if isinstance(content, str) else self._extract_text_content(msg)
-            if text.startswith(self.SUMMARY_PREFIX):
+            if msg.role != "user" or self.is_summary_message(msg):
                 continue
             return i
         return None
 
+    def is_summary_message(self, message: LLMMessage) -> bool:
+        """Whether ``message`` is a summary injected by a previous compaction."""
+        if message.role != "user":
+            return False
+        content = message.content
+        text = content if isinstance(content, str) else self._extract_text_content(message)
+        return text.startswith(self.SUMMARY_PREFIX)
+
     def _find_tool_pairs(self, messages: List[LLMMessage]) -> tuple[List[List[int]], List[int]]:
         """Find tool_use/tool_result pairs in messages.
 
@@ -482,19 +495,73 @@ Original messages ({count} messages, ~{tokens} tokens):
             - pairs: List of [assistant_index, tool_response_index] for matched pairs
             - orphaned_tool_use_indices: List of message indices with unmatched tool_use
         """
-        pairs = []
-        pending_tool_uses = {}  # tool_id -> message_index
+        index = self.tool_pair_index(messages)
+        return index.pairs, index.orphaned
+
+    def tool_pair_index(self, messages: List[LLMMessage]) -> ToolPairIndex:
+        """Return the tool-pair index of ``messages``, building it if needed.
+
+        The last index built is reused while the same, unchanged list is
+        passed in, so one compaction (strategy selection, prompt build,
+        applying the summary) scans the history once.  Call
+        ``release_tool_pair_index`` when the compaction is done.
+        """
+        cached = self._pair_index
+        if (
+            cached is not None
+            and cached[0] is messages
+            and cached[1] == len(messages)
+            and messages[-1] is cached[2]
+        ):
+            return cached[3]
+        index = self._build_tool_pair_index(messages)
+        if messages:
+            self._pair_index = (messages, len(messages), messages[-1], index)
+        return index
+
+    def release_tool_pair_index(self) -> None:
+        """Drop the cached tool-pair index (and its reference to the history)."""
+        self._pair_index = None
+
+    def _build_tool_pair_index(self, messages: List[LLMMessage]) -> ToolPairIndex:
+        index = ToolPairIndex()
+        pairs, by_id, groups = index.pairs, index.by_id, index.groups
+        pending_tool_uses: dict[str, int] = {}  # tool_id -> message_index
+
+        def pair(tool_id: str, result_idx: int) -> None:
+            assistant_idx = pending_tool_uses.pop(tool_id)
+            by_id[tool_id] = pair_ = (assistant_idx, result_idx)
+            pairs.append(pair_)
+            group = groups.get(assistant_idx)
+            if group is None:
+                group = groups[assistant_idx] = [assistant_idx]
+            other = groups.get(result_idx)
+            if other is None:
+                group.append(result_idx)
+                groups[result_idx] = group
+            elif other is not group:
+                # Legacy format: one tool_result message answers several
+                # assistant messages, joining their groups.
+                group.extend(other)
+                for j in other:
+                    groups[j] = group
 
         for i, msg in enumerate(messages):
+            role = msg.role
+            if not index.has_tool_calls and (
+                msg.tool_calls or role == "tool" or content_has_tool_calls(msg.content)
+            ):
+                index.has_tool_calls = True
+
             # New format: assistant with tool_calls field
-            if msg.role == "assistant" and hasattr(msg, "tool_calls") and msg.tool_calls:
+            if role == "assistant" and msg.tool_calls:
                 for tc in msg.tool_calls:
                     tool_id = tc.get("id") if isinstance(tc, dict) else getattr(tc, "id", None)
                     if tool_id:
                         pending_tool_uses[tool_id] = i
 
             # Legacy format: assistant with tool_use blocks in content
-            elif msg.role == "assistant" and isinstance(msg.content, list):
+            elif role == "assistant" and isinstance(msg.content, list):
                 for block in msg.content:
                     btype = self._get_block_attr(block, "type")
                     if btype == "tool_use":
@@ -502,35 +569,40 @@ Original messages ({count} messages, ~{tokens} tokens):
                         if tool_id:
                             pending_tool_uses[tool_id] = i
 
-            # New format: tool role message
-            elif msg.role == "tool" and hasattr(msg, "tool_call_id") and msg.tool_call_id:
-                tool_call_id = msg.tool_call_id
-                if tool_call_id in pending_tool_uses:
-                    assistant_idx = pending_tool_uses[tool_call_id]
-                    pairs.append([assistant_idx, i])
-                    del pending_tool_uses[tool_call_id]
+            # New format: tool role message (the common case, kept inline)
+            elif role == "tool" and msg.tool_call_id:
+                tool_id = msg.tool_call_id
+                assistant_idx = pending_tool_uses.pop(tool_id, None)
+                if assistant_idx is None:
+                    continue
+                by_id[tool_id] = pair_ = (assistant_idx, i)
+                pairs.append(pair_)
+                group = groups.get(assistant_idx)
+                if group is None:
+                    group = groups[assistant_idx] = [assistant_idx]
+                group.append(i)
+                groups[i] = group
 
             # Legacy format: user with tool_result blocks in content
-            elif msg.role == "user" and isinstance(msg.content, list):
+            elif role == "user" and isinstance(msg.content, list):
                 for block in msg.content:
                     btype = self._get_block_attr(block, "type")
                     if btype == "tool_result":
                         tool_use_id = self._get_block_attr(block, "tool_use_id")
                         if tool_use_id in pending_tool_uses:
-                            assistant_idx = pending_tool_uses[tool_use_id]
-                            pairs.append([assistant_idx, i])
-                            del pending_tool_uses[tool_use_id]
+                            pair(tool_use_id, i)
 
         # Remaining items in pending_tool_uses are orphaned (no matching result yet)
-        orphaned_indices = list(pending_tool_uses.values())
-
-        if orphaned_indices:
+        index.orphaned = list(pending_tool_uses.values())
+        if index.orphaned:
             logger.debug(
-                f"Found {len(orphaned_indices)} orphaned tool_use without matching tool_result - "
+                f"Found {len(index.orphaned)} orphaned tool_use without matching tool_result - "
                 f"these will be preserved to wait for results"
             )
 
-        return pairs, orphaned_indices
+        if self.PROTECTED_TOOLS:
+            index.protected = self._find_protected_tool_pairs(messages, pairs)
+        return index
 
     def _find_protected_tool_pairs(
         self, messages: List[LLMMessage], tool_pairs: List[List[int]]
@@ -641,7 +713,7 @@ Original messages ({count} messages, ~{tokens} tokens):
         msg_dicts = [m.to_dict() for m in messages]
 
         try:
-            return litellm.token_counter(model=model, messages=msg_dicts)
+            return load_litellm().token_counter(model=model, messages=msg_dicts)
         except Exception as e:
             logger.debug(f"litellm.token_counter failed ({e}), using fallback")
             # Fallback: character-based estimation
@@ -1,30 +1,55 @@
 """CompactionHook — adapts CompactionManager into the core loop's Hook protocol.
 
-The hook owns the full compaction pipeline: detect-need → run a
-cache-safe LLM call to produce a summary → apply that summary to the
-loop's detached message list in place.  The core loop knows nothing
-about compaction; it just gives every hook a chance to pre-empt the
-iteration via ``on_iteration_start``.
+The hook owns the full compaction pipeline: detect-need → stub out
+superseded tool outputs (no LLM call) → if still over the threshold,
+run a cache-safe LLM call to produce a summary → apply that summary to
+the loop's detached message list in place.  Past a soft threshold it
+also summarizes the oldest messages (or, in a single long task, the tool
+turns after its query) in a background task, swapped in at a later
+iteration start if that prefix is unchanged, so the hard threshold is
+usually never reached and the loop does not stall on compaction.  A
+summary still in flight when the run ends is cancelled.
+When keeping the oldest messages verbatim is cheaper under the provider's
+cache pricing (see ``CompactionManager.plan_compaction``), only the window
+after them is summarized, so the cached prefix stays valid.
+Each summary is stored in the manager's ``SummaryHierarchy``; roll-ups
+into epoch and session summaries also run as background tasks.
+The core loop knows nothing about compaction; it just gives every hook
+a chance to pre-empt the iteration via ``on_iteration_start``.
 """
 
 from __future__ import annotations
 
+import asyncio
+from dataclasses import dataclass
 from typing import Any
 
+from ouro.core.llm.message_types import LLMMessage
 from ouro.core.log import get_logger
 from ouro.core.loop import MessageListContext
 from ouro.core.loop.protocols import LoopContext
+from ouro.core.tracing import TraceEventType, Tracer
 
 from .manager import CompactionManager
+from .types import CompactionPlan, PrunedToolResult
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class _BackgroundSummary:
+    """A background summary of detached messages ``prefix[keep:]``."""
+
+    prefix: list[LLMMessage]
+    task: asyncio.Task[tuple[str, dict[str, int]]]
+    keep: int = 0
+
+
 class CompactionHook:
     """Wires a CompactionManager into the core agent loop.
 
     Structurally satisfies the ``core.loop.Hook`` Protocol via the
-    single ``on_iteration_start`` method.  We deliberately *don't*
+    ``on_iteration_start`` and ``on_run_end`` methods.  We deliberately *don't*
     inherit from ``Hook``: Protocol method bodies are ``...`` which
     at runtime resolves to ``return None``.  Inheriting would supply
     no-op stubs for every lifecycle method, and ``before_call``'s
@@ -37,12 +62,22 @@ class CompactionHook:
         compaction: CompactionManager,
         *,
         max_tokens: int = 4096,
+        tracer: Tracer | None = None,
     ) -> None:
         self.compaction = compaction
+        self.tracer = tracer or Tracer(enabled=False)
         # Token budget for the compaction LLM call (the summary
         # response).  Mirrors ``Agent.max_tokens_per_call`` so the
         # summary has room to express itself.
         self.max_tokens = max_tokens
+        # (loop context, estimate, input tokens billed so far) taken just
+        # before the iteration's LLM call; paired with that call's usage at
+        # the next iteration start to calibrate the estimate.
+        self._pending_sample: tuple[LoopContext, int, int] | None = None
+        # Summary of the oldest prefix being produced off the hot path.
+        self._background: _BackgroundSummary | None = None
+        # Roll-up of stored chunk summaries into epoch/session summaries.
+        self._rollup: asyncio.Task[dict[str, int]] | None = None
 
     async def on_iteration_start(
         self,
@@ -50,12 +85,51 @@ class CompactionHook:
         context: MessageListContext,
         tools: list[dict[str, Any]],
     ) -> None:
-        snap = context.detached.snapshot()
-        if not snap:
+        self._observe_last_call(ctx)
+        await self.compaction.save_calibration(force=False)
+        self._collect_rollup(ctx)
+        if not len(context.detached):
             return
-        tokens = self.compaction.estimate_tokens(snap)
-        should, _reason = self.compaction.should_compress(tokens)
-        if not should:
+        self._swap_in_background(ctx, context)
+        tokens = self.compaction.estimate_context_tokens(context.detached)
+        if not self._over_threshold(tokens):
+            if self._background is None and self.compaction.should_start_background(
+                self.compaction.calibrated_tokens(tokens)
+            ):
+                self._start_background(context, tools)
+            self._mark_sample(ctx, tokens)
+            return
+
+        # Over the hard threshold with a background summary in flight:
+        # waiting for it is shorter than starting a new one.
+        if self._background is not None:
+            async with ctx.progress.spinner("Compressing memory...", title="Working"):
+                await asyncio.wait({self._background.task})
+            if self._swap_in_background(ctx, context):
+                tokens = self.compaction.estimate_context_tokens(context.detached)
+                if not self._over_threshold(tokens):
+                    self._mark_sample(ctx, tokens)
+                    return
+
+        snap = context.detached.snapshot()
+
+        # Tier 1: stub superseded tool outputs.  Only fall through to the
+        # LLM summary when that alone cannot get under the threshold.
+        pruned_snap, pruned = self.compaction.prune_tool_results(snap)
+        if pruned:
+            snap = context.detached.replace(pruned_snap)
+            pruned_tokens = self.compaction.estimate_context_tokens(context.detached)
+            await self._trace_pruned(pruned, tokens, pruned_tokens)
+            tokens = pruned_tokens
+            if not self._over_threshold(tokens):
+                self._mark_sample(ctx, tokens)
+                return
+
+        plan = self._plan(context, snap)
+        if plan.horizon_calls:
+            await self._trace_plan(plan)
+        if plan.mode == "keep_prefix":
+            await self._compact_window(ctx, context, tools, snap, plan)
             return
 
         # Cache-safe fork: system + current detached + the compaction
@@ -77,3 +151,211 @@ class CompactionHook:
         compressed = self.compaction.apply_compression(summary, snap, usage)
         context.detached.replace(compressed)
         ctx.add_usage(usage)
+        self._start_rollup()
+        self._mark_sample(ctx, self.compaction.estimate_context_tokens(context.detached))
+
+    async def _compact_window(
+        self,
+        ctx: LoopContext,
+        context: MessageListContext,
+        tools: list[dict[str, Any]],
+        snap: list[LLMMessage],
+        plan: CompactionPlan,
+    ) -> None:
+        """Summarize ``snap[plan.keep:plan.end]`` in place, keeping the cached prefix."""
+        prefix = snap[: plan.end]
+        fork_messages = (
+            list(context.system_messages)
+            + prefix
+            + [self.compaction.build_window_prompt(prefix, plan.keep)]
+        )
+        async with ctx.progress.spinner("Compressing memory...", title="Working"):
+            response = await self.compaction.llm.call_async(
+                messages=fork_messages,
+                tools=tools,
+                max_tokens=self.max_tokens,
+            )
+        usage = getattr(response, "usage", None) or {}
+        ctx.add_usage(usage)
+        self._replace_window(context, prefix, plan.keep, self.compaction.llm.extract_text(response))
+        self._start_rollup()
+        self._mark_sample(ctx, self.compaction.estimate_context_tokens(context.detached))
+
+    def _replace_window(
+        self,
+        context: MessageListContext,
+        prefix: list[LLMMessage],
+        keep: int,
+        summary_text: str,
+    ) -> None:
+        """Replace ``prefix[keep:]`` at the head of the detached list with its summary."""
+        detached = context.detached
+        original_tokens = self.compaction.estimate_context_tokens(detached)
+        summary_message = self.compaction.summary_message_for(
+            summary_text,
+            prefix[keep:],
+            detached.snapshot()[len(prefix) :],
+            render_hierarchy=not keep,
+        )
+        detached.replace_range(keep, len(prefix), [summary_message])
+        self.compaction.record_compression(
+            original_tokens, self.compaction.estimate_context_tokens(detached)
+        )
+
+    def _plan(self, context: MessageListContext, snap: list[LLMMessage]) -> CompactionPlan:
+        system_tokens = self.compaction.estimate_tokens(list(context.system_messages))
+        return self.compaction.plan_compaction(snap, system_tokens=system_tokens)
+
+    def _over_threshold(self, tokens: int) -> bool:
+        should, _reason = self.compaction.should_compress(self.compaction.calibrated_tokens(tokens))
+        return should
+
+    def _mark_sample(self, ctx: LoopContext, tokens: int) -> None:
+        self._pending_sample = (ctx, tokens, ctx.usage_total.get("input_tokens", 0))
+
+    def _start_background(self, context: MessageListContext, tools: list[dict[str, Any]]) -> None:
+        """Start summarizing the oldest prefix while the loop keeps going."""
+        snap = context.detached.snapshot()
+        start, cut = self.compaction.select_background_window(snap)
+        if cut <= 0:
+            return
+        keep = max(self._plan(context, snap).keep, start)
+        prefix = snap[:cut]
+        task = asyncio.create_task(
+            self.compaction.summarize_prefix(
+                list(context.system_messages),
+                prefix,
+                tools,
+                max_tokens=self.max_tokens,
+                keep=keep,
+            )
+        )
+        self._background = _BackgroundSummary(prefix=prefix, task=task, keep=keep)
+        logger.info(f"Started background compaction of {cut - keep} messages")
+
+    async def on_run_end(self, ctx: LoopContext) -> None:
+        """Cancel a background summary still in flight; its run is over.
+
+        A finished summary is kept for the next run to swap in.  Calibration
+        samples not yet written are saved.
+        """
+        await self.compaction.save_calibration()
+        background = self._background
+        if background is not None and not background.task.done():
+            background.task.cancel()
+            self._background = None
+            logger.info("Cancelled background compaction at the end of the run")
+
+    def _swap_in_background(self, ctx: LoopContext, context: MessageListContext) -> bool:
+        """Apply a finished background summary if its prefix is unchanged.
+
+        Returns True when the summary replaced the prefix.  A summary whose
+        prefix was rewritten meanwhile (or that failed) is dropped.
+        """
+        background = self._background
+        if background is None:
+            return False
+        if background.task.get_loop() is not asyncio.get_running_loop():
+            # Left over from a previous event loop; it can never finish here.
+            self._background = None
+            return False
+        if not background.task.done():
+            return False
+        self._background = None
+        if background.task.cancelled():
+            return False
+        error = background.task.exception()
+        if error is not None:
+            logger.warning(f"Background compaction failed: {error}")
+            return False
+
+        summary_text, usage = background.task.result()
+        ctx.add_usage(usage)
+        prefix = background.prefix
+        detached = context.detached
+        if len(detached) < len(prefix) or any(
+            detached[i] is not message for i, message in enumerate(prefix)
+        ):
+            logger.info("Discarding background compaction: summarized history changed")
+            return False
+
+        self._replace_window(context, prefix, background.keep, summary_text)
+        self._start_rollup()
+        return True
+
+    def _start_rollup(self) -> None:
+        """Roll stored summaries up a level off the hot path, when due."""
+        if self._rollup is not None or self.compaction.summaries.pending_rollup() is None:
+            return
+        self._rollup = asyncio.create_task(
+            self.compaction.roll_up_summaries(max_tokens=self.max_tokens)
+        )
+
+    def _collect_rollup(self, ctx: LoopContext) -> None:
+        """Account a finished roll-up's usage to the loop."""
+        rollup = self._rollup
+        if rollup is None:
+            return
+        if rollup.get_loop() is not asyncio.get_running_loop():
+            self._rollup = None
+            return
+        if not rollup.done():
+            return
+        self._rollup = None
+        if not rollup.cancelled():
+            ctx.add_usage(rollup.result())
+
+    async def _trace_pruned(
+        self, pruned: list[PrunedToolResult], tokens_before: int, tokens_after: int
+    ) -> None:
+        await self.tracer.emit_event(
+            TraceEventType.MEMORY,
+            "compaction.prune",
+            attributes={
+                "compaction.tier": "prune",
+                "compaction.pruned_count": len(pruned),
+                "compaction.tokens_before": tokens_before,
+                "compaction.tokens_after": tokens_after,
+                "compaction.pruned": [
+                    {
+                        "index": record.index,
+                        "tool_call_id": record.tool_call_id,
+                        "tool": record.tool_name,
+                        "reason": record.reason,
+                        "original_chars": record.original_chars,
+                    }
+                    for record in pruned
+                ],
+            },
+        )
+
+    async def _trace_plan(self, plan: CompactionPlan) -> None:
+        await self.tracer.emit_event(
+            TraceEventType.MEMORY,
+            "compaction.plan",
+            attributes={
+                "compaction.mode": plan.mode,
+                "compaction.keep": plan.keep,
+                "compaction.horizon_calls": plan.horizon_calls,
+                "compaction.full_cost": plan.full_cost,
+                "compaction.keep_cost": plan.keep_cost,
+                "compaction.full_cache_write_tokens": plan.full_cache_write_tokens,
+                "compaction.keep_cache_write_tokens": plan.keep_cache_write_tokens,
+                "compaction.full_tokens_after": plan.full_tokens_after,
+                "compaction.keep_tokens_after": plan.keep_tokens_after,
+            },
+        )
+
+    def _observe_last_call(self, ctx: LoopContext) -> None:
+        """Calibrate against the input tokens billed since the last sample."""
+        pending, self._pending_sample = self._pending_sample, None
+        if pending is None or pending[0] is not ctx:
+            return
+        _, estimate, billed_before = pending
+        # A request trimmed to the context budget was billed for fewer
+        # tokens than ``estimate`` counts; pairing them skews the fit.
+        if ctx.request_trimmed:
+            return
+        billed = ctx.usage_total.get("input_tokens", 0) - billed_before
+        if billed > 0:
+            self.compaction.observe_usage(estimate, billed)
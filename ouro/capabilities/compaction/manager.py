@@ -8,20 +8,24 @@ tracking, while compaction lives in its own capability package.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 from ouro.config import Config
-from ouro.core.llm.content_utils import content_has_tool_calls
 from ouro.core.llm.message_types import LLMMessage
 
+from .calibration import TokenCalibrator
 from .compressor import WorkingMemoryCompressor
-from .types import CompressedMemory, CompressionStrategy
+from .pruning import prune_superseded_tool_results
+from .summaries import SummaryHierarchy
+from .types import CompactionPlan, CompressedMemory, CompressionStrategy, PrunedToolResult
 
 logger = logging.getLogger(__name__)
 
 
 if TYPE_CHECKING:
+    from ouro.capabilities.memory.token_tracker import TokenTracker
     from ouro.core.llm import LLMAdapter
+    from ouro.core.loop import MessageList
 
 
 class CompactionManager:
@@ -31,21 +35,58 @@ class CompactionManager:
     compress, and applies compression results back to a message list.
 
     This class is stateless with respect to the message list — it operates
-    on lists passed in by callers (e.g. ``MemoryManager``).
+    on lists passed in by callers (e.g. ``MemoryManager``).  It does own
+    the session's ``SummaryHierarchy``, from which each summary message is
+    rendered.
     """
 
-    def __init__(self, llm: LLMAdapter) -> None:
+    # Share of MEMORY_COMPRESSION_THRESHOLD the rendered summaries may use.
+    SUMMARY_CONTEXT_SHARE = 0.1
+    # Requests after a compaction over which plan costs are compared.
+    CACHE_PLAN_HORIZON = 10
+    # A keep_prefix plan must leave the context below this share of the
+    # threshold, so it does not trigger another compaction right away.
+    KEEP_PREFIX_MAX_FILL = 0.6
+
+    KEEP_PREFIX_PROMPT_SUFFIX = (
+        "\n\nThe first {keep} messages of this conversation stay in context "
+        "verbatim. Summarize only the messages after them."
+    )
+
+    def __init__(
+        self,
+        llm: LLMAdapter,
+        *,
+        count_message: Callable[[LLMMessage], int] | None = None,
+        calibrator: TokenCalibrator | None = None,
+        token_tracker: TokenTracker | None = None,
+    ) -> None:
         self.llm = llm
         self.compressor = WorkingMemoryCompressor(llm)
 
+        # Per-message token counter for the running ledger kept on
+        # ``MessageList`` (see ``estimate_context_tokens``).  MemoryManager
+        # passes TokenTracker's cached counter so both share one cache.
+        self._count_message = count_message or self._count_message_tokens
+        # Maps estimates onto billed input tokens; None uses raw estimates.
+        self.calibrator = calibrator
+        # Prices plans against the provider's cache pricing; None always
+        # compacts the whole history.
+        self.token_tracker = token_tracker
+
         # State tracking (mirrors what MemoryManager used to own)
         self.was_compressed_last_iteration = False
         self.last_compression_savings = 0
         self.compression_count = 0
+        # Tool outputs stubbed by the deterministic tier (no LLM call)
+        self.pruned_tool_results = 0
 
         # Deferred compression flag
         self._compression_needed = False
 
+        # Chunk / epoch / session summaries of everything compacted so far
+        self.summaries = SummaryHierarchy()
+
         # Optional callback to get current todo context for compression
         self._todo_context_provider: Callable[[], str | None] | None = None
 
@@ -73,6 +114,17 @@ class CompactionManager:
 
         return False, None
 
+    def should_start_background(self, current_tokens: int) -> bool:
+        """Check the soft threshold for starting a background compaction.
+
+        The soft threshold is ``MEMORY_BACKGROUND_COMPACTION_RATIO`` of
+        ``MEMORY_COMPRESSION_THRESHOLD``; a ratio of 0 disables it.
+        """
+        ratio = Config.MEMORY_BACKGROUND_COMPACTION_RATIO
+        if not Config.MEMORY_ENABLED or ratio <= 0:
+            return False
+        return current_tokens > Config.MEMORY_COMPRESSION_THRESHOLD * ratio
+
     def mark_compression_needed(self, reason: str) -> None:
         """Set the deferred compression flag."""
         self._compression_needed = True
@@ -96,6 +148,60 @@ class CompactionManager:
         """
         return self.compressor._estimate_tokens(messages)
 
+    def estimate_context_tokens(self, messages: MessageList) -> int:
+        """Estimate the token cost of a ``MessageList`` incrementally.
+
+        Uses the list's running ledger, so only messages added since the
+        previous call are tokenized.  The total is the sum of per-message
+        counts, which runs a few tokens per message above a whole-list
+        count; that only makes the threshold check slightly conservative.
+        """
+        return messages.token_count(self._count_message)
+
+    def calibrated_tokens(self, estimate: int) -> int:
+        """Map a token estimate onto the current model's billed scale."""
+        if self.calibrator is None:
+            return estimate
+        return self.calibrator.correct(self.llm.model, estimate)
+
+    def observe_usage(self, estimate: int, input_tokens: int) -> None:
+        """Feed one ``(estimate, billed input tokens)`` pair to the calibrator."""
+        if self.calibrator is not None:
+            self.calibrator.observe(self.llm.model, estimate, input_tokens)
+
+    async def save_calibration(self, *, force: bool = True) -> None:
+        """Persist calibration samples off the event loop.
+
+        Without ``force``, only once ``TokenCalibrator.SAVE_EVERY`` samples
+        are unsaved.
+        """
+        if self.calibrator is not None:
+            await self.calibrator.save_async(force=force)
+
+    def _count_message_tokens(self, message: LLMMessage) -> int:
+        return self.compressor._estimate_tokens([message])
+
+    # ------------------------------------------------------------------
+    # Deterministic tier (no LLM call)
+    # ------------------------------------------------------------------
+
+    def prune_tool_results(
+        self, messages: list[LLMMessage]
+    ) -> tuple[list[LLMMessage], list[PrunedToolResult]]:
+        """Stub out tool outputs that later turns superseded.
+
+        The first compaction tier: costs no LLM call and leaves the most
+        recent ``MEMORY_SHORT_TERM_MIN_SIZE`` messages alone.  See
+        ``pruning.prune_superseded_tool_results``.
+        """
+        result, pruned = prune_superseded_tool_results(
+            messages, keep_recent=Config.MEMORY_SHORT_TERM_MIN_SIZE
+        )
+        if pruned:
+            self.pruned_tool_results += len(pruned)
+            logger.info(f"🗜️  Stubbed {len(pruned)} superseded tool outputs")
+        return result, pruned
+
     # ------------------------------------------------------------------
     # Prompt building (cache-safe fork)
     # ------------------------------------------------------------------
@@ -130,6 +236,262 @@ class CompactionManager:
         )
         return LLMMessage(role="user", content=prompt_text)
 
+    # ------------------------------------------------------------------
+    # Background prefix summaries
+    # ------------------------------------------------------------------
+
+    def select_background_window(self, messages: list[LLMMessage]) -> tuple[int, int]:
+        """Return the ``(start, end)`` window a background summary may replace.
+
+        Keeps the most recent ``MEMORY_SHORT_TERM_MIN_SIZE`` messages and the
+        latest user query, and never ends the window between an assistant
+        tool call and its results.  The history before the latest query is
+        summarized first; once that is at most a prior summary, the tool
+        turns after the query are (a single long task has nothing else).
+        Returns ``(0, 0)`` when there is nothing to do.
+        """
+        end = len(messages) - Config.MEMORY_SHORT_TERM_MIN_SIZE
+        while 0 < end < len(messages) and messages[end].role == "tool":
+            end -= 1
+        latest_user_idx = self.compressor._find_latest_user_query(messages)
+        if latest_user_idx is None:
+            start = 0
+        elif latest_user_idx > 1 or latest_user_idx >= end:
+            # Older turns before the query; a lone prior summary is not
+            # worth summarizing again.
+            start, end = 0, min(end, latest_user_idx)
+        else:
+            start = latest_user_idx + 1
+        if end - start < 2:
+            return 0, 0
+        return start, end
+
+    async def summarize_prefix(
+        self,
+        system_messages: list[LLMMessage],
+        prefix: list[LLMMessage],
+        tools: list[dict[str, Any]],
+        *,
+        max_tokens: int,
+        keep: int = 0,
+    ) -> tuple[str, dict[str, int]]:
+        """Summarize ``prefix`` with a cache-safe fork (system + prefix + prompt).
+
+        With ``keep``, only ``prefix[keep:]`` is summarized; the first
+        ``keep`` messages stay in context (see ``plan_compaction``).
+
+        Returns:
+            Tuple of (summary text for ``summary_message_for``, LLM usage).
+        """
+        prompt = self.build_window_prompt(prefix, keep)
+        response = await self.llm.call_async(
+            messages=list(system_messages) + prefix + [prompt],
+            tools=tools,
+            max_tokens=max_tokens,
+        )
+        usage = getattr(response, "usage", None) or {}
+        return self.llm.extract_text(response), usage
+
+    def build_window_prompt(self, messages: list[LLMMessage], keep: int = 0) -> LLMMessage:
+        """Build the prompt summarizing ``messages[keep:]`` of a fork over ``messages``."""
+        window = messages[keep:]
+        window_tokens = sum(self._count_message(m) for m in window)
+        todo_context = self._todo_context_provider() if self._todo_context_provider else None
+        prompt_text = self.compressor.build_compaction_prompt(
+            window,
+            CompressionStrategy.SLIDING_WINDOW,
+            self._calculate_target_tokens(window_tokens),
+            todo_context,
+        )
+        if keep:
+            prompt_text += self.KEEP_PREFIX_PROMPT_SUFFIX.format(keep=keep)
+        return LLMMessage(role="user", content=prompt_text)
+
+    def record_compression(self, original_tokens: int, compressed_tokens: int) -> None:
+        """Track a compaction that was applied outside ``apply_compression``."""
+        self.compression_count += 1
+        self.was_compressed_last_iteration = True
+        self.last_compression_savings = original_tokens - compressed_tokens
+        self._compression_needed = False
+        logger.info(f"✅ Compression applied: {original_tokens} → {compressed_tokens} tokens")
+
+    # ------------------------------------------------------------------
+    # Cache-aware planning
+    # ------------------------------------------------------------------
+
+    def plan_compaction(
+        self, messages: list[LLMMessage], *, system_tokens: int = 0
+    ) -> CompactionPlan:
+        """Choose between compacting everything and keeping the cached prefix.
+
+        A full compaction rewrites the history from its first message, so
+        the provider's prompt cache is lost and the next request pays a
+        cache write for the whole new context.  ``keep_prefix`` leaves the
+        oldest messages byte-identical (still a cache hit) and summarizes
+        only the window between them and the recent messages, at the price
+        of a larger context afterwards and a shorter summary to write.  Both
+        are priced with the ``TokenTracker``'s cache and output pricing over
+        ``CACHE_PLAN_HORIZON`` requests, and the cheaper one is chosen.
+
+        Args:
+            messages: The detached message list about to be compacted.
+            system_tokens: Tokens of the system prefix ahead of ``messages``.
+        """
+        full = CompactionPlan(mode="full", end=len(messages))
+        if (
+            self.token_tracker is None
+            or not Config.MEMORY_CACHE_AWARE_COMPACTION
+            or not Config.PROMPT_CACHE
+        ):
+            return full
+        start, end = self.select_background_window(messages)
+        counts = [self._count_message(m) for m in messages]
+        keep = max(self._cacheable_prefix(messages, counts, end), start)
+        if keep <= 0 or end - keep < 2:
+            return full
+
+        total = sum(counts)
+        prefix_tokens = sum(counts[:keep])
+        window_tokens = sum(counts[keep:end])
+        preserved = self._preserved_messages(messages, self._select_strategy(messages))
+        full_after = self._calculate_target_tokens(total) + sum(
+            self._count_message(m) for m in preserved
+        )
+        keep_after = total - window_tokens + self._calculate_target_tokens(window_tokens)
+        if keep_after > Config.MEMORY_COMPRESSION_THRESHOLD * self.KEEP_PREFIX_MAX_FILL:
+            return full
+
+        # The summary call reads the same fork either way; they differ in
+        # the summary written, the cache write of the first request after
+        # it, and the cached reads of the requests that follow.
+        price = self.token_tracker.estimate_cost
+        model = self.llm.model
+        later = self.CACHE_PLAN_HORIZON - 1
+        full_cost = (
+            price(model, output=self._calculate_target_tokens(total))
+            + price(model, cache_read=system_tokens, cache_write=full_after)
+            + later * price(model, cache_read=system_tokens + full_after)
+        )
+        keep_cost = (
+            price(model, output=self._calculate_target_tokens(window_tokens))
+            + price(
+                model,
+                cache_read=system_tokens + prefix_tokens,
+                cache_write=keep_after - prefix_tokens,
+            )
+            + later * price(model, cache_read=system_tokens + keep_after)
+        )
+        use_keep = keep_cost < full_cost
+        if use_keep:
+            # No apply_compression follows to release the index.
+            self.compressor.release_tool_pair_index()
+        plan = CompactionPlan(
+            mode="keep_prefix" if use_keep else "full",
+            keep=keep if use_keep else 0,
+            end=end if use_keep else len(messages),
+            horizon_calls=self.CACHE_PLAN_HORIZON,
+            full_cost=full_cost,
+            keep_cost=keep_cost,
+            full_cache_write_tokens=full_after,
+            keep_cache_write_tokens=keep_after - prefix_tokens,
+            full_tokens_after=full_after,
+            keep_tokens_after=keep_after,
+        )
+        logger.info(
+            f"🗜️  Compaction plan: {plan.mode} (full ${full_cost:.4f} vs "
+            f"keep {keep} cached messages ${keep_cost:.4f} over {plan.horizon_calls} calls)"
+        )
+        return plan
+
+    def _cacheable_prefix(self, messages: list[LLMMessage], counts: list[int], end: int) -> int:
+        """Leading messages worth keeping verbatim, without splitting a tool group.
+
+        The prefix is capped at ``MEMORY_COMPRESSION_RATIO`` of the threshold
+        (the size a summary may have) and leaves at least two messages
+        before ``end`` to summarize.
+        """
+        budget = Config.MEMORY_COMPRESSION_THRESHOLD * Config.MEMORY_COMPRESSION_RATIO
+        keep = 0
+        used = 0
+        while keep < end - 2 and used + counts[keep] <= budget:
+            used += counts[keep]
+            keep += 1
+        # Back off to a tool-group boundary: a call and its results stay together.
+        groups = self.compressor.tool_pair_index(messages).groups
+        while keep > 0 and (group := groups.get(keep)) is not None and min(group) < keep:
+            keep = min(group)
+        return keep
+
+    # ------------------------------------------------------------------
+    # Hierarchical summaries
+    # ------------------------------------------------------------------
+
+    def summary_message_for(
+        self,
+        summary_text: str,
+        compressed: list[LLMMessage],
+        remaining: list[LLMMessage],
+        *,
+        render_hierarchy: bool = True,
+    ) -> LLMMessage:
+        """Store a new chunk summary and render the message that replaces history.
+
+        Args:
+            summary_text: The LLM's summary of ``compressed``.
+            compressed: Messages being replaced.  Previous summary messages
+                among them are not counted; their content is already stored.
+            remaining: Messages kept after the summary.  The latest user
+                query (here, else in ``compressed``) picks which older
+                summaries are relevant.
+            render_hierarchy: False renders only the new chunk, for a
+                summary placed after a kept prefix that already carries
+                the earlier summaries.
+        """
+        count = sum(1 for m in compressed if not self.compressor.is_summary_message(m))
+        node = self.summaries.add_chunk(summary_text, count)
+        todo_context = self._todo_context_provider() if self._todo_context_provider else None
+        if not render_hierarchy:
+            return self._build_summary_message(f"## {node.label}\n{node.text}", todo_context)
+        query = ""
+        for candidates in (remaining, compressed):
+            query_idx = self.compressor._find_latest_user_query(candidates)
+            if query_idx is not None:
+                query = self.compressor._extract_text_content(candidates[query_idx])
+                break
+        budget = int(Config.MEMORY_COMPRESSION_THRESHOLD * self.SUMMARY_CONTEXT_SHARE)
+        return self._build_summary_message(self.summaries.render(query, budget), todo_context)
+
+    async def roll_up_summaries(self, *, max_tokens: int) -> dict[str, int]:
+        """Roll chunk summaries up into epochs and epochs into the session summary.
+
+        Runs until no level has ``SummaryHierarchy.FANOUT`` summaries left to
+        roll up, or an LLM call fails.
+
+        Returns:
+            Combined LLM usage of the roll-up calls.
+        """
+        hierarchy = self.summaries
+        usage_total: dict[str, int] = {}
+        while (pending := hierarchy.pending_rollup()) is not None:
+            level, sources = pending
+            source_tokens = sum(len(n.text) for n in sources) // 4
+            prompt = hierarchy.rollup_prompt(
+                level, sources, self._calculate_target_tokens(source_tokens)
+            )
+            try:
+                response = await self.llm.call_async(
+                    messages=[LLMMessage(role="user", content=prompt)],
+                    max_tokens=max_tokens,
+                )
+            except Exception as e:
+                logger.warning(f"Summary roll-up failed: {e}")
+                break
+            hierarchy.add_rollup(level, self.llm.extract_text(response), sources)
+            for key, value in (getattr(response, "usage", None) or {}).items():
+                if isinstance(value, int):
+                    usage_total[key] = usage_total.get(key, 0) + value
+        return usage_total
+
     # Legacy alias
     async def get_compaction_prompt(
         self,
@@ -164,25 +526,20 @@ class CompactionManager:
             return list(messages)
 
         strategy = self._select_strategy(messages)
-        todo_context = self._todo_context_provider() if self._todo_context_provider else None
 
         logger.info(
             f"🗜️  Applying compression to {len(messages)} messages using {strategy} strategy"
         )
 
-        # Inject todo context into summary
-        if todo_context and "[Current Tasks]" not in summary_text:
-            summary_text = f"{summary_text}\n\n[Current Tasks]\n{todo_context}"
-
-        # Build summary message
-        summary_message = LLMMessage(
-            role="user",
-            content=f"{self.compressor.SUMMARY_PREFIX}{summary_text}",
-        )
-
         # Assemble final message list and calculate metrics
         original_tokens = self.compressor._estimate_tokens(messages)
-        result_messages = self._assemble_compressed_messages(messages, summary_message, strategy)
+        preserved = self._preserved_messages(messages, strategy)
+        self.compressor.release_tool_pair_index()
+        kept = {id(m) for m in preserved}
+        summary_message = self.summary_message_for(
+            summary_text, [m for m in messages if id(m) not in kept], preserved
+        )
+        result_messages = [summary_message] + preserved
         compressed_tokens = self.compressor._estimate_tokens(result_messages)
         token_savings = original_tokens - compressed_tokens
 
@@ -249,12 +606,15 @@ class CompactionManager:
                 original_tokens = self.compressor._estimate_tokens(messages)
                 target_tokens = self._calculate_target_tokens(original_tokens)
 
-            compressed = await self.compressor.compress(
-                messages,
-                strategy=strategy,
-                target_tokens=target_tokens,
-                todo_context=todo_context,
-            )
+            try:
+                compressed = await self.compressor.compress(
+                    messages,
+                    strategy=strategy,
+                    target_tokens=target_tokens,
+                    todo_context=todo_context,
+                )
+            finally:
+                self.compressor.release_tool_pair_index()
 
             # Track compression results
             self.compression_count += 1
@@ -287,45 +647,40 @@ class CompactionManager:
 
     def _select_strategy(self, messages: list[LLMMessage]) -> str:
         """Auto-select compression strategy based on message characteristics."""
-        has_tool_calls = any(self._message_has_tool_calls(msg) for msg in messages)
-
-        if has_tool_calls:
+        if self.compressor.tool_pair_index(messages).has_tool_calls:
             return CompressionStrategy.SELECTIVE
         elif len(messages) < 5:
             return CompressionStrategy.DELETION
         else:
             return CompressionStrategy.SLIDING_WINDOW
 
-    @staticmethod
-    def _message_has_tool_calls(message: LLMMessage) -> bool:
-        """Check if message contains tool calls."""
-        if hasattr(message, "tool_calls") and message.tool_calls:
-            return True
-        if message.role == "tool":
-            return True
-        return content_has_tool_calls(message.content)
+    def _build_summary_message(self, summary_text: str, todo_context: str | None) -> LLMMessage:
+        """Wrap summary text as the user message that replaces compressed history."""
+        # Inject todo context into summary
+        if todo_context and "[Current Tasks]" not in summary_text:
+            summary_text = f"{summary_text}\n\n[Current Tasks]\n{todo_context}"
+        return LLMMessage(
+            role="user",
+            content=f"{self.compressor.SUMMARY_PREFIX}{summary_text}",
+        )
 
     def _calculate_target_tokens(self, current_tokens: int) -> int:
         """Calculate target token count for compression."""
         target = int(current_tokens * Config.MEMORY_COMPRESSION_RATIO)
         return max(target, 500)  # Minimum 500 tokens for summary
 
-    def _assemble_compressed_messages(
-        self,
-        messages: list[LLMMessage],
-        summary_message: LLMMessage,
-        strategy: str,
-    ) -> list[LLMMessage]:
-        """Assemble the post-compression message list."""
+    def _preserved_messages(self, messages: list[LLMMessage], strategy: str) -> list[LLMMessage]:
+        """Messages kept verbatim after the summary."""
         if strategy == CompressionStrategy.SELECTIVE:
             preserved, _ = self.compressor._separate_messages(messages)
-            non_system_preserved = [m for m in preserved if m.role != "system"]
-            return [summary_message] + non_system_preserved
-        return [summary_message]
+            return [m for m in preserved if m.role != "system"]
+        return []
 
     def reset(self) -> None:
         """Reset compaction state."""
         self.was_compressed_last_iteration = False
         self.last_compression_savings = 0
         self.compression_count = 0
+        self.pruned_tool_results = 0
         self._compression_needed = False
+        self.summaries = SummaryHierarchy()
@@ -0,0 +1,127 @@
+"""Deterministic pre-compaction: collapse superseded tool results.
+
+Long coding runs accumulate tool outputs that later turns have made stale:
+a ``read_file`` of a file that was since edited or read again, or a
+``grep_content`` whose identical call was repeated later.  Replacing those
+outputs with short stubs frees context without an LLM call, so the summary
+tier only runs when this is not enough.
+
+Only ``role="tool"`` contents change; every message keeps its position,
+``tool_call_id`` and ``name``, so tool-call pairing is untouched.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+from ouro.core.llm.message_types import LLMMessage
+
+from .types import PrunedToolResult
+
+# Tools whose result describes a file's content at read time.
+FILE_READ_TOOLS = frozenset({"read_file"})
+# Tools that change a file, making earlier reads of it stale.
+FILE_WRITE_TOOLS = frozenset({"write_file", "smart_edit"})
+# Read-only tools whose result is superseded by a later identical call.
+REPEATABLE_TOOLS = frozenset(
+    {"read_file", "grep_content", "glob_files", "web_search", "web_fetch", "conversation_search"}
+)
+
+STUB_TEMPLATE = "[Stale {tool} output removed: {reason}. Re-run the tool if it is needed again.]"
+
+
+def _tool_call_args(messages: list[LLMMessage]) -> dict[str, tuple[str, dict[str, Any]]]:
+    """Map tool_call_id -> (tool name, parsed arguments)."""
+    calls: dict[str, tuple[str, dict[str, Any]]] = {}
+    for msg in messages:
+        if msg.role != "assistant" or not msg.tool_calls:
+            continue
+        for tool_call in msg.tool_calls:
+            function = tool_call.get("function") or {}
+            raw = function.get("arguments") or "{}"
+            try:
+                args = json.loads(raw) if isinstance(raw, str) else dict(raw)
+            except (TypeError, ValueError):
+                continue
+            if isinstance(args, dict):
+                calls[tool_call.get("id", "")] = (function.get("name", ""), args)
+    return calls
+
+
+def _file_key(args: dict[str, Any]) -> str | None:
+    file_path = args.get("file_path")
+    if not isinstance(file_path, str) or not file_path:
+        return None
+    return os.path.abspath(file_path)
+
+
+def prune_superseded_tool_results(
+    messages: list[LLMMessage],
+    *,
+    keep_recent: int = 0,
+) -> tuple[list[LLMMessage], list[PrunedToolResult]]:
+    """Replace superseded tool outputs with stubs.
+
+    A tool output is superseded when a later call repeats it with identical
+    arguments (``REPEATABLE_TOOLS``), or when it read a file that a later
+    call wrote or edited (``FILE_WRITE_TOOLS``).  Outputs in the last
+    ``keep_recent`` messages are never touched.
+
+    Args:
+        messages: Conversation messages, oldest first.
+        keep_recent: Number of trailing messages to leave as they are.
+
+    Returns:
+        Tuple of (messages with stubs, one record per replaced output).
+        The input list and its messages are not modified.
+    """
+    calls = _tool_call_args(messages)
+    cutoff = len(messages) - keep_recent
+    # Walk newest to oldest, remembering what later calls did.
+    seen_calls: set[tuple[str, str]] = set()
+    written_files: set[str] = set()
+    result = list(messages)
+    pruned: list[PrunedToolResult] = []
+
+    for i in range(len(messages) - 1, -1, -1):
+        msg = messages[i]
+        if msg.role != "tool" or not msg.tool_call_id or msg.tool_call_id not in calls:
+            continue
+        name, args = calls[msg.tool_call_id]
+        signature = (name, json.dumps(args, sort_keys=True, default=str))
+        file_key = _file_key(args)
+
+        reason = None
+        if i < cutoff and isinstance(msg.content, str):
+            if name in REPEATABLE_TOOLS and signature in seen_calls:
+                reason = "the same call was made again later"
+            elif name in FILE_READ_TOOLS and file_key in written_files:
+                reason = "the file was modified later"
+
+        if name in REPEATABLE_TOOLS:
+            seen_calls.add(signature)
+        if name in FILE_WRITE_TOOLS and file_key and not str(msg.content).startswith("Error"):
+            written_files.add(file_key)
+
+        if reason is None:
+            continue
+        stub = STUB_TEMPLATE.format(tool=name, reason=reason)
+        if len(stub) >= len(msg.content or ""):
+            continue
+        result[i] = LLMMessage(
+            role="tool", content=stub, tool_call_id=msg.tool_call_id, name=msg.name
+        )
+        pruned.append(
+            PrunedToolResult(
+                index=i,
+                tool_call_id=msg.tool_call_id,
+                tool_name=name,
+                reason=reason,
+                original_chars=len(msg.content or ""),
+            )
+        )
+
+    pruned.reverse()
+    return result, pruned
@@ -0,0 +1,203 @@
+"""Hierarchical rolling summaries of compacted history.
+
+Folding every compaction into one summary message (summary of summary of
+summary...) loses early detail with each pass.  ``SummaryHierarchy`` keeps
+every compaction's summary instead, with the span of history it covers:
+
+- level 0, *chunk*: one compaction's summary of the messages it replaced;
+- level 1, *epoch*: a roll-up of ``FANOUT`` consecutive chunks;
+- level 2, *session*: a roll-up of all epochs so far (at most one).
+
+The summary message placed in context is rendered from this store: the
+session summary and the not-yet-rolled-up epochs and chunks, then older
+epochs and chunks that share terms with the current user query, within a
+token budget.  Context stays bounded however long the session runs, and
+older detail is still reachable when a turn asks about it.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+
+LEVEL_NAMES = ("chunk", "epoch", "session")
+TOP_LEVEL = len(LEVEL_NAMES) - 1
+
+ROLLUP_PROMPT = (
+    "Combine the following consecutive summaries of an agent session into one "
+    "{level} summary. Keep decisions, outcomes, concrete facts (file paths, "
+    "names, numbers, errors) and open threads; drop repetition.\n"
+    "\n"
+    "{sources}\n"
+    "\n"
+    "Target length: {target_tokens} tokens."
+)
+
+_WORD_RE = re.compile(r"[a-z0-9_./-]{4,}")
+
+
+def _text_tokens(text: str) -> int:
+    """Cheap token estimate for budgeting rendered summaries."""
+    return len(text) // 4 + 1
+
+
+def _terms(text: str) -> set[str]:
+    return set(_WORD_RE.findall(text.lower()))
+
+
+@dataclass
+class SummaryNode:
+    """One summary and the span of compacted messages it covers.
+
+    ``start``/``end`` count messages removed by compaction since the session
+    began (``end`` exclusive), so spans at every level line up.
+    """
+
+    level: int
+    text: str
+    start: int
+    end: int
+    created_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    @property
+    def label(self) -> str:
+        return f"{LEVEL_NAMES[self.level].title()} summary (messages {self.start}-{self.end - 1})"
+
+
+class SummaryHierarchy:
+    """Multi-level store of compaction summaries for one session."""
+
+    FANOUT = 4
+
+    def __init__(self, nodes: list[SummaryNode] | None = None) -> None:
+        self.nodes: list[SummaryNode] = list(nodes or [])
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    @property
+    def next_start(self) -> int:
+        """First message ordinal not yet covered by a chunk."""
+        return max((n.end for n in self.nodes if n.level == 0), default=0)
+
+    def level(self, level: int) -> list[SummaryNode]:
+        return sorted((n for n in self.nodes if n.level == level), key=lambda n: n.start)
+
+    def uncovered(self, level: int) -> list[SummaryNode]:
+        """Nodes at ``level`` not yet rolled up into the level above."""
+        covered_end = max((n.end for n in self.nodes if n.level == level + 1), default=0)
+        return [n for n in self.level(level) if n.end > covered_end]
+
+    # ------------------------------------------------------------------
+    # Building the hierarchy
+    # ------------------------------------------------------------------
+
+    def add_chunk(self, text: str, message_count: int) -> SummaryNode:
+        """Record one compaction's summary of ``message_count`` messages."""
+        start = self.next_start
+        node = SummaryNode(level=0, text=text, start=start, end=start + max(message_count, 1))
+        self.nodes.append(node)
+        return node
+
+    def pending_rollup(self) -> tuple[int, list[SummaryNode]] | None:
+        """Return ``(target level, sources)`` for the next roll-up, if any.
+
+        Chunks roll up ``FANOUT`` at a time into an epoch; ``FANOUT``
+        uncovered epochs are folded, with the existing session summary,
+        into a new session summary.
+        """
+        for level in range(TOP_LEVEL):
+            uncovered = self.uncovered(level)
+            if len(uncovered) < self.FANOUT:
+                continue
+            sources = uncovered[: self.FANOUT]
+            if level + 1 == TOP_LEVEL:
+                sources = self.level(TOP_LEVEL) + sources
+            return level + 1, sources
+        return None
+
+    def rollup_prompt(self, level: int, sources: list[SummaryNode], target_tokens: int) -> str:
+        return ROLLUP_PROMPT.format(
+            level=LEVEL_NAMES[level],
+            sources="\n\n".join(f"[{n.label}]\n{n.text}" for n in sources),
+            target_tokens=target_tokens,
+        )
+
+    def add_rollup(self, level: int, text: str, sources: list[SummaryNode]) -> SummaryNode:
+        """Record a roll-up of ``sources``; a new session summary replaces the old."""
+        node = SummaryNode(
+            level=level,
+            text=text,
+            start=min(n.start for n in sources),
+            end=max(n.end for n in sources),
+        )
+        if level == TOP_LEVEL:
+            self.nodes = [n for n in self.nodes if n.level != TOP_LEVEL]
+        self.nodes.append(node)
+        return node
+
+    # ------------------------------------------------------------------
+    # Rendering into context
+    # ------------------------------------------------------------------
+
+    def select(self, query: str, budget: int) -> list[SummaryNode]:
+        """Pick the summaries to put in context for a turn about ``query``.
+
+        The session summary and the newest not-yet-rolled-up epochs and
+        chunks come first; remaining budget goes to older epochs and chunks
+        ranked by term overlap with ``query``.
+        """
+        frontier = (
+            self.level(TOP_LEVEL)
+            + self.uncovered(1)[::-1]
+            + self.uncovered(0)[::-1]  # newest first
+        )
+        frontier_ids = {id(n) for n in frontier}
+        selected: list[SummaryNode] = []
+        used = 0
+        for node in frontier:
+            cost = _text_tokens(node.text)
+            if selected and used + cost > budget:
+                continue
+            selected.append(node)
+            used += cost
+
+        query_terms = _terms(query)
+        if query_terms:
+            scored = []
+            for node in self.nodes:
+                if id(node) in frontier_ids:
+                    continue
+                node_terms = _terms(node.text)
+                overlap = len(query_terms & node_terms)
+                if overlap:
+                    scored.append((overlap / math.sqrt(len(node_terms)), node))
+            scored.sort(key=lambda item: item[0], reverse=True)
+            for _score, node in scored:
+                cost = _text_tokens(node.text)
+                if used + cost > budget:
+                    continue
+                selected.append(node)
+                used += cost
+
+        selected.sort(key=lambda n: (n.start, -n.level))
+        return selected
+
+    def render(self, query: str, budget: int) -> str:
+        """Render the selected summaries as one text block, oldest span first."""
+        return "\n\n".join(f"## {n.label}\n{n.text}" for n in self.select(query, budget))
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"nodes": [asdict(n) for n in self.nodes]}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any] | None) -> SummaryHierarchy:
+        nodes = [SummaryNode(**n) for n in (data or {}).get("nodes") or []]
+        return cls(nodes)
@@ -2,7 +2,7 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from ouro.core.llm.base import LLMMessage
 
@@ -36,6 +36,64 @@ class CompressedMemory:
         return (self.token_savings / self.original_tokens) * 100
 
 
+@dataclass
+class PrunedToolResult:
+    """A tool output replaced by a stub during deterministic pre-compaction."""
+
+    index: int  # Position in the message list
+    tool_call_id: str
+    tool_name: str
+    reason: str
+    original_chars: int
+
+
+@dataclass
+class CompactionPlan:
+    """How a compaction rewrites the history, chosen by expected input cost.
+
+    ``full`` replaces everything with a summary plus preserved messages.
+    ``keep_prefix`` keeps ``messages[:keep]`` byte-identical so the provider's
+    cached prefix stays valid, and summarizes only ``messages[keep:end]``.
+    Costs are USD over the next ``horizon_calls`` requests.
+    """
+
+    mode: str  # "full" or "keep_prefix"
+    keep: int = 0
+    end: int = 0
+    horizon_calls: int = 0
+    full_cost: float = 0.0
+    keep_cost: float = 0.0
+    full_cache_write_tokens: int = 0
+    keep_cache_write_tokens: int = 0
+    full_tokens_after: int = 0
+    keep_tokens_after: int = 0
+
+    @property
+    def savings(self) -> float:
+        """Expected saving of the chosen mode over the other (USD)."""
+        return abs(self.full_cost - self.keep_cost)
+
+
+@dataclass
+class ToolPairIndex:
+    """Tool call / result pairing of one message list, built in a single pass.
+
+    Indices refer to positions in the indexed list.  ``groups`` maps every
+    paired index to all indices that must be kept or dropped together with
+    it: an assistant message, all of its results, and any assistant whose
+    results share a (legacy) ``tool_result`` message with them.
+    """
+
+    pairs: List[Tuple[int, int]] = field(default_factory=list)  # (assistant_idx, result_idx)
+    by_id: Dict[str, Tuple[int, int]] = field(default_factory=dict)  # tool_call_id -> pair
+    orphaned: List[int] = field(default_factory=list)  # assistant indices awaiting results
+    protected: List[List[int]] = field(default_factory=list)  # pairs using PROTECTED_TOOLS
+    groups: Dict[int, List[int]] = field(default_factory=dict)
+    has_tool_calls: bool = False
+    # (preserved, to_compress) by MEMORY_SHORT_TERM_MIN_SIZE, see _separate_messages
+    separated: Dict[int, Tuple[List[LLMMessage], List[LLMMessage]]] = field(default_factory=dict)
+
+
 @dataclass
 class CompressionStrategy:
     """Enum-like class for compression strategies.
@@ -1,7 +1,7 @@
 """SessionPersistenceHook — incremental session persistence on every message.
 
 Wires MemoryManager into the core loop so that each new message is
-appended to session.yaml immediately, rather than waiting until the
+appended to the session store immediately, rather than waiting until the
 entire turn finishes.  This gives crash-safety for long multi-tool
 runs and for long-lived bot processes.
 """
@@ -32,6 +32,9 @@ class SessionPersistenceHook:
     def __init__(self, memory: MemoryManager) -> None:
         self.memory = memory
         self._last_saved_count: int = 0
+        # ``MessageList.generation`` of what was last persisted; a change
+        # means the list was rewritten (compaction), not just appended to.
+        self._saved_generation: int | None = None
 
     async def on_run_start(self, ctx: LoopContext, messages: MessageList) -> None:
         """Initialize the incremental counter without replaying history.
@@ -40,24 +43,27 @@ class SessionPersistenceHook:
         already contains the previous persisted conversation plus the new user
         message for this turn. Resetting to 0 would append the entire history to
         ``session.yaml`` again on the first iteration.
+
+        Also starts a new run window in the token tracker, which backs the
+        per-run prompt-cache hit ratio.
         """
+        self.memory.token_tracker.start_run()
+        self._saved_generation = messages.generation
         current_count = len(messages)
         if self._last_saved_count == 0 and current_count > 1:
             self._last_saved_count = current_count - 1
 
     async def _persist_batch(self, messages: list[Any]) -> None:
-        """Best-effort persistence of a batch of messages."""
-        for msg in messages:
-            try:
-                await self.memory.save_single_message(msg)
-            except Exception:  # noqa: PERF203
-                # Each message is independent; one failure must not
-                # prevent the rest from persisting.
-                logger.warning(
-                    "Failed to incrementally save message for session %s",
-                    self.memory.session_id,
-                    exc_info=True,
-                )
+        """Best-effort persistence of a batch of messages in one store write."""
+        try:
+            await self.memory.save_messages(messages)
+        except Exception:
+            logger.warning(
+                "Failed to incrementally save %d message(s) for session %s",
+                len(messages),
+                self.memory.session_id,
+                exc_info=True,
+            )
 
     async def on_iteration_end(
         self,
@@ -72,19 +78,24 @@ class SessionPersistenceHook:
         ensuring that assistant messages and tool results are flushed
         to disk before the next LLM call.
 
-        When compaction shortens the message list mid-turn, we fall
-        back to a full messages replacement so the persisted state
-        stays consistent.
+        When compaction rewrites the message list mid-turn, we fall back
+        to a full messages replacement so the persisted state stays
+        consistent.  A rewrite is detected by ``MessageList.generation``,
+        not by length: replacing a small window in place and appending a
+        call and its result can leave the list longer than before.
         """
         if self.memory.session_id is None:
             return ContinueDecision.cont()
 
         current_count = len(messages.snapshot())
-
-        if current_count < self._last_saved_count:
-            # Compaction happened: the message list was replaced with a
-            # shorter summary.  Do a full replacement rather than
-            # incremental append so session.yaml stays consistent.
+        if self._saved_generation is None:
+            self._saved_generation = messages.generation
+        rewritten = messages.generation != self._saved_generation
+
+        if rewritten or current_count < self._last_saved_count:
+            # Compaction happened: part of the list was replaced with a
+            # summary.  Do a full replacement rather than incremental
+            # append so session.yaml stays consistent.
             try:
                 await self.memory.replace_messages(messages.snapshot())
             except Exception:
@@ -94,6 +105,7 @@ class SessionPersistenceHook:
                     exc_info=True,
                 )
             self._last_saved_count = current_count
+            self._saved_generation = messages.generation
             logger.debug(
                 "Replaced messages after compaction for session %s (%d messages)",
                 self.memory.session_id,
@@ -4,7 +4,7 @@ The conversation list itself lives on the loop's
 ``MessageListContext`` (see ``ouro.core.loop.context``).  This class
 owns the parts that belong to the *capability* layer:
 
-- ``YamlFileMemoryStore`` — session save/load on disk.
+- the session store (``create_memory_store``) — session save/load on disk.
 - ``MemoryBlockManager`` — named, size-bounded markdown blocks for
   cross-session memory; always on. Replaces the old
   ``LongTermMemoryManager`` (memory.md + daily files).
@@ -23,7 +23,12 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from ouro.capabilities.compaction import CompactionManager
+from ouro.capabilities.compaction import (
+    CompactionManager,
+    SummaryHierarchy,
+    get_token_calibrator,
+)
+from ouro.config import Config
 from ouro.core.llm.message_types import LLMMessage
 from ouro.core.loop import MessageListContext
 from ouro.core.loop.protocols import NullProgressSink, ProgressSink
@@ -51,9 +56,9 @@ class MemoryManager:
         self.llm = llm
         self._progress: ProgressSink = progress or NullProgressSink()
 
-        from .store import YamlFileMemoryStore
+        from .store import create_memory_store
 
-        self._store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        self._store = create_memory_store(sessions_dir=sessions_dir)
 
         # Lazy session creation: real session is created on first save.
         if session_id is not None:
@@ -64,12 +69,20 @@ class MemoryManager:
             self._session_created = False
 
         self.token_tracker = TokenTracker()
-        self._compaction = CompactionManager(llm)
+        self._compaction = CompactionManager(
+            llm,
+            count_message=self.count_message_tokens,
+            calibrator=get_token_calibrator() if Config.TOKEN_CALIBRATION else None,
+            token_tracker=self.token_tracker,
+        )
 
         # Conversation recall (FTS5 over historical messages — no embedder).
-        # Created lazily on first save_memory; only when feature is enabled.
+        # Created lazily on first save. Messages are appended to it as they
+        # are persisted; ``_recall_seen`` is how many messages of the live
+        # history it has been given.
         self._recall_index: Any = None
         self._recall_memory_dir = memory_dir
+        self._recall_seen = 0
 
         # Memory blocks — always on; replaces the old memory.md + daily files.
         self._long_term: MemoryBlockManager = MemoryBlockManager(llm, memory_dir=memory_dir)
@@ -132,6 +145,13 @@ class MemoryManager:
                 f"cache_creation={manager.token_tracker.total_cache_creation_tokens}"
             )
 
+        summaries = session_data.get("summaries")
+        if summaries:
+            manager.compaction.summaries = SummaryHierarchy.from_dict(summaries)
+
+        # The loaded messages were indexed when they were saved.
+        manager._recall_seen = len(context.detached)
+
         logger.info(
             f"Loaded session {session_id}: "
             f"{len(context.detached)} messages, "
@@ -143,23 +163,23 @@ class MemoryManager:
     async def list_sessions(
         limit: int = 50, sessions_dir: str | None = None
     ) -> list[dict[str, Any]]:
-        from .store import YamlFileMemoryStore
+        from .store import create_memory_store
 
-        store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        store = create_memory_store(sessions_dir=sessions_dir)
         return await store.list_sessions(limit=limit)
 
     @staticmethod
     async def find_latest_session(sessions_dir: str | None = None) -> str | None:
-        from .store import YamlFileMemoryStore
+        from .store import create_memory_store
 
-        store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        store = create_memory_store(sessions_dir=sessions_dir)
         return await store.find_latest_session()
 
     @staticmethod
     async def find_session_by_prefix(prefix: str, sessions_dir: str | None = None) -> str | None:
-        from .store import YamlFileMemoryStore
+        from .store import create_memory_store
 
-        store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        store = create_memory_store(sessions_dir=sessions_dir)
         return await store.find_session_by_prefix(prefix)
 
     async def _ensure_session(self) -> None:
@@ -200,6 +220,15 @@ class MemoryManager:
         """Forward the todo-context provider through to compaction."""
         self._compaction.set_todo_context_provider(provider)
 
+    def count_message_tokens(self, message: LLMMessage) -> int:
+        """Per-message counter for the detached list's running token ledger.
+
+        Used by compaction and the request token budget; goes through
+        ``TokenTracker`` so counts share its content cache.
+        """
+        provider = getattr(self.llm, "provider_name", "")
+        return self.token_tracker.count_message_tokens(message, provider, self.llm.model)
+
     # ------------------------------------------------------------------
     # Operations on a MessageListContext
     # ------------------------------------------------------------------
@@ -219,6 +248,23 @@ class MemoryManager:
             return
 
         await self._store.save_message(self.session_id, message, tokens)
+        await self._append_recall([message])
+
+    async def save_messages(self, messages: list[LLMMessage]) -> None:
+        """Persist a batch of new messages in one store write.
+
+        Used by ``SessionPersistenceHook`` for the messages an iteration
+        appended.  Lazily creates the session on first call.
+        """
+        if not self._session_created:
+            await self._ensure_session()
+
+        if not self._store or not self._session_created or not self.session_id:
+            logger.debug("Skipping save_messages: no session created")
+            return
+
+        await self._store.save_messages(self.session_id, messages)
+        await self._append_recall(messages)
 
     async def replace_messages(self, messages: list[LLMMessage]) -> None:
         """Replace the entire messages list in session storage.
@@ -235,6 +281,9 @@ class MemoryManager:
             return
 
         await self._store.replace_messages(self.session_id, messages)
+        # Compaction shortened the history; the recall index keeps the
+        # messages it replaced, which is what recall is for.
+        self._recall_seen = len(messages)
 
     async def save_memory(self, *, context: MessageListContext) -> None:
         """Persist the conversation snapshot to disk.
@@ -272,13 +321,22 @@ class MemoryManager:
             system_messages=sys_msgs,
             messages=messages,
             token_stats=token_stats,
+            summaries=self._compaction.summaries.to_dict(),
         )
-        # Reindex FTS recall — best-effort, never blocks the save path.
+        # Index only what incremental saves have not already indexed.
+        if len(messages) > self._recall_seen:
+            await self._append_recall(messages[self._recall_seen :])
+        else:
+            self._recall_seen = len(messages)
+        logger.info(f"Saved memory state for session {self.session_id}")
+
+    async def _append_recall(self, messages: list[LLMMessage]) -> None:
+        """Append newly persisted messages to the FTS recall index — best-effort."""
+        self._recall_seen += len(messages)
         try:
-            await self._get_recall_index().reindex_session(self.session_id, messages)
+            await self._get_recall_index().append_messages(self.session_id, messages)
         except Exception:
-            logger.warning("Failed to reindex recall FTS", exc_info=True)
-        logger.info(f"Saved memory state for session {self.session_id}")
+            logger.warning("Failed to update recall FTS", exc_info=True)
 
     def _get_recall_index(self) -> Any:
         """Lazy-instantiate the FTS recall index."""
@@ -302,9 +360,10 @@ class MemoryManager:
         call (system + detached).  Token-tracker fields are cumulative
         across the session.
         """
-        detached = context.detached.snapshot()
-        msg_count = len(detached)
-        current_tokens = self._compaction.estimate_tokens(list(context.system_messages) + detached)
+        msg_count = len(context.detached)
+        current_tokens = self._compaction.estimate_tokens(
+            context.system_messages
+        ) + self._compaction.estimate_context_tokens(context.detached)
 
         return {
             "current_tokens": current_tokens,
@@ -312,7 +371,10 @@ class MemoryManager:
             "total_output_tokens": self.token_tracker.total_output_tokens,
             "cache_read_tokens": self.token_tracker.total_cache_read_tokens,
             "cache_creation_tokens": self.token_tracker.total_cache_creation_tokens,
+            "cache_hit_ratio": self.token_tracker.cache_hit_ratio(),
+            "run_cache_hit_ratio": self.token_tracker.cache_hit_ratio(run=True),
             "compression_count": self._compaction.compression_count,
+            "pruned_tool_results": self._compaction.pruned_tool_results,
             "total_savings": self.token_tracker.compression_savings,
             "compression_cost": self.token_tracker.compression_cost,
             "net_savings": (
@@ -1,6 +1,7 @@
 """Recall memory — keyword search over historical conversation messages.
 
-SQLite FTS5 backed; no embedder required. Built on the OS-paging idea from
+SQLite FTS5 backed; no embedder required. An optional vector tier
+(``RECALL_EMBEDDER``, see ``dense``) is fused with the keyword ranking. Built on the OS-paging idea from
 Letta/MemGPT: keep recent messages in context, page older messages out to
 an indexed store, search them on demand via a tool call.
 """
@@ -0,0 +1,208 @@
+"""Dense-vector tier of the recall index.
+
+An ``Embedder`` turns message text into unit-length float32 vectors:
+
+- ``HashingEmbedder`` (``RECALL_EMBEDDER=hash``) hashes words and their
+  character trigrams into a fixed number of signed buckets. It needs no
+  model or dependency and matches inflections, partial words and
+  misspellings that FTS5 tokens miss, but not synonyms.
+- ``SentenceTransformerEmbedder`` (``RECALL_EMBEDDER=<model name>``) runs a
+  small local CPU model through ``sentence-transformers`` when that package
+  is installed; otherwise the hashing sketch is used instead.
+
+Vectors are appended to a flat float32 file next to ``recall.db``
+(``VectorFile``), one row per indexed message, and searched by brute-force
+cosine similarity — through a NumPy memmap when NumPy is installed, with a
+pure-Python loop over an ``mmap`` otherwise. Which row belongs to which
+message is recorded in ``recall.db``; rows no longer referenced there (after
+a reindex or delete) are skipped, not rewritten.
+"""
+
+from __future__ import annotations
+
+import heapq
+import importlib.util
+import logging
+import math
+import mmap
+import operator
+import os
+import re
+import zlib
+from array import array
+from collections import Counter
+from typing import Protocol, Sequence
+
+logger = logging.getLogger(__name__)
+
+# Characters of a message that are embedded; the rest rarely changes the vector.
+EMBED_CHARS = 2000
+
+_WORD_RE = re.compile(r"\w+")
+
+
+class Embedder(Protocol):
+    """Text -> unit-length vectors of ``dim`` float32 values."""
+
+    name: str
+    dim: int
+    # Cosine similarity below which a vector hit is not worth returning.
+    min_score: float
+
+    def embed(self, texts: Sequence[str]) -> list[array]: ...
+
+
+class HashingEmbedder:
+    """Signed feature hashing of words and character trigrams.
+
+    Feature counts are damped (``1 + log(count)``) so that a long message
+    repeating a word many times does not outrank short ones about it.
+    """
+
+    min_score = 0.2
+
+    def __init__(self, dim: int = 256) -> None:
+        self.dim = dim
+        self.name = f"hash{dim}"
+
+    @staticmethod
+    def _features(text: str) -> Counter[str]:
+        features: Counter[str] = Counter()
+        for word in _WORD_RE.findall(text.lower()):
+            features[word] += 1
+            padded = f"<{word}>"
+            features.update(padded[i : i + 3] for i in range(len(padded) - 2))
+        return features
+
+    def embed(self, texts: Sequence[str]) -> list[array]:
+        vectors = []
+        for text in texts:
+            vec = [0.0] * self.dim
+            for feature, count in self._features(text[:EMBED_CHARS]).items():
+                # crc32, not hash(): vectors must not depend on PYTHONHASHSEED.
+                h = zlib.crc32(feature.encode("utf-8"))
+                weight = 1.0 + math.log(count)
+                vec[h % self.dim] += weight if h & 0x80000000 else -weight
+            norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+            vectors.append(array("f", (v / norm for v in vec)))
+        return vectors
+
+
+class SentenceTransformerEmbedder:
+    """A local ``sentence-transformers`` model, run on the CPU."""
+
+    min_score = 0.3
+
+    def __init__(self, model_name: str) -> None:
+        from sentence_transformers import SentenceTransformer
+
+        self._model = SentenceTransformer(model_name, device="cpu")
+        self.dim = int(self._model.get_sentence_embedding_dimension())
+        self.name = model_name
+
+    def embed(self, texts: Sequence[str]) -> list[array]:
+        matrix = self._model.encode(
+            [text[:EMBED_CHARS] for text in texts], normalize_embeddings=True
+        )
+        return [array("f", row.tolist()) for row in matrix]
+
+
+_embedders: dict[str, Embedder | None] = {}
+
+
+def get_embedder(spec: str) -> Embedder | None:
+    """Embedder for a ``RECALL_EMBEDDER`` value (``off``, ``hash`` or a model name)."""
+    spec = (spec or "off").strip()
+    if spec not in _embedders:
+        embedder: Embedder | None
+        if spec.lower() in ("", "off", "false", "none"):
+            embedder = None
+        elif spec.lower() == "hash":
+            embedder = HashingEmbedder()
+        elif importlib.util.find_spec("sentence_transformers") is None:
+            logger.warning(
+                "sentence-transformers is not installed; recall uses the hashing sketch "
+                "instead of %s",
+                spec,
+            )
+            embedder = HashingEmbedder()
+        else:
+            try:
+                embedder = SentenceTransformerEmbedder(spec)
+            except Exception:
+                logger.warning(
+                    "Could not load embedding model %s; recall uses the hashing sketch",
+                    spec,
+                    exc_info=True,
+                )
+                embedder = HashingEmbedder()
+        _embedders[spec] = embedder
+    return _embedders[spec]
+
+
+def _numpy():
+    if importlib.util.find_spec("numpy") is None:
+        return None
+    import numpy
+
+    return numpy
+
+
+class VectorFile:
+    """Append-only file of ``dim``-wide float32 rows."""
+
+    def __init__(self, path: str, dim: int) -> None:
+        self.path = path
+        self.dim = dim
+        self._row_bytes = 4 * dim
+
+    def rows(self) -> int:
+        try:
+            # A torn last row from a crash mid-append is not counted.
+            return os.path.getsize(self.path) // self._row_bytes
+        except FileNotFoundError:
+            return 0
+
+    def append(self, vectors: Sequence[array]) -> int:
+        """Append ``vectors``; returns the row number of the first one."""
+        first = self.rows()
+        with open(self.path, "ab") as f:
+            # Start on a row boundary even after a torn append.
+            f.truncate(first * self._row_bytes)
+            for vec in vectors:
+                f.write(vec.tobytes())
+        return first
+
+    def top_k(
+        self, query: array, k: int, rows: Sequence[int] | None = None
+    ) -> list[tuple[int, float]]:
+        """The ``k`` rows most similar to ``query`` (of ``rows``, default all)."""
+        n = self.rows()
+        if n == 0 or k <= 0:
+            return []
+        if rows is not None:
+            rows = [r for r in rows if r < n]
+            if not rows:
+                return []
+        np = _numpy()
+        if np is not None:
+            matrix = np.memmap(self.path, dtype=np.float32, mode="r", shape=(n, self.dim))
+            ids = np.arange(n) if rows is None else np.asarray(rows)
+            vectors = matrix if rows is None else matrix[ids]
+            scores = vectors @ np.frombuffer(query.tobytes(), dtype=np.float32)
+            best = np.argsort(-scores)[:k]
+            return [(int(ids[i]), float(scores[i])) for i in best]
+
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)[: n * self._row_bytes].cast("f")
+            try:
+                dim = self.dim
+                candidates = range(n) if rows is None else rows
+                scored = (
+                    (sum(map(operator.mul, view[r * dim : (r + 1) * dim], query)), r)
+                    for r in candidates
+                )
+                best = heapq.nlargest(k, scored)
+            finally:
+                view.release()
+        return [(r, score) for score, r in best]
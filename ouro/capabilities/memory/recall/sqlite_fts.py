@@ -1,13 +1,29 @@
 """SQLite FTS5-backed recall index for conversation messages.
 
-The index lives at ``<memory_dir>/recall.db`` and contains a single FTS5
-virtual table with one row per message. Writes are best-effort: an indexing
-failure must never break the loop. Reads are scoped by ``session_id`` when
-provided.
-
-Threading: ``sqlite3`` connections are not safe to share between threads, so
-every operation opens a fresh connection inside ``asyncio.to_thread``. WAL
-mode is enabled so concurrent readers/writers don't block each other.
+The index lives at ``<memory_dir>/recall.db`` and contains an FTS5 virtual
+table with one row per message, plus a ``sessions`` table recording how
+many messages of each session it covers. Writes are best-effort: an
+indexing failure must never break the loop. Reads are scoped by
+``session_id`` when provided.
+
+Messages are indexed incrementally: ``append_messages`` inserts only the
+new ones after the session's count, so the cost of a save depends on the
+number of new messages rather than on the session length. Appends from
+concurrent callers are queued and inserted in one transaction, and every
+``MERGE_EVERY_ROWS`` inserted rows the FTS5 segments are merged (with a
+full ``optimize`` every ``OPTIMIZE_EVERY_MERGES`` merges) so that many
+small appends do not leave many small segments for searches to visit.
+
+With ``RECALL_EMBEDDER`` set, each indexed message also gets a vector
+(see ``dense``), and ``search`` fuses the bm25 ranking with a
+vector-similarity ranking by reciprocal rank, so paraphrases and queries
+FTS5 cannot parse still find messages. Vectors are computed in a worker
+thread before a write is queued; the writer only appends them to the
+vector file.
+
+Threading: connections come from the shared ``SQLitePool`` — writes run on
+its writer thread, searches on reader threads, and WAL mode keeps them from
+blocking each other.
 """
 
 from __future__ import annotations
@@ -15,15 +31,34 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import re
 import sqlite3
+from array import array
 from typing import Any, Iterable
 
+from ouro.capabilities.memory.recall.dense import Embedder, VectorFile, get_embedder
+from ouro.capabilities.memory.sqlite_pool import SQLitePool, get_sqlite_pool
+from ouro.config import Config
 from ouro.core.llm.message_types import LLMMessage
 
 logger = logging.getLogger(__name__)
 
 _DEFAULT_DB_NAME = "recall.db"
 
+# FTS5 segment maintenance, counted in inserted rows / merges.
+MERGE_EVERY_ROWS = 2000
+MERGE_PAGES = 500
+OPTIMIZE_EVERY_MERGES = 20
+
+# Reciprocal rank fusion constant, and candidates taken from each ranking per hit.
+RRF_K = 60
+CANDIDATES_PER_HIT = 4
+
+# (msg_idx, role, timestamp, content)
+_Row = tuple[int, str, str, str]
+
+_TERM_RE = re.compile(r"\w+")
+
 
 def _flatten_content(content: Any) -> str:
     """Flatten LLMMessage.content into a single searchable string."""
@@ -43,26 +78,75 @@ def _flatten_content(content: Any) -> str:
     return str(content)
 
 
+def _rows(messages: Iterable[LLMMessage], timestamp: str) -> list[tuple[str, str, str]]:
+    """``(role, timestamp, content)`` per message; empty content stays as ``""``."""
+    return [(msg.role, timestamp, _flatten_content(msg.content)) for msg in messages]
+
+
+def _texts(rows: list[tuple[str, str, str]]) -> list[str]:
+    """Contents of the rows that get an FTS row (and a vector)."""
+    return [content for _, _, content in rows if content.strip()]
+
+
+def _terms_query(query: str) -> str:
+    """FTS5 query matching all words of *query*, for input FTS5 cannot parse."""
+    return " ".join(f'"{term}"' for term in _TERM_RE.findall(query))
+
+
+def _fuse(rankings: list[list[dict[str, Any]]], limit: int) -> list[dict[str, Any]]:
+    """Reciprocal rank fusion; ``score`` becomes the fused score (higher is better)."""
+    scores: dict[tuple[str, Any], float] = {}
+    hits: dict[tuple[str, Any], dict[str, Any]] = {}
+    for ranking in rankings:
+        for rank, hit in enumerate(ranking, 1):
+            key = (hit["session_id"], hit["msg_idx"])
+            scores[key] = scores.get(key, 0.0) + 1.0 / (RRF_K + rank)
+            hits.setdefault(key, hit)
+    best = sorted(scores, key=scores.__getitem__, reverse=True)[:limit]
+    return [dict(hits[key], score=scores[key]) for key in best]
+
+
 class RecallIndex:
     """FTS5-backed message store keyed by ``(session_id, message_idx)``.
 
-    Use ``reindex_session`` to replace all rows for a session in one go —
-    that's the natural fit for ``save_memory`` which writes the full
-    snapshot. ``add_message`` is provided for incremental writes.
+    ``append_messages`` indexes the messages a session appended, numbering
+    them after the ones already indexed; ``msg_idx`` is thus a message's
+    position in everything the session ever appended, which survives
+    compaction shortening the live history. ``reindex_session`` replaces
+    all rows for a session in one go, and ``add_message`` writes a single
+    row at a caller-chosen index.
+
+    ``embedder`` defaults to the one ``RECALL_EMBEDDER`` selects (none by
+    default, which leaves search purely lexical).
     """
 
-    def __init__(self, memory_dir: str, db_name: str = _DEFAULT_DB_NAME) -> None:
+    def __init__(
+        self,
+        memory_dir: str,
+        db_name: str = _DEFAULT_DB_NAME,
+        *,
+        pool: SQLitePool | None = None,
+        embedder: Embedder | None = None,
+    ) -> None:
         self.memory_dir = memory_dir
         self.db_path = os.path.join(memory_dir, db_name)
+        self._pool = pool or get_sqlite_pool()
+        self._embedder = embedder or get_embedder(Config.RECALL_EMBEDDER)
+        self._vectors: VectorFile | None = None
+        if self._embedder is not None:
+            file_name = re.sub(r"[^\w.-]", "_", self._embedder.name)
+            self._vectors = VectorFile(
+                os.path.join(memory_dir, f"recall.{file_name}.vec"), self._embedder.dim
+            )
+        self._pending: list[
+            tuple[str, list[tuple[str, str, str]], list[array] | None, asyncio.Future]
+        ] = []
+        self._flusher: asyncio.Task | None = None
+        # Only touched on the writer thread.
+        self._rows_since_merge = 0
+        self._merges = 0
 
-    # ---- sync helpers (run inside asyncio.to_thread) ---------------------
-
-    def _connect(self) -> sqlite3.Connection:
-        os.makedirs(self.memory_dir, exist_ok=True)
-        conn = sqlite3.connect(self.db_path, isolation_level=None, timeout=10.0)
-        conn.execute("PRAGMA journal_mode=WAL")
-        conn.execute("PRAGMA synchronous=NORMAL")
-        return conn
+    # ---- sync helpers (run on a pool thread) -----------------------------
 
     def _ensure_schema(self, conn: sqlite3.Connection) -> None:
         # FTS5 virtual table — content is searchable; the rest is UNINDEXED metadata.
@@ -77,106 +161,296 @@ class RecallIndex:
             )
             """
         )
+        # Messages of each session covered so far (including empty ones,
+        # which get no FTS row) — where the next append starts numbering.
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "session_id TEXT PRIMARY KEY, message_count INTEGER NOT NULL)"
+        )
+        # Row of each message's vector in the embedder's vector file.
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS vectors ("
+            "embedder TEXT NOT NULL, row INTEGER NOT NULL, msg_rowid INTEGER NOT NULL, "
+            "session_id TEXT NOT NULL, PRIMARY KEY (embedder, row))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS vectors_session ON vectors (session_id)")
+
+    @staticmethod
+    def _indexed_count(conn: sqlite3.Connection, session_id: str) -> int:
+        row = conn.execute(
+            "SELECT message_count FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is not None:
+            return row[0]
+        # Indexed before the sessions table existed: continue after its last row.
+        row = conn.execute(
+            "SELECT MAX(CAST(msg_idx AS INTEGER)) FROM messages WHERE session_id = ?",
+            (session_id,),
+        ).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    @staticmethod
+    def _set_count(conn: sqlite3.Connection, session_id: str, count: int) -> None:
+        conn.execute(
+            "INSERT INTO sessions (session_id, message_count) VALUES (?, ?) "
+            "ON CONFLICT(session_id) DO UPDATE SET message_count = excluded.message_count",
+            (session_id, count),
+        )
+
+    def _insert_rows(
+        self,
+        conn: sqlite3.Connection,
+        session_id: str,
+        rows: list[_Row],
+        vectors: list[array] | None,
+    ) -> int:
+        """Insert the rows with content and their ``vectors``; returns how many.
+
+        ``vectors`` (from ``_embed``) has one vector per row with content.
+        """
+        rows = [row for row in rows if row[3].strip()]
+        if not rows:
+            return 0
+        sql = (
+            "INSERT INTO messages (session_id, msg_idx, role, timestamp, content) "
+            "VALUES (?, ?, ?, ?, ?)"
+        )
+        params = [(session_id, idx, role, ts, content) for idx, role, ts, content in rows]
+        if self._embedder is None or self._vectors is None or vectors is None:
+            conn.executemany(sql, params)
+            return len(rows)
+
+        rowids = [conn.execute(sql, p).lastrowid for p in params]
+        # Rows appended here but never committed are simply never referenced.
+        first = self._vectors.append(vectors)
+        conn.executemany(
+            "INSERT INTO vectors (embedder, row, msg_rowid, session_id) VALUES (?, ?, ?, ?)",
+            [(self._embedder.name, first + i, rowid, session_id) for i, rowid in enumerate(rowids)],
+        )
+        return len(rows)
+
+    def _append_batch_sync(
+        self,
+        conn: sqlite3.Connection,
+        batch: list[tuple[str, list[tuple[str, str, str]], list[array] | None]],
+    ) -> None:
+        """Append each ``(session_id, [(role, timestamp, content)], vectors)`` in one transaction."""
+        self._ensure_schema(conn)
+        inserted = 0
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            counts: dict[str, int] = {}
+            for session_id, messages, vectors in batch:
+                start = counts.get(session_id)
+                if start is None:
+                    start = self._indexed_count(conn, session_id)
+                rows = [
+                    (start + i, role, ts, content) for i, (role, ts, content) in enumerate(messages)
+                ]
+                inserted += self._insert_rows(conn, session_id, rows, vectors)
+                counts[session_id] = start + len(messages)
+            for session_id, count in counts.items():
+                self._set_count(conn, session_id, count)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        self._maintain(conn, inserted)
+
+    def _maintain(self, conn: sqlite3.Connection, inserted: int) -> None:
+        """Merge FTS5 segments every ``MERGE_EVERY_ROWS`` inserted rows."""
+        self._rows_since_merge += inserted
+        if self._rows_since_merge < MERGE_EVERY_ROWS:
+            return
+        self._rows_since_merge = 0
+        self._merges += 1
+        if self._merges % OPTIMIZE_EVERY_MERGES == 0:
+            self._optimize_sync(conn)
+        else:
+            conn.execute(
+                "INSERT INTO messages (messages, rank) VALUES ('merge', ?)", (MERGE_PAGES,)
+            )
+
+    def _optimize_sync(self, conn: sqlite3.Connection) -> None:
+        self._ensure_schema(conn)
+        conn.execute("INSERT INTO messages (messages) VALUES ('optimize')")
 
     def _reindex_session_sync(
         self,
+        conn: sqlite3.Connection,
         session_id: str,
-        messages: list[tuple[int, str, str, str]],
+        messages: list[tuple[str, str, str]],
+        vectors: list[array] | None,
     ) -> None:
         """Replace all rows for session_id with the given messages.
 
         Args:
+            conn: Writer connection.
             session_id: Session UUID.
-            messages: list of (msg_idx, role, timestamp, content).
+            messages: list of (role, timestamp, content), in order.
+            vectors: Vectors of the messages with content (see ``_embed``).
         """
-        conn = self._connect()
+        self._ensure_schema(conn)
+        conn.execute("BEGIN")
         try:
-            self._ensure_schema(conn)
-            conn.execute("BEGIN")
             conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
-            if messages:
-                conn.executemany(
-                    "INSERT INTO messages (session_id, msg_idx, role, timestamp, content) "
-                    "VALUES (?, ?, ?, ?, ?)",
-                    [(session_id, idx, role, ts, content) for idx, role, ts, content in messages],
-                )
-            conn.execute("COMMIT")
-        finally:
-            conn.close()
+            conn.execute("DELETE FROM vectors WHERE session_id = ?", (session_id,))
+            rows = [(idx, role, ts, content) for idx, (role, ts, content) in enumerate(messages)]
+            inserted = self._insert_rows(conn, session_id, rows, vectors)
+            self._set_count(conn, session_id, len(messages))
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        self._maintain(conn, inserted)
 
     def _add_message_sync(
         self,
+        conn: sqlite3.Connection,
         session_id: str,
         msg_idx: int,
         role: str,
         timestamp: str,
         content: str,
+        vectors: list[array] | None,
     ) -> None:
-        conn = self._connect()
-        try:
-            self._ensure_schema(conn)
-            conn.execute(
-                "INSERT INTO messages (session_id, msg_idx, role, timestamp, content) "
-                "VALUES (?, ?, ?, ?, ?)",
-                (session_id, msg_idx, role, timestamp, content),
-            )
-        finally:
-            conn.close()
+        self._ensure_schema(conn)
+        self._insert_rows(conn, session_id, [(msg_idx, role, timestamp, content)], vectors)
 
     def _search_sync(
         self,
+        conn: sqlite3.Connection,
+        query: str,
+        session_id: str | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        cur = conn.cursor()
+        # bm25() ranking — lower is more relevant
+        if session_id:
+            cur.execute(
+                "SELECT session_id, msg_idx, role, timestamp, content, bm25(messages) AS rank "
+                "FROM messages WHERE messages MATCH ? AND session_id = ? "
+                "ORDER BY rank LIMIT ?",
+                (query, session_id, limit),
+            )
+        else:
+            cur.execute(
+                "SELECT session_id, msg_idx, role, timestamp, content, bm25(messages) AS rank "
+                "FROM messages WHERE messages MATCH ? "
+                "ORDER BY rank LIMIT ?",
+                (query, limit),
+            )
+        rows = cur.fetchall()
+        return [
+            {
+                "session_id": r[0],
+                "msg_idx": r[1],
+                "role": r[2],
+                "timestamp": r[3],
+                "content": r[4],
+                "score": r[5],
+            }
+            for r in rows
+        ]
+
+    def _lexical_search_sync(
+        self,
+        conn: sqlite3.Connection,
         query: str,
         session_id: str | None,
         limit: int,
     ) -> list[dict[str, Any]]:
-        if not os.path.isfile(self.db_path):
-            return []
-        conn = self._connect()
         try:
-            cur = conn.cursor()
-            # bm25() ranking — lower is more relevant
-            if session_id:
-                cur.execute(
-                    "SELECT session_id, msg_idx, role, timestamp, content, bm25(messages) AS rank "
-                    "FROM messages WHERE messages MATCH ? AND session_id = ? "
-                    "ORDER BY rank LIMIT ?",
-                    (query, session_id, limit),
-                )
-            else:
-                cur.execute(
-                    "SELECT session_id, msg_idx, role, timestamp, content, bm25(messages) AS rank "
-                    "FROM messages WHERE messages MATCH ? "
-                    "ORDER BY rank LIMIT ?",
-                    (query, limit),
+            return self._search_sync(conn, query, session_id, limit)
+        except sqlite3.OperationalError as e:
+            # Common cause: malformed FTS query syntax. Retry with its bare words.
+            logger.debug("FTS recall search syntax error for query %r: %s", query, e)
+            fallback = _terms_query(query)
+            if not fallback:
+                return []
+            return self._search_sync(conn, fallback, session_id, limit)
+
+    def _dense_search_sync(
+        self,
+        conn: sqlite3.Connection,
+        query: str,
+        session_id: str | None,
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Messages whose vectors are most similar to the query's, best first."""
+        assert self._embedder is not None and self._vectors is not None
+        name = self._embedder.name
+        rows: list[int] | None = None
+        if session_id:
+            rows = [
+                r
+                for (r,) in conn.execute(
+                    "SELECT row FROM vectors WHERE embedder = ? AND session_id = ?",
+                    (name, session_id),
                 )
-            rows = cur.fetchall()
-            return [
+            ]
+            if not rows:
+                return []
+        query_vec = self._embedder.embed([query])[0]
+        # Extra candidates make up for rows a reindex or delete left unreferenced.
+        top = [
+            (row, score)
+            for row, score in self._vectors.top_k(query_vec, 2 * limit, rows)
+            if score >= self._embedder.min_score
+        ]
+        if not top:
+            return []
+
+        marks = ",".join("?" * len(top))
+        msg_rowids = dict(
+            conn.execute(
+                f"SELECT row, msg_rowid FROM vectors WHERE embedder = ? AND row IN ({marks})",
+                (name, *(row for row, _ in top)),
+            ).fetchall()
+        )
+        if not msg_rowids:
+            return []
+        marks = ",".join("?" * len(msg_rowids))
+        messages = {
+            r[0]: r[1:]
+            for r in conn.execute(
+                "SELECT rowid, session_id, msg_idx, role, timestamp, content "
+                f"FROM messages WHERE rowid IN ({marks})",
+                tuple(msg_rowids.values()),
+            )
+        }
+        hits = []
+        for row, score in top:
+            message = messages.get(msg_rowids.get(row, -1))
+            if message is None:
+                continue
+            hits.append(
                 {
-                    "session_id": r[0],
-                    "msg_idx": r[1],
-                    "role": r[2],
-                    "timestamp": r[3],
-                    "content": r[4],
-                    "score": r[5],
+                    "session_id": message[0],
+                    "msg_idx": message[1],
+                    "role": message[2],
+                    "timestamp": message[3],
+                    "content": message[4],
+                    "score": score,
                 }
-                for r in rows
-            ]
-        finally:
-            conn.close()
+            )
+        return hits[:limit]
 
-    def _delete_session_sync(self, session_id: str) -> int:
-        if not os.path.isfile(self.db_path):
-            return 0
-        conn = self._connect()
-        try:
-            self._ensure_schema(conn)
-            cur = conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
-            return cur.rowcount or 0
-        finally:
-            conn.close()
+    def _delete_session_sync(self, conn: sqlite3.Connection, session_id: str) -> int:
+        self._ensure_schema(conn)
+        cur = conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        conn.execute("DELETE FROM vectors WHERE session_id = ?", (session_id,))
+        return cur.rowcount or 0
 
     # ---- async API -------------------------------------------------------
 
+    async def _embed(self, texts: list[str]) -> list[array] | None:
+        """Vectors of ``texts``, computed off the event loop and the writer thread."""
+        if self._embedder is None or not texts:
+            return None
+        return await asyncio.to_thread(self._embedder.embed, texts)
+
     async def reindex_session(
         self,
         session_id: str,
@@ -190,17 +464,71 @@ class RecallIndex:
         scaffolding). Failures are logged but not raised — recall is
         non-critical.
         """
-        rows: list[tuple[int, str, str, str]] = []
-        for idx, msg in enumerate(messages):
-            content = _flatten_content(msg.content)
-            if not content.strip():
-                continue
-            rows.append((idx, msg.role, timestamp, content))
+        rows = _rows(messages, timestamp)
         try:
-            await asyncio.to_thread(self._reindex_session_sync, session_id, rows)
+            vectors = await self._embed(_texts(rows))
+            await self._pool.write(
+                self.db_path, self._reindex_session_sync, session_id, rows, vectors
+            )
         except Exception:
             logger.warning("FTS recall reindex failed for session %s", session_id, exc_info=True)
 
+    async def append_messages(
+        self,
+        session_id: str,
+        messages: Iterable[LLMMessage],
+        *,
+        timestamp: str = "",
+    ) -> None:
+        """Index *messages* as the next messages of *session_id*.
+
+        They are numbered after the messages already indexed for the
+        session. Appends that arrive while a batch is being written are
+        inserted together in the next transaction. Failures are logged but
+        not raised.
+        """
+        rows = _rows(messages, timestamp)
+        if not rows:
+            return
+        try:
+            vectors = await self._embed(_texts(rows))
+            future = asyncio.get_running_loop().create_future()
+            self._pending.append((session_id, rows, vectors, future))
+            if self._flusher is None or self._flusher.done():
+                self._flusher = asyncio.create_task(self._flush())
+            await future
+        except Exception:
+            logger.warning("FTS recall append failed for session %s", session_id, exc_info=True)
+
+    async def _flush(self) -> None:
+        while self._pending:
+            batch, self._pending = self._pending, []
+            error: Exception | None = None
+            try:
+                await self._pool.write(
+                    self.db_path,
+                    self._append_batch_sync,
+                    [(session_id, rows, vectors) for session_id, rows, vectors, _ in batch],
+                )
+            except Exception as e:
+                error = e
+            for *_, future in batch:
+                if future.done():
+                    continue
+                if error is not None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(None)
+
+    async def optimize(self) -> None:
+        """Merge all FTS5 segments into one (also done periodically on append)."""
+        if not os.path.isfile(self.db_path):
+            return
+        try:
+            await self._pool.write(self.db_path, self._optimize_sync)
+        except Exception:
+            logger.warning("FTS recall optimize failed", exc_info=True)
+
     async def add_message(
         self,
         session_id: str,
@@ -213,13 +541,16 @@ class RecallIndex:
         if not content.strip():
             return
         try:
-            await asyncio.to_thread(
+            vectors = await self._embed([content])
+            await self._pool.write(
+                self.db_path,
                 self._add_message_sync,
                 session_id,
                 msg_idx,
                 message.role,
                 timestamp,
                 content,
+                vectors,
             )
         except Exception:
             logger.warning("FTS recall add_message failed", exc_info=True)
@@ -233,23 +564,41 @@ class RecallIndex:
     ) -> list[dict[str, Any]]:
         """Run an FTS5 MATCH query, scoped to *session_id* if given.
 
-        Returns at most *limit* hits ordered by bm25 relevance.
+        A query FTS5 cannot parse is retried as its bare words.
+        Without an embedder, returns at most *limit* hits ordered by bm25
+        relevance (``score`` is bm25, lower is better). With one, the bm25
+        and vector-similarity rankings are fused by reciprocal rank
+        (``score`` is the fused score, higher is better).
         """
-        if not query or not query.strip():
+        if not query or not query.strip() or not os.path.isfile(self.db_path):
             return []
+        candidates = limit if self._embedder is None else limit * CANDIDATES_PER_HIT
         try:
-            return await asyncio.to_thread(self._search_sync, query, session_id, limit)
+            lexical = await self._pool.read(
+                self.db_path, self._lexical_search_sync, query, session_id, candidates
+            )
         except sqlite3.OperationalError as e:
-            # Common cause: malformed FTS query syntax. Surface a clean empty result.
-            logger.debug("FTS recall search syntax error for query %r: %s", query, e)
-            return []
+            logger.debug("FTS recall search failed for query %r: %s", query, e)
+            lexical = []
         except Exception:
             logger.warning("FTS recall search failed", exc_info=True)
-            return []
+            lexical = []
+        if self._embedder is None:
+            return lexical
+        try:
+            dense = await self._pool.read(
+                self.db_path, self._dense_search_sync, query, session_id, candidates
+            )
+        except Exception:
+            logger.warning("Vector recall search failed", exc_info=True)
+            dense = []
+        return _fuse([lexical, dense], limit)
 
     async def delete_session(self, session_id: str) -> int:
+        if not os.path.isfile(self.db_path):
+            return 0
         try:
-            return await asyncio.to_thread(self._delete_session_sync, session_id)
+            return await self._pool.write(self.db_path, self._delete_session_sync, session_id)
         except Exception:
             logger.warning("FTS recall delete_session failed", exc_info=True)
             return 0
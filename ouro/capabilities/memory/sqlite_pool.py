@@ -0,0 +1,156 @@
+"""Shared SQLite connections for the memory databases.
+
+One process-wide pool serves every memory database (``sessions.db`` of
+``SQLiteMemoryStore``, ``recall.db`` of ``RecallIndex``):
+
+- writes run on a single long-lived writer thread with one connection per
+  database, so writers in the process never contend for SQLite's write
+  lock and no connection is opened per call;
+- reads run in ``asyncio.to_thread`` on per-thread connections, which WAL
+  mode lets proceed while a write is in progress;
+- ``submit`` queues small writes per database: those submitted while a
+  batch is being committed (by any caller in the process, e.g. every bot
+  conversation's ``SQLiteMemoryStore``) go into the next transaction
+  together, one savepoint each.
+
+Connections are opened with ``isolation_level=None``; callers issue their
+own ``BEGIN``/``COMMIT``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+_Op = Callable[[sqlite3.Connection], Any]
+# Ops waiting for the next batch, keyed by (database path, event loop).
+_QueueKey = tuple[str, asyncio.AbstractEventLoop]
+
+
+class SQLitePool:
+    """Writer thread plus per-thread reader connections, keyed by database path."""
+
+    def __init__(self) -> None:
+        self._writer: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+        # (thread id, database path) -> connection
+        self._connections: dict[tuple[int, str], sqlite3.Connection] = {}
+        self._queues: dict[_QueueKey, list[tuple[_Op, asyncio.Future]]] = {}
+        self._flushers: set[asyncio.Task] = set()
+
+    def _connection(self, path: str) -> sqlite3.Connection:
+        key = (threading.get_ident(), path)
+        conn = self._connections.get(key)
+        if conn is None:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            # Only ever used by the thread in ``key``; check_same_thread is off
+            # so ``close`` can run from another thread.
+            conn = sqlite3.connect(
+                path, isolation_level=None, timeout=10.0, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._lock:
+                self._connections[key] = conn
+        return conn
+
+    def _run(self, path: str, fn: Callable[..., T], args: tuple[Any, ...]) -> T:
+        return fn(self._connection(path), *args)
+
+    async def write(self, path: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(conn, *args)`` on the writer thread's connection to ``path``."""
+        with self._lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="ouro-sqlite-writer"
+                )
+            writer = self._writer
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(writer, self._run, path, fn, args)
+
+    async def submit(self, path: str, op: Callable[[sqlite3.Connection], T]) -> T:
+        """Run ``op(conn)`` in the next batched write transaction on ``path``.
+
+        Ops are applied in submission order under their own savepoint, so a
+        failing op raises to its caller without rolling back the others.
+        """
+        loop = asyncio.get_running_loop()
+        key = (path, loop)
+        future = loop.create_future()
+        queue = self._queues.get(key)
+        if queue is None:
+            queue = self._queues[key] = []
+            flusher = loop.create_task(self._flush(key, queue))
+            self._flushers.add(flusher)
+            flusher.add_done_callback(self._flushers.discard)
+        queue.append((op, future))
+        return await future
+
+    async def _flush(self, key: _QueueKey, queue: list[tuple[_Op, asyncio.Future]]) -> None:
+        try:
+            while queue:
+                batch = list(queue)
+                queue.clear()
+                try:
+                    results = await self.write(key[0], _apply_batch, [op for op, _ in batch])
+                except Exception as e:
+                    results = [e] * len(batch)
+                for (_, future), result in zip(batch, results, strict=True):
+                    if future.done():
+                        continue
+                    if isinstance(result, Exception):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            del self._queues[key]
+
+    async def read(self, path: str, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(conn, *args)`` on a reader thread's connection to ``path``."""
+        return await asyncio.to_thread(self._run, path, fn, args)
+
+    def close(self, path: str | None = None) -> None:
+        """Close the connections to ``path`` (default: all, and the writer thread)."""
+        with self._lock:
+            keys = [k for k in self._connections if path is None or k[1] == path]
+            conns = [self._connections.pop(k) for k in keys]
+            writer = None
+            if path is None:
+                writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.shutdown(wait=True)
+        for conn in conns:
+            conn.close()
+
+
+def _apply_batch(conn: sqlite3.Connection, ops: list[_Op]) -> list[Any]:
+    results: list[Any] = []
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for op in ops:
+            conn.execute("SAVEPOINT op")
+            try:
+                results.append(op(conn))
+            except Exception as e:
+                conn.execute("ROLLBACK TO op")
+                results.append(e)
+            conn.execute("RELEASE op")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+    return results
+
+
+_pool = SQLitePool()
+
+
+def get_sqlite_pool() -> SQLitePool:
+    """The process-wide pool shared by the memory databases."""
+    return _pool
@@ -1,6 +1,15 @@
 """Memory store implementations for session persistence."""
 
+from .factory import create_memory_store
+from .journal_memory_store import JournalMemoryStore
 from .memory_store import MemoryStore
+from .sqlite_memory_store import SQLiteMemoryStore
 from .yaml_file_memory_store import YamlFileMemoryStore
 
-__all__ = ["MemoryStore", "YamlFileMemoryStore"]
+__all__ = [
+    "JournalMemoryStore",
+    "MemoryStore",
+    "SQLiteMemoryStore",
+    "YamlFileMemoryStore",
+    "create_memory_store",
+]
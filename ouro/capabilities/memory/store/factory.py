@@ -0,0 +1,29 @@
+"""Select the session store backend from configuration."""
+
+from typing import Optional
+
+from ouro.config import Config
+
+from .journal_memory_store import JournalMemoryStore
+from .memory_store import MemoryStore
+from .sqlite_memory_store import SQLiteMemoryStore
+from .yaml_file_memory_store import YamlFileMemoryStore
+
+MEMORY_STORE_BACKENDS = ("journal", "yaml", "sqlite")
+
+
+def create_memory_store(sessions_dir: Optional[str] = None) -> MemoryStore:
+    """Create the store named by ``MEMORY_STORE`` for ``sessions_dir``.
+
+    ``journal`` and ``yaml`` share the session directories: ``yaml``
+    ignores journal frames not yet folded into ``session.yaml``, so run
+    ``session_manager.py compact`` before switching from ``journal`` to
+    ``yaml``.  ``sqlite`` keeps its own ``sessions.db``; copy existing
+    sessions into it with ``session_manager.py to-sqlite``.
+    """
+    backend = Config.MEMORY_STORE.lower()
+    if backend == "yaml":
+        return YamlFileMemoryStore(sessions_dir=sessions_dir)
+    if backend == "sqlite":
+        return SQLiteMemoryStore(sessions_dir=sessions_dir)
+    return JournalMemoryStore(sessions_dir=sessions_dir)
@@ -0,0 +1,226 @@
+"""Append-only journal persistence backend.
+
+Same directory layout as ``YamlFileMemoryStore``, plus a journal:
+
+    .ouro/sessions/YYYY-MM-DD_<uuid[:8]>/session.yaml   (snapshot)
+    .ouro/sessions/YYYY-MM-DD_<uuid[:8]>/journal.jsonl  (messages since)
+
+Appending a message writes one JSON line to ``journal.jsonl`` instead of
+rewriting ``session.yaml``, so persisting a session costs O(new messages)
+rather than O(session) per message.  Every frame carries a sequence
+number; the snapshot records the last one it contains (``journal_seq``),
+and loading replays only the newer frames.  Whole-state writes
+(``save_memory``, ``replace_messages``) and every ``snapshot_every``
+appended frames write a fresh snapshot and drop the journal.
+
+Existing YAML sessions need no migration: a ``session.yaml`` without a
+journal is simply a snapshot with nothing to replay.  ``compact_session``
+folds the journal back into ``session.yaml``, which makes a session
+readable by ``YamlFileMemoryStore`` again.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from ouro.capabilities.memory.serialization import serialize_message
+from ouro.capabilities.memory.store.yaml_file_memory_store import YamlFileMemoryStore
+from ouro.config import Config
+from ouro.core.llm.message_types import LLMMessage
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILE = "journal.jsonl"
+
+# When to fsync: after every append, only when a snapshot is written, or never
+# (leave it to the OS; a process crash loses nothing, a power loss may).
+FSYNC_POLICIES = ("always", "snapshot", "never")
+
+
+class JournalMemoryStore(YamlFileMemoryStore):
+    """YAML snapshot plus append-only JSONL journal per session.
+
+    Writes are serialized per session rather than store-wide, so sessions
+    of different conversations do not wait on each other.
+    """
+
+    def __init__(
+        self,
+        sessions_dir: Optional[str] = None,
+        *,
+        fsync: Optional[str] = None,
+        snapshot_every: Optional[int] = None,
+    ):
+        """Initialize the journal backend.
+
+        Args:
+            sessions_dir: Path to sessions directory (default: .ouro/sessions/)
+            fsync: One of ``FSYNC_POLICIES`` (default: ``MEMORY_JOURNAL_FSYNC``)
+            snapshot_every: Journal frames after which a snapshot is written
+                (default: ``MEMORY_JOURNAL_SNAPSHOT_EVERY``)
+        """
+        super().__init__(sessions_dir)
+        fsync = (fsync or Config.MEMORY_JOURNAL_FSYNC).lower()
+        if fsync not in FSYNC_POLICIES:
+            logger.warning(f"Unknown journal fsync policy '{fsync}', using 'snapshot'")
+            fsync = "snapshot"
+        self.fsync = fsync
+        self.snapshot_every = max(
+            1,
+            snapshot_every if snapshot_every is not None else Config.MEMORY_JOURNAL_SNAPSHOT_EVERY,
+        )
+        self._locks: Dict[str, asyncio.Lock] = {}
+        # dir_name -> last journal sequence number, and the one the snapshot holds.
+        self._seq: Dict[str, int] = {}
+        self._snapshot_seq: Dict[str, int] = {}
+
+    def _journal_path(self, dir_name: str) -> str:
+        """Get path to journal.jsonl within a session directory."""
+        return os.path.join(self.sessions_dir, dir_name, JOURNAL_FILE)
+
+    def _session_lock(self, dir_name: str) -> asyncio.Lock:
+        lock = self._locks.get(dir_name)
+        if lock is None:
+            lock = self._locks[dir_name] = asyncio.Lock()
+        return lock
+
+    def _note_seq(self, dir_name: str, seq: int, snapshot_seq: Optional[int] = None) -> None:
+        # Readers run unlocked; never move the counters backwards.
+        self._seq[dir_name] = max(self._seq.get(dir_name, 0), seq)
+        if snapshot_seq is not None:
+            self._snapshot_seq[dir_name] = max(self._snapshot_seq.get(dir_name, 0), snapshot_seq)
+
+    async def _load_session_data(self, dir_name: str) -> Optional[Dict[str, Any]]:
+        """Load the snapshot and replay the journal frames written after it."""
+        data = await super()._load_session_data(dir_name)
+        if not data:
+            return data
+
+        snapshot_seq = seq = int(data.get("journal_seq") or 0)
+        for frame in await asyncio.to_thread(self._read_frames, dir_name):
+            if frame["seq"] <= seq:
+                continue
+            data.setdefault(frame["field"], []).append(frame["message"])
+            data["updated_at"] = frame["at"]
+            seq = frame["seq"]
+        data["journal_seq"] = seq
+        self._note_seq(dir_name, seq, snapshot_seq)
+        return data
+
+    def _read_frames(self, dir_name: str) -> List[Dict[str, Any]]:
+        path = self._journal_path(dir_name)
+        if not os.path.exists(path):
+            return []
+        frames = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    frame = json.loads(line)
+                    frame["seq"] = int(frame["seq"])
+                except (ValueError, KeyError, TypeError):
+                    # A torn last line from a crash mid-append.
+                    logger.warning(f"Skipping unreadable journal frame in {dir_name}")
+                    continue
+                frames.append(frame)
+        return frames
+
+    async def _save_session_data(self, dir_name: str, data: Dict[str, Any]) -> None:
+        """Write ``data`` as the new snapshot and drop the journal it covers."""
+        seq = int(data.get("journal_seq") or 0)
+        data["journal_seq"] = seq
+        await asyncio.to_thread(self._write_snapshot, dir_name, data)
+        self._note_seq(dir_name, seq, seq)
+
+    def _write_snapshot(self, dir_name: str, data: Dict[str, Any]) -> None:
+        os.makedirs(os.path.join(self.sessions_dir, dir_name), exist_ok=True)
+        yaml_path = self._session_yaml_path(dir_name)
+        tmp_path = yaml_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self._render_session(data))
+            if self.fsync != "never":
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, yaml_path)
+        # Frames up to journal_seq are in the snapshot; a crash before this
+        # removal only leaves frames that loading skips.
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self._journal_path(dir_name))
+
+    async def _append(self, session_id: str, entries: List[Tuple[LLMMessage, int]]) -> None:
+        """Append ``(message, tokens)`` entries as journal frames."""
+        resolved = await self._resolve_session(session_id)
+        if not resolved:
+            logger.warning(f"Session {session_id} not found")
+            return
+        full_id, dir_name = resolved
+
+        async with self._session_lock(dir_name):
+            if dir_name not in self._seq and not await self._load_session_data(dir_name):
+                logger.warning(f"Session {session_id} not found")
+                return
+
+            seq = self._seq[dir_name]
+            now = datetime.now().isoformat()
+            lines = []
+            for message, tokens in entries:
+                seq += 1
+                msg_data = serialize_message(message)
+                msg_data["tokens"] = tokens
+                frame = {
+                    "seq": seq,
+                    "at": now,
+                    "field": "system_messages" if message.role == "system" else "messages",
+                    "message": msg_data,
+                }
+                lines.append(json.dumps(frame, ensure_ascii=False) + "\n")
+
+            await asyncio.to_thread(self._write_frames, dir_name, "".join(lines))
+            self._note_seq(dir_name, seq)
+            await self._index_appended(full_id, entries, now)
+
+            if seq - self._snapshot_seq.get(dir_name, 0) >= self.snapshot_every:
+                await self._compact(dir_name)
+
+    def _write_frames(self, dir_name: str, content: str) -> None:
+        with open(self._journal_path(dir_name), "a", encoding="utf-8") as f:
+            f.write(content)
+            if self.fsync == "always":
+                f.flush()
+                os.fsync(f.fileno())
+
+    async def _compact(self, dir_name: str) -> None:
+        data = await self._load_session_data(dir_name)
+        if data:
+            await self._save_session_data(dir_name, data)
+
+    async def compact_session(self, session_id: str) -> bool:
+        """Fold a session's journal into its snapshot.
+
+        Args:
+            session_id: Full or prefix of session UUID
+
+        Returns:
+            True if the session was found
+        """
+        dir_name = await self._resolve_session_dir(session_id)
+        if not dir_name:
+            return False
+        async with self._session_lock(dir_name):
+            await self._compact(dir_name)
+        return True
+
+    async def delete_session(self, session_id: str) -> bool:
+        dir_name = await self._resolve_session_dir(session_id)
+        if not dir_name:
+            return False
+        async with self._session_lock(dir_name):
+            deleted = await super().delete_session(session_id)
+            self._seq.pop(dir_name, None)
+            self._snapshot_seq.pop(dir_name, None)
+        return deleted
@@ -1,5 +1,6 @@
 """Abstract base class for memory persistence backends."""
 
+import sys
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
@@ -34,6 +35,19 @@ class MemoryStore(ABC):
             tokens: Token count for this message
         """
 
+    async def save_messages(self, session_id: str, messages: List[LLMMessage]) -> None:
+        """Append several messages to a session in one write.
+
+        The default saves them one by one; backends override it to
+        persist the batch at once.
+
+        Args:
+            session_id: Session ID
+            messages: Messages to append, in order
+        """
+        for message in messages:
+            await self.save_message(session_id, message)
+
     @abstractmethod
     async def save_memory(
         self,
@@ -41,6 +55,7 @@ class MemoryStore(ABC):
         system_messages: List[LLMMessage],
         messages: List[LLMMessage],
         token_stats: Optional[Dict[str, Any]] = None,
+        summaries: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Save complete memory state (replaces existing data).
 
@@ -49,6 +64,7 @@ class MemoryStore(ABC):
             system_messages: List of system messages
             messages: List of regular messages
             token_stats: Optional token usage statistics to persist
+            summaries: Optional compaction summary hierarchy to persist
         """
 
     @abstractmethod
@@ -76,7 +92,9 @@ class MemoryStore(ABC):
             {
                 "system_messages": [LLMMessage],
                 "messages": [LLMMessage],
-                "stats": {"created_at": str, ...}
+                "stats": {"created_at": str, ...},
+                "token_stats": dict | None,
+                "summaries": dict | None,
             }
         """
 
@@ -113,3 +131,30 @@ class MemoryStore(ABC):
         Returns:
             Session statistics or None if not found
         """
+
+    async def find_latest_session(self) -> Optional[str]:
+        """Find the most recently updated session ID.
+
+        Returns:
+            Session ID or None if no sessions exist
+        """
+        sessions = await self.list_sessions(limit=1)
+        if sessions:
+            return sessions[0]["id"]
+        return None
+
+    async def find_session_by_prefix(self, prefix: str) -> Optional[str]:
+        """Find a session by ID prefix.
+
+        The default scans ``list_sessions``; backends with an index
+        override it.
+
+        Args:
+            prefix: Prefix of session UUID
+
+        Returns:
+            Full session ID, or None if no session or several match
+        """
+        sessions = await self.list_sessions(limit=sys.maxsize)
+        matches = [s["id"] for s in sessions if s["id"].startswith(prefix)]
+        return matches[0] if len(matches) == 1 else None
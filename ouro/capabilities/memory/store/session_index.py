@@ -0,0 +1,146 @@
+"""Sidecar metadata index for the file-backed session stores.
+
+``<sessions_dir>/.index.jsonl`` has one line per session change: the
+session's directory, timestamps, message counts and preview, or a
+tombstone for a deleted session.  Replaying it (the last line of a session
+wins) answers ``list_sessions``, sorting, pagination and prefix lookup
+without opening any ``session.yaml``.
+
+Every write appends one line; the file is rewritten compactly once it holds
+``COMPACT_RATIO`` times more lines than sessions, on load and on writes (so
+a long-running process does not grow it without bound).  A missing index is
+rebuilt by the store from the session directories.
+"""
+
+import asyncio
+import heapq
+import json
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = ".index.jsonl"
+PREVIEW_CHARS = 100
+
+
+def preview_of(messages: Iterable[Dict[str, Any]]) -> str:
+    """First user message with text content, truncated, as the session preview."""
+    for msg in messages:
+        if msg.get("role") == "user" and isinstance(msg.get("content"), str):
+            return msg["content"][:PREVIEW_CHARS]
+    return ""
+
+
+class SessionIndex:
+    """Session ID -> metadata entry, persisted as an append-only JSONL log.
+
+    Entries hold ``id``, ``dir``, ``created_at``, ``updated_at``,
+    ``message_count``, ``system_message_count`` and ``preview``.
+    """
+
+    COMPACT_RATIO = 4
+
+    def __init__(self, sessions_dir: str):
+        self.path = os.path.join(sessions_dir, INDEX_FILE)
+        self.entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lines = 0
+        # Whether ``entries`` holds every session in the file, so that a
+        # rewrite from it loses nothing (not after a ``put`` before ``load``).
+        self._complete = False
+        self._lock = asyncio.Lock()
+
+    async def load(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """Load the index; None if there is no index file yet."""
+        if self.entries is None:
+            async with self._lock:
+                if self.entries is None:
+                    self.entries = await asyncio.to_thread(self._load_sync)
+                    self._complete = self.entries is not None
+                    await self._compact_if_needed()
+        return self.entries
+
+    async def _compact_if_needed(self) -> None:
+        """Rewrite the file once it is mostly superseded lines (lock held)."""
+        if (
+            self._complete
+            and self.entries is not None
+            and self._lines > self.COMPACT_RATIO * max(len(self.entries), 16)
+        ):
+            await asyncio.to_thread(self._rewrite_sync)
+
+    def _load_sync(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        if not os.path.exists(self.path):
+            return None
+        entries: Dict[str, Dict[str, Any]] = {}
+        lines = 0
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                lines += 1
+                try:
+                    record = json.loads(line)
+                    session_id = record["id"]
+                except (ValueError, KeyError, TypeError):
+                    logger.warning("Skipping unreadable session index line")
+                    continue
+                if record.get("deleted"):
+                    entries.pop(session_id, None)
+                else:
+                    entries[session_id] = record
+        self._lines = lines
+        return entries
+
+    def _rewrite_sync(self) -> None:
+        entries = self.entries or {}
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in entries.values():
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        os.replace(tmp_path, self.path)
+        self._lines = len(entries)
+
+    def _append_sync(self, record: Dict[str, Any]) -> None:
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._lines += 1
+
+    async def replace_all(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Replace the whole index (after a rebuild)."""
+        async with self._lock:
+            self.entries = entries
+            self._complete = True
+            await asyncio.to_thread(self._rewrite_sync)
+
+    async def put(self, entry: Dict[str, Any]) -> None:
+        """Add or update one session's entry."""
+        async with self._lock:
+            if self.entries is None:
+                self.entries = {}
+            self.entries[entry["id"]] = entry
+            await asyncio.to_thread(self._append_sync, entry)
+            await self._compact_if_needed()
+
+    async def remove(self, session_id: str) -> None:
+        async with self._lock:
+            if self.entries is not None and self.entries.pop(session_id, None) is not None:
+                await asyncio.to_thread(self._append_sync, {"id": session_id, "deleted": True})
+                await self._compact_if_needed()
+
+    def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return (self.entries or {}).get(session_id)
+
+    def match(self, prefix: str) -> List[str]:
+        """Session IDs starting with ``prefix``."""
+        return [sid for sid in self.entries or {} if sid.startswith(prefix)]
+
+    def page(self, limit: int, offset: int) -> List[Dict[str, Any]]:
+        """Entries by ``updated_at`` descending, ``offset``..``offset + limit``."""
+        newest = heapq.nlargest(
+            offset + limit, (self.entries or {}).values(), key=lambda e: e.get("updated_at", "")
+        )
+        return newest[offset:]
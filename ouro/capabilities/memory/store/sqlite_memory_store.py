@@ -0,0 +1,400 @@
+"""SQLite persistence backend.
+
+All sessions live in one WAL-mode database, ``<sessions_dir>/sessions.db``:
+
+- ``sessions``: one row per session (timestamps, metadata, summaries);
+- ``messages``: one row per message, keyed by ``(session_id, seq)``;
+  ``kind`` is ``system`` or ``message`` and ``data`` the serialized message;
+- ``token_stats``: the session's token usage counters.
+
+Appending a message inserts rows instead of rewriting the session.  Writes
+go through ``SQLitePool.submit``, whose queue is per database, not per
+store: writes queued while a commit is in flight (e.g. by the stores of
+other bot conversations) go into the next transaction together, one
+savepoint each, so one failing write does not roll back the others.  A
+session's writes are applied in the order they were made, and never wait
+on another session's file I/O.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ouro.capabilities.memory.serialization import (
+    deserialize_message,
+    serialize_message,
+)
+from ouro.capabilities.memory.sqlite_pool import SQLitePool, get_sqlite_pool
+from ouro.capabilities.memory.store.memory_store import MemoryStore
+from ouro.core.llm.message_types import LLMMessage
+from ouro.core.runtime import get_sessions_dir
+
+logger = logging.getLogger(__name__)
+
+DB_NAME = "sessions.db"
+
+TOKEN_STAT_KEYS = (
+    "total_input_tokens",
+    "total_output_tokens",
+    "total_cache_read_tokens",
+    "total_cache_creation_tokens",
+    "compression_savings",
+    "compression_cost",
+)
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS sessions (
+    id          TEXT PRIMARY KEY,
+    created_at  TEXT NOT NULL,
+    updated_at  TEXT NOT NULL,
+    metadata    TEXT,
+    summaries   TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_updated ON sessions(updated_at);
+CREATE TABLE IF NOT EXISTS messages (
+    session_id  TEXT NOT NULL,
+    seq         INTEGER NOT NULL,
+    kind        TEXT NOT NULL,
+    role        TEXT NOT NULL,
+    data        TEXT NOT NULL,
+    tokens      INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (session_id, seq)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS token_stats (
+    session_id  TEXT PRIMARY KEY,
+    {", ".join(f"{key} REAL NOT NULL DEFAULT 0" for key in TOKEN_STAT_KEYS)}
+);
+"""
+
+# Counts and first-user-message preview per session, for list_sessions.
+_LIST_SQL = """
+SELECT s.id, s.created_at, s.updated_at,
+    (SELECT COUNT(*) FROM messages m WHERE m.session_id = s.id AND m.kind = 'message'),
+    (SELECT COUNT(*) FROM messages m WHERE m.session_id = s.id AND m.kind = 'system'),
+    (SELECT substr(json_extract(m.data, '$.content'), 1, 100) FROM messages m
+        WHERE m.session_id = s.id AND m.kind = 'message' AND m.role = 'user'
+            AND json_type(m.data, '$.content') = 'text'
+        ORDER BY m.seq LIMIT 1)
+FROM sessions s
+ORDER BY s.updated_at DESC
+LIMIT ? OFFSET ?
+"""
+
+_Op = Callable[[sqlite3.Connection], Any]
+
+
+def _kind(message: LLMMessage) -> str:
+    return "system" if message.role == "system" else "message"
+
+
+def _stat(value: float) -> Any:
+    return int(value) if float(value).is_integer() else value
+
+
+class SQLiteMemoryStore(MemoryStore):
+    """SQLite persistence backend with batched, ordered writes."""
+
+    def __init__(self, sessions_dir: Optional[str] = None, *, pool: Optional[SQLitePool] = None):
+        """Initialize SQLite backend.
+
+        Args:
+            sessions_dir: Directory holding sessions.db (default: .ouro/sessions/)
+            pool: Connection pool (default: the process-wide one, shared with
+                the recall index)
+        """
+        self.sessions_dir = sessions_dir or get_sessions_dir()
+        self.db_path = os.path.join(self.sessions_dir, DB_NAME)
+        self._pool = pool or get_sqlite_pool()
+        self._schema_ready = False
+
+    # ---- write queue -----------------------------------------------------
+
+    async def _ensure_schema(self) -> None:
+        if not self._schema_ready:
+            await self._pool.write(self.db_path, lambda conn: conn.executescript(_SCHEMA))
+            self._schema_ready = True
+
+    async def _submit(self, op: _Op) -> Any:
+        """Queue ``op(conn)`` for the database's next batch and wait for its commit."""
+        await self._ensure_schema()
+        return await self._pool.submit(self.db_path, op)
+
+    async def _read(self, fn: Callable[..., Any], *args: Any) -> Any:
+        await self._ensure_schema()
+        return await self._pool.read(self.db_path, fn, *args)
+
+    # ---- sync helpers (run on a pool thread) -----------------------------
+
+    @staticmethod
+    def _resolve(conn: sqlite3.Connection, session_id: str) -> Optional[str]:
+        """Resolve a full ID or unique prefix to the session ID."""
+        row = conn.execute("SELECT id FROM sessions WHERE id = ?", (session_id,)).fetchone()
+        if row:
+            return row[0]
+        rows = conn.execute(
+            "SELECT id FROM sessions WHERE substr(id, 1, ?) = ? LIMIT 2",
+            (len(session_id), session_id),
+        ).fetchall()
+        if len(rows) > 1:
+            logger.warning(f"Ambiguous session prefix '{session_id}'")
+        return rows[0][0] if len(rows) == 1 else None
+
+    @staticmethod
+    def _insert_messages(
+        conn: sqlite3.Connection, session_id: str, entries: List[Tuple[LLMMessage, int]]
+    ) -> None:
+        (last,) = conn.execute(
+            "SELECT COALESCE(MAX(seq), 0) FROM messages WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        conn.executemany(
+            "INSERT INTO messages (session_id, seq, kind, role, data, tokens) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    session_id,
+                    last + i,
+                    _kind(message),
+                    message.role,
+                    json.dumps(serialize_message(message), ensure_ascii=False),
+                    tokens,
+                )
+                for i, (message, tokens) in enumerate(entries, 1)
+            ],
+        )
+
+    @classmethod
+    def _write_memory(
+        cls,
+        conn: sqlite3.Connection,
+        session_id: str,
+        system_messages: List[LLMMessage],
+        messages: List[LLMMessage],
+        token_stats: Optional[Dict[str, Any]],
+        summaries: Optional[Dict[str, Any]],
+    ) -> None:
+        conn.execute("DELETE FROM messages WHERE session_id = ?", (session_id,))
+        cls._insert_messages(
+            conn, session_id, [(m, 0) for m in system_messages] + [(m, 0) for m in messages]
+        )
+        if token_stats is not None:
+            conn.execute(
+                f"INSERT OR REPLACE INTO token_stats (session_id, {', '.join(TOKEN_STAT_KEYS)}) "
+                f"VALUES (?{', ?' * len(TOKEN_STAT_KEYS)})",
+                (session_id, *(token_stats.get(key, 0) for key in TOKEN_STAT_KEYS)),
+            )
+        if summaries is not None:
+            conn.execute(
+                "UPDATE sessions SET summaries = ? WHERE id = ?",
+                (json.dumps(summaries, ensure_ascii=False), session_id),
+            )
+
+    @staticmethod
+    def _touch(conn: sqlite3.Connection, session_id: str) -> None:
+        conn.execute(
+            "UPDATE sessions SET updated_at = ? WHERE id = ?",
+            (datetime.now().isoformat(), session_id),
+        )
+
+    # ---- MemoryStore -----------------------------------------------------
+
+    async def create_session(self, metadata: Optional[Dict[str, Any]] = None) -> str:
+        session_id = str(uuid.uuid4())
+        now = datetime.now().isoformat()
+        await self._submit(
+            lambda conn: conn.execute(
+                "INSERT INTO sessions (id, created_at, updated_at, metadata) VALUES (?, ?, ?, ?)",
+                (session_id, now, now, json.dumps(metadata) if metadata else None),
+            )
+        )
+        logger.info(f"Created session {session_id} in {self.db_path}")
+        return session_id
+
+    async def save_message(self, session_id: str, message: LLMMessage, tokens: int = 0) -> None:
+        await self._append(session_id, [(message, tokens)])
+
+    async def save_messages(self, session_id: str, messages: List[LLMMessage]) -> None:
+        await self._append(session_id, [(message, 0) for message in messages])
+
+    async def _append(self, session_id: str, entries: List[Tuple[LLMMessage, int]]) -> None:
+        def op(conn: sqlite3.Connection) -> bool:
+            sid = self._resolve(conn, session_id)
+            if sid is None:
+                return False
+            self._insert_messages(conn, sid, entries)
+            self._touch(conn, sid)
+            return True
+
+        if not await self._submit(op):
+            logger.warning(f"Session {session_id} not found")
+
+    async def save_memory(
+        self,
+        session_id: str,
+        system_messages: List[LLMMessage],
+        messages: List[LLMMessage],
+        token_stats: Optional[Dict[str, Any]] = None,
+        summaries: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        def op(conn: sqlite3.Connection) -> bool:
+            sid = self._resolve(conn, session_id)
+            if sid is None:
+                return False
+            self._write_memory(conn, sid, system_messages, messages, token_stats, summaries)
+            self._touch(conn, sid)
+            return True
+
+        if not await self._submit(op):
+            logger.warning(f"Session {session_id} not found")
+            return
+        logger.debug(
+            f"Saved memory for session {session_id}: "
+            f"{len(system_messages)} system msgs, "
+            f"{len(messages)} messages"
+        )
+
+    async def replace_messages(self, session_id: str, messages: List[LLMMessage]) -> None:
+        """Replace only the messages list, preserving system_messages and token_stats."""
+
+        def op(conn: sqlite3.Connection) -> bool:
+            sid = self._resolve(conn, session_id)
+            if sid is None:
+                return False
+            conn.execute("DELETE FROM messages WHERE session_id = ? AND kind = 'message'", (sid,))
+            self._insert_messages(conn, sid, [(m, 0) for m in messages])
+            self._touch(conn, sid)
+            return True
+
+        if not await self._submit(op):
+            logger.warning(f"Session {session_id} not found")
+            return
+        logger.debug(f"Replaced messages for session {session_id}: {len(messages)} messages")
+
+    def _load_sync(self, conn: sqlite3.Connection, session_id: str) -> Optional[Dict[str, Any]]:
+        sid = self._resolve(conn, session_id)
+        if sid is None:
+            return None
+        created_at, summaries = conn.execute(
+            "SELECT created_at, summaries FROM sessions WHERE id = ?", (sid,)
+        ).fetchone()
+        rows = conn.execute(
+            "SELECT kind, data FROM messages WHERE session_id = ? ORDER BY seq", (sid,)
+        ).fetchall()
+        stats = conn.execute(
+            f"SELECT {', '.join(TOKEN_STAT_KEYS)} FROM token_stats WHERE session_id = ?", (sid,)
+        ).fetchone()
+        return {
+            "config": None,
+            "system_messages": [
+                deserialize_message(json.loads(data)) for kind, data in rows if kind == "system"
+            ],
+            "messages": [
+                deserialize_message(json.loads(data)) for kind, data in rows if kind == "message"
+            ],
+            "stats": {"created_at": created_at},
+            "token_stats": (
+                {key: _stat(value) for key, value in zip(TOKEN_STAT_KEYS, stats, strict=True)}
+                if stats
+                else None
+            ),
+            "summaries": json.loads(summaries) if summaries else None,
+        }
+
+    async def load_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        data = await self._read(self._load_sync, session_id)
+        if data is None:
+            logger.warning(f"Session {session_id} not found")
+        return data
+
+    @staticmethod
+    def _list_sync(conn: sqlite3.Connection, limit: int, offset: int) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": row[0],
+                "created_at": row[1],
+                "updated_at": row[2],
+                "message_count": row[3],
+                "system_message_count": row[4],
+                "preview": row[5] or "",
+            }
+            for row in conn.execute(_LIST_SQL, (min(limit, 2**62), offset))
+        ]
+
+    async def list_sessions(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
+        return await self._read(self._list_sync, limit, offset)
+
+    async def delete_session(self, session_id: str) -> bool:
+        def op(conn: sqlite3.Connection) -> bool:
+            sid = self._resolve(conn, session_id)
+            if sid is None:
+                return False
+            conn.execute("DELETE FROM messages WHERE session_id = ?", (sid,))
+            conn.execute("DELETE FROM token_stats WHERE session_id = ?", (sid,))
+            conn.execute("DELETE FROM sessions WHERE id = ?", (sid,))
+            return True
+
+        deleted = await self._submit(op)
+        if deleted:
+            logger.info(f"Deleted session {session_id}")
+        return deleted
+
+    def _stats_sync(self, conn: sqlite3.Connection, session_id: str) -> Optional[Dict[str, Any]]:
+        sid = self._resolve(conn, session_id)
+        if sid is None:
+            return None
+        created_at, updated_at = conn.execute(
+            "SELECT created_at, updated_at FROM sessions WHERE id = ?", (sid,)
+        ).fetchone()
+        counts = dict.fromkeys(("message", "system"), (0, 0))
+        for kind, count, tokens in conn.execute(
+            "SELECT kind, COUNT(*), SUM(tokens) FROM messages WHERE session_id = ? GROUP BY kind",
+            (sid,),
+        ):
+            counts[kind] = (count, tokens or 0)
+        return {
+            "session_id": session_id,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "message_count": counts["message"][0],
+            "system_message_count": counts["system"][0],
+            "total_message_tokens": counts["message"][1],
+        }
+
+    async def get_session_stats(self, session_id: str) -> Optional[Dict[str, Any]]:
+        return await self._read(self._stats_sync, session_id)
+
+    async def find_session_by_prefix(self, prefix: str) -> Optional[str]:
+        return await self._read(self._resolve, prefix)
+
+    async def import_session(self, source: MemoryStore, session_id: str) -> bool:
+        """Copy one session from another store, keeping its ID and timestamps.
+
+        Returns:
+            True if copied, False if missing in ``source`` or already here
+        """
+        data = await source.load_session(session_id)
+        stats = await source.get_session_stats(session_id)
+        if data is None or stats is None:
+            return False
+
+        def op(conn: sqlite3.Connection) -> bool:
+            if conn.execute("SELECT 1 FROM sessions WHERE id = ?", (session_id,)).fetchone():
+                return False
+            conn.execute(
+                "INSERT INTO sessions (id, created_at, updated_at) VALUES (?, ?, ?)",
+                (session_id, stats["created_at"], stats.get("updated_at") or stats["created_at"]),
+            )
+            self._write_memory(
+                conn,
+                session_id,
+                data["system_messages"],
+                data["messages"],
+                data.get("token_stats"),
+                data.get("summaries"),
+            )
+            return True
+
+        return await self._submit(op)
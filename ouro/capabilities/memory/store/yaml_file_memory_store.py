@@ -5,11 +5,12 @@ Directory structure: .ouro/sessions/YYYY-MM-DD_<uuid[:8]>/session.yaml
 """
 
 import asyncio
+import contextlib
 import logging
 import os
 import uuid
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import aiofiles
 import aiofiles.os
@@ -20,6 +21,11 @@ from ouro.capabilities.memory.serialization import (
     serialize_message,
 )
 from ouro.capabilities.memory.store.memory_store import MemoryStore
+from ouro.capabilities.memory.store.session_index import (
+    PREVIEW_CHARS,
+    SessionIndex,
+    preview_of,
+)
 from ouro.core.llm.message_types import LLMMessage
 from ouro.core.runtime import get_sessions_dir
 
@@ -30,7 +36,8 @@ class YamlFileMemoryStore(MemoryStore):
     """YAML file-based persistence backend.
 
     Each session is stored as a directory containing a session.yaml file.
-    An .index.yaml file maps session UUIDs to directory names for fast lookup.
+    An .index.jsonl file (``SessionIndex``) maps session UUIDs to directory
+    names and the metadata ``list_sessions`` returns.
     """
 
     def __init__(self, sessions_dir: Optional[str] = None):
@@ -41,7 +48,7 @@ class YamlFileMemoryStore(MemoryStore):
         """
         self.sessions_dir = sessions_dir or get_sessions_dir()
         self._write_lock = asyncio.Lock()
-        self._index: Optional[Dict[str, str]] = None  # UUID -> dir_name
+        self._session_index = SessionIndex(self.sessions_dir)
 
     async def _ensure_dir(self) -> None:
         """Ensure sessions directory exists."""
@@ -65,72 +72,75 @@ class YamlFileMemoryStore(MemoryStore):
         """Get path to session.yaml within a session directory."""
         return os.path.join(self.sessions_dir, dir_name, "session.yaml")
 
-    def _index_path(self) -> str:
-        """Get path to the index file."""
-        return os.path.join(self.sessions_dir, ".index.yaml")
-
-    async def _load_index(self) -> Dict[str, str]:
-        """Load or rebuild the UUID -> dir_name index.
+    async def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load or rebuild the session metadata index.
 
         Returns:
-            Dict mapping session UUID to directory name
+            Dict mapping session UUID to its index entry (see ``SessionIndex``)
         """
-        if self._index is not None:
-            return self._index
-
-        index_path = self._index_path()
-        if await asyncio.to_thread(os.path.exists, index_path):
-            try:
-                async with aiofiles.open(index_path, encoding="utf-8") as f:
-                    content = await f.read()
-                self._index = yaml.safe_load(content) or {}
-                return self._index
-            except Exception:
-                logger.warning("Failed to load index, rebuilding")
-
-        # Rebuild index by scanning directories
-        self._index = await self._rebuild_index()
-        return self._index
-
-    async def _rebuild_index(self) -> Dict[str, str]:
-        """Rebuild index by scanning session directories.
+        entries = await self._session_index.load()
+        if entries is None:
+            await self.rebuild_index()
+            entries = self._session_index.entries or {}
+        return entries
+
+    async def rebuild_index(self) -> int:
+        """Rebuild the metadata index by reading every session directory.
 
         Returns:
-            Dict mapping session UUID to directory name
+            Number of sessions indexed
         """
-        index: Dict[str, str] = {}
-        if not await asyncio.to_thread(os.path.exists, self.sessions_dir):
-            self._index = index
-            return index
-
-        entries = await asyncio.to_thread(os.listdir, self.sessions_dir)
-        for entry in entries:
-            if entry.startswith("."):
-                continue
-            yaml_path = self._session_yaml_path(entry)
-            if not await asyncio.to_thread(os.path.exists, yaml_path):
+        index: Dict[str, Dict[str, Any]] = {}
+        if await asyncio.to_thread(os.path.exists, self.sessions_dir):
+            entries = await asyncio.to_thread(os.listdir, self.sessions_dir)
+            for entry in entries:
+                if entry.startswith("."):
+                    continue
+                if not await asyncio.to_thread(os.path.exists, self._session_yaml_path(entry)):
+                    continue
+                try:
+                    data = await self._load_session_data(entry)
+                    if data and "id" in data:
+                        index[data["id"]] = self._index_entry(data["id"], entry, data)
+                except Exception:
+                    logger.warning(f"Failed to read session from {entry}")
+
+        await self._session_index.replace_all(index)
+        # Older versions kept a UUID -> directory map in .index.yaml.
+        with contextlib.suppress(FileNotFoundError):
+            await aiofiles.os.remove(os.path.join(self.sessions_dir, ".index.yaml"))
+        return len(index)
+
+    @staticmethod
+    def _index_entry(session_id: str, dir_name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Index entry for a session from its full data."""
+        messages = data.get("messages") or []
+        return {
+            "id": session_id,
+            "dir": dir_name,
+            "created_at": data.get("created_at", ""),
+            "updated_at": data.get("updated_at", ""),
+            "message_count": len(messages),
+            "system_message_count": len(data.get("system_messages") or []),
+            "preview": preview_of(messages),
+        }
+
+    async def _index_appended(
+        self, session_id: str, entries: List[Tuple[LLMMessage, int]], updated_at: str
+    ) -> None:
+        """Update a session's index entry for appended messages."""
+        entry = self._session_index.get(session_id)
+        if entry is None:
+            return
+        entry = dict(entry, updated_at=updated_at)
+        for message, _tokens in entries:
+            if message.role == "system":
+                entry["system_message_count"] += 1
                 continue
-            try:
-                async with aiofiles.open(yaml_path, encoding="utf-8") as f:
-                    content = await f.read()
-                data = yaml.safe_load(content)
-                if data and "id" in data:
-                    index[data["id"]] = entry
-            except Exception:
-                logger.warning(f"Failed to read session from {entry}")
-
-        self._index = index
-        await self._save_index(index)
-        return index
-
-    async def _save_index(self, index: Dict[str, str]) -> None:
-        """Save index to disk."""
-        index_path = self._index_path()
-        tmp_path = index_path + ".tmp"
-        content = yaml.dump(index, default_flow_style=False, allow_unicode=True)
-        async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
-            await f.write(content)
-        await asyncio.to_thread(os.replace, tmp_path, index_path)
+            entry["message_count"] += 1
+            if not entry["preview"] and message.role == "user" and isinstance(message.content, str):
+                entry["preview"] = message.content[:PREVIEW_CHARS]
+        await self._session_index.put(entry)
 
     async def _load_session_data(self, dir_name: str) -> Optional[Dict[str, Any]]:
         """Load raw YAML data from a session directory.
@@ -148,6 +158,17 @@ class YamlFileMemoryStore(MemoryStore):
             content = await f.read()
         return yaml.safe_load(content)
 
+    @staticmethod
+    def _render_session(data: Dict[str, Any]) -> str:
+        """Render session data as session.yaml content."""
+        return yaml.dump(
+            data,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+            width=120,
+        )
+
     async def _save_session_data(self, dir_name: str, data: Dict[str, Any]) -> None:
         """Atomically write session data to YAML file.
 
@@ -161,19 +182,13 @@ class YamlFileMemoryStore(MemoryStore):
         yaml_path = self._session_yaml_path(dir_name)
         tmp_path = yaml_path + ".tmp"
 
-        content = yaml.dump(
-            data,
-            default_flow_style=False,
-            allow_unicode=True,
-            sort_keys=False,
-            width=120,
-        )
+        content = self._render_session(data)
         async with aiofiles.open(tmp_path, "w", encoding="utf-8") as f:
             await f.write(content)
         await asyncio.to_thread(os.replace, tmp_path, yaml_path)
 
-    async def _resolve_session_dir(self, session_id: str) -> Optional[str]:
-        """Resolve a session ID to its directory name.
+    async def _resolve_session(self, session_id: str) -> Optional[Tuple[str, str]]:
+        """Resolve a session ID to its full ID and directory name.
 
         Supports full UUID and prefix matching.
 
@@ -181,23 +196,28 @@ class YamlFileMemoryStore(MemoryStore):
             session_id: Full or prefix of session UUID
 
         Returns:
-            Directory name or None
+            ``(session_id, dir_name)`` or None
         """
         index = await self._load_index()
 
         # Exact match
         if session_id in index:
-            return index[session_id]
+            return session_id, index[session_id]["dir"]
 
         # Prefix match
-        matches = [(sid, dir_name) for sid, dir_name in index.items() if sid.startswith(session_id)]
+        matches = self._session_index.match(session_id)
         if len(matches) == 1:
-            return matches[0][1]
+            return matches[0], index[matches[0]]["dir"]
         elif len(matches) > 1:
             logger.warning(f"Ambiguous session prefix '{session_id}', {len(matches)} matches")
 
         return None
 
+    async def _resolve_session_dir(self, session_id: str) -> Optional[str]:
+        """Resolve a session ID (full or prefix) to its directory name."""
+        resolved = await self._resolve_session(session_id)
+        return resolved[1] if resolved else None
+
     async def create_session(self, metadata: Optional[Dict[str, Any]] = None) -> str:
         await self._ensure_dir()
 
@@ -214,33 +234,47 @@ class YamlFileMemoryStore(MemoryStore):
         }
 
         async with self._write_lock:
+            # Load (or rebuild) the index before the new session is on disk.
+            await self._load_index()
             await self._save_session_data(dir_name, data)
-            index = await self._load_index()
-            index[session_id] = dir_name
-            await self._save_index(index)
+            await self._session_index.put(self._index_entry(session_id, dir_name, data))
 
         logger.info(f"Created session {session_id} in {dir_name}")
         return session_id
 
+    def _session_lock(self, dir_name: str) -> asyncio.Lock:
+        """Lock serializing writes to one session (the store-wide lock here)."""
+        return self._write_lock
+
     async def save_message(self, session_id: str, message: LLMMessage, tokens: int = 0) -> None:
-        dir_name = await self._resolve_session_dir(session_id)
-        if not dir_name:
+        await self._append(session_id, [(message, tokens)])
+
+    async def save_messages(self, session_id: str, messages: List[LLMMessage]) -> None:
+        await self._append(session_id, [(message, 0) for message in messages])
+
+    async def _append(self, session_id: str, entries: List[Tuple[LLMMessage, int]]) -> None:
+        """Append ``(message, tokens)`` entries with a single rewrite of session.yaml."""
+        resolved = await self._resolve_session(session_id)
+        if not resolved:
             logger.warning(f"Session {session_id} not found")
             return
+        full_id, dir_name = resolved
 
-        async with self._write_lock:
+        async with self._session_lock(dir_name):
             data = await self._load_session_data(dir_name)
             if not data:
                 logger.warning(f"Session {session_id} not found")
                 return
 
-            field = "system_messages" if message.role == "system" else "messages"
-            msg_data = serialize_message(message)
-            msg_data["tokens"] = tokens
-            data[field].append(msg_data)
+            for message, tokens in entries:
+                field = "system_messages" if message.role == "system" else "messages"
+                msg_data = serialize_message(message)
+                msg_data["tokens"] = tokens
+                data[field].append(msg_data)
             data["updated_at"] = datetime.now().isoformat()
 
             await self._save_session_data(dir_name, data)
+            await self._index_appended(full_id, entries, data["updated_at"])
 
     async def save_memory(
         self,
@@ -248,13 +282,15 @@ class YamlFileMemoryStore(MemoryStore):
         system_messages: List[LLMMessage],
         messages: List[LLMMessage],
         token_stats: Optional[Dict[str, Any]] = None,
+        summaries: Optional[Dict[str, Any]] = None,
     ) -> None:
-        dir_name = await self._resolve_session_dir(session_id)
-        if not dir_name:
+        resolved = await self._resolve_session(session_id)
+        if not resolved:
             logger.warning(f"Session {session_id} not found")
             return
+        full_id, dir_name = resolved
 
-        async with self._write_lock:
+        async with self._session_lock(dir_name):
             data = await self._load_session_data(dir_name)
             if not data:
                 logger.warning(f"Session {session_id} not found")
@@ -277,8 +313,11 @@ class YamlFileMemoryStore(MemoryStore):
             elif "token_stats" in data:
                 # Preserve existing token_stats if not explicitly cleared
                 pass
+            if summaries is not None:
+                data["summaries"] = summaries
 
             await self._save_session_data(dir_name, data)
+            await self._session_index.put(self._index_entry(full_id, dir_name, data))
 
         logger.debug(
             f"Saved memory for session {session_id}: "
@@ -288,12 +327,13 @@ class YamlFileMemoryStore(MemoryStore):
 
     async def replace_messages(self, session_id: str, messages: List[LLMMessage]) -> None:
         """Replace only the messages list, preserving system_messages and token_stats."""
-        dir_name = await self._resolve_session_dir(session_id)
-        if not dir_name:
+        resolved = await self._resolve_session(session_id)
+        if not resolved:
             logger.warning(f"Session {session_id} not found")
             return
+        full_id, dir_name = resolved
 
-        async with self._write_lock:
+        async with self._session_lock(dir_name):
             data = await self._load_session_data(dir_name)
             if not data:
                 logger.warning(f"Session {session_id} not found")
@@ -308,6 +348,7 @@ class YamlFileMemoryStore(MemoryStore):
             data["updated_at"] = datetime.now().isoformat()
 
             await self._save_session_data(dir_name, data)
+            await self._session_index.put(self._index_entry(full_id, dir_name, data))
 
         logger.debug(f"Replaced messages for session {session_id}: {len(messages)} messages")
 
@@ -332,43 +373,17 @@ class YamlFileMemoryStore(MemoryStore):
                 "created_at": data.get("created_at", ""),
             },
             "token_stats": data.get("token_stats"),
+            "summaries": data.get("summaries"),
         }
 
     async def list_sessions(self, limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
         await self._ensure_dir()
-        index = await self._load_index()
-
-        sessions = []
-        for session_id, dir_name in index.items():
-            data = await self._load_session_data(dir_name)
-            if not data:
-                continue
-
-            messages_data = data.get("messages") or []
-            system_messages_data = data.get("system_messages") or []
-
-            # Extract first user message as preview
-            first_user_msg = ""
-            for msg in messages_data:
-                if msg.get("role") == "user" and isinstance(msg.get("content"), str):
-                    first_user_msg = msg["content"][:100]
-                    break
-
-            sessions.append(
-                {
-                    "id": session_id,
-                    "created_at": data.get("created_at", ""),
-                    "updated_at": data.get("updated_at", ""),
-                    "message_count": len(messages_data),
-                    "system_message_count": len(system_messages_data),
-                    "preview": first_user_msg,
-                }
-            )
-
-        # Sort by updated_at descending
-        sessions.sort(key=lambda s: s.get("updated_at", ""), reverse=True)
-
-        return sessions[offset : offset + limit]
+        await self._load_index()
+        # Answered from the index alone; no session.yaml is opened.
+        return [
+            {key: value for key, value in entry.items() if key != "dir"}
+            for entry in self._session_index.page(limit, offset)
+        ]
 
     async def delete_session(self, session_id: str) -> bool:
         dir_name = await self._resolve_session_dir(session_id)
@@ -389,10 +404,9 @@ class YamlFileMemoryStore(MemoryStore):
             # Update index
             index = await self._load_index()
             # Find and remove by dir_name (session_id might be prefix)
-            to_remove = [sid for sid, dn in index.items() if dn == dir_name]
+            to_remove = [sid for sid, entry in index.items() if entry["dir"] == dir_name]
             for sid in to_remove:
-                del index[sid]
-            await self._save_index(index)
+                await self._session_index.remove(sid)
 
         logger.info(f"Deleted session {session_id}")
         return True
@@ -419,17 +433,6 @@ class YamlFileMemoryStore(MemoryStore):
             "total_message_tokens": total_message_tokens,
         }
 
-    async def find_latest_session(self) -> Optional[str]:
-        """Find the most recently updated session ID.
-
-        Returns:
-            Session ID or None if no sessions exist
-        """
-        sessions = await self.list_sessions(limit=1)
-        if sessions:
-            return sessions[0]["id"]
-        return None
-
     async def find_session_by_prefix(self, prefix: str) -> Optional[str]:
         """Find a session by ID prefix.
 
@@ -439,8 +442,8 @@ class YamlFileMemoryStore(MemoryStore):
         Returns:
             Full session ID or None
         """
-        index = await self._load_index()
-        matches = [sid for sid in index if sid.startswith(prefix)]
+        await self._load_index()
+        matches = self._session_index.match(prefix)
         if len(matches) == 1:
             return matches[0]
         elif len(matches) > 1:
@@ -5,8 +5,7 @@ import json
 import logging
 from typing import Dict
 
-import litellm
-
+from ouro.core.llm.litellm_adapter import load_litellm
 from ouro.core.llm.message_types import LLMMessage
 from ouro.core.model_pricing import MODEL_PRICING
 
@@ -27,6 +26,10 @@ class TokenTracker:
         self.total_cache_creation_tokens = 0
         self.compression_savings = 0  # Tokens saved through compression
         self.compression_cost = 0  # Tokens spent on compression
+        # Input/cache counters for the current agent run (see start_run).
+        self.run_input_tokens = 0
+        self.run_cache_read_tokens = 0
+        self.run_cache_creation_tokens = 0
         self._token_cache: Dict[str, int] = {}
 
     def count_message_tokens(self, message: LLMMessage, provider: str, model: str) -> int:
@@ -46,7 +49,7 @@ class TokenTracker:
 
         try:
             msg_dict = message.to_dict()
-            count = litellm.token_counter(model=model, messages=[msg_dict])
+            count = load_litellm().token_counter(model=model, messages=[msg_dict])
         except Exception as e:
             logger.debug(f"litellm.token_counter failed ({e}), using fallback")
             content = self._extract_content_text(message)
@@ -84,12 +87,42 @@ class TokenTracker:
 
         Args:
             usage: Dict with keys input_tokens, output_tokens, and optionally
-                   cache_read_tokens, cache_creation_tokens.
+                   cache_read_tokens, cache_creation_tokens, and the
+                   hedge_input_tokens/hedge_output_tokens billed for requests
+                   that lost a hedge (see ``RoutingAdapter``).
         """
-        self.total_input_tokens += usage.get("input_tokens", 0)
-        self.total_output_tokens += usage.get("output_tokens", 0)
+        self.total_input_tokens += usage.get("input_tokens", 0) + usage.get("hedge_input_tokens", 0)
+        self.total_output_tokens += usage.get("output_tokens", 0) + usage.get(
+            "hedge_output_tokens", 0
+        )
         self.total_cache_read_tokens += usage.get("cache_read_tokens", 0)
         self.total_cache_creation_tokens += usage.get("cache_creation_tokens", 0)
+        self.run_input_tokens += usage.get("input_tokens", 0)
+        self.run_cache_read_tokens += usage.get("cache_read_tokens", 0)
+        self.run_cache_creation_tokens += usage.get("cache_creation_tokens", 0)
+
+    def start_run(self) -> None:
+        """Reset the per-run counters at the start of an agent run."""
+        self.run_input_tokens = 0
+        self.run_cache_read_tokens = 0
+        self.run_cache_creation_tokens = 0
+
+    def cache_hit_ratio(self, *, run: bool = False) -> float:
+        """Fraction of input tokens served from the provider's prompt cache.
+
+        Args:
+            run: Use the current run's counters instead of the session totals.
+
+        Returns:
+            Ratio in [0, 1]; 0.0 before any input has been recorded.
+        """
+        if run:
+            input_tokens, cache_read = self.run_input_tokens, self.run_cache_read_tokens
+        else:
+            input_tokens, cache_read = self.total_input_tokens, self.total_cache_read_tokens
+        if input_tokens <= 0:
+            return 0.0
+        return min(1.0, cache_read / input_tokens)
 
     def add_compression_savings(self, saved: int):
         """Record tokens saved through compression."""
@@ -168,11 +201,6 @@ class TokenTracker:
         Returns:
             Total cost in USD
         """
-        pricing = self._find_pricing(model)
-
-        cache_read_price = pricing.get("cache_read", pricing["input"])
-        cache_write_price = pricing.get("cache_write", pricing["input"])
-
         non_cached_input = max(
             0,
             self.total_input_tokens
@@ -180,12 +208,41 @@ class TokenTracker:
             - self.total_cache_creation_tokens,
         )
 
-        input_cost = (non_cached_input * pricing["input"]) / 1_000_000
-        cache_read_cost = (self.total_cache_read_tokens * cache_read_price) / 1_000_000
-        cache_write_cost = (self.total_cache_creation_tokens * cache_write_price) / 1_000_000
-        output_cost = (self.total_output_tokens * pricing["output"]) / 1_000_000
+        return self.estimate_cost(
+            model,
+            uncached=non_cached_input,
+            cache_read=self.total_cache_read_tokens,
+            cache_write=self.total_cache_creation_tokens,
+            output=self.total_output_tokens,
+        )
+
+    def estimate_cost(
+        self,
+        model: str,
+        *,
+        uncached: int = 0,
+        cache_read: int = 0,
+        cache_write: int = 0,
+        output: int = 0,
+    ) -> float:
+        """Price token counts with the model's cache pricing.
+
+        Cache reads and writes fall back to the input price when the model
+        lists none.  Used by ``get_total_cost`` and to price compaction plans
+        before running them.
 
-        return input_cost + cache_read_cost + cache_write_cost + output_cost
+        Returns:
+            Cost in USD
+        """
+        pricing = self._find_pricing(model)
+        cache_read_price = pricing.get("cache_read", pricing["input"])
+        cache_write_price = pricing.get("cache_write", pricing["input"])
+        return (
+            uncached * pricing["input"]
+            + cache_read * cache_read_price
+            + cache_write * cache_write_price
+            + output * pricing["output"]
+        ) / 1_000_000
 
     def get_net_savings(self, model: str) -> Dict[str, float]:
         """Calculate net token and cost savings after accounting for compression overhead.
@@ -227,4 +284,5 @@ class TokenTracker:
         self.total_cache_creation_tokens = 0
         self.compression_savings = 0
         self.compression_cost = 0
+        self.start_run()
         self._token_cache.clear()
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ouro.core.llm.tool_output import ToolOutput
+
+    from .spill import SpillStore
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -13,10 +15,19 @@ from typing import Any
 class BaseTool(ABC):
     """Abstract base class for all tools."""
 
-    # Token limits for tool output size checking
+    # Token limits for tool output size checking.  ``MAX_TOKENS`` is the
+    # tool's output budget; subclasses may lower or raise it.
     MAX_TOKENS = 25000
     CHARS_PER_TOKEN = 4  # Conservative estimate
+    # Set by ToolExecutor when outputs over budget spill to disk instead of
+    # failing; see ``ouro.capabilities.tools.spill``.
+    spill_store: SpillStore | None = None
     readonly: bool = False
+    # Dispatch limits enforced by ToolExecutor: at most ``max_concurrency``
+    # calls of this tool in flight, started at most ``rate_limit`` per second.
+    # ``None`` means unlimited.
+    max_concurrency: int | None = None
+    rate_limit: float | None = None
 
     def conflict_keys(self, **kwargs: Any) -> set[str] | None:
         """Resource keys this call would touch, for parallel-dispatch grouping.
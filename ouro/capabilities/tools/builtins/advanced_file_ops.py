@@ -364,6 +364,10 @@ Examples:
             # Check output size
             estimated_tokens = len(result) // self.CHARS_PER_TOKEN
             if estimated_tokens > self.MAX_TOKENS:
+                if self.spill_store is not None:
+                    return await self.spill_store.spill(
+                        self.name, result, max_tokens=self.MAX_TOKENS
+                    )
                 max_chars = self.MAX_TOKENS * self.CHARS_PER_TOKEN
                 result = result[:max_chars]
                 result += f"\n... (output truncated to ~{self.MAX_TOKENS} tokens)"
@@ -522,6 +526,10 @@ Examples:
             # Check output size
             estimated_tokens = len(result) // self.CHARS_PER_TOKEN
             if estimated_tokens > self.MAX_TOKENS:
+                if self.spill_store is not None:
+                    return await self.spill_store.spill(
+                        self.name, result, max_tokens=self.MAX_TOKENS
+                    )
                 return (
                     f"Error: Grep output (~{estimated_tokens} tokens) exceeds "
                     f"maximum allowed ({self.MAX_TOKENS}). Please use more specific "
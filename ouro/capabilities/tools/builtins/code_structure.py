@@ -6,18 +6,14 @@ FileReadTool to show code structure when a file is too large to read fully.
 
 import ast
 import importlib
+import importlib.util
 from pathlib import Path
 from typing import Dict, List, Optional
 
 import aiofiles
 
-# Try to import tree-sitter for multi-language support
-try:
-    from tree_sitter import Language, Parser, Query, QueryCursor
-
-    HAS_TREE_SITTER = True
-except ImportError:
-    HAS_TREE_SITTER = False
+# tree-sitter (optional) adds multi-language support; it is imported on first use.
+HAS_TREE_SITTER = importlib.util.find_spec("tree_sitter") is not None
 
 # Map language names to (module_name, entry_function_name)
 LANGUAGE_MODULES = {
@@ -107,6 +103,8 @@ def detect_language(file_path: Path) -> Optional[str]:
 
 def _get_tree_sitter_parser_and_language(lang: str):
     """Get a tree-sitter parser and language via individual language packages."""
+    from tree_sitter import Language, Parser
+
     module_name, func_name = LANGUAGE_MODULES[lang]
     mod = importlib.import_module(module_name)
     language = Language(getattr(mod, func_name)())
@@ -272,6 +270,8 @@ async def _show_structure_python(path: Path) -> str:
 
 async def _show_structure_tree_sitter(path: Path, lang: str) -> str:
     """Show structure of file using tree-sitter."""
+    from tree_sitter import Query, QueryCursor
+
     parser, language = _get_tree_sitter_parser_and_language(lang)
 
     async with aiofiles.open(path, "rb") as f:
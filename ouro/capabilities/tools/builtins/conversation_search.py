@@ -1,7 +1,9 @@
 """Conversation search tool — keyword search over historical messages.
 
 Backed by the SQLite FTS5 ``RecallIndex``. Returns the most relevant past
-messages for a query, optionally scoped to a single session.
+messages for a query, optionally scoped to a single session. With
+``RECALL_EMBEDDER`` set, keyword matches are fused with vector-similarity
+matches, so differently worded queries still find messages.
 
 This is the "recall memory" layer in the Letta/MemGPT sense: messages that
 have been paged out of context can be searched on demand and pulled back
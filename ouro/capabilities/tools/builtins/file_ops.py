@@ -10,6 +10,7 @@ import aiofiles.os
 from ouro.core.llm.tool_output import ToolOutput
 
 from ..base import BaseTool
+from ..spill import is_spill_handle
 from .code_structure import show_file_structure
 
 
@@ -45,7 +46,8 @@ class FileReadTool(BaseTool):
     def description(self) -> str:
         return (
             "Read contents of a file. For large files, use offset and limit "
-            "parameters to read specific portions."
+            "parameters to read specific portions. Also pages through spilled tool "
+            "outputs: pass their spill:<hash> handle as file_path."
         )
 
     @property
@@ -67,6 +69,11 @@ class FileReadTool(BaseTool):
 
     async def execute(self, file_path: str, offset: int = 0, limit: int = None) -> str | ToolOutput:
         """Read file with optional pagination."""
+        if is_spill_handle(file_path):
+            spilled_path = self.spill_store.path_for(file_path) if self.spill_store else None
+            if spilled_path is None:
+                return f"Error: Spilled output '{file_path}' not found (it may have expired)"
+            file_path = spilled_path
         try:
             # Pre-check file size
             file_size = await aiofiles.os.path.getsize(file_path)
@@ -190,15 +190,14 @@ Input parameters:
         ]
 
     def _build_subtask_registry(self) -> ToolExecutor:
-        """Construct a fresh ToolExecutor with the parent's tools minus multi_task.
+        """Construct a child of the parent's ToolExecutor without multi_task.
 
         The sub-agent must not recurse back into multi_task; filtering both the
         schemas (sent to the LLM) and the executable registry guarantees that.
+        The child shares the parent's concurrency caps, rate limits and
+        progress sink, so parallel sub-tasks stay within the agent's limits.
         """
-        sub_tools = [
-            tool for name, tool in self.agent.tool_executor.tools.items() if name != self.name
-        ]
-        return ToolExecutor(sub_tools)
+        return self.agent.tool_executor.child(exclude={self.name})
 
     def _resolve_parallel_limit(self, max_parallel: int | None) -> int | None:
         if max_parallel is None:
@@ -318,7 +317,7 @@ Input parameters:
     ) -> str:
         # Run the sub-task in a fresh memoryless core.Agent so it cannot
         # touch the parent's memory or persistence. The parent's tool set
-        # (minus multi_task itself) is reused via a freshly-built registry.
+        # (minus multi_task itself) is reused via a child registry.
         sub_registry = self._build_subtask_registry()
         sub_agent = CoreAgent(
             llm=self.agent.llm,
@@ -8,6 +8,7 @@ from typing import Any
 from ouro.core.sandbox import SandboxExecResult, SandboxSession
 
 from ..base import BaseTool
+from ..spill import is_spill_handle
 from .advanced_file_ops import GlobTool, GrepTool
 from .conversation_search import ConversationSearchTool
 from .file_ops import FileReadTool, FileWriteTool
@@ -28,9 +29,11 @@ def _format_exec_result(result: SandboxExecResult) -> str:
     return output or "Sandbox command executed successfully (no output)"
 
 
-def _check_output_size(tool: BaseTool, output: str) -> str:
+async def _check_output_size(tool: BaseTool, output: str) -> str:
     estimated_tokens = len(output) // tool.CHARS_PER_TOKEN
     if estimated_tokens > tool.MAX_TOKENS:
+        if tool.spill_store is not None:
+            return await tool.spill_store.spill(tool.name, output, max_tokens=tool.MAX_TOKENS)
         return (
             f"Error: Tool output (~{estimated_tokens} tokens) exceeds maximum "
             f"allowed ({tool.MAX_TOKENS}). Use pagination, grep, or redirect output to a file."
@@ -58,7 +61,7 @@ class SandboxShellTool(ShellTool):
                 cwd=kwargs.get("cwd") or _default_cwd(self.session),
                 timeout=timeout,
             )
-            return _check_output_size(self, _format_exec_result(result))
+            return await _check_output_size(self, _format_exec_result(result))
         except Exception as e:
             return f"Error executing sandbox command: {e}"
 
@@ -70,9 +73,12 @@ class SandboxReadFileTool(FileReadTool):
         self.session = session
 
     async def execute(self, file_path: str, offset: int = 0, limit: int | None = None) -> str:
+        if is_spill_handle(file_path):
+            # Spilled tool outputs live on the host, not in the sandbox.
+            return await super().execute(file_path, offset=offset, limit=limit)
         try:
             content = await self.session.read_file(file_path, offset=offset, limit=limit)
-            return _check_output_size(self, content)
+            return await _check_output_size(self, content)
         except Exception as e:
             return f"Error reading sandbox file: {e}"
 
@@ -149,7 +155,7 @@ class SandboxGrepTool(GrepTool):
                 head_limit=head_limit,
                 offset=offset,
             )
-            return _check_output_size(self, output)
+            return await _check_output_size(self, output)
         except Exception as e:
             return f"Error executing grep: {e}"
 
@@ -6,6 +6,9 @@ Usage:
     python tools/session_manager.py show <session_id>
     python tools/session_manager.py delete <session_id>
     python tools/session_manager.py stats <session_id>
+    python tools/session_manager.py compact [session_id]
+    python tools/session_manager.py to-sqlite
+    python tools/session_manager.py reindex
 """
 
 import argparse
@@ -17,7 +20,12 @@ from pathlib import Path
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from ouro.capabilities.memory.store import YamlFileMemoryStore
+from ouro.capabilities.memory.store import (
+    JournalMemoryStore,
+    MemoryStore,
+    SQLiteMemoryStore,
+    create_memory_store,
+)
 from ouro.core.runtime import get_sessions_dir
 
 
@@ -30,7 +38,7 @@ def format_timestamp(ts: str) -> str:
         return ts
 
 
-async def list_sessions(store: YamlFileMemoryStore, limit: int = 50):
+async def list_sessions(store: MemoryStore, limit: int = 50):
     """List all sessions."""
     sessions = await store.list_sessions(limit=limit)
 
@@ -54,7 +62,7 @@ async def list_sessions(store: YamlFileMemoryStore, limit: int = 50):
     print("=" * 100)
 
 
-async def show_session(store: YamlFileMemoryStore, session_id: str, show_messages: bool = False):
+async def show_session(store: MemoryStore, session_id: str, show_messages: bool = False):
     """Show detailed session information."""
     session_data = await store.load_session(session_id)
 
@@ -88,7 +96,7 @@ async def show_session(store: YamlFileMemoryStore, session_id: str, show_message
     print("=" * 100)
 
 
-async def show_stats(store: YamlFileMemoryStore, session_id: str):
+async def show_stats(store: MemoryStore, session_id: str):
     """Show session statistics."""
     stats = await store.get_session_stats(session_id)
 
@@ -115,7 +123,7 @@ async def show_stats(store: YamlFileMemoryStore, session_id: str):
     print("=" * 80)
 
 
-async def delete_session(store: YamlFileMemoryStore, session_id: str, confirm: bool = False):
+async def delete_session(store: MemoryStore, session_id: str, confirm: bool = False):
     """Delete a session."""
     if not confirm:
         response = input(f"Are you sure you want to delete session {session_id}? (yes/no): ")
@@ -130,6 +138,38 @@ async def delete_session(store: YamlFileMemoryStore, session_id: str, confirm: b
         print(f"❌ Session {session_id} not found")
 
 
+async def compact_sessions(store: JournalMemoryStore, session_id: str | None = None):
+    """Fold journals into session.yaml (one session, or all of them)."""
+    if session_id:
+        session_ids = [session_id]
+    else:
+        session_ids = [s["id"] for s in await store.list_sessions(limit=sys.maxsize)]
+
+    for sid in session_ids:
+        if not await store.compact_session(sid):
+            print(f"❌ Session {sid} not found")
+            return
+    print(f"✅ Compacted {len(session_ids)} session(s)")
+
+
+async def reindex_sessions(store: JournalMemoryStore):
+    """Rebuild the session metadata index from the session directories."""
+    count = await store.rebuild_index()
+    print(f"✅ Indexed {count} session(s)")
+
+
+async def copy_to_sqlite(sessions_dir: str):
+    """Copy the YAML/journal sessions in sessions_dir into sessions.db."""
+    source = JournalMemoryStore(sessions_dir=sessions_dir)
+    target = SQLiteMemoryStore(sessions_dir=sessions_dir)
+    sessions = await source.list_sessions(limit=sys.maxsize)
+    copied = 0
+    for session in sessions:
+        if await target.import_session(source, session["id"]):
+            copied += 1
+    print(f"✅ Copied {copied} of {len(sessions)} session(s) to {target.db_path}")
+
+
 async def main():
     parser = argparse.ArgumentParser(
         description="Manage memory sessions",
@@ -150,6 +190,15 @@ Examples:
 
   Delete a session:
     python tools/session_manager.py delete <session_id>
+
+  Fold journals into session.yaml (e.g. before switching MEMORY_STORE to yaml):
+    python tools/session_manager.py compact [session_id]
+
+  Copy sessions into sessions.db (before switching MEMORY_STORE to sqlite):
+    python tools/session_manager.py to-sqlite
+
+  Rebuild the session index (e.g. after editing session files by hand):
+    python tools/session_manager.py reindex
         """,
     )
 
@@ -180,6 +229,13 @@ Examples:
     delete_parser.add_argument("session_id", help="Session ID")
     delete_parser.add_argument("--yes", action="store_true", help="Skip confirmation")
 
+    # Compact command
+    compact_parser = subparsers.add_parser("compact", help="Fold journals into session.yaml")
+    compact_parser.add_argument("session_id", nargs="?", help="Session ID (default: all)")
+
+    subparsers.add_parser("to-sqlite", help="Copy sessions into sessions.db")
+    subparsers.add_parser("reindex", help="Rebuild the session metadata index")
+
     args = parser.parse_args()
 
     if not args.command:
@@ -188,7 +244,7 @@ Examples:
 
     # Initialize store
     sessions_dir = args.sessions_dir if args.sessions_dir else get_sessions_dir()
-    store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+    store = create_memory_store(sessions_dir=sessions_dir)
 
     # Execute command
     if args.command == "list":
@@ -199,6 +255,14 @@ Examples:
         await show_stats(store, args.session_id)
     elif args.command == "delete":
         await delete_session(store, args.session_id, confirm=args.yes)
+    elif args.command == "compact":
+        # Whatever MEMORY_STORE says: this is how sessions get back to plain YAML.
+        await compact_sessions(JournalMemoryStore(sessions_dir=sessions_dir), args.session_id)
+    elif args.command == "to-sqlite":
+        await copy_to_sqlite(sessions_dir)
+    elif args.command == "reindex":
+        # The journal store reads plain YAML sessions too, with journals replayed.
+        await reindex_sessions(JournalMemoryStore(sessions_dir=sessions_dir))
 
 
 if __name__ == "__main__":
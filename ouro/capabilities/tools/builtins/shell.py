@@ -158,6 +158,10 @@ class ShellTool(BaseTool):
             # Check output size
             estimated_tokens = len(output) // self.CHARS_PER_TOKEN
             if estimated_tokens > self.MAX_TOKENS:
+                if self.spill_store is not None:
+                    return await self.spill_store.spill(
+                        self.name, output, max_tokens=self.MAX_TOKENS
+                    )
                 return (
                     f"Error: Command output (~{estimated_tokens} tokens) exceeds "
                     f"maximum allowed ({self.MAX_TOKENS}). Please pipe output through "
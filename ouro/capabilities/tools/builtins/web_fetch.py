@@ -17,8 +17,8 @@ from urllib.parse import urljoin, urlparse
 import aiofiles
 import aiofiles.os
 import httpx
-import trafilatura
-from lxml import html as lxml_html
+
+from ouro.core.http_pool import get_http_client
 
 from ..base import BaseTool
 
@@ -133,6 +133,7 @@ class WebFetchTool(BaseTool):
     """Fetch content from URLs and convert to various formats."""
 
     readonly = True
+    max_concurrency = 4
 
     @property
     def name(self) -> str:
@@ -317,6 +318,12 @@ class WebFetchTool(BaseTool):
         # Check content size before returning
         estimated_tokens = len(output) // self.CHARS_PER_TOKEN
         if estimated_tokens > self.MAX_TOKENS:
+            if self.spill_store is not None:
+                preview = await self.spill_store.spill(
+                    self.name, output, max_tokens=self.MAX_TOKENS
+                )
+                metadata["spilled"] = True
+                return {"ok": True, "title": title, "output": preview, "metadata": metadata}
             raise WebFetchError(
                 "content_too_large",
                 f"Page content (~{estimated_tokens} tokens) exceeds maximum allowed ({self.MAX_TOKENS}). "
@@ -458,60 +465,59 @@ class WebFetchTool(BaseTool):
 
         redirects: list[str] = []
         current_url = url
-        timeout_config = httpx.Timeout(timeout)
-        async with httpx.AsyncClient(follow_redirects=False, timeout=timeout_config) as client:
-            for _ in range(MAX_REDIRECTS + 1):
-                parsed = await self._validate_url(current_url)
-                try:
-                    response, content_bytes = await self._request(
-                        client, parsed.geturl(), headers, timeout
-                    )
-                except httpx.TimeoutException as exc:
-                    raise WebFetchError(
-                        "timeout",
-                        "Request timed out",
-                        {"requested_url": current_url},
-                    ) from exc
-                except httpx.RequestError as exc:
-                    raise WebFetchError(
-                        "request_error",
-                        "Failed to fetch URL",
-                        {"requested_url": current_url, "error": str(exc)},
-                    ) from exc
-
-                if response.status_code in {301, 302, 303, 307, 308}:
-                    location = response.headers.get("location")
-                    if not location:
-                        raise WebFetchError(
-                            "http_error",
-                            "Redirect response missing Location header",
-                            {"requested_url": current_url, "status_code": response.status_code},
-                        )
-                    next_url = urljoin(current_url, location)
-                    try:
-                        await self._validate_url(next_url)
-                    except WebFetchError as exc:
-                        raise WebFetchError(
-                            "redirect_blocked",
-                            "Redirect target is not allowed",
-                            {
-                                "requested_url": current_url,
-                                "redirect_url": next_url,
-                                "redirect_error": exc.code,
-                            },
-                        ) from exc
-                    redirects.append(next_url)
-                    current_url = next_url
-                    continue
+        client = get_http_client()
+        for _ in range(MAX_REDIRECTS + 1):
+            parsed = await self._validate_url(current_url)
+            try:
+                response, content_bytes = await self._request(
+                    client, parsed.geturl(), headers, timeout
+                )
+            except httpx.TimeoutException as exc:
+                raise WebFetchError(
+                    "timeout",
+                    "Request timed out",
+                    {"requested_url": current_url},
+                ) from exc
+            except httpx.RequestError as exc:
+                raise WebFetchError(
+                    "request_error",
+                    "Failed to fetch URL",
+                    {"requested_url": current_url, "error": str(exc)},
+                ) from exc
 
-                if response.status_code >= 400:
+            if response.status_code in {301, 302, 303, 307, 308}:
+                location = response.headers.get("location")
+                if not location:
                     raise WebFetchError(
                         "http_error",
-                        f"Request failed with status code: {response.status_code}",
+                        "Redirect response missing Location header",
                         {"requested_url": current_url, "status_code": response.status_code},
                     )
+                next_url = urljoin(current_url, location)
+                try:
+                    await self._validate_url(next_url)
+                except WebFetchError as exc:
+                    raise WebFetchError(
+                        "redirect_blocked",
+                        "Redirect target is not allowed",
+                        {
+                            "requested_url": current_url,
+                            "redirect_url": next_url,
+                            "redirect_error": exc.code,
+                        },
+                    ) from exc
+                redirects.append(next_url)
+                current_url = next_url
+                continue
 
-                return response, content_bytes, redirects
+            if response.status_code >= 400:
+                raise WebFetchError(
+                    "http_error",
+                    f"Request failed with status code: {response.status_code}",
+                    {"requested_url": current_url, "status_code": response.status_code},
+                )
+
+            return response, content_bytes, redirects
 
         raise WebFetchError(
             "redirect_blocked",
@@ -522,7 +528,9 @@ class WebFetchTool(BaseTool):
     async def _request(
         self, client: httpx.AsyncClient, url: str, headers: dict[str, str], timeout: float
     ) -> tuple[httpx.Response, bytes]:
-        async with client.stream("GET", url, headers=headers, follow_redirects=False) as response:
+        async with client.stream(
+            "GET", url, headers=headers, follow_redirects=False, timeout=httpx.Timeout(timeout)
+        ) as response:
             if response.status_code in {301, 302, 303, 307, 308}:
                 return response, b""
             if response.status_code >= 400:
@@ -584,6 +592,10 @@ class WebFetchTool(BaseTool):
         )
 
     def _render_html(self, html: str, format: str, url: str) -> tuple[str, str]:
+        # trafilatura (and lxml with it) is slow to import; load on first page.
+        import trafilatura
+        from lxml import html as lxml_html
+
         # Extract title from HTML
         title = url
         try:
@@ -624,6 +636,8 @@ class WebFetchTool(BaseTool):
         Returns:
             List of ExtractedLink dictionaries with href, text, and type
         """
+        from lxml import html as lxml_html
+
         links: list[ExtractedLink] = []
         try:
             tree = lxml_html.fromstring(html)
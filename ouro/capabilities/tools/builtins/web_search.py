@@ -3,24 +3,33 @@
 import asyncio
 from typing import Any, Dict, List
 
-from ddgs import DDGS
-from ddgs.http_client import HttpClient
-
 from ..base import BaseTool
 
-# Fix ddgs/primp compatibility: ddgs ships impersonate profiles that primp 1.0
-# no longer recognises.  Passing an unknown value triggers a Rust-side fallback
-# path that deadlocks under concurrent threads.  Override with valid values.
-HttpClient._impersonates = ("random",)  # type: ignore[attr-defined]
-HttpClient._impersonates_os = ("macos", "linux", "windows")  # type: ignore[attr-defined]
-
 # Default timeout for web search operations
 DEFAULT_SEARCH_TIMEOUT = 30.0
 
+_DDGS = None
+
+
+def _load_ddgs():
+    """Import ``ddgs`` on first search; it is slow to import and rarely used."""
+    global _DDGS  # noqa: PLW0603
+    if _DDGS is None:
+        from ddgs import DDGS
+        from ddgs.http_client import HttpClient
+
+        # Fix ddgs/primp compatibility: ddgs ships impersonate profiles that primp 1.0
+        # no longer recognises.  Passing an unknown value triggers a Rust-side fallback
+        # path that deadlocks under concurrent threads.  Override with valid values.
+        HttpClient._impersonates = ("random",)  # type: ignore[attr-defined]
+        HttpClient._impersonates_os = ("macos", "linux", "windows")  # type: ignore[attr-defined]
+        _DDGS = DDGS
+    return _DDGS
+
 
 def _sync_search(query: str, max_results: int = 5) -> List[Dict[str, str]]:
     """Synchronous search function to run in thread."""
-    with DDGS() as ddgs:
+    with _load_ddgs()() as ddgs:
         return list(ddgs.text(query, max_results=max_results))
 
 
@@ -28,6 +37,9 @@ class WebSearchTool(BaseTool):
     """Simple web search using DuckDuckGo (no API key needed)."""
 
     readonly = True
+    # DuckDuckGo starts returning empty/blocked pages under bursts.
+    max_concurrency = 2
+    rate_limit = 1.0
 
     @property
     def name(self) -> str:
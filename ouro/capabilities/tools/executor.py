@@ -1,25 +1,96 @@
 """Tool execution engine for managing and executing tools."""
 
 import asyncio
-from typing import Any, Dict, List
+import copy
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterable, List
 
 from ouro.capabilities.tools.base import BaseTool
+from ouro.capabilities.tools.spill import SpillStore
 from ouro.config import Config
 from ouro.core.llm import ToolOutput
+from ouro.core.loop import NullProgressSink, ProgressEvent, ProgressSink
+from ouro.core.ratelimit import TokenBucket
+
+
+class _GlobalSlot:
+    """A global slot held by the tool call running in the current context."""
+
+    __slots__ = ("semaphore", "held")
+
+    def __init__(self, semaphore: asyncio.Semaphore) -> None:
+        self.semaphore = semaphore
+        self.held = True
+
+    def release(self) -> None:
+        if self.held:
+            self.held = False
+            self.semaphore.release()
+
+
+_current_global_slot: ContextVar[_GlobalSlot | None] = ContextVar(
+    "ouro_tool_global_slot", default=None
+)
 
 
 class ToolExecutor:
     """Executes tools called by the LLM."""
 
-    def __init__(self, tools: List[BaseTool]):
-        """Initialize with a list of tools."""
-        self.tools = {tool.name: tool for tool in tools}
+    def __init__(
+        self,
+        tools: List[BaseTool],
+        *,
+        max_concurrency: int | None = None,
+        tool_concurrency: Dict[str, int] | None = None,
+        tool_rate_limits: Dict[str, float] | None = None,
+        progress: ProgressSink | None = None,
+        spill_store: SpillStore | None = None,
+        tool_output_budgets: Dict[str, int] | None = None,
+    ):
+        """Initialize with a list of tools.
+
+        Args:
+            tools: Tools to register.
+            max_concurrency: Cap on tool calls in flight across all tools
+                (``None`` or ``<= 0`` means unlimited).
+            tool_concurrency: Per-tool in-flight caps, overriding each tool's
+                ``max_concurrency``.
+            tool_rate_limits: Per-tool start rates in calls/second, overriding
+                each tool's ``rate_limit``.
+            progress: Sink that receives ``tool_queue`` events whenever the
+                number of queued or running calls changes.
+            spill_store: Where tools put outputs over their ``MAX_TOKENS``
+                budget, returning a preview and a handle instead of an error.
+            tool_output_budgets: Per-tool output budgets in tokens, overriding
+                each tool's ``MAX_TOKENS``.
+        """
+        self.spill_store = spill_store
+        self._tool_output_budgets = dict(tool_output_budgets or {})
+        self.tools: Dict[str, BaseTool] = {}
+        for tool in tools:
+            self._register(tool)
+        self._progress: ProgressSink = progress or NullProgressSink()
+        self._global_slots = (
+            asyncio.Semaphore(max_concurrency) if max_concurrency and max_concurrency > 0 else None
+        )
+        self._tool_concurrency = dict(tool_concurrency or {})
+        self._tool_rate_limits = dict(tool_rate_limits or {})
+        self._tool_slots: Dict[str, asyncio.Semaphore] = {}
+        self._tool_buckets: Dict[str, TokenBucket] = {}
+        # Queue depth; shared with ``child`` executors, like the limits.
+        self._counts = {"queued": 0, "running": 0, "peak_queued": 0}
 
     async def execute_tool_call(self, tool_name: str, tool_input: Dict[str, Any]) -> ToolOutput:
         """Execute a single tool call and return result."""
         if tool_name not in self.tools:
             return ToolOutput(content=f"Error: Tool '{tool_name}' not found")
 
+        # The timeout covers execution only, not time spent waiting for a slot.
+        async with self._dispatch_slot(tool_name):
+            return await self._execute(tool_name, tool_input)
+
+    async def _execute(self, tool_name: str, tool_input: Dict[str, Any]) -> ToolOutput:
         try:
             timeout = Config.TOOL_TIMEOUT
             if "timeout" in tool_input and tool_input["timeout"] is not None:
@@ -45,6 +116,105 @@ class ToolExecutor:
         except Exception as e:
             return ToolOutput(content=f"Error executing {tool_name}: {str(e)}")
 
+    @asynccontextmanager
+    async def _dispatch_slot(self, tool_name: str) -> AsyncIterator[None]:
+        """Wait for the tool's concurrency slot, rate token, then a global slot.
+
+        The per-tool limits are taken first so a throttled tool never holds a
+        global slot while it waits.  A call made from inside another tool's
+        call (a ``child`` executor's sub-agent) first releases the caller's
+        global slot, since the caller only waits on it from then on; holding
+        it would deadlock at a cap of 1.
+        """
+        tool_slots = self._slots_for(tool_name)
+        bucket = self._bucket_for(tool_name)
+        acquired: list[asyncio.Semaphore] = []
+        global_slot: _GlobalSlot | None = None
+        counts = self._counts
+        counts["queued"] += 1
+        counts["peak_queued"] = max(counts["peak_queued"], counts["queued"])
+        self._emit_queue(tool_name)
+        try:
+            if tool_slots is not None:
+                await tool_slots.acquire()
+                acquired.append(tool_slots)
+            if bucket is not None:
+                await bucket.acquire()
+            if self._global_slots is not None:
+                caller = _current_global_slot.get()
+                if caller is not None and caller.semaphore is self._global_slots:
+                    caller.release()
+                await self._global_slots.acquire()
+                global_slot = _GlobalSlot(self._global_slots)
+        except BaseException:
+            for slot in acquired:
+                slot.release()
+            counts["queued"] -= 1
+            self._emit_queue(tool_name)
+            raise
+
+        counts["queued"] -= 1
+        counts["running"] += 1
+        self._emit_queue(tool_name)
+        token = _current_global_slot.set(global_slot)
+        try:
+            yield
+        finally:
+            _current_global_slot.reset(token)
+            counts["running"] -= 1
+            if global_slot is not None:
+                global_slot.release()
+            for slot in acquired:
+                slot.release()
+            self._emit_queue(tool_name)
+
+    def _slots_for(self, tool_name: str) -> asyncio.Semaphore | None:
+        limit = self._tool_concurrency.get(tool_name, self.tools[tool_name].max_concurrency)
+        if not limit or limit <= 0:
+            return None
+        if tool_name not in self._tool_slots:
+            self._tool_slots[tool_name] = asyncio.Semaphore(limit)
+        return self._tool_slots[tool_name]
+
+    def _bucket_for(self, tool_name: str) -> TokenBucket | None:
+        rate = self._tool_rate_limits.get(tool_name, self.tools[tool_name].rate_limit)
+        if not rate or rate <= 0:
+            return None
+        if tool_name not in self._tool_buckets:
+            self._tool_buckets[tool_name] = TokenBucket(rate)
+        return self._tool_buckets[tool_name]
+
+    def _emit_queue(self, tool_name: str) -> None:
+        self._progress.emit(
+            ProgressEvent(
+                kind="tool_queue",
+                payload={
+                    "name": tool_name,
+                    "queued": self._counts["queued"],
+                    "running": self._counts["running"],
+                },
+            )
+        )
+
+    def dispatch_stats(self) -> Dict[str, int]:
+        """Current and peak tool-call queue depth."""
+        return dict(self._counts)
+
+    def child(self, exclude: Iterable[str] = ()) -> "ToolExecutor":
+        """An executor over these tools minus ``exclude``, sharing the dispatch limits.
+
+        Calls made through either executor count against the same global and
+        per-tool concurrency caps and rate limits, and their ``tool_queue``
+        events go to the same progress sink. Used for sub-agents, so running
+        tools in parallel sub-tasks cannot exceed the caps set for the agent.
+        A tool dispatching through its child gives up its own global slot
+        (see ``_dispatch_slot``).
+        """
+        excluded = set(exclude)
+        child = copy.copy(self)
+        child.tools = {name: tool for name, tool in self.tools.items() if name not in excluded}
+        return child
+
     def is_tool_readonly(self, tool_name: str) -> bool:
         """Check if a tool is readonly (safe for parallel execution)."""
         tool = self.tools.get(tool_name)
@@ -68,10 +238,20 @@ class ToolExecutor:
         """Get Anthropic-formatted schemas for all tools."""
         return [tool.to_anthropic_schema() for tool in self.tools.values()]
 
+    def _register(self, tool: BaseTool) -> None:
+        if self.spill_store is not None:
+            tool.spill_store = self.spill_store
+        budget = self._tool_output_budgets.get(tool.name)
+        if budget:
+            tool.MAX_TOKENS = budget
+        self.tools[tool.name] = tool
+
     def add_tool(self, tool: BaseTool):
         """Add a tool to the executor.
 
         Args:
             tool: Tool instance to add
         """
-        self.tools[tool.name] = tool
+        self._register(tool)
+        self._tool_slots.pop(tool.name, None)
+        self._tool_buckets.pop(tool.name, None)
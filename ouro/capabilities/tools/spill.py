@@ -0,0 +1,119 @@
+"""Spill store for tool outputs too large for the context.
+
+A tool whose output exceeds its ``MAX_TOKENS`` budget can spill the full
+text here instead of failing or truncating it.  The model gets a head/tail
+preview plus a handle (``spill:<hash>``) that ``read_file`` pages through
+with ``offset``/``limit``, so an expensive command never has to be rerun
+just to see the rest of its output.
+
+Outputs are stored content-addressed (SHA-256 of the text) as plain files
+under the sessions directory; identical outputs share one file, and files
+older than ``MAX_AGE_DAYS`` are removed when the store is first written.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import os
+import re
+import time
+
+from ouro.core.log import get_logger
+
+logger = get_logger(__name__)
+
+SPILL_PREFIX = "spill:"
+_HANDLE_RE = re.compile(r"^spill:([0-9a-f]{16,64})$")
+
+
+def is_spill_handle(path: str) -> bool:
+    """Whether ``path`` is a spill handle rather than a filesystem path."""
+    return bool(_HANDLE_RE.match(path))
+
+
+class SpillStore:
+    """Content-addressed files holding oversized tool outputs."""
+
+    # Tokens of head + tail shown in place of a spilled output.
+    PREVIEW_TOKENS = 2000
+    CHARS_PER_TOKEN = 4
+    MAX_AGE_DAYS = 7
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.expanduser(root)
+        self._pruned = False
+
+    def path_for(self, handle: str) -> str | None:
+        """Filesystem path of ``handle``, or None if it is not a stored handle."""
+        match = _HANDLE_RE.match(handle)
+        if match is None:
+            return None
+        path = os.path.join(self.root, f"{match.group(1)}.txt")
+        return path if os.path.isfile(path) else None
+
+    async def put(self, content: str) -> str:
+        """Store ``content`` and return its handle."""
+        digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
+        await asyncio.to_thread(self._write, digest, content)
+        return f"{SPILL_PREFIX}{digest}"
+
+    async def spill(self, tool_name: str, output: str, *, max_tokens: int) -> str:
+        """Store ``output`` and return the preview the model sees instead.
+
+        Args:
+            tool_name: Tool that produced ``output`` (named in the preview).
+            output: The full tool output.
+            max_tokens: The tool's output budget; the preview stays within it.
+        """
+        handle = await self.put(output)
+        tokens = len(output) // self.CHARS_PER_TOKEN
+        line_count = output.count("\n") + 1
+        preview_chars = min(self.PREVIEW_TOKENS, max_tokens) * self.CHARS_PER_TOKEN
+        head = _cut(output[: preview_chars // 2], at_end=True)
+        tail = _cut(output[len(output) - preview_chars // 2 :], at_end=False)
+        omitted = len(output) - len(head) - len(tail)
+        logger.info(f"Spilled {tool_name} output (~{tokens} tokens) to {handle}")
+        return (
+            f"[{tool_name} output too large for context (~{tokens} tokens, {line_count} lines, "
+            f"budget {max_tokens}). Full output saved as {handle} - page through it with "
+            f'read_file(file_path="{handle}", offset=<line>, limit=<lines>) instead of '
+            f"rerunning the command.]\n"
+            f"{head}\n"
+            f"[... {omitted} characters omitted ...]\n"
+            f"{tail}"
+        )
+
+    def _write(self, digest: str, content: str) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        if not self._pruned:
+            self._pruned = True
+            self._prune()
+        path = os.path.join(self.root, f"{digest}.txt")
+        if os.path.exists(path):
+            os.utime(path)
+            return
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, path)
+
+    def _prune(self) -> None:
+        cutoff = time.time() - self.MAX_AGE_DAYS * 86400
+        for entry in os.scandir(self.root):
+            with contextlib.suppress(OSError):
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+
+
+def _cut(text: str, *, at_end: bool) -> str:
+    """Trim ``text`` to whole lines: drop a partial last (or first) line.
+
+    Text without a line break (one very long line) is kept as is.
+    """
+    if at_end:
+        idx = text.rfind("\n")
+        return text[:idx] if idx > 0 else text
+    idx = text.find("\n")
+    return text[idx + 1 :] if 0 <= idx < len(text) - 1 else text
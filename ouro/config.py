@@ -18,6 +18,61 @@ _DEFAULT_CONFIG = """\
 TOOL_TIMEOUT=600
 MAX_ITERATIONS=1000
 
+# Maximum tool calls running at once across all tools (0 = unlimited).
+# TOOL_MAX_CONCURRENCY=16
+
+# Save tool outputs larger than a tool's budget under ~/.ouro/sessions/.spill
+# and show the model a head/tail preview plus a handle read_file can page.
+# TOOL_OUTPUT_SPILL=true
+
+# Stream LLM responses and start readonly tool calls while the model is still
+# writing later ones.
+# STREAM_TOOL_CALLS=false
+
+# Token budget for each LLM request (0 = off). When the conversation is
+# larger, older low-value messages are stubbed in the request only; the
+# session history is untouched. Keep it below MEMORY_COMPRESSION_THRESHOLD.
+# CONTEXT_TOKEN_BUDGET=0
+
+# Place prompt-cache breakpoints (system prompt, tools, rolling history point)
+# for providers that need explicit markers, e.g. Anthropic Claude.
+# PROMPT_CACHE=true
+
+# Hedged requests to the `fallback` models in models.yaml: when the current
+# model is slower than this percentile of its recent latencies (but at least
+# LLM_HEDGE_MIN_DELAY seconds), the request is also sent to the first fallback
+# and the first answer wins. 0 disables hedging; fail-over on errors still applies.
+# LLM_HEDGE_PERCENTILE=95
+# LLM_HEDGE_MIN_DELAY=5
+
+# Start summarizing the oldest history in the background once the context
+# passes this fraction of MEMORY_COMPRESSION_THRESHOLD (0 = disabled).
+# MEMORY_BACKGROUND_COMPACTION_RATIO=0.8
+
+# When the prompt cache is on, keep the oldest cached messages verbatim and
+# summarize only the history after them if that is cheaper under the model's
+# cache pricing than rewriting the whole context.
+# MEMORY_CACHE_AWARE_COMPACTION=true
+
+# Session storage: "journal" appends each message to a per-session
+# journal.jsonl and folds it into session.yaml every
+# MEMORY_JOURNAL_SNAPSHOT_EVERY messages; "yaml" rewrites session.yaml on every
+# message; "sqlite" keeps all sessions in sessions.db.
+# MEMORY_JOURNAL_FSYNC: always | snapshot | never.
+# MEMORY_STORE=journal
+# MEMORY_JOURNAL_FSYNC=snapshot
+# MEMORY_JOURNAL_SNAPSHOT_EVERY=200
+
+# Vector recall for conversation_search, fused with keyword (FTS5) matches:
+# "off", "hash" (dependency-free hashing sketch) or a sentence-transformers
+# model name run locally on the CPU, e.g. all-MiniLM-L6-v2 (falls back to
+# "hash" when sentence-transformers is not installed).
+# RECALL_EMBEDDER=off
+
+# Correct the token estimate used for the compaction threshold with a per-model
+# fit to the input tokens the provider actually bills (~/.ouro/token_calibration.json).
+# TOKEN_CALIBRATION=true
+
 # Ralph Loop (outer verification loop — re-checks task completion)
 # RALPH_LOOP_MAX_ITERATIONS=3
 
@@ -94,9 +149,16 @@ class Config:
     # Model configuration is handled by `~/.ouro/models.yaml` via ModelManager.
     # `~/.ouro/config` controls non-model runtime settings only.
     TOOL_TIMEOUT = float(_cfg.get("TOOL_TIMEOUT", "600"))
+    TOOL_MAX_CONCURRENCY = int(_cfg.get("TOOL_MAX_CONCURRENCY", "16"))
+    TOOL_OUTPUT_SPILL = _cfg.get("TOOL_OUTPUT_SPILL", "true").lower() == "true"
 
     # Agent Configuration
     MAX_ITERATIONS = int(_cfg.get("MAX_ITERATIONS", "1000"))
+    STREAM_TOOL_CALLS = _cfg.get("STREAM_TOOL_CALLS", "false").lower() == "true"
+    PROMPT_CACHE = _cfg.get("PROMPT_CACHE", "true").lower() == "true"
+    CONTEXT_TOKEN_BUDGET = int(_cfg.get("CONTEXT_TOKEN_BUDGET", "0"))
+    LLM_HEDGE_PERCENTILE = float(_cfg.get("LLM_HEDGE_PERCENTILE", "95"))
+    LLM_HEDGE_MIN_DELAY = float(_cfg.get("LLM_HEDGE_MIN_DELAY", "5"))
 
     # Commit / PR attribution (append ouro trailers to commits/PRs)
     ATTRIBUTION_ENABLED = _cfg.get("ATTRIBUTION_ENABLED", "true").lower() == "true"
@@ -132,7 +194,18 @@ class Config:
     MEMORY_COMPRESSION_THRESHOLD = int(_cfg.get("MEMORY_COMPRESSION_THRESHOLD", "256000"))
     MEMORY_SHORT_TERM_MIN_SIZE = int(_cfg.get("MEMORY_SHORT_TERM_MIN_SIZE", "6"))
     MEMORY_COMPRESSION_RATIO = float(_cfg.get("MEMORY_COMPRESSION_RATIO", "0.3"))
+    MEMORY_BACKGROUND_COMPACTION_RATIO = float(
+        _cfg.get("MEMORY_BACKGROUND_COMPACTION_RATIO", "0.8")
+    )
+    MEMORY_CACHE_AWARE_COMPACTION = (
+        _cfg.get("MEMORY_CACHE_AWARE_COMPACTION", "true").lower() == "true"
+    )
     MEMORY_PRESERVE_SYSTEM_PROMPTS = True
+    MEMORY_STORE = _cfg.get("MEMORY_STORE", "journal")  # "journal", "yaml" or "sqlite"
+    MEMORY_JOURNAL_FSYNC = _cfg.get("MEMORY_JOURNAL_FSYNC", "snapshot")
+    MEMORY_JOURNAL_SNAPSHOT_EVERY = int(_cfg.get("MEMORY_JOURNAL_SNAPSHOT_EVERY", "200"))
+    RECALL_EMBEDDER = _cfg.get("RECALL_EMBEDDER", "off")
+    TOKEN_CALIBRATION = _cfg.get("TOKEN_CALIBRATION", "true").lower() == "true"
 
     # Logging Configuration
     # Note: Logging is now controlled via --verbose flag
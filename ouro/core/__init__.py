@@ -21,53 +21,97 @@ Public SDK surface:
 - Logging: `get_logger`, `setup_logger`, `get_log_file_path`.
 """
 
-import contextlib
+from typing import TYPE_CHECKING
 
-from ouro.core.llm import (
-    REASONING_EFFORT_CHOICES,
-    FunctionCall,
-    LiteLLMAdapter,
-    LLMMessage,
-    LLMResponse,
-    ModelManager,
-    ModelProfile,
-    StopReason,
-    ToolCall,
-    ToolCallBlock,
-    ToolResult,
-    display_reasoning_effort,
-    ensure_new_format,
-    extract_text,
-    extract_text_from_message,
-    extract_tool_calls_from_content,
-    message_to_dict,
-    migrate_messages,
-    normalize_reasoning_effort,
-    normalize_stop_reason,
-)
-from ouro.core.log import get_log_file_path, get_logger, setup_logger
-from ouro.core.loop import (
-    Agent,
-    ContinueDecision,
-    ContinueKind,
-    Hook,
-    LoopContext,
-    NullProgressSink,
-    ProgressSink,
-    ToolRegistry,
-)
-from ouro.core.runtime import (
-    ensure_runtime_dirs,
-    get_runtime_dir,
+from ouro.core.lazy import lazy_exports
+
+# Everything is re-exported lazily: importing a leaf module such as
+# ``ouro.core.llm.reasoning`` must not drag in the agent loop and adapters.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ouro.core.llm": (
+            "REASONING_EFFORT_CHOICES",
+            "FunctionCall",
+            "LiteLLMAdapter",
+            "LLMMessage",
+            "LLMResponse",
+            "ModelManager",
+            "ModelProfile",
+            "StopReason",
+            "ToolCall",
+            "ToolCallBlock",
+            "ToolResult",
+            "display_reasoning_effort",
+            "ensure_new_format",
+            "extract_text",
+            "extract_text_from_message",
+            "extract_tool_calls_from_content",
+            "message_to_dict",
+            "migrate_messages",
+            "normalize_reasoning_effort",
+            "normalize_stop_reason",
+        ),
+        "ouro.core.log": ("get_log_file_path", "get_logger", "setup_logger"),
+        "ouro.core.loop": (
+            "Agent",
+            "ContinueDecision",
+            "ContinueKind",
+            "Hook",
+            "LoopContext",
+            "NullProgressSink",
+            "ProgressSink",
+            "ToolRegistry",
+        ),
+        "ouro.core.runtime": (
+            "ensure_runtime_dirs",
+            "get_memory_dir",
+            "get_runtime_dir",
+            "get_sessions_dir",
+        ),
+    },
 )
 
-# get_sessions_dir / get_memory_dir live in runtime.py with various other
-# helpers; re-export the ones the SDK calls out, fall back gracefully if a
-# helper isn't present in older runtime modules.
-with contextlib.suppress(ImportError):
-    from ouro.core.runtime import get_sessions_dir
-with contextlib.suppress(ImportError):
-    from ouro.core.runtime import get_memory_dir
+if TYPE_CHECKING:
+    from ouro.core.llm import (
+        REASONING_EFFORT_CHOICES,
+        FunctionCall,
+        LiteLLMAdapter,
+        LLMMessage,
+        LLMResponse,
+        ModelManager,
+        ModelProfile,
+        StopReason,
+        ToolCall,
+        ToolCallBlock,
+        ToolResult,
+        display_reasoning_effort,
+        ensure_new_format,
+        extract_text,
+        extract_text_from_message,
+        extract_tool_calls_from_content,
+        message_to_dict,
+        migrate_messages,
+        normalize_reasoning_effort,
+        normalize_stop_reason,
+    )
+    from ouro.core.log import get_log_file_path, get_logger, setup_logger
+    from ouro.core.loop import (
+        Agent,
+        ContinueDecision,
+        ContinueKind,
+        Hook,
+        LoopContext,
+        NullProgressSink,
+        ProgressSink,
+        ToolRegistry,
+    )
+    from ouro.core.runtime import (
+        ensure_runtime_dirs,
+        get_memory_dir,
+        get_runtime_dir,
+        get_sessions_dir,
+    )
 
 __all__ = [
     # Loop
@@ -0,0 +1,156 @@
+"""Process-wide pool of keep-alive ``httpx.AsyncClient`` instances.
+
+Opening a fresh client per request pays DNS, TCP and TLS setup every time,
+which adds up across swarm workers that all talk to the same provider.
+`get_http_client()` hands out one long-lived client per base URL instead, with
+HTTP/2 enabled when the optional ``h2`` package is installed.
+
+Clients are stateless on purpose: cookies are never stored, and timeouts,
+headers and redirect handling are passed per request so callers with
+different needs can share a connection pool safely.
+
+Call `close_http_clients()` once on shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+
+from ouro.core.log import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TIMEOUT = httpx.Timeout(600.0, connect=30.0)
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=60.0
+)
+
+
+def _http2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _pool_key(base_url: str | None) -> str:
+    """Reduce a URL to ``scheme://host[:port]``; empty string for the shared default."""
+    if not base_url:
+        return ""
+    parts = urlsplit(base_url if "://" in base_url else f"https://{base_url}")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+@dataclass
+class _PoolEntry:
+    client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop | None
+
+
+class HttpClientPool:
+    """Long-lived async HTTP clients keyed by base URL."""
+
+    def __init__(
+        self,
+        *,
+        http2: bool | None = None,
+        limits: httpx.Limits = DEFAULT_LIMITS,
+        timeout: httpx.Timeout = DEFAULT_TIMEOUT,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.http2 = _http2_available() if http2 is None else http2
+        self._limits = limits
+        self._timeout = timeout
+        self._transport = transport
+        self._entries: dict[str, _PoolEntry] = {}
+        self._requests: dict[str, int] = {}
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, base_url: str | None = None) -> httpx.AsyncClient:
+        """Return the pooled client for ``base_url``'s origin, creating it on first use.
+
+        ``None`` returns a shared general-purpose client (e.g. for fetching
+        arbitrary web pages). A client is bound to the event loop it was first
+        used on; asking from a different loop replaces it.
+        """
+        key = _pool_key(base_url)
+        loop = _running_loop()
+        entry = self._entries.get(key)
+        if entry is not None and not entry.client.is_closed and entry.loop is loop:
+            self._hits += 1
+            return entry.client
+
+        if entry is not None:
+            # The old loop is gone (or the client was closed by its owner);
+            # its connections can't be reused or awaited from here.
+            logger.debug("Replacing pooled HTTP client for %r", key or "<default>")
+        self._misses += 1
+        entry = _PoolEntry(client=self._new_client(key), loop=loop)
+        self._entries[key] = entry
+        return entry.client
+
+    def _new_client(self, key: str) -> httpx.AsyncClient:
+        async def _count_request(request: httpx.Request) -> None:
+            self._requests[key] = self._requests.get(key, 0) + 1
+
+        return httpx.AsyncClient(
+            http2=self.http2,
+            limits=self._limits,
+            timeout=self._timeout,
+            cookies=CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+            event_hooks={"request": [_count_request]},
+            transport=self._transport,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Pool-level counters plus per-origin request counts."""
+        return {
+            "clients": sum(1 for e in self._entries.values() if not e.client.is_closed),
+            "hits": self._hits,
+            "misses": self._misses,
+            "http2": self.http2,
+            "requests": {key or "<default>": n for key, n in self._requests.items()},
+        }
+
+    async def aclose(self) -> None:
+        """Close every client owned by the current event loop and forget the rest."""
+        loop = _running_loop()
+        entries = list(self._entries.values())
+        self._entries.clear()
+        for entry in entries:
+            if entry.client.is_closed or entry.loop is not loop:
+                continue
+            try:
+                await entry.client.aclose()
+            except Exception:
+                logger.debug("Error closing pooled HTTP client", exc_info=True)
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+_default_pool = HttpClientPool()
+
+
+def get_http_client(base_url: str | None = None) -> httpx.AsyncClient:
+    """Return the process-wide pooled client for ``base_url``."""
+    return _default_pool.get(base_url)
+
+
+def http_pool_stats() -> dict[str, Any]:
+    """Statistics for the process-wide pool."""
+    return _default_pool.stats()
+
+
+async def close_http_clients() -> None:
+    """Close the process-wide pool's clients (call once at shutdown)."""
+    await _default_pool.aclose()
@@ -0,0 +1,48 @@
+"""Lazy package re-exports (PEP 562).
+
+Package ``__init__`` modules re-export names from their submodules for the
+SDK surface, but importing every submodule eagerly makes ``import ouro.core``
+(and anything under it, such as ``ouro.core.llm.reasoning``) pay for the
+whole tree. `lazy_exports()` returns ``__getattr__`` / ``__dir__`` functions
+that import a submodule only when one of its names is first accessed::
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        "ouro.core.loop": ("Agent", "Hook"),
+    })
+
+Keep a matching ``if TYPE_CHECKING:`` import block so type checkers and IDEs
+still see the real symbols.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: Mapping[str, Iterable[str]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build module-level ``__getattr__`` and ``__dir__`` for ``package``.
+
+    Args:
+        package: ``__name__`` of the package doing the re-exporting.
+        exports: Absolute submodule name -> names it provides.
+    """
+    origin = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = origin.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        # Cache on the package so later lookups skip this hook.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(origin))
+
+    return __getattr__, __dir__
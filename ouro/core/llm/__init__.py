@@ -1,9 +1,13 @@
 """LLM module - LiteLLM adapter for unified access to 100+ providers."""
 
+from typing import TYPE_CHECKING
+
+from ouro.core.lazy import lazy_exports
+
 # Import new types from message_types (primary source)
 # Import compatibility utilities
 # Import adapters
-from .adapter import LLMAdapter, create_llm_adapter
+from .adapter import LLMAdapter, ToolCallCallback, create_llm_adapter
 from .compat import ensure_new_format, migrate_messages, normalize_stop_reason
 
 # Import utilities
@@ -13,7 +17,6 @@ from .content_utils import (
     extract_tool_calls_from_content,
     message_to_dict,
 )
-from .litellm_adapter import LiteLLMAdapter
 from .message_types import (
     FunctionCall,
     LLMMessage,
@@ -23,7 +26,6 @@ from .message_types import (
     ToolCallBlock,
     ToolResult,
 )
-from .model_manager import ModelManager, ModelProfile
 from .reasoning import (
     REASONING_EFFORT_CHOICES,
     display_reasoning_effort,
@@ -31,6 +33,26 @@ from .reasoning import (
 )
 from .tool_output import ToolOutput
 
+# Adapters, routing and the model manager pull in httpx, tenacity and YAML;
+# load them on first use so importing message types stays cheap.
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        f"{__name__}.litellm_adapter": ("LiteLLMAdapter",),
+        f"{__name__}.model_manager": ("ModelManager", "ModelProfile"),
+        f"{__name__}.routing": (
+            "RoutingAdapter",
+            "create_profile_adapter",
+            "create_routed_adapter",
+        ),
+    },
+)
+
+if TYPE_CHECKING:
+    from .litellm_adapter import LiteLLMAdapter
+    from .model_manager import ModelManager, ModelProfile
+    from .routing import RoutingAdapter, create_profile_adapter, create_routed_adapter
+
 __all__ = [
     # Core types
     "LLMMessage",
@@ -44,7 +66,11 @@ __all__ = [
     # Adapter
     "LLMAdapter",
     "LiteLLMAdapter",
+    "ToolCallCallback",
     "create_llm_adapter",
+    "RoutingAdapter",
+    "create_profile_adapter",
+    "create_routed_adapter",
     # Model Manager
     "ModelManager",
     "ModelProfile",
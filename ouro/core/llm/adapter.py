@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Callable, Protocol, runtime_checkable
 
-from .message_types import LLMMessage, LLMResponse, ToolCall, ToolResult
+from .message_types import LLMMessage, LLMResponse, ToolCall, ToolCallBlock, ToolResult
+
+# Invoked by ``call_stream_async`` with each tool call whose arguments have
+# finished streaming, before the rest of the response has arrived.
+ToolCallCallback = Callable[[ToolCallBlock], None]
 
 
 @runtime_checkable
@@ -21,6 +25,16 @@ class LLMAdapter(Protocol):
         **kwargs: Any,
     ) -> LLMResponse: ...
 
+    async def call_stream_async(
+        self,
+        messages: list[LLMMessage],
+        tools: list[dict[str, Any]] | None = None,
+        max_tokens: int | None = None,
+        *,
+        on_tool_call: ToolCallCallback | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse: ...
+
     def extract_text(self, response: LLMResponse) -> str: ...
 
     def extract_tool_calls(self, response: LLMResponse) -> list[ToolCall]: ...
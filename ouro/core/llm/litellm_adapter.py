@@ -5,8 +5,12 @@ import json
 import logging
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+from ouro.config import Config
+from ouro.core.http_pool import get_http_client
 from ouro.core.log import get_logger
+from ouro.core.ratelimit import get_rate_limiter
 
+from .adapter import ToolCallCallback
 from .content_utils import extract_text, extract_tool_calls_from_content
 from .message_types import (
     LLMMessage,
@@ -16,13 +20,56 @@ from .message_types import (
     ToolCallBlock,
     ToolResult,
 )
-from .retry import with_retry
+from .prompt_cache import apply_cache_breakpoints, supports_cache_control
+from .retry import response_headers, with_retry
 
 logger = get_logger(__name__)
 
 _LITELLM = None
 
 
+def load_litellm():
+    """Import ``litellm`` on first use and quiet its loggers.
+
+    ``litellm`` takes seconds to import, so nothing imports it at module
+    level; everything that needs it goes through this function.
+    """
+    global _LITELLM  # noqa: PLW0603
+    if _LITELLM is None:
+        _LITELLM = importlib.import_module("litellm")
+
+        # Suppress LiteLLM's verbose logging to console.
+        # LiteLLM adds its own StreamHandler(stderr) on import; remove it
+        # to prevent debug messages leaking to the terminal in bot mode.
+        litellm_logger = logging.getLogger("LiteLLM")
+        litellm_logger.handlers = [
+            h
+            for h in litellm_logger.handlers
+            if not (isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler))
+        ]
+        litellm_logger.setLevel(logging.WARNING)
+        litellm_logger.propagate = False
+
+        # Also suppress httpx and upstream provider loggers that LiteLLM uses.
+        for name in ("httpx", "openai", "anthropic", "LiteLLM Proxy", "LiteLLM Router"):
+            lg = logging.getLogger(name)
+            lg.setLevel(logging.WARNING)
+            lg.handlers = [
+                h
+                for h in lg.handlers
+                if not (
+                    isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)
+                )
+            ]
+
+    return _LITELLM
+
+
+def _limiter_key(adapter: "LiteLLMAdapter", *args: Any, **kwargs: Any) -> str:
+    """Calls to the same provider/model share one rate limiter."""
+    return f"{adapter.provider}/{adapter.model}"
+
+
 class LiteLLMAdapter:
     """LiteLLM adapter supporting 100+ LLM providers."""
 
@@ -54,6 +101,12 @@ class LiteLLMAdapter:
         self.api_base = kwargs.pop("api_base", None)
         self.drop_params = kwargs.pop("drop_params", True)
         self.timeout = kwargs.pop("timeout", 600)
+        self.prompt_cache = kwargs.pop("prompt_cache", Config.PROMPT_CACHE)
+
+        # id(message) -> (message, converted dicts); see _convert_messages.
+        self._message_cache: Dict[int, Tuple[LLMMessage, List[Dict]]] = {}
+        # (pooled httpx client, OpenAI SDK client on it); see _request_client.
+        self._sdk_client: Optional[Tuple[Any, Any]] = None
 
         if self.provider == "chatgpt":
             from .chatgpt_auth import configure_chatgpt_auth_env
@@ -67,45 +120,40 @@ class LiteLLMAdapter:
         logger.info(f"Initialized LiteLLM adapter for provider: {self.provider}, model: {model}")
 
     def _get_litellm(self):
-        global _LITELLM  # noqa: PLW0603
-        if _LITELLM is None:
-            _LITELLM = importlib.import_module("litellm")
-
-            # Suppress LiteLLM's verbose logging to console.
-            # LiteLLM adds its own StreamHandler(stderr) on import; remove it
-            # to prevent debug messages leaking to the terminal in bot mode.
-            litellm_logger = logging.getLogger("LiteLLM")
-            litellm_logger.handlers = [
-                h
-                for h in litellm_logger.handlers
-                if not (
-                    isinstance(h, logging.StreamHandler) and not isinstance(h, logging.FileHandler)
-                )
-            ]
-            litellm_logger.setLevel(logging.WARNING)
-            litellm_logger.propagate = False
-
-            # Also suppress httpx and upstream provider loggers that LiteLLM uses.
-            for name in ("httpx", "openai", "anthropic", "LiteLLM Proxy", "LiteLLM Router"):
-                lg = logging.getLogger(name)
-                lg.setLevel(logging.WARNING)
-                lg.handlers = [
-                    h
-                    for h in lg.handlers
-                    if not (
-                        isinstance(h, logging.StreamHandler)
-                        and not isinstance(h, logging.FileHandler)
-                    )
-                ]
-
-        return _LITELLM
+        return load_litellm()
 
     def _configure_litellm_globals(self) -> None:
+        # Only settings shared by every adapter; per-adapter ones (drop_params,
+        # the HTTP client) go with each request so concurrent adapters can't
+        # see each other's.
         litellm = self._get_litellm()
-        litellm.drop_params = self.drop_params
         litellm.set_verbose = False
         litellm.suppress_debug_info = True
 
+    def _request_client(self) -> Optional[Any]:
+        """SDK client on the pooled keep-alive connection, for ``openai/`` models.
+
+        LiteLLM sends ``openai/`` requests through the OpenAI SDK, which takes a
+        per-request ``client``; other providers use LiteLLM's own cached httpx
+        clients. Rebuilt when the pool hands out a new client (new event loop).
+        Returns None when the SDK client can't be built (e.g. no API key), so
+        LiteLLM reports the problem as usual.
+        """
+        if self.provider != "openai":
+            return None
+        http_client = get_http_client(self.api_base)
+        if self._sdk_client is None or self._sdk_client[0] is not http_client:
+            from openai import AsyncOpenAI, OpenAIError
+
+            try:
+                client = AsyncOpenAI(
+                    api_key=self.api_key, base_url=self.api_base, http_client=http_client
+                )
+            except OpenAIError:
+                return None
+            self._sdk_client = (http_client, client)
+        return self._sdk_client[1]
+
     @with_retry()
     async def _ensure_chatgpt_access_token_with_retry(self) -> None:
         from .chatgpt_auth import ensure_chatgpt_access_token
@@ -145,7 +193,7 @@ class LiteLLMAdapter:
                 ) from e
             return
 
-    @with_retry()
+    @with_retry(limiter_key=_limiter_key)
     async def _make_api_call_async(self, **call_params):
         """Internal async API call with retry logic."""
         self._configure_litellm_globals()
@@ -153,6 +201,9 @@ class LiteLLMAdapter:
         acompletion = getattr(litellm, "acompletion", None)
         if acompletion is None:
             raise RuntimeError("LiteLLM async completion is unavailable.")
+        client = self._request_client()
+        if client is not None:
+            call_params.setdefault("client", client)
         return await acompletion(**call_params)
 
     def _build_call_params(
@@ -170,6 +221,7 @@ class LiteLLMAdapter:
             "messages": litellm_messages,
             "timeout": self.timeout,
             "max_tokens": max_tokens if max_tokens is not None else self.DEFAULT_MAX_TOKENS,
+            "drop_params": self.drop_params,
         }
 
         # Add API key if provided
@@ -184,6 +236,13 @@ class LiteLLMAdapter:
         if tools:
             call_params["tools"] = self._convert_tools(tools)
 
+        if self.prompt_cache and supports_cache_control(self.model):
+            call_params["messages"], cached_tools = apply_cache_breakpoints(
+                litellm_messages, call_params.get("tools")
+            )
+            if cached_tools:
+                call_params["tools"] = cached_tools
+
         # Add any additional parameters
         call_params.update(kwargs)
 
@@ -225,80 +284,165 @@ class LiteLLMAdapter:
 
         return self._convert_response(response)
 
+    async def call_stream_async(
+        self,
+        messages: List[LLMMessage],
+        tools: Optional[List[Dict[str, Any]]] = None,
+        max_tokens: int | None = None,
+        *,
+        on_tool_call: Optional[ToolCallCallback] = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Streaming LLM call via LiteLLM.
+
+        Returns the same ``LLMResponse`` as ``call_async``. While the stream is
+        in flight, ``on_tool_call`` receives each tool call as soon as its
+        arguments are complete (the next call has started, or the stream
+        ended), so the caller can start executing it early.
+        """
+        await self._ensure_provider_ready()
+        litellm_messages, call_params = self._build_call_params(
+            messages=messages,
+            tools=tools,
+            max_tokens=max_tokens,
+            **kwargs,
+        )
+        call_params["stream"] = True
+        call_params["stream_options"] = {"include_usage": True}
+
+        logger.debug(
+            f"Streaming LiteLLM async with model: {self.model}, messages: {len(litellm_messages)}, tools: {len(tools) if tools else 0}"
+        )
+        return await self._make_streaming_call_async(on_tool_call, **call_params)
+
+    @with_retry(limiter_key=_limiter_key)
+    async def _make_streaming_call_async(
+        self, on_tool_call: Optional[ToolCallCallback], **call_params
+    ) -> LLMResponse:
+        """Internal streaming API call with retry logic.
+
+        A retry restarts the stream from scratch; callers dedupe
+        ``on_tool_call`` notifications by tool call ID.
+        """
+        self._configure_litellm_globals()
+        litellm = self._get_litellm()
+        acompletion = getattr(litellm, "acompletion", None)
+        if acompletion is None:
+            raise RuntimeError("LiteLLM async completion is unavailable.")
+        client = self._request_client()
+        if client is not None:
+            call_params.setdefault("client", client)
+        stream = await acompletion(**call_params)
+        # The stream wrapper, not the final response, carries the headers.
+        get_rate_limiter(_limiter_key(self)).observe_headers(response_headers(stream))
+        accumulator = _StreamAccumulator(on_tool_call)
+        async for chunk in stream:
+            accumulator.add_chunk(chunk)
+        return accumulator.finish()
+
+    def invalidate_message_cache(self) -> None:
+        """Forget memoized message conversions.
+
+        Called by the loop when the conversation history is rewritten
+        (``MessageList.replace``), e.g. after compaction.
+        """
+        self._message_cache.clear()
+
     def _convert_messages(self, messages: List[LLMMessage]) -> List[Dict]:
         """Convert LLMMessage to LiteLLM format (OpenAI-compatible).
 
         Handles both new format (tool_calls field, tool role) and legacy format
         (tool_result blocks in user content).
-        """
-        litellm_messages = []
 
+        History is append-only between rewrites, so conversions are memoized
+        per message object and each call only converts the new tail.
+        """
+        cache = self._message_cache
+        litellm_messages: List[Dict] = []
         for msg in messages:
-            # Handle system messages
-            if msg.role == "system":
-                content = msg.content if isinstance(msg.content, str) else extract_text(msg.content)
-                litellm_messages.append({"role": "system", "content": content})
-
-            # Handle tool messages (new OpenAI format)
-            elif msg.role == "tool":
-                tool_msg: Dict[str, Any] = {
-                    "role": "tool",
-                    "content": msg.content or "",
-                    "tool_call_id": msg.tool_call_id or "",
-                }
-                litellm_messages.append(tool_msg)
-
-            # Handle user messages
-            elif msg.role == "user":
-                if isinstance(msg.content, str):
-                    litellm_messages.append({"role": "user", "content": msg.content})
-                elif isinstance(msg.content, list):
-                    # Legacy: Handle tool results (Anthropic format)
-                    # Convert to tool messages for OpenAI compatibility
-                    tool_messages = self._convert_anthropic_tool_results(msg.content)
-                    if tool_messages:
-                        litellm_messages.extend(tool_messages)
-                    else:
-                        # Pass through as multimodal content blocks (text + image_url).
-                        # LiteLLM supports OpenAI vision format natively.
-                        multimodal_msg: Dict[str, Any] = {
-                            "role": "user",
-                            "content": msg.content,
-                        }
-                        litellm_messages.append(multimodal_msg)
+            entry = cache.get(id(msg))
+            # The entry holds a strong ref, so a matching id is the same object.
+            if entry is None or entry[0] is not msg:
+                entry = (msg, self._convert_message(msg))
+                cache[id(msg)] = entry
+            litellm_messages.extend(entry[1])
+
+        # Drop entries for messages that have left the history.
+        if len(cache) > 2 * len(messages) + 16:
+            live = {id(msg) for msg in messages}
+            for key in [key for key in cache if key not in live]:
+                del cache[key]
+        return litellm_messages
+
+    def _convert_message(self, msg: LLMMessage) -> List[Dict]:
+        """Convert one LLMMessage into zero or more LiteLLM messages."""
+        litellm_messages: List[Dict] = []
+
+        # Handle system messages
+        if msg.role == "system":
+            content = msg.content if isinstance(msg.content, str) else extract_text(msg.content)
+            litellm_messages.append({"role": "system", "content": content})
+
+        # Handle tool messages (new OpenAI format)
+        elif msg.role == "tool":
+            tool_msg: Dict[str, Any] = {
+                "role": "tool",
+                "content": msg.content or "",
+                "tool_call_id": msg.tool_call_id or "",
+            }
+            litellm_messages.append(tool_msg)
+
+        # Handle user messages
+        elif msg.role == "user":
+            if isinstance(msg.content, str):
+                litellm_messages.append({"role": "user", "content": msg.content})
+            elif isinstance(msg.content, list):
+                # Legacy: Handle tool results (Anthropic format)
+                # Convert to tool messages for OpenAI compatibility
+                tool_messages = self._convert_anthropic_tool_results(msg.content)
+                if tool_messages:
+                    litellm_messages.extend(tool_messages)
                 else:
-                    content = extract_text(msg.content)
-                    litellm_messages.append({"role": "user", "content": content})
-
-            # Handle assistant messages
-            elif msg.role == "assistant":
-                assistant_msg: Dict[str, Any] = {"role": "assistant"}
-
-                # New format: tool_calls field
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    assistant_msg["tool_calls"] = msg.tool_calls
-                    # Content can be None or text
-                    if msg.content:
-                        assistant_msg["content"] = msg.content
-                    else:
-                        assistant_msg["content"] = None
-                # Simple string content
-                elif isinstance(msg.content, str):
+                    # Pass through as multimodal content blocks (text + image_url).
+                    # LiteLLM supports OpenAI vision format natively.
+                    multimodal_msg: Dict[str, Any] = {
+                        "role": "user",
+                        "content": msg.content,
+                    }
+                    litellm_messages.append(multimodal_msg)
+            else:
+                content = extract_text(msg.content)
+                litellm_messages.append({"role": "user", "content": content})
+
+        # Handle assistant messages
+        elif msg.role == "assistant":
+            assistant_msg: Dict[str, Any] = {"role": "assistant"}
+
+            # New format: tool_calls field
+            if hasattr(msg, "tool_calls") and msg.tool_calls:
+                assistant_msg["tool_calls"] = msg.tool_calls
+                # Content can be None or text
+                if msg.content:
                     assistant_msg["content"] = msg.content
-                # Legacy: complex content (may contain tool calls)
                 else:
-                    # Extract tool calls from legacy format
-                    tool_calls = extract_tool_calls_from_content(msg.content)
-                    if tool_calls:
-                        assistant_msg["tool_calls"] = tool_calls
-                        # Also extract any text content
-                        text = extract_text(msg.content)
-                        assistant_msg["content"] = text if text else None
-                    else:
-                        content = extract_text(msg.content)
-                        assistant_msg["content"] = content if content else ""
-
-                litellm_messages.append(assistant_msg)
+                    assistant_msg["content"] = None
+            # Simple string content
+            elif isinstance(msg.content, str):
+                assistant_msg["content"] = msg.content
+            # Legacy: complex content (may contain tool calls)
+            else:
+                # Extract tool calls from legacy format
+                tool_calls = extract_tool_calls_from_content(msg.content)
+                if tool_calls:
+                    assistant_msg["tool_calls"] = tool_calls
+                    # Also extract any text content
+                    text = extract_text(msg.content)
+                    assistant_msg["content"] = text if text else None
+                else:
+                    content = extract_text(msg.content)
+                    assistant_msg["content"] = content if content else ""
+
+            litellm_messages.append(assistant_msg)
 
         return litellm_messages
 
@@ -543,3 +687,109 @@ class LiteLLMAdapter:
     def provider_name(self) -> str:
         """Name of the LLM provider."""
         return self.provider.upper()
+
+
+def _field(obj: Any, key: str, default: Any = None) -> Any:
+    """Read ``key`` from a LiteLLM stream object or a plain dict."""
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
+
+class _StreamAccumulator:
+    """Reassemble streamed LiteLLM chunks into an ``LLMResponse``.
+
+    Tool call deltas arrive keyed by ``index``; a call is complete once a
+    higher index shows up or the stream ends, at which point it is handed to
+    ``on_tool_call``.
+    """
+
+    def __init__(self, on_tool_call: Optional[ToolCallCallback]) -> None:
+        self._on_tool_call = on_tool_call
+        self._text: List[str] = []
+        self._thinking: List[str] = []
+        self._calls: Dict[int, Dict[str, str]] = {}
+        self._emitted: set[int] = set()
+        self._finish_reason: Optional[str] = None
+        self._usage: Any = None
+
+    def add_chunk(self, chunk: Any) -> None:
+        usage = _field(chunk, "usage")
+        if usage:
+            self._usage = usage
+        choices = _field(chunk, "choices") or []
+        if not choices:
+            return
+        choice = choices[0]
+        finish_reason = _field(choice, "finish_reason")
+        if finish_reason:
+            self._finish_reason = finish_reason
+        delta = _field(choice, "delta")
+        if delta is None:
+            return
+        content = _field(delta, "content")
+        if isinstance(content, str) and content:
+            self._text.append(content)
+        reasoning = _field(delta, "reasoning_content")
+        if isinstance(reasoning, str) and reasoning:
+            self._thinking.append(reasoning)
+        for tc in _field(delta, "tool_calls") or []:
+            self._add_tool_call_delta(tc)
+
+    def _add_tool_call_delta(self, tc: Any) -> None:
+        index = _field(tc, "index")
+        if not isinstance(index, int):
+            index = max(self._calls, default=0)
+        # A new index means every lower-indexed call has finished streaming.
+        for done in sorted(i for i in self._calls if i < index):
+            self._emit(done)
+        call = self._calls.setdefault(index, {"id": "", "name": "", "arguments": ""})
+        call_id = _field(tc, "id")
+        if call_id:
+            call["id"] = call_id.split("__thought__")[0]
+        function = _field(tc, "function")
+        if function is not None:
+            name = _field(function, "name")
+            if name:
+                call["name"] = name
+            arguments = _field(function, "arguments")
+            if arguments:
+                call["arguments"] += arguments
+
+    def _block(self, index: int) -> ToolCallBlock:
+        call = self._calls[index]
+        return {
+            "id": call["id"],
+            "type": "function",
+            "function": {"name": call["name"], "arguments": call["arguments"]},
+        }
+
+    def _emit(self, index: int) -> None:
+        if index in self._emitted:
+            return
+        self._emitted.add(index)
+        if self._on_tool_call is not None:
+            self._on_tool_call(self._block(index))
+
+    def finish(self) -> LLMResponse:
+        for index in sorted(self._calls):
+            self._emit(index)
+        tool_calls = [self._block(i) for i in sorted(self._calls)] or None
+
+        usage_dict = None
+        if self._usage:
+            usage_dict = {
+                "input_tokens": _field(self._usage, "prompt_tokens", 0) or 0,
+                "output_tokens": _field(self._usage, "completion_tokens", 0) or 0,
+                "cache_read_tokens": _field(self._usage, "cache_read_input_tokens", 0) or 0,
+                "cache_creation_tokens": _field(self._usage, "cache_creation_input_tokens", 0) or 0,
+            }
+
+        stop_reason = StopReason.normalize(self._finish_reason or "stop")
+        return LLMResponse(
+            content="".join(self._text) or None,
+            tool_calls=tool_calls,
+            stop_reason=stop_reason,
+            usage=usage_dict,
+            thinking="".join(self._thinking) or None,
+        )
@@ -4,7 +4,8 @@ This module defines the standard message formats used throughout the codebase.
 All types follow the OpenAI/LiteLLM format for consistency and serialization.
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Literal, Optional, Union
 
 from typing_extensions import TypedDict
@@ -66,7 +67,20 @@ class StopReason:
 # =============================================================================
 
 
-@dataclass
+# Fields whose values repeat across a session (roles, tool names) and are worth
+# sharing a single string object for.
+_INTERNED_FIELDS = frozenset({"role", "name"})
+
+
+def _intern_tool_names(tool_calls: Optional[List[ToolCallBlock]]) -> None:
+    """Intern function names inside tool calls in place."""
+    for tool_call in tool_calls or ():
+        function = tool_call.get("function") if isinstance(tool_call, dict) else None
+        if isinstance(function, dict) and isinstance(function.get("name"), str):
+            function["name"] = sys.intern(function["name"])
+
+
+@dataclass(slots=True, weakref_slot=True)
 class LLMMessage:
     """Unified message format across all LLM providers.
 
@@ -78,6 +92,11 @@ class LLMMessage:
     - name: For tool role, name of the tool
 
     This class is fully JSON-serializable via to_dict()/from_dict().
+
+    Instances are slotted and intern ``role``, ``name`` and tool-call function
+    names, since long sessions hold many thousands of them. ``to_dict()`` is
+    cached until a field is reassigned; mutating ``content`` or ``tool_calls``
+    in place is not detected, so replace them instead.
     """
 
     role: Literal["system", "user", "assistant", "tool"]
@@ -85,13 +104,31 @@ class LLMMessage:
     tool_calls: Optional[List[ToolCallBlock]] = None
     tool_call_id: Optional[str] = None  # For tool role
     name: Optional[str] = None  # Tool name (for tool role)
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        if key != "_dict_cache":
+            if key in _INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            elif key == "tool_calls":
+                _intern_tool_names(value)
+            object.__setattr__(self, "_dict_cache", None)
+        object.__setattr__(self, key, value)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization and API calls.
 
+        The dict is cached and shared between calls; treat it as read-only.
+
         Returns:
             Dict representation in OpenAI format
         """
+        cached = self._dict_cache
+        if cached is not None:
+            return cached
+
         result: Dict[str, Any] = {"role": self.role}
 
         if self.content is not None:
@@ -106,6 +143,7 @@ class LLMMessage:
         if self.name:
             result["name"] = self.name
 
+        object.__setattr__(self, "_dict_cache", result)
         return result
 
     @classmethod
@@ -153,6 +191,8 @@ class LLMResponse:
         stop_reason: Normalized stop reason (StopReason constants)
         usage: Token usage dict {"input_tokens": int, "output_tokens": int}
         thinking: Thinking/reasoning content (for models that support it)
+        model: Model that answered, set when a ``RoutingAdapter`` may have
+            used a backup instead of the configured model
     """
 
     content: Optional[str] = None
@@ -160,6 +200,7 @@ class LLMResponse:
     stop_reason: str = StopReason.STOP
     usage: Optional[Dict[str, int]] = None
     thinking: Optional[str] = None
+    model: Optional[str] = None
 
     def to_message(self) -> LLMMessage:
         """Convert response to an LLMMessage for storing in conversation history.
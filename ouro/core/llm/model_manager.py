@@ -35,6 +35,10 @@ models:
   #   api_base: http://localhost:11434
 default: null
 current: null
+# Optional: models to hedge slow requests to and fail over to on errors,
+# in order of preference (see LLM_HEDGE_* in ~/.ouro/config).
+# fallback:
+#   - openai/gpt-4o
 """
 
 
@@ -118,6 +122,7 @@ class ModelManager:
         self.models: dict[str, ModelProfile] = {}
         self.default_model_id: str | None = None
         self.current_model_id: str | None = None
+        self.fallback_model_ids: list[str] = []
         self._load()
 
     def _ensure_yaml(self) -> None:
@@ -197,6 +202,12 @@ class ModelManager:
         self.current_model_id = current if isinstance(current, str) else self.default_model_id
         if self.current_model_id not in self.models:
             self.current_model_id = self.default_model_id
+
+        fallback = config.get("fallback") or []
+        if not isinstance(fallback, list):
+            logger.warning("Invalid models.yaml format: 'fallback' should be a list")
+            fallback = []
+        self.fallback_model_ids = [m for m in fallback if isinstance(m, str) and m in self.models]
         logger.info(f"Loaded {len(self.models)} models from {self.config_path}")
 
     def _save(self) -> None:
@@ -208,6 +219,8 @@ class ModelManager:
             "default": self.default_model_id,
             "current": self.current_model_id,
         }
+        if self.fallback_model_ids:
+            config["fallback"] = list(self.fallback_model_ids)
         header = "# Model Configuration\n# This file is gitignored - do not commit to version control\n\n"
         body = yaml.safe_dump(config, sort_keys=False, allow_unicode=True)
         self._atomic_write(header + body)
@@ -248,6 +261,17 @@ class ModelManager:
         self._save()
         return self.get_current_model()
 
+    def get_fallback_models(self, primary_id: str | None = None) -> list[ModelProfile]:
+        """Configured fallback profiles, in order, excluding ``primary_id`` and invalid ones."""
+        profiles = []
+        for model_id in self.fallback_model_ids:
+            profile = self.models.get(model_id)
+            if profile is None or model_id == primary_id:
+                continue
+            if self.validate_model(profile)[0]:
+                profiles.append(profile)
+        return profiles
+
     def validate_model(self, model: ModelProfile) -> tuple[bool, str]:
         """Validate a model has required configuration."""
         if not model.model_id:
@@ -269,4 +293,5 @@ class ModelManager:
         self.models.clear()
         self.default_model_id = None
         self.current_model_id = None
+        self.fallback_model_ids = []
         self._load()
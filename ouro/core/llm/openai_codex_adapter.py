@@ -12,13 +12,16 @@ import base64
 import json
 import platform
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from typing import Any
 
 import httpx
 
+from ouro.core.http_pool import get_http_client
 from ouro.core.log import get_logger
+from ouro.core.ratelimit import get_rate_limiter
 
+from .adapter import ToolCallCallback
 from .content_utils import extract_text
 from .message_types import LLMMessage, LLMResponse, StopReason, ToolCall, ToolCallBlock, ToolResult
 from .retry import with_retry
@@ -29,6 +32,11 @@ DEFAULT_CODEX_BASE_URL = "https://chatgpt.com/backend-api"
 JWT_CLAIM_PATH = "https://api.openai.com/auth"
 
 
+def _limiter_key(adapter: OpenAICodexAdapter, *args: Any, **kwargs: Any) -> str:
+    """All Codex calls for one model share a rate limiter."""
+    return f"chatgpt/{adapter.model}"
+
+
 class OpenAICodexAdapter:
     """Adapter for ChatGPT subscription models exposed as openai-codex/*."""
 
@@ -47,11 +55,30 @@ class OpenAICodexAdapter:
         max_tokens: int | None = None,
         **kwargs: Any,
     ) -> LLMResponse:
+        return await self.call_stream_async(messages, tools, max_tokens, **kwargs)
+
+    async def call_stream_async(
+        self,
+        messages: list[LLMMessage],
+        tools: list[dict[str, Any]] | None = None,
+        max_tokens: int | None = None,
+        *,
+        on_tool_call: ToolCallCallback | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Call the Codex endpoint, reporting each finished tool call as it streams.
+
+        The endpoint is always SSE; ``call_async`` is this method without a
+        callback.
+        """
         token = await self._ensure_access_token()
         account_id = _extract_account_id(token)
         body = self._build_request_body(messages, tools, max_tokens, **kwargs)
+        on_event = _tool_call_event_listener(on_tool_call) if on_tool_call is not None else None
         try:
-            events = await self._request_events(token=token, account_id=account_id, body=body)
+            events = await self._request_events(
+                token=token, account_id=account_id, body=body, on_event=on_event
+            )
         except httpx.RequestError as e:
             raise RuntimeError(
                 _format_request_error(e, url=_resolve_codex_url(self.api_base))
@@ -173,29 +200,34 @@ class OpenAICodexAdapter:
             for tool in tools
         ]
 
-    @with_retry()
+    @with_retry(limiter_key=_limiter_key)
     async def _request_events(
         self,
         *,
         token: str,
         account_id: str,
         body: dict[str, Any],
+        on_event: Callable[[dict[str, Any]], None] | None = None,
     ) -> list[dict[str, Any]]:
         headers = _build_sse_headers(token=token, account_id=account_id)
         timeout = httpx.Timeout(float(self.timeout))
         events: list[dict[str, Any]] = []
-        async with (
-            httpx.AsyncClient(timeout=timeout) as client,
-            client.stream(
-                "POST",
-                _resolve_codex_url(self.api_base),
-                headers=headers,
-                json=body,
-            ) as response,
-        ):
+        url = _resolve_codex_url(self.api_base)
+        client = get_http_client(url)
+        async with client.stream(
+            "POST", url, headers=headers, json=body, timeout=timeout
+        ) as response:
             if response.status_code >= 400:
-                raise RuntimeError(await _format_error_response(response))
-            events.extend([event async for event in _iter_sse_events(response)])
+                raise CodexHTTPError(
+                    await _format_error_response(response),
+                    status_code=response.status_code,
+                    headers=response.headers,
+                )
+            get_rate_limiter(_limiter_key(self)).observe_headers(response.headers)
+            async for event in _iter_sse_events(response):
+                events.append(event)
+                if on_event is not None:
+                    on_event(event)
         return events
 
     def extract_text(self, response: LLMResponse) -> str:
@@ -244,6 +276,22 @@ class OpenAICodexAdapter:
         return "OPENAI-CODEX"
 
 
+def _tool_call_event_listener(
+    on_tool_call: ToolCallCallback,
+) -> Callable[[dict[str, Any]], None]:
+    """Forward each completed ``function_call`` output item to ``on_tool_call``."""
+
+    def on_event(event: dict[str, Any]) -> None:
+        if event.get("type") != "response.output_item.done":
+            return
+        item = _dict_value(event, "item")
+        if item.get("type") != "function_call":
+            return
+        on_tool_call(_normalize_codex_tool_call(item, str(item.get("arguments") or "")))
+
+    return on_event
+
+
 def _message_text(msg: LLMMessage) -> str:
     if isinstance(msg.content, str):
         return msg.content
@@ -341,6 +389,15 @@ async def _iter_sse_events(response: httpx.Response) -> AsyncIterator[dict[str,
                 yield event
 
 
+class CodexHTTPError(RuntimeError):
+    """HTTP error from the Codex endpoint; keeps status and headers for retry pacing."""
+
+    def __init__(self, message: str, *, status_code: int, headers: Any = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+        self.headers = dict(headers or {})
+
+
 async def _format_error_response(response: httpx.Response) -> str:
     text = await response.aread()
     try:
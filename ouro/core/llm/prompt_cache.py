@@ -0,0 +1,87 @@
+"""Prompt-cache breakpoint planning.
+
+Anthropic-style providers only cache a prompt prefix up to an explicit
+``cache_control`` marker, and allow at most four markers per request. The
+planner places them where the prefix is stable:
+
+1. the last tool schema (tools are rendered first),
+2. the last system message,
+3. the end of the previous request (the message before the latest assistant
+   turn), which the previous call wrote to the cache and this call reads,
+4. the last message, which writes the cache for the next iteration.
+
+After compaction the tool and system breakpoints still match, so only the
+conversation part is re-written.
+
+Markers are added to shallow copies; the input dicts (which may be shared
+with the adapter's conversion cache) are never mutated. Providers with
+automatic prefix caching (OpenAI, DeepSeek, ...) need no markers and are
+left alone.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+EPHEMERAL: dict[str, str] = {"type": "ephemeral"}
+
+# Provider prefixes that forward ``cache_control`` to an Anthropic model.
+_CACHE_CONTROL_PROVIDERS = ("anthropic", "bedrock", "vertex_ai", "openrouter")
+
+
+def supports_cache_control(model: str) -> bool:
+    """Whether ``model`` takes explicit Anthropic-style cache markers."""
+    name = model.lower()
+    provider = name.split("/", 1)[0] if "/" in name else ""
+    if provider == "anthropic":
+        return True
+    return provider in _CACHE_CONTROL_PROVIDERS and "claude" in name
+
+
+def plan_breakpoints(messages: list[dict[str, Any]]) -> list[int]:
+    """Message indices to mark: last system message, previous tail, current tail."""
+    marked: list[int] = []
+    last_system = -1
+    last_assistant = -1
+    for i, msg in enumerate(messages):
+        role = msg.get("role")
+        if role == "system":
+            last_system = i
+        elif role == "assistant":
+            last_assistant = i
+
+    if last_system >= 0:
+        marked.append(last_system)
+    previous_tail = last_assistant - 1
+    if previous_tail > last_system:
+        marked.append(previous_tail)
+    tail = len(messages) - 1
+    if tail > last_system and tail not in marked:
+        marked.append(tail)
+    return marked
+
+
+def apply_cache_breakpoints(
+    messages: list[dict[str, Any]],
+    tools: list[dict[str, Any]] | None = None,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]] | None]:
+    """Return ``(messages, tools)`` with ``cache_control`` markers added."""
+    marked_messages = list(messages)
+    for i in plan_breakpoints(messages):
+        marked_messages[i] = _with_marker(messages[i])
+
+    marked_tools = tools
+    if tools:
+        marked_tools = list(tools)
+        marked_tools[-1] = {**tools[-1], "cache_control": EPHEMERAL}
+    return marked_messages, marked_tools
+
+
+def _with_marker(message: dict[str, Any]) -> dict[str, Any]:
+    content = message.get("content")
+    if isinstance(content, list) and content and isinstance(content[-1], dict):
+        # Block content: the marker goes on the last block.
+        blocks = list(content)
+        blocks[-1] = {**blocks[-1], "cache_control": EPHEMERAL}
+        return {**message, "content": blocks}
+    return {**message, "cache_control": EPHEMERAL}
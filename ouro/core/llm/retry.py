@@ -1,7 +1,10 @@
 """Retry utilities for LLM API calls using tenacity."""
 
 import asyncio
-from typing import Callable, TypeVar
+import functools
+import random
+from collections.abc import Mapping
+from typing import Any, Callable, TypeVar
 
 import httpx
 from tenacity import retry, retry_if_exception, stop_after_attempt
@@ -9,6 +12,7 @@ from tenacity.wait import wait_base
 
 from ouro.config import Config
 from ouro.core.log import get_logger
+from ouro.core.ratelimit import get_rate_limiter, retry_after_seconds
 
 logger = get_logger(__name__)
 T = TypeVar("T")
@@ -16,6 +20,8 @@ T = TypeVar("T")
 
 def is_rate_limit_error(error: BaseException) -> bool:
     """Check if an error is a rate limit error."""
+    if error_status_code(error) == 429:
+        return True
     error_str = str(error).lower()
     rate_limit_indicators = [
         "429",
@@ -71,12 +77,68 @@ def is_retryable_error(error: BaseException) -> bool:
     return any(indicator in error_str for indicator in retryable_indicators)
 
 
+def error_status_code(error: BaseException) -> int | None:
+    """HTTP status carried by a provider error, if any."""
+    for candidate in (getattr(error, "status_code", None), _response_attr(error, "status_code")):
+        if isinstance(candidate, int):
+            return candidate
+    return None
+
+
+def error_headers(error: BaseException) -> Mapping[str, Any] | None:
+    """Response headers attached to a provider error, if any.
+
+    httpx errors carry ``response.headers``; LiteLLM exceptions carry
+    ``litellm_response_headers`` and usually ``response`` as well.
+    """
+    for candidate in (
+        getattr(error, "litellm_response_headers", None),
+        _response_attr(error, "headers"),
+        getattr(error, "headers", None),
+    ):
+        if isinstance(candidate, Mapping) and candidate:
+            return candidate
+    return None
+
+
+def _response_attr(error: BaseException, name: str) -> Any:
+    try:
+        response = getattr(error, "response", None)
+        return getattr(response, name, None)
+    except Exception:
+        # Some SDK exceptions raise when ``response`` was never set.
+        return None
+
+
 class _ConfigBackoff(wait_base):
     def __call__(self, retry_state) -> float:
         attempt = max(retry_state.attempt_number - 1, 0)
         return Config.get_retry_delay(attempt)
 
 
+class _RateLimitAwareBackoff(_ConfigBackoff):
+    """Backoff that defers to the server and the shared limiter on 429s.
+
+    With a shared limiter (``paced``) the cooldown is enforced by
+    ``AdaptiveRateLimiter.acquire`` before the next attempt, so the retry
+    itself only adds a little jitter. Without one, ``Retry-After`` is used
+    directly when present.
+    """
+
+    def __init__(self, *, paced: bool) -> None:
+        self.paced = paced
+
+    def __call__(self, retry_state) -> float:
+        error = retry_state.outcome.exception() if retry_state.outcome else None
+        if error is not None and is_rate_limit_error(error):
+            if self.paced:
+                return random.uniform(0, Config.RETRY_INITIAL_DELAY)
+            hint = retry_after_seconds(error_headers(error))
+            if hint is not None:
+                return min(hint, Config.RETRY_MAX_DELAY) + random.uniform(0, 1)
+        return super().__call__(retry_state)
+
+
 def _boxed_retry_message(
     *, error_type: str, error: BaseException, delay: float, attempt: int
 ) -> str:
@@ -110,7 +172,10 @@ def _log_before_sleep(retry_state) -> None:
         return
 
     error_type = "Rate limit" if is_rate_limit_error(error) else "Retryable"
-    delay = _ConfigBackoff()(retry_state)
+    next_action = getattr(retry_state, "next_action", None)
+    delay = getattr(next_action, "sleep", None)
+    if delay is None:
+        delay = _ConfigBackoff()(retry_state)
     logger.warning(
         _boxed_retry_message(
             error_type=error_type,
@@ -121,23 +186,67 @@ def _log_before_sleep(retry_state) -> None:
     )
 
 
-def with_retry():
+def _paced(func: Callable[..., Any], limiter_key: Callable[..., str]) -> Callable[..., Any]:
+    """Route every attempt of ``func`` through the shared limiter for its key."""
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        limiter = get_rate_limiter(
+            limiter_key(*args, **kwargs),
+            base_delay=Config.RETRY_INITIAL_DELAY,
+            max_delay=Config.RETRY_MAX_DELAY,
+        )
+        await limiter.acquire()
+        try:
+            result = await func(*args, **kwargs)
+        except Exception as e:
+            if is_rate_limit_error(e):
+                headers = error_headers(e)
+                limiter.observe_headers(headers)
+                limiter.on_rate_limited(retry_after_seconds(headers))
+            raise
+        limiter.on_success()
+        limiter.observe_headers(response_headers(result))
+        return result
+
+    return wrapper
+
+
+def response_headers(response: Any) -> Mapping[str, Any] | None:
+    """Upstream headers LiteLLM attaches to a (streaming) response."""
+    hidden = getattr(response, "_hidden_params", None)
+    if isinstance(hidden, Mapping):
+        headers = hidden.get("additional_headers")
+        if isinstance(headers, Mapping):
+            return headers
+    return None
+
+
+def with_retry(*, limiter_key: Callable[..., str] | None = None):
     """Decorator to add async retry logic with exponential backoff.
 
     The total number of attempts is RETRY_MAX_ATTEMPTS + 1:
     - 1 initial attempt
     - RETRY_MAX_ATTEMPTS retry attempts (if initial fails)
+
+    Args:
+        limiter_key: Called with the wrapped function's arguments to name the
+            upstream (e.g. ``"anthropic/claude-sonnet-4-5"``). Attempts then
+            share one ``AdaptiveRateLimiter`` per key: a 429 puts every caller
+            of that upstream into the same cooldown and paces them out of it,
+            instead of each retrying on its own schedule.
     """
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        target = _paced(func, limiter_key) if limiter_key is not None else func
         # stop_after_attempt counts total attempts, not retries
         # So for N retries, we need N+1 total attempts
         return retry(
             retry=retry_if_exception(is_retryable_error),
             stop=stop_after_attempt(Config.RETRY_MAX_ATTEMPTS + 1),
-            wait=_ConfigBackoff(),
+            wait=_RateLimitAwareBackoff(paced=limiter_key is not None),
             reraise=True,
             before_sleep=_log_before_sleep,
-        )(func)
+        )(target)
 
     return decorator
@@ -0,0 +1,319 @@
+"""Hedged and fail-over routing across several model profiles.
+
+`RoutingAdapter` implements `LLMAdapter` on top of a primary adapter and an
+ordered list of backups:
+
+- **Hedging**: when the primary has not answered within its recent latency
+  percentile (``hedge_percentile``, floored at ``hedge_min_delay``), the same
+  request is also sent to the first backup and whichever answers first wins;
+  the other request is cancelled.
+- **Fail-over**: when a request fails with a transient error (see
+  ``is_retryable_error``) that survived the adapter's own retries, the next
+  backup is tried.  Errors in the request itself (bad request, context
+  length, ...) would fail the same way everywhere and are raised at once.
+
+The adapter that answered is reported in ``LLMResponse.model`` and becomes
+``RoutingAdapter.model``, so usage is priced and calibrated for the model
+that billed it.  Requests that lost a hedge are billed too: their usage
+(or, when cancelled in flight, the winner's input tokens as an estimate)
+is added to the response as ``hedge_input_tokens``/``hedge_output_tokens``,
+which count towards cost but not towards token calibration.
+
+Streaming calls report tool calls to the caller as they arrive, so the first
+attempt to report one is committed to: racing attempts are cancelled and no
+further hedge or fail-over is started for that call.
+
+`create_routed_adapter()` builds one from the ``fallback`` list in
+``models.yaml``; without fallbacks it returns the plain adapter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+from ouro.config import Config
+from ouro.core.log import get_logger
+
+from .adapter import LLMAdapter, ToolCallCallback, create_llm_adapter
+from .message_types import LLMMessage, LLMResponse, ToolCall, ToolCallBlock, ToolResult
+from .model_manager import ModelManager, ModelProfile
+from .retry import is_retryable_error
+
+logger = get_logger(__name__)
+
+_Call = Callable[[LLMAdapter, ToolCallCallback | None], Coroutine[Any, Any, LLMResponse]]
+
+
+class LatencyWindow:
+    """Rolling window of recent call latencies."""
+
+    def __init__(self, size: int = 50) -> None:
+        self._samples: deque[float] = deque(maxlen=size)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, pct: float) -> float | None:
+        """Nearest-rank percentile, or ``None`` with no samples."""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(pct / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+
+class RoutingAdapter:
+    """`LLMAdapter` that hedges slow calls and fails over across adapters."""
+
+    def __init__(
+        self,
+        primary: LLMAdapter,
+        backups: list[LLMAdapter],
+        *,
+        hedge_percentile: float = 95.0,
+        hedge_min_delay: float = 5.0,
+        hedge_initial_delay: float = 60.0,
+        min_samples: int = 8,
+        window: int = 50,
+    ) -> None:
+        """
+        Args:
+            primary: Adapter every call goes to first.
+            backups: Adapters to hedge to (the first one) and fail over to, in order.
+            hedge_percentile: Primary latency percentile after which a hedge is
+                sent; ``0`` disables hedging (fail-over still applies).
+            hedge_min_delay: Never hedge sooner than this many seconds.
+            hedge_initial_delay: Hedge delay used until ``min_samples``
+                latencies have been observed.
+            min_samples: Observations needed before the percentile is trusted.
+            window: Number of recent primary latencies to keep.
+        """
+        self.primary = primary
+        # Model of the adapter that answered the last call.
+        self.model = primary.model
+        self.backups = list(backups)
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_delay = hedge_min_delay
+        self.hedge_initial_delay = hedge_initial_delay
+        self.min_samples = min_samples
+        self.latencies = LatencyWindow(window)
+        self._stats = {"calls": 0, "hedged": 0, "hedge_wins": 0, "failovers": 0}
+
+    @property
+    def supports_tools(self) -> bool:
+        return self.primary.supports_tools
+
+    @property
+    def provider_name(self) -> str:
+        return self.primary.provider_name
+
+    def __getattr__(self, name: str) -> Any:
+        # Adapter-specific extras (api_base, token_tracker hooks, ...) come
+        # from the primary.
+        if name == "primary":
+            raise AttributeError(name)
+        return getattr(self.primary, name)
+
+    def hedge_delay(self) -> float | None:
+        """Seconds to wait on the primary before hedging, or ``None`` if disabled."""
+        if self.hedge_percentile <= 0 or not self.backups:
+            return None
+        if len(self.latencies) < self.min_samples:
+            return max(self.hedge_min_delay, self.hedge_initial_delay)
+        threshold = self.latencies.percentile(self.hedge_percentile) or 0.0
+        return max(self.hedge_min_delay, threshold)
+
+    def routing_stats(self) -> dict[str, int]:
+        """Counters: calls, hedges sent, hedges that won, fail-overs."""
+        return dict(self._stats)
+
+    async def call_async(
+        self,
+        messages: list[LLMMessage],
+        tools: list[dict[str, Any]] | None = None,
+        max_tokens: int | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        return await self._route(
+            lambda adapter, _cb: adapter.call_async(messages, tools, max_tokens, **kwargs),
+            on_tool_call=None,
+        )
+
+    async def call_stream_async(
+        self,
+        messages: list[LLMMessage],
+        tools: list[dict[str, Any]] | None = None,
+        max_tokens: int | None = None,
+        *,
+        on_tool_call: ToolCallCallback | None = None,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        async def call(adapter: LLMAdapter, cb: ToolCallCallback | None) -> LLMResponse:
+            stream = getattr(adapter, "call_stream_async", None)
+            if stream is None:
+                return await adapter.call_async(messages, tools, max_tokens, **kwargs)
+            return await stream(messages, tools, max_tokens, on_tool_call=cb, **kwargs)
+
+        return await self._route(call, on_tool_call=on_tool_call)
+
+    async def _route(self, call: _Call, *, on_tool_call: ToolCallCallback | None) -> LLMResponse:
+        candidates = [self.primary, *self.backups]
+        pending: dict[asyncio.Task[LLMResponse], LLMAdapter] = {}
+        errors: list[BaseException] = []
+        committed: list[asyncio.Task[Any] | None] = []
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        hedge_delay = self.hedge_delay()
+        hedged = False
+        next_index = 0
+        winner: LLMResponse | None = None
+        # Attempts that lost the race: their responses, or None if cancelled.
+        losers: list[LLMResponse | None] = []
+        self._stats["calls"] += 1
+
+        def forward(block: ToolCallBlock) -> None:
+            # Runs inside the attempt's task while it streams.
+            attempt = asyncio.current_task()
+            if not committed:
+                committed.append(attempt)
+                for other in pending:
+                    if other is not attempt:
+                        other.cancel()
+            if committed[0] is attempt and on_tool_call is not None:
+                on_tool_call(block)
+
+        def launch() -> None:
+            nonlocal next_index
+            adapter = candidates[next_index]
+            next_index += 1
+            task = asyncio.create_task(call(adapter, forward if on_tool_call else None))
+            pending[task] = adapter
+
+        launch()
+        try:
+            while pending:
+                timeout = None
+                # Only the primary is ever hedged, and only before it commits.
+                if hedge_delay is not None and next_index == 1 and not committed:
+                    timeout = max(0.0, started + hedge_delay - loop.time())
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if committed:
+                        # The primary reported a tool call while we waited.
+                        continue
+                    logger.info(
+                        f"{self.primary.model} slower than {hedge_delay:.1f}s; "
+                        f"hedging to {candidates[1].model}"
+                    )
+                    self._stats["hedged"] += 1
+                    hedged = True
+                    launch()
+                    continue
+
+                for task in done:
+                    adapter = pending.pop(task)
+                    if task.cancelled():
+                        losers.append(None)
+                        continue
+                    error = task.exception()
+                    if error is None:
+                        if adapter is self.primary:
+                            self.latencies.add(loop.time() - started)
+                        elif hedged and adapter is candidates[1]:
+                            self._stats["hedge_wins"] += 1
+                        winner = task.result()
+                        winner.model = winner.model or adapter.model
+                        self.model = adapter.model
+                        return winner
+                    logger.warning(f"{adapter.model} failed: {error}")
+                    if not is_retryable_error(error):
+                        raise error
+                    errors.append(error)
+
+                if not pending and next_index < len(candidates) and not committed:
+                    logger.info(f"Failing over to {candidates[next_index].model}")
+                    self._stats["failovers"] += 1
+                    launch()
+            raise errors[0] if errors else RuntimeError("All model routes were cancelled")
+        finally:
+            elapsed = loop.time() - started
+            for task, adapter in pending.items():
+                task.cancel()
+                if adapter is self.primary:
+                    # Censored sample: the primary took at least this long.
+                    self.latencies.add(elapsed)
+            if pending:
+                results = await asyncio.gather(*pending, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, LLMResponse):
+                        losers.append(result)
+                    elif isinstance(result, asyncio.CancelledError):
+                        losers.append(None)
+            if winner is not None and losers:
+                _add_loser_usage(winner, losers)
+
+    def extract_text(self, response: LLMResponse) -> str:
+        return self.primary.extract_text(response)
+
+    def extract_tool_calls(self, response: LLMResponse) -> list[ToolCall]:
+        return self.primary.extract_tool_calls(response)
+
+    def extract_thinking(self, response: LLMResponse) -> str | None:
+        return self.primary.extract_thinking(response)
+
+    def format_tool_results(self, results: list[ToolResult]) -> LLMMessage | list[LLMMessage]:
+        return self.primary.format_tool_results(results)
+
+    def invalidate_message_cache(self) -> None:
+        for adapter in (self.primary, *self.backups):
+            invalidate = getattr(adapter, "invalidate_message_cache", None)
+            if invalidate is not None:
+                invalidate()
+
+
+def _add_loser_usage(winner: LLMResponse, losers: list[LLMResponse | None]) -> None:
+    """Add what the attempts that lost a hedge were billed to ``winner.usage``."""
+    usage = dict(winner.usage or {})
+    for loser in losers:
+        if loser is None:
+            # Cancelled in flight: the prompt was sent, the answer unknown.
+            extra = {"input_tokens": usage.get("input_tokens", 0)}
+        else:
+            extra = loser.usage or {}
+        for key in ("input_tokens", "output_tokens"):
+            usage[f"hedge_{key}"] = usage.get(f"hedge_{key}", 0) + extra.get(key, 0)
+    winner.usage = usage
+
+
+def create_profile_adapter(profile: ModelProfile) -> LLMAdapter:
+    """Create the concrete adapter for one model profile."""
+    return create_llm_adapter(
+        model=profile.model_id,
+        api_key=profile.api_key,
+        api_base=profile.api_base,
+        drop_params=profile.drop_params,
+        timeout=profile.timeout,
+    )
+
+
+def create_routed_adapter(manager: ModelManager, profile: ModelProfile) -> LLMAdapter:
+    """Adapter for ``profile``, wrapped in a `RoutingAdapter` if fallbacks are configured."""
+    primary = create_profile_adapter(profile)
+    fallbacks = manager.get_fallback_models(profile.model_id)
+    if not fallbacks:
+        return primary
+    return RoutingAdapter(
+        primary,
+        [create_profile_adapter(p) for p in fallbacks],
+        hedge_percentile=Config.LLM_HEDGE_PERCENTILE,
+        hedge_min_delay=Config.LLM_HEDGE_MIN_DELAY,
+    )
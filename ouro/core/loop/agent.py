@@ -8,10 +8,19 @@ memory, BaseTool, verification, or terminal UI — those plug in via
 from __future__ import annotations
 
 import asyncio
+import json
 import os
 from typing import Any, Callable, Sequence
 
-from ouro.core.llm import LLMMessage, LLMResponse, StopReason, ToolCall, ToolOutput, ToolResult
+from ouro.core.llm import (
+    LLMMessage,
+    LLMResponse,
+    StopReason,
+    ToolCall,
+    ToolCallBlock,
+    ToolOutput,
+    ToolResult,
+)
 from ouro.core.llm.reasoning import normalize_reasoning_effort
 from ouro.core.log import get_logger
 from ouro.core.tracing import TraceEventType, Tracer
@@ -32,6 +41,10 @@ from .rules import RepeatedToolCallRule, Rule
 
 logger = get_logger(__name__)
 
+# Readonly tool calls started while the LLM response was still streaming,
+# keyed by tool_call_id. See ``Agent._call_llm``.
+_Prefetched = dict[str, tuple[ToolCall, "asyncio.Task[ToolOutput]"]]
+
 
 class Agent:
     """Hooks-based core loop."""
@@ -48,6 +61,9 @@ class Agent:
         repeat_tool_call_threshold: int = 3,
         rules: Sequence[Rule] = (),
         tracer: Tracer | None = None,
+        stream_tool_calls: bool = False,
+        context_budget: int | None = None,
+        count_tokens: Callable[[LLMMessage], int] | None = None,
     ) -> None:
         self.llm = llm
         self.tools = tools
@@ -68,6 +84,18 @@ class Agent:
         # runaway backstop). See `rules.py`.
         self.rules: list[Rule] = [RepeatedToolCallRule(repeat_tool_call_threshold)]
         self.rules.extend(rules)
+        # Stream responses (when the adapter has ``call_stream_async``) and
+        # start readonly tool calls as soon as their arguments finish, while
+        # the model is still writing later calls. See ``_call_llm``.
+        self.stream_tool_calls = stream_tool_calls
+        # Token budget for each outgoing request; older messages are stubbed
+        # in the request (not the history) to fit.  See
+        # ``MessageListContext.build_context``.
+        self.context_budget = context_budget
+        self.count_tokens = count_tokens
+        # (id, generation) of the history the adapter last converted; see
+        # ``_sync_message_cache``.
+        self._history_version: tuple[int, int] | None = None
 
     def set_reasoning_effort(self, value: str | None) -> None:
         self._reasoning_effort = normalize_reasoning_effort(value)
@@ -112,17 +140,29 @@ class Agent:
         if context is None:
             context = MessageListContext()
         ctx = RunStatistic(task=task, progress=self.progress, usage_callback=self._usage_callback)
+        await self._fanout_async("on_run_start", ctx, context.detached)
+        try:
+            return await self._run_iterations(ctx, context)
+        finally:
+            # Lets hooks stop background work (e.g. a compaction summary)
+            # that would otherwise keep spending tokens after the run.
+            await self._fanout_async("on_run_end", ctx)
+
+    async def _run_iterations(self, ctx: RunStatistic, context: MessageListContext) -> str:
         messages = context.detached
-        await self._fanout_async("on_run_start", ctx, messages)
-
         tool_schemas = self.tools.get_tool_schemas()
         final_answer: str = ""
+        prefetched: _Prefetched = {}
         for ctx.iteration in range(1, self.max_iterations + 1):
             # Hooks may mutate ``context`` in place here (e.g.
             # ``CompactionHook`` compresses ``context.detached``).
             # The loop continues with whatever state they leave behind.
             await self._fanout_async("on_iteration_start", ctx, context, tool_schemas)
-            outgoing = context.build_context()
+            self._sync_message_cache(messages)
+            outgoing = context.build_context(
+                token_budget=self.context_budget, count_tokens=self.count_tokens
+            )
+            ctx.request_trimmed = context.last_build_trimmed
 
             async with self.progress.spinner(
                 "Analyzing request..." if ctx.iteration == 1 else "Processing results..."
@@ -154,7 +194,7 @@ class Agent:
                         "agent.iteration": ctx.iteration,
                     },
                 ) as llm_span:
-                    response = await self.llm.call_async(**call_kwargs)
+                    response = await self._call_llm(call_kwargs, prefetched)
                     usage = getattr(response, "usage", None) or {}
                     llm_span.set_attributes(
                         {
@@ -169,6 +209,8 @@ class Agent:
                     )
             ctx.stop_reason_last = response.stop_reason
             ctx.add_usage(getattr(response, "usage", None))
+            if response.stop_reason != StopReason.TOOL_CALLS:
+                await _discard_prefetched(prefetched)
 
             extract_thinking = getattr(self.llm, "extract_thinking", None)
             if extract_thinking is not None:
@@ -206,6 +248,7 @@ class Agent:
 
                 tool_calls = self.llm.extract_tool_calls(response)
                 if not tool_calls:
+                    await _discard_prefetched(prefetched)
                     final_answer = self.llm.extract_text(response) or ""
                     return final_answer or "No response generated."
 
@@ -235,7 +278,7 @@ class Agent:
 
                     contents: dict[str, str] = dict(blocked)
                     if remaining:
-                        results = await self._dispatch_tools(ctx, remaining)
+                        results = await self._dispatch_tools(ctx, remaining, prefetched)
                         for tc, tr in zip(remaining, results):
                             contents[tc.id] = self._rules_after(ctx, tc, tr)
 
@@ -258,6 +301,10 @@ class Agent:
                     if snap and snap[-1].role == "assistant":
                         messages.replace(snap[:-1])
                     raise
+                finally:
+                    # Prefetched calls that were blocked by a rule or whose
+                    # arguments changed on a retry are never consumed.
+                    await _discard_prefetched(prefetched)
                 continue
 
             if response.stop_reason == StopReason.LENGTH:
@@ -298,6 +345,71 @@ class Agent:
         logger.warning("Agent.run reached max_iterations=%d without STOP", self.max_iterations)
         return final_answer
 
+    def _sync_message_cache(self, messages: MessageList) -> None:
+        """Drop the adapter's memoized conversions if history was rewritten.
+
+        Adapters may cache per-message conversions on the assumption that
+        history only grows; a ``replace`` (compaction, rollback) breaks that.
+        """
+        version = (id(messages), messages.generation)
+        if version == self._history_version:
+            return
+        if self._history_version is not None:
+            invalidate = getattr(self.llm, "invalidate_message_cache", None)
+            if callable(invalidate):
+                invalidate()
+        self._history_version = version
+
+    async def _call_llm(self, call_kwargs: dict[str, Any], prefetched: _Prefetched) -> LLMResponse:
+        """Call the LLM, starting readonly tool calls early when streaming.
+
+        With ``stream_tool_calls`` on, each tool call is reported as soon as its
+        arguments finish streaming. While every call seen so far in the
+        response is readonly, the call starts executing right away and its task
+        is recorded in ``prefetched``; dispatch later joins that task instead of
+        running the call again. The first non-readonly call ends prefetching for
+        the rest of the response, so nothing observes state a later-ordered write
+        would have changed — and rules still see every call before its result is
+        used.
+        """
+        stream = getattr(self.llm, "call_stream_async", None)
+        if not self.stream_tool_calls or stream is None:
+            return await self.llm.call_async(**call_kwargs)
+
+        prefix_readonly = True
+
+        def on_tool_call(block: ToolCallBlock) -> None:
+            nonlocal prefix_readonly
+            call_id = block.get("id") or ""
+            if not prefix_readonly or not call_id or call_id in prefetched:
+                return
+            name = block["function"]["name"]
+            try:
+                arguments = json.loads(block["function"]["arguments"] or "{}")
+            except json.JSONDecodeError:
+                arguments = None
+            if not isinstance(arguments, dict) or not self.tools.is_tool_readonly(name):
+                prefix_readonly = False
+                return
+            tc = ToolCall(id=call_id, name=name, arguments=arguments)
+            prefetched[call_id] = (tc, asyncio.create_task(self._execute_traced_tool_call(tc)))
+
+        try:
+            return await stream(on_tool_call=on_tool_call, **call_kwargs)
+        except BaseException:
+            await _discard_prefetched(prefetched)
+            raise
+
+    async def _execute_or_join(self, tool_call: ToolCall, prefetched: _Prefetched) -> ToolOutput:
+        """Return the prefetched output for ``tool_call``, or execute it now."""
+        entry = prefetched.pop(tool_call.id, None)
+        if entry is not None:
+            started, task = entry
+            if started.name == tool_call.name and started.arguments == tool_call.arguments:
+                return await task
+            task.cancel()
+        return await self._execute_traced_tool_call(tool_call)
+
     def _rules_before(
         self,
         ctx: LoopContext,
@@ -363,58 +475,63 @@ class Agent:
         self,
         ctx: RunStatistic,
         tool_calls: list[ToolCall],
+        prefetched: _Prefetched | None = None,
     ) -> list[ToolResult]:
         if not tool_calls:
             return []
 
+        deps = self._build_dependencies(tool_calls)
         results: list[ToolResult | None] = [None] * len(tool_calls)
-        for batch in self._build_batches(tool_calls):
-            indexed = [(i, tool_calls[i]) for i in batch]
+        for segment in _split_at_barriers(deps):
+            indexed = [(i, tool_calls[i]) for i in segment]
             if len(indexed) == 1:
                 i, tc = indexed[0]
-                (single,) = await self._exec_sequential(ctx, [tc])
+                (single,) = await self._exec_sequential(ctx, [tc], prefetched)
                 results[i] = single
             else:
-                batch_calls = [tc for _, tc in indexed]
-                batch_results = await self._exec_parallel(ctx, batch_calls)
-                for (i, _), res in zip(indexed, batch_results):
+                # Within a segment, each call waits only for its own
+                # predecessors; anything before the segment has finished.
+                local = {i: k for k, (i, _) in enumerate(indexed)}
+                segment_deps = [{local[j] for j in deps[i] if j in local} for i, _ in indexed]
+                segment_calls = [tc for _, tc in indexed]
+                segment_results = await self._exec_parallel(
+                    ctx, segment_calls, prefetched, deps=segment_deps
+                )
+                for (i, _), res in zip(indexed, segment_results):
                     results[i] = res
         return [r for r in results if r is not None]
 
-    def _build_batches(self, tool_calls: list[ToolCall]) -> list[list[int]]:
-        """Group tool-call indices into prefix-greedy parallel batches.
+    def _build_dependencies(self, tool_calls: list[ToolCall]) -> list[set[int]]:
+        """Map each tool call to the indices of earlier calls it must wait for.
 
-        Each call's ``conflict_keys`` describes the resources it touches:
-        ``set()`` joins any batch, ``None`` runs alone, non-empty joins the
-        current batch only when disjoint with the batch's accumulated keys.
-        Order within ``tool_calls`` is preserved across batches.
+        Each call's ``conflict_keys`` describes the resources it touches. An
+        earlier call is a predecessor when the two key sets overlap or either
+        is ``None`` (unknown scope) — except that two readonly calls never
+        conflict. Calls with no path between them in this DAG may run
+        concurrently, so a call starts as soon as its real predecessors finish
+        instead of waiting for everything emitted before it.
         """
-        batches: list[list[int]] = []
-        current: list[int] = []
-        current_keys: set[str] = set()
-
-        def flush() -> None:
-            nonlocal current, current_keys
-            if current:
-                batches.append(current)
-            current = []
-            current_keys = set()
-
-        for i, tc in enumerate(tool_calls):
-            keys = self.tools.conflict_keys(tc.name, tc.arguments)
-            if keys is None:
-                flush()
-                batches.append([i])
-                continue
-            if keys and keys & current_keys:
-                flush()
-            current.append(i)
-            current_keys |= keys
-        flush()
-        return batches
+        scopes = [
+            (self.tools.conflict_keys(tc.name, tc.arguments), self.tools.is_tool_readonly(tc.name))
+            for tc in tool_calls
+        ]
+        deps: list[set[int]] = []
+        for i, (keys, readonly) in enumerate(scopes):
+            preds: set[int] = set()
+            for j in range(i):
+                other_keys, other_readonly = scopes[j]
+                if readonly and other_readonly:
+                    continue
+                if keys is None or other_keys is None or keys & other_keys:
+                    preds.add(j)
+            deps.append(preds)
+        return deps
 
     async def _exec_sequential(
-        self, ctx: RunStatistic, tool_calls: list[ToolCall]
+        self,
+        ctx: RunStatistic,
+        tool_calls: list[ToolCall],
+        prefetched: _Prefetched | None = None,
     ) -> list[ToolResult]:
         results: list[ToolResult] = []
         for tc in tool_calls:
@@ -425,7 +542,7 @@ class Agent:
                 )
             )
             async with self.progress.spinner(f"Executing {tc.name}...", title="Working"):
-                output = await self._execute_traced_tool_call(tc)
+                output = await self._execute_or_join(tc, prefetched or {})
             self.progress.emit(ProgressEvent(kind="tool_result", payload={"text": output.content}))
             results.append(
                 ToolResult(
@@ -461,8 +578,18 @@ class Agent:
         raise AssertionError("unreachable: tool trace span exited without returning")
 
     async def _exec_parallel(
-        self, ctx: RunStatistic, tool_calls: list[ToolCall]
+        self,
+        ctx: RunStatistic,
+        tool_calls: list[ToolCall],
+        prefetched: _Prefetched | None = None,
+        *,
+        deps: list[set[int]] | None = None,
     ) -> list[ToolResult]:
+        """Run ``tool_calls`` concurrently, each after its ``deps`` finish.
+
+        ``deps[i]`` holds indices into ``tool_calls``; ``None`` means no
+        dependencies. Results come back in the original order.
+        """
         for tc in tool_calls:
             self.progress.emit(
                 ProgressEvent(
@@ -472,9 +599,15 @@ class Agent:
             )
 
         outputs: list[ToolOutput | None] = [None] * len(tool_calls)
+        finished = [asyncio.Event() for _ in tool_calls]
 
         async def _run(i: int, tc: ToolCall) -> None:
-            outputs[i] = await self._execute_traced_tool_call(tc)
+            try:
+                for j in sorted(deps[i]) if deps is not None else ():
+                    await finished[j].wait()
+                outputs[i] = await self._execute_or_join(tc, prefetched or {})
+            finally:
+                finished[i].set()
 
         names = ", ".join(tc.name for tc in tool_calls)
         async with self.progress.spinner(
@@ -535,6 +668,42 @@ class Agent:
         return decision
 
 
+def _split_at_barriers(deps: list[set[int]]) -> list[list[int]]:
+    """Split call indices into segments separated by barrier calls.
+
+    A barrier depends on every earlier call and every later call depends on
+    it (e.g. ``shell``, whose scope is unknown). Barriers run alone so their
+    progress output stays in order; the calls between two barriers form one
+    segment that is scheduled by dependency.
+    """
+    n = len(deps)
+    segments: list[list[int]] = []
+    current: list[int] = []
+    for i in range(n):
+        is_barrier = len(deps[i]) == i and all(i in deps[k] for k in range(i + 1, n))
+        if is_barrier:
+            if current:
+                segments.append(current)
+                current = []
+            segments.append([i])
+        else:
+            current.append(i)
+    if current:
+        segments.append(current)
+    return segments
+
+
+async def _discard_prefetched(prefetched: _Prefetched) -> None:
+    """Cancel and reap any prefetched tool calls that were never consumed."""
+    if not prefetched:
+        return
+    tasks = [task for _, task in prefetched.values()]
+    prefetched.clear()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 def _trace_message(message: LLMMessage) -> dict[str, Any]:
     return message.to_dict()
 
@@ -0,0 +1,176 @@
+"""Token-budgeted projection of the conversation for one LLM request.
+
+``fit_to_budget`` shrinks the *outgoing* message list, never the canonical
+history: when the conversation is over the budget, older messages are
+replaced by short stubs, lowest-value first, until the request fits.
+
+- The latest user message and the last tool call with its results (and
+  anything after them) are never touched.  Earlier tool rounds of the
+  current turn are candidates like older turns, so a long single-task run
+  can still be fitted.
+- Roles, tool calls and ``tool_call_id`` links are kept, so the request
+  stays well-formed; only ``content`` is stubbed.
+- An assistant tool call and its results are ranked as one unit, so a
+  result is not kept while the call that explains it is gone (or the
+  other way round).  Tool results are stubbed before the call's text.
+- Value is recency plus references from the current turn: units that
+  share file paths, identifiers or tool call ids with it rank higher.
+
+This costs no LLM call and loses nothing permanently, unlike compaction.
+Passing the same ``stubs`` mapping to every call keeps a message stubbed
+(with the same stub object) in later requests, so the stubbed prefix does
+not change between requests and per-message caches keep hitting; the
+caller drops the mapping when the history is rewritten.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Callable
+
+from ouro.core.llm import LLMMessage
+from ouro.core.llm.content_utils import extract_text
+
+# Path- or identifier-like terms: contain a ``.``, ``/`` or ``_``.
+_TERM_RE = re.compile(r"[A-Za-z0-9_./-]*[._/][A-Za-z0-9_./-]*[A-Za-z0-9]")
+# How much a reference from the current turn outweighs recency (0..1).
+REFERENCE_WEIGHT = 1.0
+
+STUB_TEMPLATE = "[~{tokens} tokens omitted from this request to fit the context budget]"
+
+
+def estimate_tokens(message: LLMMessage) -> int:
+    """Rough per-message token estimate (~4 characters per token)."""
+    text = extract_text(message.content) if message.content is not None else ""
+    if message.tool_calls:
+        text += str(message.tool_calls)
+    return len(text) // 4 + 4
+
+
+def _terms(message: LLMMessage) -> set[str]:
+    text = extract_text(message.content) if message.content is not None else ""
+    terms = set(_TERM_RE.findall(text))
+    for call in message.tool_calls or []:
+        terms.add(call.get("id", ""))
+        arguments = call.get("function", {}).get("arguments") or ""
+        try:
+            values = json.loads(arguments).values() if isinstance(arguments, str) else ()
+        except (ValueError, AttributeError):
+            values = (arguments,)
+        for value in values:
+            terms.update(_TERM_RE.findall(str(value)))
+    if message.tool_call_id:
+        terms.add(message.tool_call_id)
+    terms.discard("")
+    return terms
+
+
+# id(original) -> (original, stub), kept by the caller across requests.
+StubCache = dict[int, tuple[LLMMessage, LLMMessage]]
+
+
+def _stub(message: LLMMessage, tokens: int) -> LLMMessage:
+    return LLMMessage(
+        role=message.role,
+        content=STUB_TEMPLATE.format(tokens=tokens),
+        tool_calls=message.tool_calls,
+        tool_call_id=message.tool_call_id,
+        name=message.name,
+    )
+
+
+def _units(messages: list[LLMMessage], end: int) -> list[list[int]]:
+    """Group ``messages[:end]`` into units: a tool call with its results, or one message."""
+    units: list[list[int]] = []
+    owner: dict[str, list[int]] = {}
+    for i in range(end):
+        message = messages[i]
+        if message.role == "tool" and message.tool_call_id in owner:
+            owner[message.tool_call_id].append(i)
+            continue
+        unit = [i]
+        units.append(unit)
+        for call in message.tool_calls or []:
+            owner[call.get("id", "")] = unit
+    return units
+
+
+def _protected_start(messages: list[LLMMessage], turn_start: int) -> int:
+    """Index of the last tool call of the current turn, or len(messages)."""
+    for i in range(len(messages) - 1, turn_start, -1):
+        if messages[i].tool_calls:
+            return i
+    return len(messages)
+
+
+def fit_to_budget(
+    messages: list[LLMMessage],
+    budget: int,
+    count: Callable[[LLMMessage], int],
+    *,
+    counts: list[int] | None = None,
+    stubs: StubCache | None = None,
+) -> list[LLMMessage]:
+    """Return ``messages`` with low-value older contents stubbed to fit ``budget``.
+
+    Args:
+        messages: Conversation messages (without system messages).
+        budget: Token budget for ``messages``.
+        count: Per-message token counter (used for the stubs).
+        counts: Precomputed ``count`` of each message, e.g. from the
+            ``MessageList`` ledger.
+        stubs: Stubs made by earlier calls, applied again first; new stubs
+            are added to it.
+
+    Returns:
+        ``messages`` itself when it fits and nothing was stubbed before,
+        else a new list.  The result may still be over budget when the
+        protected messages alone are.
+    """
+    counts = counts if counts is not None else [count(m) for m in messages]
+    total = sum(counts)
+    result = list(messages)
+    stubbed = False
+    if stubs:
+        for i, message in enumerate(messages):
+            entry = stubs.get(id(message))
+            if entry is not None and entry[0] is message:
+                result[i] = entry[1]
+                total -= counts[i] - count(entry[1])
+                stubbed = True
+    if total <= budget:
+        return result if stubbed else messages
+
+    turn_start = next(
+        (i for i in range(len(messages) - 1, -1, -1) if messages[i].role == "user"), 0
+    )
+    end = _protected_start(messages, turn_start)
+    units = [unit for unit in _units(messages, end) if unit[0] != turn_start]
+    if not units:
+        return result if stubbed else messages
+    current_terms = _terms(messages[turn_start]) if messages else set()
+    for message in messages[end:]:
+        current_terms |= _terms(message)
+
+    def value(unit: list[int]) -> float:
+        recency = unit[0] / end
+        referenced = any(current_terms & _terms(messages[i]) for i in unit)
+        return recency + (REFERENCE_WEIGHT if referenced else 0.0)
+
+    for unit in sorted(units, key=value):
+        # Results first, then the message that made the calls.
+        for i in sorted(unit, key=lambda i: messages[i].role != "tool"):
+            if result[i] is not messages[i]:
+                continue
+            stub = _stub(messages[i], counts[i])
+            saved = counts[i] - count(stub)
+            if saved <= 0:
+                continue
+            result[i] = stub
+            if stubs is not None:
+                stubs[id(messages[i])] = (messages[i], stub)
+            total -= saved
+            if total <= budget:
+                return result
+    return result
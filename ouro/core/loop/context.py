@@ -19,6 +19,7 @@ from __future__ import annotations
 from typing import Callable, Iterable
 
 from ouro.core.llm import LLMMessage
+from ouro.core.loop.budget import StubCache, estimate_tokens, fit_to_budget
 from ouro.core.loop.message_list import MessageList
 from ouro.core.loop.protocols import ProgressSink
 
@@ -37,6 +38,9 @@ class RunStatistic:
         self.iteration = 0
         self.usage_total: dict[str, int] = {}
         self.stop_reason_last: str | None = None
+        # Whether the latest LLM request had messages stubbed to fit the
+        # context budget, so it was smaller than the detached history.
+        self.request_trimmed = False
         self.progress = progress
         self._usage_callback = usage_callback
 
@@ -75,6 +79,13 @@ class MessageListContext:
             self.detached = detached
         else:
             self.detached = MessageList(detached or [])
+        # Whether the last ``build_context`` stubbed messages to fit a
+        # budget; the request then differs from ``detached``.
+        self.last_build_trimmed = False
+        # Stubs reused by every budgeted build until ``detached`` is
+        # rewritten, so earlier requests' stubbed prefix stays the same.
+        self._stubs: StubCache = {}
+        self._stubs_generation = self.detached.generation
 
     # -- system messages ---------------------------------------------------
 
@@ -96,9 +107,39 @@ class MessageListContext:
 
     # -- combined context --------------------------------------------------
 
-    def build_context(self) -> list[LLMMessage]:
+    def build_context(
+        self,
+        *,
+        token_budget: int | None = None,
+        count_tokens: Callable[[LLMMessage], int] | None = None,
+    ) -> list[LLMMessage]:
         """Return system messages + detached messages as a flat list.
 
-        This is what the LLM consumes for each call.
+        This is what the LLM consumes for each call.  With ``token_budget``,
+        older detached messages are stubbed in the returned list (never in
+        ``detached``) until it fits; see ``budget.fit_to_budget``.  A message
+        stays stubbed, by the same stub object, in later builds until
+        ``detached`` is rewritten (its ``generation`` changes).
+
+        Args:
+            token_budget: Token budget for the whole request; None or 0
+                sends everything.
+            count_tokens: Per-message counter; pass the one the detached
+                list's token ledger already uses so counts are reused.
         """
-        return list(self.system_messages) + self.detached.snapshot()
+        system = list(self.system_messages)
+        messages = self.detached.snapshot()
+        self.last_build_trimmed = False
+        if not token_budget:
+            return system + messages
+        count = count_tokens or estimate_tokens
+        budget = token_budget - sum(count(m) for m in system)
+        counts = self.detached.token_counts(count)
+        if self._stubs_generation != self.detached.generation:
+            self._stubs.clear()
+            self._stubs_generation = self.detached.generation
+        fitted = fit_to_budget(messages, budget, count, counts=counts, stubs=self._stubs)
+        self.last_build_trimmed = fitted is not messages and any(
+            a is not b for a, b in zip(fitted, messages, strict=True)
+        )
+        return system + fitted
@@ -7,7 +7,7 @@ observe this loop-owned state directly, while LLM calls consume snapshots.
 
 from __future__ import annotations
 
-from typing import Iterable, Iterator
+from typing import Callable, Iterable, Iterator
 
 from ouro.core.llm import LLMMessage
 
@@ -17,6 +17,21 @@ class MessageList:
 
     def __init__(self, messages: Iterable[LLMMessage] | None = None) -> None:
         self._messages: list[LLMMessage] = list(messages or [])
+        self._generation = 0
+        # Running token ledger: per-message counts for a prefix of the list,
+        # under ``_token_counter``.  See ``token_count``.
+        self._token_counter: Callable[[LLMMessage], int] | None = None
+        self._token_counts: list[int] = []
+        self._token_total = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped by every mutation other than appending.
+
+        Between bumps the list only grows at the tail, so caches keyed on
+        message identity (e.g. provider-format conversions) stay valid.
+        """
+        return self._generation
 
     def __iter__(self) -> Iterator[LLMMessage]:
         return iter(self._messages)
@@ -27,6 +42,32 @@ class MessageList:
     def __getitem__(self, index: int) -> LLMMessage:
         return self._messages[index]
 
+    def token_count(self, counter: Callable[[LLMMessage], int]) -> int:
+        """Return the running token total of the list under ``counter``.
+
+        Per-message counts are cached, so each call only counts messages
+        appended since the previous one.  Rewrites drop the counts from the
+        first changed position on; passing a different counter starts over.
+        """
+        if counter != self._token_counter:
+            self._token_counter = counter
+            self._truncate_token_counts(0)
+        for message in self._messages[len(self._token_counts) :]:
+            count = counter(message)
+            self._token_counts.append(count)
+            self._token_total += count
+        return self._token_total
+
+    def token_counts(self, counter: Callable[[LLMMessage], int]) -> list[int]:
+        """Return per-message token counts under ``counter`` (see ``token_count``)."""
+        self.token_count(counter)
+        return list(self._token_counts)
+
+    def _truncate_token_counts(self, start: int) -> None:
+        if start < len(self._token_counts):
+            self._token_total -= sum(self._token_counts[start:])
+            del self._token_counts[start:]
+
     def snapshot(self) -> list[LLMMessage]:
         """Return a shallow copy of current messages."""
         return list(self._messages)
@@ -34,6 +75,8 @@ class MessageList:
     def replace(self, messages: Iterable[LLMMessage]) -> list[LLMMessage]:
         """Replace stored messages and return a fresh snapshot."""
         self._messages = list(messages)
+        self._generation += 1
+        self._truncate_token_counts(0)
         return self.snapshot()
 
     def replace_range(
@@ -44,11 +87,16 @@ class MessageList:
     ) -> list[LLMMessage]:
         """Replace a slice and return a fresh snapshot."""
         items = list(new_items)
+        first, _, _ = slice(start, end).indices(len(self._messages))
         self._messages[start:end] = items
+        self._generation += 1
+        self._truncate_token_counts(first)
         return self.snapshot()
 
     def clear(self) -> None:
         self._messages.clear()
+        self._generation += 1
+        self._truncate_token_counts(0)
 
     def append(self, message: LLMMessage) -> None:
         self._messages.append(message)
@@ -33,6 +33,7 @@ ProgressEventKind = Literal[
     "tool_call",
     "tool_result",
     "tool_blocked",
+    "tool_queue",
     "task_list",
     "task_status",
     "swarm_reset",
@@ -123,6 +124,8 @@ class LoopContext(Protocol):
     def stop_reason_last(self) -> str | None: ...
     @property
     def progress(self) -> ProgressSink: ...
+    @property
+    def request_trimmed(self) -> bool: ...
     def add_usage(self, usage: dict[str, int] | None) -> None: ...
 
 
@@ -157,7 +160,7 @@ ContinueKind = _ContinueKind
 class Hook(Protocol):
     """Lifecycle hooks the agent loop dispatches.
 
-    Three integration points:
+    Four integration points:
 
     - ``on_run_start`` — once at the start of ``Agent.run``.
       Pure fanout (all hooks run, no return value).
@@ -170,6 +173,8 @@ class Hook(Protocol):
       vote ``ContinueDecision.stop()`` / ``cont()`` /
       ``retry_with_feedback(...)``; the loop aggregates with
       STOP > RETRY > CONTINUE.  Used by ``VerificationHook``.
+    - ``on_run_end`` — once when ``Agent.run`` returns or raises.  Pure
+      fanout.  Used by ``CompactionHook`` to cancel a background summary.
     """
 
     async def on_run_start(self, ctx: LoopContext, messages: MessageList) -> None: ...
@@ -186,3 +191,4 @@ class Hook(Protocol):
         response: LLMResponse,
         finished: bool,
     ) -> ContinueDecision: ...
+    async def on_run_end(self, ctx: LoopContext) -> None: ...
@@ -0,0 +1,306 @@
+"""Async pacing shared by tool dispatch and LLM calls.
+
+A `TokenBucket` refills at ``rate`` tokens per second up to ``capacity``.
+Callers ``await bucket.acquire()`` before doing rate-limited work; waiters
+reserve tokens in arrival order, so a burst of concurrent callers is spread
+evenly over time instead of all firing at once.
+
+`AdaptiveRateLimiter` wraps a bucket for one upstream (e.g. an LLM provider
+and model). It starts unpaced, and on a rate-limit response it blocks every
+caller until the server's ``Retry-After`` (or a jittered backoff) has passed,
+then lets them through the bucket one at a time at a reduced rate that creeps
+back up on success. `get_rate_limiter()` returns the process-wide limiter for a
+key so concurrent agents (swarm workers, sub-agents) share one view of the
+upstream's limits.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import re
+import time
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
+
+
+class TokenBucket:
+    """FIFO async token bucket."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+
+    @property
+    def available(self) -> float:
+        """Tokens that could be taken right now without waiting."""
+        self._refill()
+        return max(0.0, self._tokens)
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping tokens (or debt) accrued so far."""
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive")
+        self._refill()
+        self.rate = float(rate)
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Take ``tokens``, sleeping until they are available.
+
+        The tokens are reserved immediately (the balance may go negative), so
+        later callers queue behind earlier ones without a lock.
+
+        Returns the number of seconds spent waiting.
+        """
+        self._refill()
+        self._tokens -= tokens
+        if self._tokens >= 0:
+            return 0.0
+        delay = -self._tokens / self.rate
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Give the reservation back so later callers don't wait for it.
+            self._tokens += tokens
+            raise
+        return delay
+
+
+# Pacing applied after the first rate-limit hit, in requests per second.
+PACED_START_RATE = 1.0
+PACED_MIN_RATE = 0.1
+# Once recovered past this rate the limiter stops pacing altogether.
+PACED_RELEASE_RATE = 10.0
+PACED_INCREASE = 0.25
+
+_REMAINING_HEADERS = (
+    "x-ratelimit-remaining-requests",
+    "anthropic-ratelimit-requests-remaining",
+    "x-ratelimit-remaining",
+)
+_RESET_HEADERS = (
+    "x-ratelimit-reset-requests",
+    "anthropic-ratelimit-requests-reset",
+    "x-ratelimit-reset",
+)
+
+
+class AdaptiveRateLimiter:
+    """Shared cooldown + AIMD pacing for one upstream."""
+
+    def __init__(
+        self,
+        *,
+        base_delay: float = 1.0,
+        max_delay: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._blocked_until = 0.0
+        self._bucket: TokenBucket | None = None
+        self._strikes = 0
+
+    @property
+    def rate(self) -> float | None:
+        """Current paced rate in requests/second, or ``None`` when unpaced."""
+        return self._bucket.rate if self._bucket is not None else None
+
+    def cooldown_remaining(self) -> float:
+        return max(0.0, self._blocked_until - self._clock())
+
+    async def acquire(self) -> float:
+        """Wait out any shared cooldown, then take a pacing token.
+
+        Returns the number of seconds spent waiting.
+        """
+        waited = 0.0
+        while (remaining := self.cooldown_remaining()) > 0:
+            await asyncio.sleep(remaining)
+            waited += remaining
+        if self._bucket is not None:
+            waited += await self._bucket.acquire()
+        return waited
+
+    def on_rate_limited(self, retry_after: float | None = None) -> float:
+        """Record a rate-limit response; returns the cooldown applied.
+
+        Without a server hint the cooldown is exponential in the number of
+        consecutive hits, with full jitter so independent processes spread out.
+        Hits reported while a cooldown is already running belong to the same
+        burst and only extend it.
+        """
+        if self.cooldown_remaining() > 0:
+            if retry_after is not None and retry_after >= 0:
+                self._block_for(min(retry_after, self.max_delay))
+            return self.cooldown_remaining()
+
+        self._strikes += 1
+        if retry_after is not None and retry_after >= 0:
+            cooldown = min(retry_after, self.max_delay)
+        else:
+            ceiling = min(self.base_delay * 2 ** (self._strikes - 1), self.max_delay)
+            cooldown = random.uniform(ceiling / 2, ceiling)
+        self._block_for(cooldown)
+
+        if self._bucket is None:
+            # Capacity 1: after the cooldown callers leave one by one.
+            self._bucket = TokenBucket(PACED_START_RATE, capacity=1, clock=self._clock)
+        else:
+            self._bucket.set_rate(max(PACED_MIN_RATE, self._bucket.rate / 2))
+        return cooldown
+
+    def on_success(self) -> None:
+        """Record a successful call: additive increase of the paced rate."""
+        self._strikes = 0
+        if self._bucket is None:
+            return
+        rate = self._bucket.rate + PACED_INCREASE
+        if rate >= PACED_RELEASE_RATE:
+            self._bucket = None
+        else:
+            self._bucket.set_rate(rate)
+
+    def observe_headers(self, headers: Mapping[str, Any] | None) -> None:
+        """Honour ``ratelimit-remaining`` / ``ratelimit-reset`` response headers.
+
+        When the server says no requests remain in the window, everyone waits
+        for the reset instead of discovering the limit with a 429.
+        """
+        if not headers:
+            return
+        normalized = _normalize_headers(headers)
+        remaining = _first_number(normalized, _REMAINING_HEADERS)
+        if remaining is None or remaining > 0:
+            return
+        reset = None
+        for name in _RESET_HEADERS:
+            if name in normalized:
+                reset = parse_reset(normalized[name])
+                if reset is not None:
+                    break
+        self._block_for(reset if reset is not None else self.base_delay)
+
+    def _block_for(self, seconds: float) -> None:
+        # A misread header must not block every caller for longer than a backoff.
+        seconds = min(seconds, self.max_delay)
+        self._blocked_until = max(self._blocked_until, self._clock() + seconds)
+
+
+_limiters: dict[str, AdaptiveRateLimiter] = {}
+
+
+def get_rate_limiter(key: str, **kwargs: Any) -> AdaptiveRateLimiter:
+    """Return the process-wide limiter for ``key`` (e.g. ``"anthropic/claude-…"``)."""
+    limiter = _limiters.get(key)
+    if limiter is None:
+        limiter = _limiters[key] = AdaptiveRateLimiter(**kwargs)
+    return limiter
+
+
+def reset_rate_limiters() -> None:
+    """Forget all shared limiters (tests, or after changing accounts)."""
+    _limiters.clear()
+
+
+def retry_after_seconds(headers: Mapping[str, Any] | None) -> float | None:
+    """Parse ``retry-after-ms`` / ``retry-after`` into seconds."""
+    if not headers:
+        return None
+    normalized = _normalize_headers(headers)
+    if "retry-after-ms" in normalized:
+        try:
+            return max(0.0, float(normalized["retry-after-ms"]) / 1000)
+        except (TypeError, ValueError):
+            pass
+    value = normalized.get("retry-after")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(str(value))
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+
+
+# Bare reset values this large are Unix timestamps (2001 on), not delays:
+# in seconds, or in milliseconds as OpenRouter sends ``x-ratelimit-reset``.
+_EPOCH_SECONDS_MIN = 1e9
+_EPOCH_MILLIS_MIN = 1e12
+
+
+def parse_reset(value: Any) -> float | None:
+    """Parse a ratelimit reset header into seconds from now.
+
+    Accepts plain seconds (``"12"``), Unix timestamps in seconds or
+    milliseconds (``"1767225600000"``), OpenAI durations (``"1m30s"``,
+    ``"250ms"``) and RFC 3339 timestamps (Anthropic).
+    """
+    text = str(value).strip()
+    try:
+        number = float(text)
+    except ValueError:
+        pass
+    else:
+        if number >= _EPOCH_MILLIS_MIN:
+            number = number / 1000 - time.time()
+        elif number >= _EPOCH_SECONDS_MIN:
+            number -= time.time()
+        return max(0.0, number)
+    parts = _DURATION_PART.findall(text)
+    if parts and "".join(n + u for n, u in parts) == text:
+        scale = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+        return sum(float(n) * scale[u] for n, u in parts)
+    try:
+        when = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _normalize_headers(headers: Mapping[str, Any]) -> dict[str, Any]:
+    # LiteLLM re-exports upstream headers with an ``llm_provider-`` prefix.
+    normalized: dict[str, Any] = {}
+    for key, value in headers.items():
+        name = str(key).lower()
+        normalized[name.removeprefix("llm_provider-")] = value
+    return normalized
+
+
+def _first_number(headers: Mapping[str, Any], names: tuple[str, ...]) -> float | None:
+    for name in names:
+        if name in headers:
+            try:
+                return float(headers[name])
+            except (TypeError, ValueError):
+                continue
+    return None
@@ -5,6 +5,7 @@ All runtime data is stored under ~/.ouro/ directory:
 - sessions/: YAML-based session persistence
 - logs/: Log files (only created with --verbose)
 - history: Interactive mode command history
+- token_calibration.json: Per-model token estimate calibration
 """
 
 import os
@@ -66,6 +67,15 @@ def get_history_file() -> str:
     return os.path.join(RUNTIME_DIR, "history")
 
 
+def get_token_calibration_file() -> str:
+    """Get the token calibration file path.
+
+    Returns:
+        Path to ~/.ouro/token_calibration.json
+    """
+    return os.path.join(RUNTIME_DIR, "token_calibration.json")
+
+
 _BOT_DIR = os.path.join(RUNTIME_DIR, "bot")
 
 
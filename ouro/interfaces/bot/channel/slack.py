@@ -16,6 +16,7 @@ from slack_sdk.socket_mode.request import SocketModeRequest
 from slack_sdk.socket_mode.response import SocketModeResponse
 from slack_sdk.web.async_client import AsyncWebClient
 
+from ouro.core.http_pool import get_http_client
 from ouro.interfaces.bot.channel.base import (
     FileAttachment,
     ImageData,
@@ -240,17 +241,14 @@ class SlackChannel:
 
     async def _download_file(self, url: str) -> bytes | None:
         """Download a file from Slack using bot token for auth."""
-        import aiohttp
-
         headers = {"Authorization": f"Bearer {self._bot_token}"}
         try:
-            async with (
-                aiohttp.ClientSession() as session,
-                session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp,
-            ):
-                if resp.status == 200:
-                    return await resp.read()
-                logger.error("Failed to download Slack file: status=%d", resp.status)
+            resp = await get_http_client(url).get(
+                url, headers=headers, timeout=30, follow_redirects=True
+            )
+            if resp.status_code == 200:
+                return resp.content
+            logger.error("Failed to download Slack file: status=%d", resp.status_code)
         except Exception:
             logger.exception("Error downloading Slack file")
         return None
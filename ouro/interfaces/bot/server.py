@@ -11,6 +11,7 @@ from typing import TYPE_CHECKING
 from aiohttp import web
 
 from ouro.config import Config
+from ouro.core.http_pool import close_http_clients
 from ouro.interfaces.bot.channel.base import Channel, IncomingMessage, OutgoingMessage
 from ouro.interfaces.bot.message_queue import ConversationQueue, coalesce_messages
 from ouro.interfaces.bot.proactive import CronScheduler, ProactiveExecutor
@@ -775,6 +776,7 @@ class BotServer:
             for ch in self._channels:
                 await ch.stop()
             await runner.cleanup()
+            await close_http_clients()
 
     def _make_callback(self, channel: Channel):
         """Create the message callback for a specific channel."""
@@ -161,9 +161,9 @@ class SessionRouter:
         if not self._sessions_dir:
             return 0
 
-        from ouro.capabilities.memory.store import YamlFileMemoryStore
+        from ouro.capabilities.memory.store import create_memory_store
 
-        store = YamlFileMemoryStore(sessions_dir=self._sessions_dir)
+        store = create_memory_store(sessions_dir=self._sessions_dir)
         sessions = await store.list_sessions(limit=1000)
 
         cutoff = datetime.now() - timedelta(days=max_age_days)
@@ -0,0 +1,88 @@
+"""Argument parsing for ``ouro-cli``.
+
+Kept free of heavy imports so ``--help`` and ``--version`` answer without
+loading the agent stack; see ``entry.py``.
+"""
+
+import argparse
+import importlib.metadata
+
+from ouro.core.llm.reasoning import REASONING_EFFORT_CHOICES
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the ``ouro-cli`` argument parser."""
+    parser = argparse.ArgumentParser(description="Run an AI agent with tool-calling capabilities")
+
+    try:
+        version = importlib.metadata.version("ouro-ai")
+    except importlib.metadata.PackageNotFoundError:
+        version = "dev"
+    parser.add_argument("--version", "-V", action="version", version=f"ouro {version}")
+
+    parser.add_argument(
+        "--task",
+        "-t",
+        type=str,
+        help="Task for the agent to complete (if not provided, enters interactive mode)",
+    )
+    parser.add_argument(
+        "--verbose",
+        "-v",
+        action="store_true",
+        help="Enable verbose logging to .ouro/logs/",
+    )
+    parser.add_argument(
+        "--model",
+        "-m",
+        type=str,
+        help="Model to use (LiteLLM model ID, e.g. openai/gpt-4o)",
+    )
+    parser.add_argument(
+        "--resume",
+        "-r",
+        nargs="?",
+        const="latest",
+        help="Resume a previous session (session ID prefix or 'latest')",
+    )
+    parser.add_argument(
+        "--login",
+        action="store_true",
+        help="Login to OAuth provider",
+    )
+    parser.add_argument(
+        "--logout",
+        action="store_true",
+        help="Logout from OAuth provider",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        default=False,
+        help="Enable Ralph Loop verification (outer loop that retries on failure). Only applies to --task mode.",
+    )
+    parser.add_argument(
+        "--reasoning-effort",
+        choices=REASONING_EFFORT_CHOICES,
+        default="default",
+        help="Run-scoped reasoning level (LiteLLM/OpenAI-style). Use 'default' to omit the parameter, or 'off' as an alias for 'none'.",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Enable agent tracing and write events to the configured SQLite trace database.",
+    )
+    parser.add_argument(
+        "--sandbox",
+        type=str,
+        nargs="?",
+        const="__current__",
+        help="Enable sandbox tools using the given sandbox id, or the current/default sandbox if omitted.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Emit machine-readable JSON progress events in one-shot task mode.",
+    )
+
+    return parser
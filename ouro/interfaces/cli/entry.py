@@ -10,6 +10,12 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 def main():
     """Main CLI entry point."""
+    from ouro.interfaces.cli.args import build_parser
+
+    # --help / --version (and usage errors) exit here, before the agent
+    # stack is imported.
+    build_parser().parse_args()
+
     from ouro.interfaces.cli.main import main as run_main
 
     run_main()
@@ -16,7 +16,7 @@ from ouro.capabilities.tools.builtins.memory_block_edit import MemoryBlockEditTo
 from ouro.capabilities.tools.builtins.multi_task import MultiTaskTool
 from ouro.capabilities.tools.builtins.sandbox import create_default_tools
 from ouro.config import Config
-from ouro.core.llm import ModelManager, create_llm_adapter
+from ouro.core.llm import ModelManager, create_routed_adapter
 from ouro.core.tracing import Tracer
 from ouro.interfaces.tui import terminal_ui
 from ouro.interfaces.tui.json_progress import JsonProgressSink
@@ -74,13 +74,7 @@ def create_agent(
     if not is_valid:
         raise ValueError(error_msg)
 
-    llm = create_llm_adapter(
-        model=current_profile.model_id,
-        api_key=current_profile.api_key,
-        api_base=current_profile.api_base,
-        drop_params=current_profile.drop_params,
-        timeout=current_profile.timeout,
-    )
+    llm = create_routed_adapter(model_manager, current_profile)
 
     progress_sink = (
         JsonProgressSink(stream=progress_stream) if progress_format == "json" else TuiProgressSink()
@@ -120,6 +114,10 @@ def create_agent(
         AgentBuilder()
         .with_llm(llm, model_manager=model_manager)
         .with_max_iterations(Config.MAX_ITERATIONS)
+        .with_streaming(Config.STREAM_TOOL_CALLS)
+        .with_tool_concurrency(Config.TOOL_MAX_CONCURRENCY)
+        .with_tool_output_spill(Config.TOOL_OUTPUT_SPILL)
+        .with_context_budget(Config.CONTEXT_TOKEN_BUDGET)
         .with_progress_sink(progress_sink)
         .with_tracer(tracer)
         .with_progress_identity(
@@ -1,8 +1,6 @@
 """Main entry point for the agentic loop system."""
 
-import argparse
 import asyncio
-import importlib.metadata
 import os
 import warnings
 
@@ -11,6 +9,7 @@ from rich.console import Console
 from ouro.capabilities.memory import MemoryManager
 from ouro.capabilities.skills import SkillsRegistry
 from ouro.config import Config
+from ouro.core.http_pool import close_http_clients
 from ouro.core.llm import ModelManager
 from ouro.core.llm.chatgpt_auth import (
     get_all_auth_provider_statuses,
@@ -20,10 +19,10 @@ from ouro.core.llm.chatgpt_auth import (
     logout_auth_provider,
 )
 from ouro.core.llm.oauth_model_sync import remove_oauth_models, sync_oauth_models
-from ouro.core.llm.reasoning import REASONING_EFFORT_CHOICES
 from ouro.core.log import setup_logger
 from ouro.core.runtime import ensure_runtime_dirs
 from ouro.core.tracing import SQLiteTraceExporter, Tracer, resolve_sqlite_trace_db_path
+from ouro.interfaces.cli.args import build_parser
 from ouro.interfaces.cli.factory import create_agent
 from ouro.interfaces.tui import terminal_ui
 from ouro.interfaces.tui.interactive import run_interactive_mode, run_model_setup_mode
@@ -102,80 +101,7 @@ def _create_tracer(*, enabled: bool) -> Tracer | None:
 
 def main():
     """Main CLI entry point."""
-    parser = argparse.ArgumentParser(description="Run an AI agent with tool-calling capabilities")
-
-    try:
-        version = importlib.metadata.version("ouro-ai")
-    except importlib.metadata.PackageNotFoundError:
-        version = "dev"
-    parser.add_argument("--version", "-V", action="version", version=f"ouro {version}")
-
-    parser.add_argument(
-        "--task",
-        "-t",
-        type=str,
-        help="Task for the agent to complete (if not provided, enters interactive mode)",
-    )
-    parser.add_argument(
-        "--verbose",
-        "-v",
-        action="store_true",
-        help="Enable verbose logging to .ouro/logs/",
-    )
-    parser.add_argument(
-        "--model",
-        "-m",
-        type=str,
-        help="Model to use (LiteLLM model ID, e.g. openai/gpt-4o)",
-    )
-    parser.add_argument(
-        "--resume",
-        "-r",
-        nargs="?",
-        const="latest",
-        help="Resume a previous session (session ID prefix or 'latest')",
-    )
-    parser.add_argument(
-        "--login",
-        action="store_true",
-        help="Login to OAuth provider",
-    )
-    parser.add_argument(
-        "--logout",
-        action="store_true",
-        help="Logout from OAuth provider",
-    )
-    parser.add_argument(
-        "--verify",
-        action="store_true",
-        default=False,
-        help="Enable Ralph Loop verification (outer loop that retries on failure). Only applies to --task mode.",
-    )
-    parser.add_argument(
-        "--reasoning-effort",
-        choices=REASONING_EFFORT_CHOICES,
-        default="default",
-        help="Run-scoped reasoning level (LiteLLM/OpenAI-style). Use 'default' to omit the parameter, or 'off' as an alias for 'none'.",
-    )
-    parser.add_argument(
-        "--trace",
-        action="store_true",
-        help="Enable agent tracing and write events to the configured SQLite trace database.",
-    )
-    parser.add_argument(
-        "--sandbox",
-        type=str,
-        nargs="?",
-        const="__current__",
-        help="Enable sandbox tools using the given sandbox id, or the current/default sandbox if omitted.",
-    )
-    parser.add_argument(
-        "--json",
-        action="store_true",
-        help="Emit machine-readable JSON progress events in one-shot task mode.",
-    )
-
-    args = parser.parse_args()
+    args = build_parser().parse_args()
 
     # Initialize runtime directories (create logs dir in verbose mode or
     # when OURO_DEBUG_LLM_HISTORY is set so the agent loop can log message
@@ -311,6 +237,12 @@ def main():
         )
 
     async def _run() -> None:
+        try:
+            await _run_agent()
+        finally:
+            await close_http_clients()
+
+    async def _run_agent() -> None:
         # Apply run-scoped reasoning control (affects primary task calls only).
         agent.set_reasoning_effort(args.reasoning_effort)
 
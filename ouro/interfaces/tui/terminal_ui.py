@@ -304,7 +304,8 @@ def print_memory_stats(stats: Dict[str, Any]) -> None:
     if has_cache:
         table.add_row("├─ Input", f"{stats['total_input_tokens']:,}")
         table.add_row("│  ├─ Cache Read", f"{cache_read:,}")
-        table.add_row("│  └─ Cache Write", f"{cache_creation:,}")
+        table.add_row("│  ├─ Cache Write", f"{cache_creation:,}")
+        table.add_row("│  └─ Cache Hit Ratio", f"{stats.get('cache_hit_ratio', 0.0):.1%}")
         table.add_row("└─ Output", f"{stats['total_output_tokens']:,}")
     else:
         table.add_row("├─ Input", f"{stats['total_input_tokens']:,}")
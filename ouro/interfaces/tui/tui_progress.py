@@ -78,6 +78,10 @@ class TuiProgressSink:
                 terminal_ui.print_tool_blocked(f"{prefix}{name}", arguments, reason)
             return
 
+        if kind == "tool_queue":
+            # Queue-depth metric for machine consumers; too chatty for the TUI.
+            return
+
         if kind == "final_answer":
             # The interactive shell renders the returned final answer itself;
             # no additional marker is needed.
@@ -0,0 +1 @@
+"""Performance benchmarks (skipped unless RUN_BENCHMARKS=1)."""
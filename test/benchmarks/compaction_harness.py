@@ -0,0 +1,261 @@
+"""Replay recorded sessions through compaction and score the result.
+
+A session YAML (the format ``YamlFileMemoryStore`` writes, optionally with a
+top-level ``probes`` list of facts the conversation established) is replayed
+message by message. Before every recorded assistant message, i.e. wherever
+the agent issued an LLM request, ``CompactionHook`` runs as it would in the
+loop, with a ``StandInLLM`` producing the summaries:
+
+- the stand-in is extractive and deterministic: it keeps the source lines
+  richest in identifiers, paths and numbers, up to the target length the
+  compaction prompt asks for, so strategies are compared on what they hand
+  the summarizer and what they keep verbatim;
+- its latency is modeled from token counts (prefill, cached prefill, decode)
+  rather than measured, so results do not depend on the machine.
+
+Metrics per strategy and session: compression ratio, prompt-cache prefix
+reuse between consecutive requests, summary calls and their modeled
+latency/token cost, and the share of probes still present in the final
+context.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+
+from ouro.capabilities.compaction import CompactionHook, CompactionManager, CompressionStrategy
+from ouro.capabilities.memory.serialization import deserialize_message
+from ouro.core.llm.content_utils import extract_text
+from ouro.core.llm.message_types import LLMMessage, LLMResponse, StopReason
+from ouro.core.loop import MessageListContext, NullProgressSink
+from ouro.core.loop.context import RunStatistic
+
+SESSIONS_DIR = Path(__file__).parent / "sessions"
+
+# Stand-in latency model (seconds per token), roughly a hosted frontier model.
+LATENCY_FIXED = 0.4
+LATENCY_PREFILL = 1 / 5000
+LATENCY_CACHED_PREFILL = 1 / 50000
+LATENCY_DECODE = 1 / 60
+
+# Strategies compared by the benchmark.  "default" is what ships: the prune
+# tier, then the strategy CompactionManager selects.
+STRATEGIES = ("default", CompressionStrategy.SELECTIVE, CompressionStrategy.SLIDING_WINDOW)
+
+_TARGET_RE = re.compile(r"Target length: (\d+) tokens")
+_SALIENT_RE = re.compile(r"[\w./-]*\d[\w./-]*|[\w-]+/[\w./-]+|\w+\.\w+|[A-Z][A-Z0-9_]{2,}|\w+_\w+")
+
+
+def count_tokens(message: LLMMessage) -> int:
+    """Deterministic token estimate (~4 characters per token)."""
+    text = extract_text(message.content) if message.content is not None else ""
+    if message.tool_calls:
+        text += str(message.tool_calls)
+    return len(text) // 4 + 4
+
+
+@dataclass
+class RecordedSession:
+    name: str
+    system_messages: list[LLMMessage]
+    messages: list[LLMMessage]
+    probes: list[str] = field(default_factory=list)
+
+
+def load_session(path: Path) -> RecordedSession:
+    with open(path, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    return RecordedSession(
+        name=path.stem if path.name != "session.yaml" else path.parent.name,
+        system_messages=[deserialize_message(m) for m in data.get("system_messages") or []],
+        messages=[deserialize_message(m) for m in data.get("messages") or []],
+        probes=[str(p) for p in data.get("probes") or []],
+    )
+
+
+def load_sessions(source: str | None = None) -> list[RecordedSession]:
+    """Load ``*.yaml`` sessions from ``source`` (a file or directory tree).
+
+    Defaults to the fixtures next to this module.  ``~/.ouro/sessions`` works
+    too; sessions recorded by the store have no probes.
+    """
+    root = Path(source).expanduser() if source else SESSIONS_DIR
+    paths = [root] if root.is_file() else sorted(root.rglob("*.yaml"))
+    return [load_session(p) for p in paths if p.name != ".index.yaml"]
+
+
+class StandInLLM:
+    """Deterministic extractive summarizer with a modeled latency."""
+
+    model = "stand-in"
+    provider_name = "stand-in"
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, float]] = []
+        # Last main-loop request, to model prompt-cache hits of the fork.
+        self.last_request: list[LLMMessage] = []
+
+    async def call_async(self, messages, tools=None, max_tokens=4096, **kwargs):
+        prompt = extract_text(messages[-1].content)
+        match = _TARGET_RE.search(prompt)
+        target = int(match.group(1)) if match else 500
+        sources = [m for m in messages[:-1] if m.role != "system"] or messages[-1:]
+        summary = self._extract(sources, min(target, max_tokens))
+
+        input_tokens = sum(count_tokens(m) for m in messages)
+        cached = sum(count_tokens(m) for m in _common_prefix(self.last_request, messages))
+        output_tokens = len(summary) // 4 + 1
+        latency = (
+            LATENCY_FIXED
+            + (input_tokens - cached) * LATENCY_PREFILL
+            + cached * LATENCY_CACHED_PREFILL
+            + output_tokens * LATENCY_DECODE
+        )
+        self.calls.append(
+            {"input": input_tokens, "cached": cached, "output": output_tokens, "latency": latency}
+        )
+        return LLMResponse(
+            content=summary,
+            stop_reason=StopReason.STOP,
+            usage={
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_read_tokens": cached,
+            },
+        )
+
+    def extract_text(self, response: LLMResponse) -> str:
+        return response.content or ""
+
+    @staticmethod
+    def _extract(sources: list[LLMMessage], target_tokens: int) -> str:
+        candidates: list[tuple[float, int, str]] = []
+        seen: set[str] = set()
+        for message in sources:
+            text = extract_text(message.content) if message.content is not None else ""
+            for line in text.splitlines():
+                line = line.strip()
+                if len(line) < 12 or line in seen:
+                    continue
+                seen.add(line)
+                salient = len(_SALIENT_RE.findall(line))
+                bonus = 2 if message.role in ("user", "assistant") else 0
+                score = (salient + bonus) / (1 + len(line) / 80)
+                candidates.append((score, len(candidates), line))
+        budget = target_tokens * 4
+        chosen = []
+        for _score, order, line in sorted(candidates, key=lambda c: (-c[0], c[1])):
+            if len(line) > budget:
+                continue
+            chosen.append((order, line))
+            budget -= len(line) + 1
+        return "\n".join(line for _order, line in sorted(chosen))
+
+
+def _same(a: LLMMessage, b: LLMMessage) -> bool:
+    return a is b or a.to_dict() == b.to_dict()
+
+
+def _common_prefix(previous: list[LLMMessage], current: list[LLMMessage]) -> list[LLMMessage]:
+    n = 0
+    for a, b in zip(previous, current, strict=False):
+        if not _same(a, b):
+            break
+        n += 1
+    return current[:n]
+
+
+@dataclass
+class ReplayResult:
+    session: str
+    strategy: str
+    original_tokens: int
+    final_tokens: int
+    peak_tokens: int
+    compactions: int
+    prefix_reuse: float
+    summary_calls: int
+    summary_latency: float
+    summary_input_tokens: int
+    summary_output_tokens: int
+    probes_kept: int
+    probes_total: int
+    wall_seconds: float
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.final_tokens / self.original_tokens if self.original_tokens else 1.0
+
+    @property
+    def retention(self) -> float:
+        return self.probes_kept / self.probes_total if self.probes_total else float("nan")
+
+
+async def replay(
+    session: RecordedSession,
+    strategy: str,
+    set_config: Callable[..., Any],
+    *,
+    threshold: int,
+    short_term: int = 6,
+) -> ReplayResult:
+    """Replay ``session`` with compaction at ``threshold`` tokens using ``strategy``."""
+    set_config(
+        MEMORY_ENABLED=True,
+        MEMORY_COMPRESSION_THRESHOLD=threshold,
+        MEMORY_SHORT_TERM_MIN_SIZE=short_term,
+        MEMORY_BACKGROUND_COMPACTION_RATIO=0,
+    )
+    llm = StandInLLM()
+    manager = CompactionManager(llm, count_message=count_tokens)  # type: ignore[arg-type]
+    manager.compressor._estimate_tokens = lambda ms: sum(count_tokens(m) for m in ms)  # type: ignore[method-assign]
+    if strategy != "default":
+        manager._select_strategy = lambda messages: strategy  # type: ignore[method-assign]
+        manager.prune_tool_results = lambda messages: (messages, [])  # type: ignore[method-assign]
+    hook = CompactionHook(manager)
+    context = MessageListContext(system_messages=list(session.system_messages))
+    ctx = RunStatistic("compaction-bench", NullProgressSink())
+
+    previous: list[LLMMessage] = []
+    reuse: list[float] = []
+    peak = 0
+    started = time.perf_counter()
+    for message in session.messages:
+        if message.role == "assistant":
+            await hook.on_iteration_start(ctx, context, [])
+            request = list(context.system_messages) + context.detached.snapshot()
+            if previous:
+                shared = sum(count_tokens(m) for m in _common_prefix(previous, request))
+                reuse.append(shared / max(1, sum(count_tokens(m) for m in previous)))
+            peak = max(peak, sum(count_tokens(m) for m in request))
+            previous = request
+            llm.last_request = request
+        context.detached.append(message)
+    wall = time.perf_counter() - started
+
+    final = list(context.system_messages) + context.detached.snapshot()
+    final_text = "\n".join(
+        extract_text(m.content) if m.content is not None else "" for m in final
+    ).lower()
+    return ReplayResult(
+        session=session.name,
+        strategy=strategy,
+        original_tokens=sum(count_tokens(m) for m in session.system_messages + session.messages),
+        final_tokens=sum(count_tokens(m) for m in final),
+        peak_tokens=peak,
+        compactions=manager.compression_count,
+        prefix_reuse=sum(reuse) / len(reuse) if reuse else 1.0,
+        summary_calls=len(llm.calls),
+        summary_latency=sum(c["latency"] for c in llm.calls),
+        summary_input_tokens=int(sum(c["input"] for c in llm.calls)),
+        summary_output_tokens=int(sum(c["output"] for c in llm.calls)),
+        probes_kept=sum(1 for p in session.probes if p.lower() in final_text),
+        probes_total=len(session.probes),
+        wall_seconds=wall,
+    )
@@ -0,0 +1,39 @@
+"""Shared helpers for benchmarks.
+
+Benchmarks measure wall time and print a small report; run them with
+``RUN_BENCHMARKS=1 ./scripts/dev.sh test -q -s test/benchmarks/``.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import time
+from typing import Callable
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _require_benchmark_opt_in():
+    if os.getenv("RUN_BENCHMARKS") != "1":
+        pytest.skip("Set RUN_BENCHMARKS=1 to run benchmarks")
+
+
+def median_seconds(fn: Callable[[], object], *, repeat: int = 7) -> float:
+    """Median wall time of ``fn()`` over ``repeat`` runs."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def report(title: str, header: list[str], rows: list[list[object]]) -> None:
+    """Print a fixed-width table (visible with ``pytest -s``)."""
+    widths = [max(len(str(c)) for c in col) for col in zip(header, *rows, strict=False)]
+    print(f"\n{title}")
+    print("  ".join(h.rjust(w) for h, w in zip(header, widths, strict=False)))
+    for row in rows:
+        print("  ".join(str(c).rjust(w) for c, w in zip(row, widths, strict=False)))
@@ -0,0 +1,75 @@
+"""Compaction quality and cost per strategy on recorded sessions.
+
+Replays the sessions in ``test/benchmarks/sessions`` (or the directory in
+``COMPACTION_BENCH_SESSIONS``) through ``CompactionHook`` with a
+deterministic stand-in summarizer; see ``compaction_harness``.  Compare the
+table before and after a compaction change.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+
+from ouro.config import Config
+
+from .compaction_harness import STRATEGIES, load_sessions, replay
+from .conftest import report
+
+THRESHOLD = int(os.getenv("COMPACTION_BENCH_THRESHOLD", "6000"))
+
+
+async def test_compaction_quality_and_cost(monkeypatch):
+    sessions = load_sessions(os.getenv("COMPACTION_BENCH_SESSIONS"))
+    assert sessions
+
+    def set_config(**values):
+        for key, value in values.items():
+            monkeypatch.setattr(Config, key, value)
+
+    results = [
+        await replay(session, strategy, set_config, threshold=THRESHOLD)
+        for session in sessions
+        for strategy in STRATEGIES
+    ]
+
+    report(
+        f"Compaction quality and cost (threshold {THRESHOLD} tokens)",
+        [
+            "session",
+            "strategy",
+            "tokens",
+            "final",
+            "ratio",
+            "peak",
+            "compactions",
+            "prefix reuse",
+            "summary s",
+            "summary in/out",
+            "probes",
+        ],
+        [
+            [
+                r.session,
+                r.strategy,
+                r.original_tokens,
+                r.final_tokens,
+                f"{r.compression_ratio:.2f}",
+                r.peak_tokens,
+                r.compactions,
+                f"{r.prefix_reuse:.0%}",
+                f"{r.summary_latency:.1f}",
+                f"{r.summary_input_tokens}/{r.summary_output_tokens}",
+                f"{r.probes_kept}/{r.probes_total}" if r.probes_total else "-",
+            ]
+            for r in results
+        ],
+    )
+
+    for r in results:
+        assert 0 < r.compression_ratio <= 1
+        assert 0 <= r.prefix_reuse <= 1
+        if r.original_tokens > THRESHOLD * 2:
+            assert r.compactions > 0, r
+        if r.probes_total:
+            assert not math.isnan(r.retention)
@@ -0,0 +1,55 @@
+"""Cold-start import time per entry point, against a budget.
+
+Each entry point is imported in a fresh interpreter with ``-X importtime``
+and the cumulative time of its top-level module is compared with a budget.
+Budgets leave roughly 2-3x headroom over a warm-cache laptop run; a failure
+usually means something heavy (litellm, ddgs, trafilatura, ...) is being
+imported at module level again.
+"""
+
+from __future__ import annotations
+
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+from .conftest import report
+
+# module -> budget in milliseconds
+BUDGETS_MS = {
+    "ouro.interfaces.cli.args": 250,
+    "ouro.core": 100,
+    "ouro.interfaces.cli.main": 2000,
+    "ouro.interfaces.bot.main": 2500,
+    "ouro.interfaces.trace_web.server": 1200,
+}
+REPEAT = 5
+
+
+def _import_ms(module: str) -> float:
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    for line in stderr.splitlines():
+        parts = [p.strip() for p in line.split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_entry_point_import_budgets():
+    rows = []
+    over = []
+    for module, budget in BUDGETS_MS.items():
+        ms = statistics.median(_import_ms(module) for _ in range(REPEAT))
+        rows.append([module, f"{ms:.0f}", budget])
+        if ms > budget:
+            over.append(f"{module}: {ms:.0f}ms > {budget}ms")
+    report("Cold import time (ms, median)", ["module", "ms", "budget"], rows)
+    if over:
+        pytest.fail("Import budget exceeded: " + "; ".join(over))
@@ -0,0 +1,111 @@
+"""LiteLLMAdapter message conversion cost per loop iteration.
+
+Each iteration appends an assistant tool call + tool result and converts the
+whole history again. With memoized conversion only the two new messages are
+converted, so the conversion work per iteration stays flat as history grows;
+what is left is assembling the outgoing list, which the request body has to
+pay for anyway.
+"""
+
+from __future__ import annotations
+
+from ouro.core.llm.litellm_adapter import LiteLLMAdapter
+from ouro.core.llm.message_types import LLMMessage
+
+from .conftest import median_seconds, report
+
+SIZES = (250, 1000, 4000)
+REPEAT = 15
+
+
+def _turn(i: int) -> list[LLMMessage]:
+    call_id = f"call_{i}"
+    return [
+        LLMMessage(
+            role="assistant",
+            content=[{"type": "text", "text": f"Reading file {i}. " * 8}],
+        ),
+        LLMMessage(
+            role="assistant",
+            content=None,
+            tool_calls=[
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": "read_file", "arguments": f'{{"path": "f{i}.py"}}'},
+                }
+            ],
+        ),
+        LLMMessage(role="tool", content="x = 1\n" * 300, tool_call_id=call_id, name="read_file"),
+        LLMMessage(
+            role="user",
+            content=[{"type": "tool_result", "tool_use_id": call_id, "content": "ok"}],
+        ),
+    ]
+
+
+def _history(n: int) -> list[LLMMessage]:
+    messages = [LLMMessage(role="system", content="You are a helpful agent.")]
+    i = 0
+    while len(messages) < n:
+        messages.extend(_turn(i))
+        i += 1
+    return messages[:n]
+
+
+def _per_iteration(adapter: LiteLLMAdapter, history: list[LLMMessage], *, cached: bool) -> float:
+    adapter._convert_messages(history)
+    step = [len(history)]
+
+    def iteration() -> None:
+        history.extend(_turn(step[0]))
+        step[0] += 1
+        if not cached:
+            adapter.invalidate_message_cache()
+        adapter._convert_messages(history)
+
+    return median_seconds(iteration, repeat=REPEAT)
+
+
+def _count_conversions(adapter: LiteLLMAdapter) -> list[LLMMessage]:
+    counted: list[LLMMessage] = []
+    original = adapter._convert_message
+
+    def convert(msg: LLMMessage) -> list[dict]:
+        counted.append(msg)
+        return original(msg)
+
+    adapter._convert_message = convert  # type: ignore[method-assign]
+    return counted
+
+
+def test_conversion_cost_stays_flat_as_history_grows():
+    rows = []
+    converted_per_iteration = []
+    cached_times = []
+    uncached_times = []
+    for n in SIZES:
+        adapter = LiteLLMAdapter(model="gpt-4o")
+        uncached = _per_iteration(adapter, _history(n), cached=False)
+
+        adapter = LiteLLMAdapter(model="gpt-4o")
+        history = _history(n)
+        adapter._convert_messages(history)
+        counted = _count_conversions(adapter)
+        cached = _per_iteration(adapter, history, cached=True)
+
+        converted_per_iteration.append(len(counted) / REPEAT)
+        cached_times.append(cached)
+        uncached_times.append(uncached)
+        rows.append(
+            [n, f"{uncached * 1e3:.3f}", f"{cached * 1e3:.3f}", f"{uncached / cached:.1f}x"]
+        )
+
+    report(
+        "LiteLLMAdapter._convert_messages per iteration",
+        ["history", "uncached ms", "cached ms", "speedup"],
+        rows,
+    )
+    # Every iteration converts exactly the new turn, regardless of history size.
+    assert converted_per_iteration[0] == converted_per_iteration[-1] == len(_turn(0))
+    assert cached_times[-1] < uncached_times[-1]
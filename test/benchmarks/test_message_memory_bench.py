@@ -0,0 +1,87 @@
+"""Resident size of a 10k-message session.
+
+Compares the slotted LLMMessage against an equivalent plain dataclass (the
+previous representation). Role and tool-name strings are built at runtime, as
+they are when a session is loaded from disk, so the plain variant pays for a
+separate copy of each while the slotted one shares interned strings.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from ouro.core.llm.message_types import LLMMessage
+
+from .conftest import report
+
+SESSION_SIZE = 10_000
+
+
+@dataclass
+class _PlainMessage:
+    role: str
+    content: Any | None = None
+    tool_calls: list | None = None
+    tool_call_id: str | None = None
+    name: str | None = None
+
+
+def _fresh(text: str) -> str:
+    # Defeat compile-time constant sharing, like strings decoded from YAML.
+    return "".join(list(text))
+
+
+def _session(factory: Callable[..., Any]) -> list[Any]:
+    messages = []
+    for i in range(SESSION_SIZE // 4):
+        call_id = f"call_{i}"
+        messages.append(factory(role=_fresh("user"), content=f"question {i}"))
+        messages.append(
+            factory(
+                role=_fresh("assistant"),
+                tool_calls=[
+                    {
+                        "id": call_id,
+                        "type": _fresh("function"),
+                        "function": {"name": _fresh("read_file"), "arguments": "{}"},
+                    }
+                ],
+            )
+        )
+        messages.append(
+            factory(
+                role=_fresh("tool"), content="ok", tool_call_id=call_id, name=_fresh("read_file")
+            )
+        )
+        messages.append(factory(role=_fresh("assistant"), content=f"answer {i}"))
+    return messages
+
+
+def _allocated(factory: Callable[..., Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        session = _session(factory)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(session) == SESSION_SIZE
+    return size
+
+
+def test_slotted_message_memory():
+    plain = _allocated(_PlainMessage)
+    slotted = _allocated(LLMMessage)
+
+    report(
+        f"{SESSION_SIZE} message session",
+        ["representation", "KiB", "bytes/msg"],
+        [
+            ["dataclass", plain // 1024, plain // SESSION_SIZE],
+            ["slotted", slotted // 1024, slotted // SESSION_SIZE],
+        ],
+    )
+    assert slotted < plain
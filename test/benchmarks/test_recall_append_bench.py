@@ -0,0 +1,69 @@
+"""Recall indexing cost of one save as the session grows.
+
+Each save adds two messages. "reindex" deletes and reinserts every FTS row
+of the session, which ``MemoryManager.save_memory`` used to do; "append"
+inserts only the new messages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+from ouro.capabilities.memory.recall import RecallIndex
+from ouro.capabilities.memory.sqlite_pool import SQLitePool
+from ouro.core.llm.message_types import LLMMessage
+
+from .conftest import median_seconds, report
+
+SIZES = (200, 2_000, 10_000)
+
+
+def _history(n: int) -> list[LLMMessage]:
+    return [
+        LLMMessage(
+            role="user" if i % 2 == 0 else "assistant",
+            content=f"message {i} about the parser, the scheduler and module_{i % 97}",
+        )
+        for i in range(n)
+    ]
+
+
+def _measure(pool: SQLitePool, root: str, n: int) -> tuple[float, float]:
+    history = _history(n)
+    new = _history(2)
+    index = RecallIndex(f"{root}/reindex_{n}", pool=pool)
+    appended = RecallIndex(f"{root}/append_{n}", pool=pool)
+    asyncio.run(index.reindex_session("s", history))
+    asyncio.run(appended.append_messages("s", history))
+
+    def reindex():
+        history.extend(new)
+        asyncio.run(index.reindex_session("s", history))
+
+    def append():
+        asyncio.run(appended.append_messages("s", new))
+
+    return median_seconds(reindex), median_seconds(append)
+
+
+def test_recall_append_bench(tmp_path):
+    pool = SQLitePool()
+    rows = []
+    try:
+        for n in SIZES:
+            reindex_s, append_s = _measure(pool, str(tmp_path), n)
+            rows.append(
+                [
+                    n,
+                    f"{reindex_s * 1000:.2f}",
+                    f"{append_s * 1000:.2f}",
+                    f"{reindex_s / append_s:.0f}x",
+                ]
+            )
+    finally:
+        pool.close()
+    report(
+        "Recall indexing per save (2 new messages)",
+        ["messages", "reindex ms", "append ms", "speedup"],
+        rows,
+    )
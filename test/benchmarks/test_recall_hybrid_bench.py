@@ -0,0 +1,129 @@
+"""Relevance and latency of lexical vs hybrid recall over recorded sessions.
+
+Every message of the recorded sessions (``sessions/``) with enough text
+becomes a target; queries are built from its three longest words:
+
+- "exact": the words as they appear;
+- "variant": each word cut to its first six characters, or pluralized when
+  shorter — a stand-in for the inflections and partial words a paraphrase
+  uses, which FTS5 tokens do not match;
+- "malformed": the exact words after an unbalanced quote and parenthesis.
+
+Relevance is hit@5 (the target is among the first five results). Latency
+is the median search time on the recorded index and on an index of
+``SCALED_MESSAGES`` messages. "hybrid" uses the hashing sketch
+(``RECALL_EMBEDDER=hash``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import statistics
+import time
+
+from ouro.capabilities.memory.recall import RecallIndex
+from ouro.capabilities.memory.recall.dense import HashingEmbedder
+from ouro.capabilities.memory.recall.sqlite_fts import _flatten_content
+from ouro.capabilities.memory.sqlite_pool import SQLitePool
+
+from .compaction_harness import load_sessions
+from .conftest import report
+
+SCALED_MESSAGES = 10_000
+MIN_CHARS = 40
+
+
+def _queries(text: str) -> dict[str, str] | None:
+    words = sorted(set(re.findall(r"[A-Za-z]{5,}", text)), key=len, reverse=True)[:3]
+    if len(words) < 3:
+        return None
+    variant = [w[:6] if len(w) > 7 else w + "s" for w in words]
+    return {
+        "exact": " ".join(words),
+        "variant": " ".join(variant),
+        "malformed": '"(' + " ".join(words),
+    }
+
+
+async def _hit_count(index: RecallIndex, targets: list, kind: str) -> int:
+    found = 0
+    for key, queries in targets:
+        results = await index.search(queries[kind], limit=5)
+        found += key in {(r["session_id"], r["msg_idx"]) for r in results}
+    return found
+
+
+def _search_latency(index: RecallIndex, queries: list[str]) -> float:
+    async def run():
+        samples = []
+        for query in queries:
+            start = time.perf_counter()
+            await index.search(query)
+            samples.append(time.perf_counter() - start)
+        return statistics.median(samples)
+
+    return asyncio.run(run())
+
+
+def test_recall_hybrid_bench(tmp_path):
+    sessions = load_sessions()
+    pool = SQLitePool()
+    embedder = HashingEmbedder()
+    indexes = {
+        "lexical": RecallIndex(str(tmp_path / "recorded"), pool=pool),
+        "hybrid": RecallIndex(str(tmp_path / "recorded"), pool=pool, embedder=embedder),
+    }
+    scaled = {
+        "lexical": RecallIndex(str(tmp_path / "scaled"), pool=pool),
+        "hybrid": RecallIndex(str(tmp_path / "scaled"), pool=pool, embedder=embedder),
+    }
+    try:
+        targets = []
+        for session in sessions:
+            # The hybrid index writes both the FTS rows and the vectors.
+            asyncio.run(indexes["hybrid"].append_messages(session.name, session.messages))
+            for idx, message in enumerate(session.messages):
+                text = _flatten_content(message.content)
+                queries = _queries(text) if len(text) >= MIN_CHARS else None
+                if queries:
+                    targets.append(((session.name, idx), queries))
+
+        all_messages = [m for s in sessions for m in s.messages]
+        copies = SCALED_MESSAGES // max(1, len(all_messages)) + 1
+        for i in range(copies):
+            asyncio.run(scaled["hybrid"].append_messages(f"copy-{i}", all_messages))
+
+        rows = []
+        for kind in ("exact", "variant", "malformed"):
+            hits = {
+                name: asyncio.run(_hit_count(index, targets, kind))
+                for name, index in indexes.items()
+            }
+            rows.append(
+                [kind, len(targets)]
+                + [f"{hits[name] / len(targets):.0%}" for name in ("lexical", "hybrid")]
+            )
+        report(
+            "Recall hit@5 over recorded sessions",
+            ["queries", "n", "lexical", "hybrid"],
+            rows,
+        )
+
+        sample = [queries["variant"] for _, queries in targets[:50]]
+        latency_rows = []
+        for label, group, size in (
+            ("recorded", indexes, len(all_messages)),
+            ("scaled", scaled, copies * len(all_messages)),
+        ):
+            latency_rows.append(
+                [label, size]
+                + [f"{_search_latency(group[name], sample) * 1000:.1f}" for name in group]
+            )
+        report(
+            "Recall search latency (median ms)",
+            ["index", "messages", "lexical", "hybrid"],
+            latency_rows,
+        )
+    finally:
+        pool.close()
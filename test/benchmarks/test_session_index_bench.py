@@ -0,0 +1,75 @@
+"""``list_sessions`` / ``/resume`` over 10k stored sessions.
+
+"scan" reads every ``session.yaml``, which is what ``list_sessions`` used to
+do on each call (and what ``rebuild_index`` still does). "cold" is a fresh
+store answering from ``.index.jsonl``; "warm" is a store that already has
+the index in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import yaml
+
+from ouro.capabilities.memory.store import YamlFileMemoryStore
+
+from .conftest import median_seconds, report
+
+SESSIONS = 10_000
+MESSAGES_PER_SESSION = 20
+
+
+def _write_sessions(sessions_dir: str) -> None:
+    start = datetime(2025, 1, 1)
+    for i in range(SESSIONS):
+        session_id = str(uuid.uuid4())
+        at = (start + timedelta(minutes=i)).isoformat()
+        data = {
+            "id": session_id,
+            "created_at": at,
+            "updated_at": at,
+            "system_messages": [{"role": "system", "content": "You are helpful.", "tokens": 0}],
+            "messages": [
+                {"role": "user" if k % 2 == 0 else "assistant", "content": f"msg {k}", "tokens": 0}
+                for k in range(MESSAGES_PER_SESSION)
+            ],
+        }
+        session_dir = os.path.join(sessions_dir, f"{at[:10]}_{session_id[:8]}")
+        os.makedirs(session_dir)
+        with open(os.path.join(session_dir, "session.yaml"), "w", encoding="utf-8") as f:
+            yaml.safe_dump(data, f, sort_keys=False)
+
+
+def test_session_index_bench(tmp_path):
+    sessions_dir = str(tmp_path / "sessions")
+    _write_sessions(sessions_dir)
+
+    def scan():
+        asyncio.run(YamlFileMemoryStore(sessions_dir=sessions_dir).rebuild_index())
+
+    def cold():
+        asyncio.run(YamlFileMemoryStore(sessions_dir=sessions_dir).list_sessions())
+
+    warm_store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+    asyncio.run(warm_store.list_sessions())
+
+    def warm():
+        asyncio.run(warm_store.list_sessions())
+
+    scan_s = median_seconds(scan, repeat=1)
+    cold_s = median_seconds(cold, repeat=3)
+    warm_s = median_seconds(warm)
+    report(
+        f"list_sessions over {SESSIONS} sessions",
+        ["path", "ms", "speedup"],
+        [
+            ["scan", f"{scan_s * 1000:.0f}", "1.0x"],
+            ["cold", f"{cold_s * 1000:.1f}", f"{scan_s / cold_s:.0f}x"],
+            ["warm", f"{warm_s * 1000:.2f}", f"{scan_s / warm_s:.0f}x"],
+        ],
+    )
+    assert cold_s < scan_s
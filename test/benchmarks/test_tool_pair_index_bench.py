@@ -0,0 +1,98 @@
+"""Tool-pair analysis cost of one compaction on long synthetic histories.
+
+One compaction selects a strategy, builds the compaction prompt and applies
+the summary; each step needs the tool_call_id -> (assistant, result) pairing
+and the preserved/compressed split. With the shared ``ToolPairIndex`` the
+history is scanned once per compaction; the "rescan" column drops the index
+before every step, which is what each step used to pay.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from ouro.capabilities.compaction import CompactionManager
+from ouro.core.llm.message_types import LLMMessage
+
+from .conftest import median_seconds, report
+
+SIZES = (5_000, 20_000, 50_000)
+PARALLEL_CALLS = 3
+
+
+class _StubLLM:
+    model = "gpt-4o"
+    provider_name = "openai"
+
+
+def _history(n: int) -> list[LLMMessage]:
+    messages: list[LLMMessage] = []
+    i = 0
+    while len(messages) < n:
+        ids = [f"call_{i}_{k}" for k in range(PARALLEL_CALLS)]
+        messages.append(LLMMessage(role="user", content=f"question {i}"))
+        messages.append(
+            LLMMessage(
+                role="assistant",
+                tool_calls=[
+                    {
+                        "id": call_id,
+                        "type": "function",
+                        "function": {"name": "read_file", "arguments": "{}"},
+                    }
+                    for call_id in ids
+                ],
+            )
+        )
+        messages.extend(
+            LLMMessage(role="tool", content="ok", tool_call_id=call_id, name="read_file")
+            for call_id in ids
+        )
+        messages.append(LLMMessage(role="assistant", content=f"answer {i}"))
+        i += 1
+    return messages[:n]
+
+
+def _compaction(manager: CompactionManager, history: list[LLMMessage], *, rescan: bool):
+    compressor = manager.compressor
+
+    def step(fn):
+        if rescan:
+            compressor.release_tool_pair_index()
+        return fn()
+
+    def run() -> None:
+        strategy = step(lambda: manager._select_strategy(history))
+        step(lambda: compressor.build_compaction_prompt(history, strategy, 1000))
+        step(lambda: manager.apply_compression("summary", history))
+
+    return run
+
+
+def test_tool_pair_analysis_scans_history_once_per_compaction():
+    logging.disable(logging.INFO)
+    try:
+        rows = []
+        shared_times = []
+        for n in SIZES:
+            history = _history(n)
+            manager = CompactionManager(_StubLLM(), count_message=lambda m: 1)
+            # Keep token counting out of the measurement.
+            manager.compressor._estimate_tokens = len  # type: ignore[method-assign]
+
+            rescan = median_seconds(_compaction(manager, history, rescan=True), repeat=5)
+            shared = median_seconds(_compaction(manager, history, rescan=False), repeat=5)
+            shared_times.append(shared)
+            rows.append(
+                [n, f"{rescan * 1e3:.1f}", f"{shared * 1e3:.1f}", f"{rescan / shared:.1f}x"]
+            )
+    finally:
+        logging.disable(logging.NOTSET)
+
+    report(
+        "Tool-pair analysis per compaction",
+        ["messages", "rescan ms", "shared ms", "speedup"],
+        rows,
+    )
+    # Linear: 10x the history costs well under 20x the time.
+    assert shared_times[-1] < shared_times[0] * (SIZES[-1] / SIZES[0]) * 2
@@ -0,0 +1,193 @@
+"""Tests for background summarization of the oldest history."""
+
+import asyncio
+
+from ouro.capabilities.compaction import CompactionHook, CompactionManager
+from ouro.capabilities.tools.executor import ToolExecutor
+from ouro.core.llm.message_types import LLMMessage
+from ouro.core.loop import Agent, MessageListContext, NullProgressSink
+from ouro.core.loop.context import RunStatistic
+
+
+def _count(message):
+    return len(message.content or "") // 4
+
+
+def _history(turns, size=400):
+    messages = []
+    for i in range(turns):
+        messages.append(LLMMessage(role="user", content=f"question {i} " + "x" * size))
+        messages.append(LLMMessage(role="assistant", content=f"answer {i} " + "y" * size))
+    return messages
+
+
+def _task(steps, size=400):
+    """One user query followed by ``steps`` tool calls and their results."""
+    messages = [LLMMessage(role="user", content="refactor the parser")]
+    for i in range(steps):
+        messages.append(
+            LLMMessage(
+                role="assistant",
+                content=f"step {i}",
+                tool_calls=[
+                    {
+                        "id": f"call_{i}",
+                        "type": "function",
+                        "function": {"name": "read_file", "arguments": "{}"},
+                    }
+                ],
+            )
+        )
+        messages.append(LLMMessage(role="tool", content="z" * size, tool_call_id=f"call_{i}"))
+    return messages
+
+
+def _setup(mock_llm, set_memory_config, threshold):
+    set_memory_config(
+        MEMORY_COMPRESSION_THRESHOLD=threshold,
+        MEMORY_SHORT_TERM_MIN_SIZE=2,
+        MEMORY_BACKGROUND_COMPACTION_RATIO=0.5,
+    )
+    manager = CompactionManager(mock_llm, count_message=_count)
+    return manager, CompactionHook(manager)
+
+
+class TestBackgroundCompaction:
+    async def test_starts_below_threshold_and_swaps_in_later(self, mock_llm, set_memory_config):
+        # 8 messages of ~100 tokens: over the soft (500) but not the hard (1000) threshold.
+        manager, hook = _setup(mock_llm, set_memory_config, threshold=1000)
+        context = MessageListContext(detached=_history(4))
+        ctx = RunStatistic("t", NullProgressSink())
+
+        await hook.on_iteration_start(ctx, context, [])
+        assert len(context.detached) == 8
+        assert hook._background is not None
+
+        await asyncio.wait({hook._background.task})
+        context.detached.append(LLMMessage(role="assistant", content="new"))
+        await hook.on_iteration_start(ctx, context, [])
+
+        assert mock_llm.call_count == 1
+        assert manager.compression_count == 1
+        # Prefix up to the latest user query replaced by one summary.
+        assert len(context.detached) == 4
+        assert context.detached[0].content.startswith(manager.compressor.SUMMARY_PREFIX)
+        assert context.detached[1].content.startswith("question 3")
+        assert context.detached[-1].content == "new"
+        assert ctx.usage_total["input_tokens"] == 100
+
+    async def test_discards_summary_when_prefix_changed(self, mock_llm, set_memory_config):
+        manager, hook = _setup(mock_llm, set_memory_config, threshold=1000)
+        context = MessageListContext(detached=_history(4))
+        ctx = RunStatistic("t", NullProgressSink())
+
+        await hook.on_iteration_start(ctx, context, [])
+        await asyncio.wait({hook._background.task})
+        context.detached.replace_range(0, 1, [LLMMessage(role="user", content="rewritten")])
+        await hook.on_iteration_start(ctx, context, [])
+
+        assert manager.compression_count == 0
+        assert len(context.detached) == 8
+        assert context.detached[0].content == "rewritten"
+
+    async def test_awaits_in_flight_summary_at_hard_threshold(self, mock_llm, set_memory_config):
+        manager, hook = _setup(mock_llm, set_memory_config, threshold=1000)
+        context = MessageListContext(detached=_history(4))
+        ctx = RunStatistic("t", NullProgressSink())
+
+        await hook.on_iteration_start(ctx, context, [])
+        # Grow past the hard threshold before the background task has run.
+        context.detached.extend(_history(2, size=600)[:3])
+        await hook.on_iteration_start(ctx, context, [])
+
+        # The in-flight summary was used instead of a second blocking call.
+        assert mock_llm.call_count == 1
+        assert manager.compression_count == 1
+        assert context.detached[0].content.startswith(manager.compressor.SUMMARY_PREFIX)
+
+    async def test_failed_summary_is_dropped(self, mock_llm, set_memory_config):
+        manager, hook = _setup(mock_llm, set_memory_config, threshold=1000)
+
+        async def fail(*args, **kwargs):
+            raise RuntimeError("boom")
+
+        mock_llm.call_async = fail
+        context = MessageListContext(detached=_history(4))
+        ctx = RunStatistic("t", NullProgressSink())
+
+        await hook.on_iteration_start(ctx, context, [])
+        await asyncio.wait({hook._background.task})
+        await hook.on_iteration_start(ctx, context, [])
+
+        assert manager.compression_count == 0
+        assert len(context.detached) == 8
+
+    async def test_disabled_with_zero_ratio(self, mock_llm, set_memory_config):
+        manager, hook = _setup(mock_llm, set_memory_config, threshold=1000)
+        set_memory_config(MEMORY_BACKGROUND_COMPACTION_RATIO=0)
+        context = MessageListContext(detached=_history(4))
+
+        await hook.on_iteration_start(RunStatistic("t", NullProgressSink()), context, [])
+
+        assert hook._background is None
+        assert mock_llm.call_count == 0
+
+    async def test_single_task_summarizes_tool_turns_after_query(self, mock_llm, set_memory_config):
+        manager, hook = _setup(mock_llm, set_memory_config, threshold=1000)
+        history = _task(6)  # 13 messages, ~600 tokens of tool output
+        context = MessageListContext(detached=history)
+        ctx = RunStatistic("t", NullProgressSink())
+
+        await hook.on_iteration_start(ctx, context, [])
+        assert hook._background is not None
+        await asyncio.wait({hook._background.task})
+        await hook.on_iteration_start(ctx, context, [])
+
+        assert manager.compression_count == 1
+        detached = context.detached.snapshot()
+        # The query stays first; the two-message tail is a whole call + result.
+        assert detached[0] is history[0]
+        assert detached[1].content.startswith(manager.compressor.SUMMARY_PREFIX)
+        assert detached[2:] == history[-2:]
+
+    async def test_cancelled_at_run_end(self, mock_llm, set_memory_config):
+        manager, hook = _setup(mock_llm, set_memory_config, threshold=1000)
+        context = MessageListContext(detached=_history(4))
+        ctx = RunStatistic("t", NullProgressSink())
+
+        await hook.on_iteration_start(ctx, context, [])
+        task = hook._background.task
+        await hook.on_run_end(ctx)
+
+        assert hook._background is None
+        await asyncio.wait({task})
+        assert task.cancelled()
+        assert mock_llm.call_count == 0
+
+    async def test_agent_run_end_cancels_background(self, mock_llm, set_memory_config):
+        manager, hook = _setup(mock_llm, set_memory_config, threshold=1000)
+        context = MessageListContext(detached=_history(4))
+        agent = Agent(llm=mock_llm, tools=ToolExecutor([]), hooks=(hook,))
+
+        await agent.run("t", context=context)
+
+        # Only the agent's own call was made; the summary never ran.
+        assert mock_llm.call_count == 1
+        assert hook._background is None
+        assert manager.compression_count == 0
+
+
+class TestSelectBackgroundWindow:
+    def test_prefix_before_latest_query(self, mock_llm, set_memory_config):
+        manager, _ = _setup(mock_llm, set_memory_config, threshold=1000)
+        assert manager.select_background_window(_history(4)) == (0, 6)
+
+    def test_window_after_single_query_ends_on_call_boundary(self, mock_llm, set_memory_config):
+        manager, _ = _setup(mock_llm, set_memory_config, threshold=1000)
+        set_memory_config(MEMORY_SHORT_TERM_MIN_SIZE=3)
+        # The last 3 messages start with a tool result: its call stays too.
+        assert manager.select_background_window(_task(4)) == (1, 5)
+
+    def test_nothing_to_summarize(self, mock_llm, set_memory_config):
+        manager, _ = _setup(mock_llm, set_memory_config, threshold=1000)
+        assert manager.select_background_window(_task(1)) == (0, 0)
@@ -0,0 +1,160 @@
+"""Tests for compaction that keeps the cached prefix verbatim."""
+
+from ouro.capabilities.compaction import CompactionHook, CompactionManager
+from ouro.capabilities.memory.token_tracker import TokenTracker
+from ouro.core.llm.message_types import LLMMessage
+from ouro.core.loop import MessageListContext, NullProgressSink
+from ouro.core.loop.context import RunStatistic
+
+# Has cache read/write prices (0.50 / 6.25 per million).
+CACHED_MODEL = "claude-opus-4-6"
+
+
+def _count(message):
+    return len(message.content or "") // 4
+
+
+def _history(turns, size=1600):
+    # ~400 tokens per message
+    messages = []
+    for i in range(turns):
+        messages.append(LLMMessage(role="user", content=f"question {i} " + "x" * size))
+        messages.append(LLMMessage(role="assistant", content=f"answer {i} " + "y" * size))
+    return messages
+
+
+def _manager(mock_llm, set_memory_config, *, tracker=True):
+    set_memory_config(
+        MEMORY_COMPRESSION_THRESHOLD=10000,
+        MEMORY_COMPRESSION_RATIO=0.3,
+        MEMORY_SHORT_TERM_MIN_SIZE=2,
+        MEMORY_BACKGROUND_COMPACTION_RATIO=0,
+        MEMORY_CACHE_AWARE_COMPACTION=True,
+        PROMPT_CACHE=True,
+    )
+    mock_llm.model = CACHED_MODEL
+    return CompactionManager(
+        mock_llm, count_message=_count, token_tracker=TokenTracker() if tracker else None
+    )
+
+
+class TestPlanCompaction:
+    def test_keeps_cached_prefix_when_cheaper(self, mock_llm, set_memory_config):
+        manager = _manager(mock_llm, set_memory_config)
+        messages = _history(13)  # 26 messages, ~10.4k tokens
+
+        plan = manager.plan_compaction(messages)
+
+        assert plan.mode == "keep_prefix"
+        # Prefix within 30% of the threshold; window ends at the latest user query.
+        assert plan.keep == 7
+        assert plan.end == 24
+        assert plan.keep_cost < plan.full_cost
+        assert plan.savings == plan.full_cost - plan.keep_cost
+        assert plan.keep_tokens_after > plan.full_tokens_after
+
+    def test_full_when_cache_reads_are_not_cheap(self, mock_llm, set_memory_config):
+        manager = _manager(mock_llm, set_memory_config)
+        # Cache reads at half the input price: re-reading the larger context
+        # costs more than the cache write it saves.
+        mock_llm.model = "gpt-4o"
+
+        plan = manager.plan_compaction(_history(13))
+
+        assert plan.mode == "full"
+        assert plan.keep == 0
+        assert plan.end == 26
+        assert plan.full_cost < plan.keep_cost
+
+    def test_full_when_keeping_leaves_too_much(self, mock_llm, set_memory_config):
+        manager = _manager(mock_llm, set_memory_config)
+        # A longer recent window leaves the context above 60% of the threshold.
+        set_memory_config(MEMORY_SHORT_TERM_MIN_SIZE=8)
+
+        plan = manager.plan_compaction(_history(13))
+
+        assert plan.mode == "full"
+        assert plan.horizon_calls == 0
+
+    def test_full_without_tracker_or_when_disabled(self, mock_llm, set_memory_config):
+        messages = _history(13)
+        manager = _manager(mock_llm, set_memory_config, tracker=False)
+        assert manager.plan_compaction(messages).mode == "full"
+
+        manager = _manager(mock_llm, set_memory_config)
+        set_memory_config(MEMORY_CACHE_AWARE_COMPACTION=False)
+        assert manager.plan_compaction(messages).mode == "full"
+        set_memory_config(MEMORY_CACHE_AWARE_COMPACTION=True, PROMPT_CACHE=False)
+        assert manager.plan_compaction(messages).mode == "full"
+
+    def test_prefix_does_not_split_tool_group(self, mock_llm, set_memory_config):
+        manager = _manager(mock_llm, set_memory_config)
+        messages = _history(13)
+        # messages[6] calls a tool whose result is messages[7]: keeping 7
+        # would separate them.
+        messages[6] = LLMMessage(
+            role="assistant",
+            content="calling " + "y" * 1600,
+            tool_calls=[
+                {
+                    "id": "call_1",
+                    "type": "function",
+                    "function": {"name": "read_file", "arguments": "{}"},
+                }
+            ],
+        )
+        messages[7] = LLMMessage(role="tool", content="z" * 1600, tool_call_id="call_1")
+
+        plan = manager.plan_compaction(messages)
+
+        assert plan.keep == 6
+
+    def test_keeps_prefix_in_single_task(self, mock_llm, set_memory_config):
+        manager = _manager(mock_llm, set_memory_config)
+        # One query followed by tool turns only (~10.4k tokens).
+        messages = [LLMMessage(role="user", content="refactor the parser")]
+        for i in range(13):
+            messages.append(
+                LLMMessage(
+                    role="assistant",
+                    content="calling " + "y" * 1600,
+                    tool_calls=[
+                        {
+                            "id": f"call_{i}",
+                            "type": "function",
+                            "function": {"name": "read_file", "arguments": "{}"},
+                        }
+                    ],
+                )
+            )
+            messages.append(LLMMessage(role="tool", content="z" * 1600, tool_call_id=f"call_{i}"))
+
+        plan = manager.plan_compaction(messages)
+
+        assert plan.mode == "keep_prefix"
+        # The query and three whole call/result pairs are kept; the window
+        # ends before the most recent pair.
+        assert plan.keep == 7
+        assert plan.end == 25
+
+
+class TestHookKeepsPrefix:
+    async def test_summarizes_only_the_window(self, mock_llm, set_memory_config):
+        manager = _manager(mock_llm, set_memory_config)
+        history = _history(13)
+        context = MessageListContext(detached=history)
+        ctx = RunStatistic("t", NullProgressSink())
+
+        await CompactionHook(manager).on_iteration_start(ctx, context, [])
+
+        assert mock_llm.call_count == 1
+        assert "The first 7 messages" in mock_llm.last_messages[-1].content
+        assert manager.compression_count == 1
+        detached = context.detached.snapshot()
+        assert len(detached) == 7 + 1 + 2
+        # The kept prefix is the very same messages, so the cache still hits.
+        assert all(a is b for a, b in zip(detached[:7], history[:7], strict=True))
+        assert detached[7].content.startswith(manager.compressor.SUMMARY_PREFIX)
+        assert "Chunk summary (messages 0-16)" in detached[7].content
+        assert detached[8] is history[24]
+        assert len(manager.summaries) == 1
@@ -191,6 +191,68 @@ class TestToolPairDetection:
                 # This is a simplified check - in reality we'd match by ID
                 assert len(tool_result_indices) > 0
 
+    async def test_tool_pair_index_maps_ids_and_groups(self, mock_llm):
+        """One pass yields id -> pair and the groups kept together."""
+        compressor = WorkingMemoryCompressor(mock_llm)
+        messages = [
+            LLMMessage(role="user", content="go"),
+            LLMMessage(
+                role="assistant",
+                tool_calls=[
+                    {"id": "a", "type": "function", "function": {"name": "t", "arguments": "{}"}},
+                    {"id": "b", "type": "function", "function": {"name": "t", "arguments": "{}"}},
+                ],
+            ),
+            LLMMessage(role="tool", content="ra", tool_call_id="a"),
+            LLMMessage(role="tool", content="rb", tool_call_id="b"),
+            LLMMessage(role="assistant", content=[{"type": "tool_use", "id": "c", "name": "t"}]),
+            LLMMessage(role="assistant", content=[{"type": "tool_use", "id": "d", "name": "t"}]),
+            LLMMessage(
+                role="user",
+                content=[
+                    {"type": "tool_result", "tool_use_id": "c", "content": "rc"},
+                    {"type": "tool_result", "tool_use_id": "d", "content": "rd"},
+                ],
+            ),
+        ]
+
+        index = compressor.tool_pair_index(messages)
+
+        assert index.by_id == {"a": (1, 2), "b": (1, 3), "c": (4, 6), "d": (5, 6)}
+        assert index.has_tool_calls
+        assert sorted(index.groups[2]) == [1, 2, 3]
+        # A legacy tool_result message answering two assistants joins them.
+        assert sorted(index.groups[4]) == [4, 5, 6]
+
+    async def test_tool_pair_index_reused_until_list_changes(self, mock_llm, tool_use_messages):
+        compressor = WorkingMemoryCompressor(mock_llm)
+        messages = list(tool_use_messages)
+
+        index = compressor.tool_pair_index(messages)
+        assert compressor.tool_pair_index(messages) is index
+
+        messages.append(LLMMessage(role="user", content="more"))
+        assert compressor.tool_pair_index(messages) is not index
+
+        index = compressor.tool_pair_index(messages)
+        compressor.release_tool_pair_index()
+        assert compressor.tool_pair_index(messages) is not index
+
+    async def test_separation_cached_per_index(
+        self, set_memory_config, mock_llm, tool_use_messages
+    ):
+        set_memory_config(MEMORY_SHORT_TERM_MIN_SIZE=1)
+        compressor = WorkingMemoryCompressor(mock_llm)
+
+        first = compressor._separate_messages(tool_use_messages)
+        first[0].append(LLMMessage(role="user", content="caller mutation"))
+        second = compressor._separate_messages(tool_use_messages)
+
+        assert len(second[0]) == len(first[0]) - 1
+        set_memory_config(MEMORY_SHORT_TERM_MIN_SIZE=len(tool_use_messages))
+        preserved, to_compress = compressor._separate_messages(tool_use_messages)
+        assert to_compress == []
+
 
 class TestProtectedTools:
     """Test protected tool handling and todo context injection."""
@@ -682,6 +744,22 @@ class TestBuildCompactionPrompt:
         assert "Summarize the conversation above" in prompt
         assert "kept verbatim" in prompt
 
+    async def test_prior_summary_after_kept_prefix(self, mock_llm, simple_messages):
+        """keep_prefix compaction leaves its summary behind the kept messages."""
+        compressor = WorkingMemoryCompressor(mock_llm)
+        summary = LLMMessage(role="user", content=f"{compressor.SUMMARY_PREFIX}earlier work")
+        messages = simple_messages[:2] + [summary] + simple_messages[2:]
+
+        prompt = compressor.build_compaction_prompt(
+            messages, CompressionStrategy.SLIDING_WINDOW, target_tokens=200
+        )
+        plain = compressor.build_compaction_prompt(
+            simple_messages, CompressionStrategy.SLIDING_WINDOW, target_tokens=200
+        )
+
+        assert compressor.COMPACTION_PROMPT_PRIOR_SUMMARY_SUFFIX in prompt
+        assert compressor.COMPACTION_PROMPT_PRIOR_SUMMARY_SUFFIX not in plain
+
     async def test_prompt_with_todo_context(self, mock_llm, simple_messages):
         """Test compaction prompt includes todo context instruction."""
         compressor = WorkingMemoryCompressor(mock_llm)
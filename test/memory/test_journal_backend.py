@@ -0,0 +1,214 @@
+"""Unit tests for JournalMemoryStore (YAML snapshot + JSONL journal)."""
+
+import asyncio
+import json
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from ouro.capabilities.memory.store import (
+    JournalMemoryStore,
+    YamlFileMemoryStore,
+    create_memory_store,
+)
+from ouro.core.llm.message_types import LLMMessage
+
+
+@pytest.fixture
+def sessions_dir(tmp_path):
+    return str(tmp_path / "sessions")
+
+
+@pytest.fixture
+def store(sessions_dir):
+    return JournalMemoryStore(sessions_dir=sessions_dir, snapshot_every=100)
+
+
+def _session_dir(sessions_dir):
+    dirs = [e for e in os.listdir(sessions_dir) if not e.startswith(".")]
+    assert len(dirs) == 1
+    return os.path.join(sessions_dir, dirs[0])
+
+
+def _snapshot(sessions_dir):
+    return yaml.safe_load(Path(_session_dir(sessions_dir), "session.yaml").read_text("utf-8"))
+
+
+def _journal_path(sessions_dir):
+    return Path(_session_dir(sessions_dir), "journal.jsonl")
+
+
+def _frames(sessions_dir):
+    return [
+        json.loads(line) for line in _journal_path(sessions_dir).read_text("utf-8").splitlines()
+    ]
+
+
+class TestJournalAppend:
+    async def test_append_writes_journal_not_snapshot(self, store, sessions_dir):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="hello"), tokens=3)
+        await store.save_messages(
+            session_id,
+            [
+                LLMMessage(role="system", content="be brief"),
+                LLMMessage(role="assistant", content="hi"),
+            ],
+        )
+
+        assert _snapshot(sessions_dir)["messages"] == []
+        frames = _frames(sessions_dir)
+        assert [f["seq"] for f in frames] == [1, 2, 3]
+        assert frames[0]["message"]["tokens"] == 3
+
+        loaded = await store.load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["hello", "hi"]
+        assert [m.content for m in loaded["system_messages"]] == ["be brief"]
+
+    async def test_reload_from_fresh_store(self, store, sessions_dir):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="one"))
+
+        reopened = JournalMemoryStore(sessions_dir=sessions_dir)
+        await reopened.save_message(session_id, LLMMessage(role="assistant", content="two"))
+
+        loaded = await reopened.load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["one", "two"]
+
+    async def test_list_sessions_and_stats_include_journal(self, store):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="first question"))
+        await store.save_message(session_id, LLMMessage(role="assistant", content="answer"), 7)
+
+        sessions = await store.list_sessions()
+        assert sessions[0]["message_count"] == 2
+        assert sessions[0]["preview"] == "first question"
+
+        stats = await store.get_session_stats(session_id)
+        assert stats["total_message_tokens"] == 7
+
+    async def test_torn_last_frame_is_skipped(self, store, sessions_dir):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="kept"))
+        journal = _journal_path(sessions_dir)
+        journal.write_text(
+            journal.read_text("utf-8") + '{"seq": 2, "at": "2026-01-01T00:00:00", "field": "mess',
+            "utf-8",
+        )
+
+        reopened = JournalMemoryStore(sessions_dir=sessions_dir)
+        loaded = await reopened.load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["kept"]
+
+    async def test_concurrent_appends_to_one_session_keep_order(self, store):
+        session_id = await store.create_session()
+        await asyncio.gather(
+            *(
+                store.save_message(session_id, LLMMessage(role="user", content=str(i)))
+                for i in range(20)
+            )
+        )
+
+        loaded = await store.load_session(session_id)
+        assert sorted(int(m.content) for m in loaded["messages"]) == list(range(20))
+
+
+class TestJournalSnapshots:
+    async def test_snapshot_every_folds_journal(self, sessions_dir):
+        store = JournalMemoryStore(sessions_dir=sessions_dir, snapshot_every=3)
+        session_id = await store.create_session()
+        for i in range(4):
+            await store.save_message(session_id, LLMMessage(role="user", content=f"m{i}"))
+
+        snapshot = _snapshot(sessions_dir)
+        assert [m["content"] for m in snapshot["messages"]] == ["m0", "m1", "m2"]
+        assert snapshot["journal_seq"] == 3
+        assert [f["seq"] for f in _frames(sessions_dir)] == [4]
+
+        loaded = await store.load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["m0", "m1", "m2", "m3"]
+
+    async def test_save_memory_writes_snapshot_and_drops_journal(self, store, sessions_dir):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="old"))
+
+        await store.save_memory(
+            session_id,
+            system_messages=[LLMMessage(role="system", content="sys")],
+            messages=[LLMMessage(role="user", content="new")],
+            token_stats={"total_input_tokens": 5},
+        )
+
+        assert not _journal_path(sessions_dir).exists()
+        await store.save_message(session_id, LLMMessage(role="assistant", content="after"))
+        loaded = await store.load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["new", "after"]
+        assert loaded["token_stats"] == {"total_input_tokens": 5}
+
+    async def test_frames_already_in_snapshot_are_not_replayed(self, store, sessions_dir):
+        """A crash between writing the snapshot and removing the journal."""
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="once"))
+        journal = _journal_path(sessions_dir).read_text("utf-8")
+
+        await store.compact_session(session_id)
+        _journal_path(sessions_dir).write_text(journal, "utf-8")
+
+        loaded = await JournalMemoryStore(sessions_dir=sessions_dir).load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["once"]
+
+    async def test_replace_messages_after_journal(self, store):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="system", content="sys"))
+        await store.save_message(session_id, LLMMessage(role="user", content="long"))
+
+        await store.replace_messages(session_id, [LLMMessage(role="user", content="summary")])
+
+        loaded = await store.load_session(session_id)
+        assert [m.content for m in loaded["system_messages"]] == ["sys"]
+        assert [m.content for m in loaded["messages"]] == ["summary"]
+
+
+class TestMigration:
+    async def test_reads_existing_yaml_sessions(self, sessions_dir):
+        yaml_store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        session_id = await yaml_store.create_session()
+        await yaml_store.save_message(session_id, LLMMessage(role="user", content="from yaml"))
+
+        store = JournalMemoryStore(sessions_dir=sessions_dir)
+        await store.save_message(session_id, LLMMessage(role="assistant", content="journaled"))
+
+        loaded = await store.load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["from yaml", "journaled"]
+
+    async def test_compact_makes_session_readable_by_yaml_store(self, store, sessions_dir):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="journaled"))
+
+        assert await store.compact_session(session_id)
+        assert not await store.compact_session("missing")
+
+        loaded = await YamlFileMemoryStore(sessions_dir=sessions_dir).load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["journaled"]
+
+    async def test_delete_session(self, store, sessions_dir):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="bye"))
+
+        assert await store.delete_session(session_id)
+        assert await store.load_session(session_id) is None
+
+
+class TestBackendSelection:
+    def test_create_memory_store(self, set_memory_config, sessions_dir):
+        set_memory_config(MEMORY_STORE="journal")
+        assert isinstance(create_memory_store(sessions_dir), JournalMemoryStore)
+
+        set_memory_config(MEMORY_STORE="yaml")
+        store = create_memory_store(sessions_dir)
+        assert type(store) is YamlFileMemoryStore
+
+    def test_unknown_fsync_policy_falls_back(self, sessions_dir):
+        assert JournalMemoryStore(sessions_dir=sessions_dir, fsync="sometimes").fsync == "snapshot"
@@ -77,6 +77,25 @@ class TestSaveMemory:
         assert [m.role for m in loaded_ctx.system_messages] == ["system"]
         assert [m.role for m in loaded_ctx.detached.snapshot()] == ["user", "assistant"]
 
+    async def test_recall_indexes_each_message_once(self, mock_llm, tmp_path):
+        manager = MemoryManager(mock_llm, memory_dir=str(tmp_path / "memory"))
+        history = [
+            LLMMessage(role="user", content="deploy the parser"),
+            LLMMessage(role="assistant", content="parser deployed"),
+        ]
+        await manager.save_messages(history)
+        await manager.save_memory(context=_ctx(detached=history))
+
+        # Compaction replaces the history; recall keeps the replaced messages.
+        summary = [LLMMessage(role="user", content="summary of earlier work")]
+        await manager.replace_messages(summary)
+        history = summary + [LLMMessage(role="user", content="now rename the parser")]
+        await manager.save_memory(context=_ctx(detached=history))
+
+        hits = await manager.recall_index.search("parser", limit=10)
+        assert sorted(h["msg_idx"] for h in hits) == [0, 1, 2]
+        assert hits and all(h["session_id"] == manager.session_id for h in hits)
+
 
 class TestGetStats:
     async def test_stats_keys(self, mock_llm, simple_messages):
@@ -114,6 +133,19 @@ class TestGetStats:
         assert with_msgs["message_count"] == 1
         assert empty["message_count"] == 0
 
+    async def test_current_tokens_share_token_tracker_cache(self, mock_llm):
+        manager = MemoryManager(mock_llm)
+        ctx = _ctx(detached=[LLMMessage(role="user", content="hello " * 50)])
+
+        first = manager.get_stats(context=ctx)["current_tokens"]
+        cached = len(manager.token_tracker._token_cache)
+        assert cached == 1
+
+        ctx.detached.append(LLMMessage(role="assistant", content="done"))
+        second = manager.get_stats(context=ctx)["current_tokens"]
+        assert second > first
+        assert len(manager.token_tracker._token_cache) == cached + 1
+
 
 class TestCompress:
     async def test_compress_empty_context_is_noop(self, mock_llm):
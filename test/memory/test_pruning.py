@@ -0,0 +1,120 @@
+"""Tests for the deterministic (no-LLM) compaction tier."""
+
+import json
+
+from ouro.capabilities.compaction import CompactionHook, CompactionManager
+from ouro.capabilities.compaction.pruning import prune_superseded_tool_results
+from ouro.core.llm.message_types import LLMMessage
+from ouro.core.loop import MessageListContext, NullProgressSink
+from ouro.core.loop.context import RunStatistic
+from ouro.core.tracing import InMemoryTraceExporter, TraceEventType, Tracer
+
+
+def _call(call_id, name, result, **args):
+    return [
+        LLMMessage(
+            role="assistant",
+            tool_calls=[
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": name, "arguments": json.dumps(args)},
+                }
+            ],
+        ),
+        LLMMessage(role="tool", content=result, tool_call_id=call_id, name=name),
+    ]
+
+
+BIG = "line\n" * 200
+
+
+class TestPruneSupersededToolResults:
+    def test_read_superseded_by_later_edit(self):
+        messages = [
+            *_call("c1", "read_file", BIG, file_path="a.py"),
+            *_call("c2", "smart_edit", "Edited a.py", file_path="a.py", mode="diff_replace"),
+        ]
+        result, pruned = prune_superseded_tool_results(messages)
+
+        assert [p.tool_call_id for p in pruned] == ["c1"]
+        assert result[1].content.startswith("[Stale read_file output removed")
+        assert result[1].tool_call_id == "c1"
+        assert result[3] is messages[3]
+        # Input is left untouched.
+        assert messages[1].content == BIG
+
+    def test_repeated_identical_grep(self):
+        messages = [
+            *_call("c1", "grep_content", BIG, pattern="foo", path="."),
+            *_call("c2", "grep_content", BIG, pattern="bar", path="."),
+            *_call("c3", "grep_content", BIG, path=".", pattern="foo"),
+        ]
+        _, pruned = prune_superseded_tool_results(messages)
+        assert [p.tool_call_id for p in pruned] == ["c1"]
+        assert pruned[0].reason == "the same call was made again later"
+
+    def test_failed_edit_does_not_supersede_read(self):
+        messages = [
+            *_call("c1", "read_file", BIG, file_path="a.py"),
+            *_call("c2", "smart_edit", "Error: old_code not found", file_path="a.py"),
+        ]
+        _, pruned = prune_superseded_tool_results(messages)
+        assert pruned == []
+
+    def test_recent_messages_are_kept(self):
+        messages = [
+            *_call("c1", "read_file", BIG, file_path="a.py"),
+            *_call("c2", "write_file", "Wrote a.py", file_path="a.py", content="x"),
+        ]
+        _, pruned = prune_superseded_tool_results(messages, keep_recent=3)
+        assert pruned == []
+
+    def test_is_idempotent(self):
+        messages = [
+            *_call("c1", "glob_files", BIG, pattern="*.py"),
+            *_call("c2", "glob_files", BIG, pattern="*.py"),
+        ]
+        once, pruned = prune_superseded_tool_results(messages)
+        assert len(pruned) == 1
+        _, again = prune_superseded_tool_results(once)
+        assert again == []
+
+
+class TestCompactionHookPruneTier:
+    async def test_prune_avoids_llm_call_when_enough(self, mock_llm, set_memory_config):
+        set_memory_config(MEMORY_COMPRESSION_THRESHOLD=1500, MEMORY_SHORT_TERM_MIN_SIZE=2)
+        manager = CompactionManager(mock_llm, count_message=lambda m: len(m.content or "") // 4)
+        exporter = InMemoryTraceExporter()
+        hook = CompactionHook(manager, tracer=Tracer(exporter=exporter))
+        messages = [
+            *_call("c1", "read_file", BIG * 3, file_path="a.py"),
+            *_call("c2", "read_file", BIG * 3, file_path="a.py"),
+            LLMMessage(role="user", content="continue"),
+        ]
+        context = MessageListContext(detached=messages)
+
+        await hook.on_iteration_start(RunStatistic("t", NullProgressSink()), context, [])
+
+        assert mock_llm.call_count == 0
+        assert context.detached[1].content.startswith("[Stale read_file")
+        assert manager.pruned_tool_results == 1
+        (event,) = exporter.events
+        assert event.event_type == TraceEventType.MEMORY
+        assert event.attributes["compaction.pruned"][0]["tool_call_id"] == "c1"
+
+    async def test_falls_back_to_summary_when_still_over(self, mock_llm, set_memory_config):
+        set_memory_config(MEMORY_COMPRESSION_THRESHOLD=100, MEMORY_SHORT_TERM_MIN_SIZE=2)
+        manager = CompactionManager(mock_llm, count_message=lambda m: len(m.content or "") // 4)
+        hook = CompactionHook(manager)
+        messages = [
+            *_call("c1", "read_file", BIG * 3, file_path="a.py"),
+            *_call("c2", "read_file", BIG * 3, file_path="a.py"),
+            LLMMessage(role="user", content="continue"),
+        ]
+        context = MessageListContext(detached=messages)
+
+        await hook.on_iteration_start(RunStatistic("t", NullProgressSink()), context, [])
+
+        assert mock_llm.call_count == 1
+        assert manager.compression_count == 1
@@ -0,0 +1,139 @@
+"""Unit tests for the dense-vector recall tier and hybrid search."""
+
+import importlib.util
+import math
+import threading
+from array import array
+
+import pytest
+
+from ouro.capabilities.memory.recall.dense import (
+    HashingEmbedder,
+    VectorFile,
+    get_embedder,
+)
+from ouro.capabilities.memory.recall.sqlite_fts import RecallIndex, _fuse
+from ouro.core.llm.message_types import LLMMessage
+
+
+@pytest.fixture
+def index(tmp_path):
+    return RecallIndex(memory_dir=str(tmp_path / "memdir"), embedder=HashingEmbedder())
+
+
+def _cosine(a, b):
+    return sum(x * y for x, y in zip(a, b, strict=True))
+
+
+class TestHashingEmbedder:
+    def test_unit_length_and_deterministic(self):
+        embedder = HashingEmbedder(dim=64)
+        first, again = embedder.embed(["Deploy the parser", "Deploy the parser"])
+        assert len(first) == 64
+        assert math.isclose(_cosine(first, first), 1.0, rel_tol=1e-5)
+        assert list(first) == list(again)
+
+    def test_inflections_are_closer_than_unrelated_text(self):
+        embedder = HashingEmbedder()
+        query, inflected, unrelated = embedder.embed(
+            ["deployment of parsers", "we deployed the parser", "kubernetes cluster upgrade"]
+        )
+        assert _cosine(query, inflected) > _cosine(query, unrelated) + 0.2
+
+
+class TestVectorFile:
+    def test_append_and_top_k(self, tmp_path):
+        vectors = VectorFile(str(tmp_path / "v.vec"), dim=2)
+        assert vectors.top_k(array("f", [1, 0]), 3) == []
+        assert vectors.append([array("f", [1, 0]), array("f", [0, 1])]) == 0
+        assert vectors.append([array("f", [0.6, 0.8])]) == 2
+
+        top = vectors.top_k(array("f", [1, 0]), 2)
+        assert [row for row, _ in top] == [0, 2]
+        assert [row for row, _ in vectors.top_k(array("f", [1, 0]), 5, rows=[1, 2, 9])] == [2, 1]
+
+    def test_torn_row_is_ignored_and_overwritten(self, tmp_path):
+        path = tmp_path / "v.vec"
+        vectors = VectorFile(str(path), dim=2)
+        vectors.append([array("f", [1, 0])])
+        path.write_bytes(path.read_bytes() + b"\x00\x00")
+        assert vectors.rows() == 1
+        assert vectors.append([array("f", [0, 1])]) == 1
+        assert vectors.rows() == 2
+
+
+class TestGetEmbedder:
+    def test_specs(self):
+        assert get_embedder("off") is None
+        assert isinstance(get_embedder("hash"), HashingEmbedder)
+
+    @pytest.mark.skipif(
+        importlib.util.find_spec("sentence_transformers") is not None,
+        reason="sentence-transformers is installed",
+    )
+    def test_model_falls_back_to_hashing(self):
+        assert isinstance(get_embedder("all-MiniLM-L6-v2"), HashingEmbedder)
+
+
+class TestHybridSearch:
+    async def test_finds_inflected_wording(self, index, tmp_path):
+        messages = [
+            LLMMessage(role="user", content="we deployed the parser to staging"),
+            LLMMessage(role="assistant", content="the kubernetes cluster is healthy"),
+        ]
+        await index.append_messages("s", messages)
+        lexical_only = RecallIndex(memory_dir=index.memory_dir)
+        assert await lexical_only.search("deployment parsers") == []
+
+        hits = await index.search("deployment parsers")
+        assert hits[0]["msg_idx"] == 0
+        assert hits[0]["score"] > 0
+
+    async def test_malformed_query_still_matches(self, index):
+        await index.append_messages("s", [LLMMessage(role="user", content="hello world")])
+        hits = await index.search('"hello (world')
+        assert [h["content"] for h in hits] == ["hello world"]
+
+    async def test_scoped_to_session(self, index):
+        await index.append_messages("a", [LLMMessage(role="user", content="parser deployment")])
+        await index.append_messages("b", [LLMMessage(role="user", content="parser deployment")])
+        hits = await index.search("deploying parsers", session_id="b")
+        assert [h["session_id"] for h in hits] == ["b"]
+
+    async def test_reindex_and_delete_drop_old_vectors(self, index):
+        await index.append_messages("s", [LLMMessage(role="user", content="original parser")])
+        await index.reindex_session("s", [LLMMessage(role="user", content="replacement lexer")])
+        assert [h["content"] for h in await index.search("parsers")] == []
+        assert [h["content"] for h in await index.search("lexers")] == ["replacement lexer"]
+
+        await index.delete_session("s")
+        assert await index.search("lexers") == []
+
+    async def test_embeds_off_the_writer_thread(self, tmp_path):
+        threads = []
+
+        class _RecordingEmbedder(HashingEmbedder):
+            def embed(self, texts):
+                threads.append(threading.current_thread().name)
+                return super().embed(texts)
+
+        index = RecallIndex(memory_dir=str(tmp_path / "memdir"), embedder=_RecordingEmbedder())
+        await index.append_messages("s", [LLMMessage(role="user", content="parser deployment")])
+        await index.reindex_session("s", [LLMMessage(role="user", content="lexer rollout")])
+        await index.add_message("s", 1, LLMMessage(role="assistant", content="lexer shipped"))
+
+        assert len(threads) == 3
+        assert not any(name.startswith("ouro-sqlite-writer") for name in threads)
+        hits = await index.search("lexers")
+        assert sorted(h["content"] for h in hits) == ["lexer rollout", "lexer shipped"]
+
+
+class TestFuse:
+    def test_reciprocal_rank_fusion(self):
+        a = {"session_id": "s", "msg_idx": 0, "score": -3.0}
+        b = {"session_id": "s", "msg_idx": 1, "score": -2.0}
+        c = {"session_id": "s", "msg_idx": 2, "score": 0.9}
+        fused = _fuse([[a, b], [c, b]], limit=2)
+        # b is ranked by both lists, so it comes first.
+        assert [h["msg_idx"] for h in fused] == [1, 0]
+        assert fused[0]["score"] == pytest.approx(1 / 62 + 1 / 62)
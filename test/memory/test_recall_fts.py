@@ -1,9 +1,11 @@
 """Unit tests for the SQLite FTS5 recall index."""
 
+import asyncio
 import os
 
 import pytest
 
+from ouro.capabilities.memory.recall import sqlite_fts
 from ouro.capabilities.memory.recall.sqlite_fts import RecallIndex, _flatten_content
 from ouro.core.llm.message_types import LLMMessage
 
@@ -101,3 +103,73 @@ class TestReindexAndSearch:
         removed = await index.delete_session("s")
         assert removed == 1
         assert await index.search("deleted") == []
+
+
+class TestAppend:
+    async def test_numbers_after_indexed_messages(self, index):
+        await index.append_messages(
+            "s",
+            [
+                LLMMessage(role="user", content="first question"),
+                LLMMessage(role="assistant", content=""),
+            ],
+        )
+        await index.append_messages("s", [LLMMessage(role="user", content="second question")])
+        hits = await index.search("question")
+        assert sorted(h["msg_idx"] for h in hits) == [0, 2]
+
+        await index.reindex_session("s", [LLMMessage(role="user", content="only one")])
+        await index.append_messages("s", [LLMMessage(role="user", content="after reindex")])
+        hits = await index.search("reindex")
+        assert hits[0]["msg_idx"] == 1
+
+    async def test_concurrent_appends_share_a_transaction(self, index, monkeypatch):
+        batches = []
+        original = index._append_batch_sync
+
+        def record(conn, batch):
+            batches.append(len(batch))
+            return original(conn, batch)
+
+        monkeypatch.setattr(index, "_append_batch_sync", record)
+        await asyncio.gather(
+            *(
+                index.append_messages(f"s{i}", [LLMMessage(role="user", content=f"topic {i}")])
+                for i in range(10)
+            )
+        )
+        assert sum(batches) == 10
+        assert len(batches) < 10
+        assert len(await index.search("topic", limit=20)) == 10
+
+    async def test_continues_legacy_index(self, index):
+        # Rows written before the sessions table existed.
+        await index.add_message("s", 4, LLMMessage(role="user", content="legacy row"))
+        await index._pool.write(index.db_path, lambda conn: conn.execute("DROP TABLE sessions"))
+        await index.append_messages("s", [LLMMessage(role="user", content="new row")])
+        hits = await index.search("new")
+        assert hits[0]["msg_idx"] == 5
+
+    async def test_merges_segments_periodically(self, index, monkeypatch):
+        monkeypatch.setattr(sqlite_fts, "MERGE_EVERY_ROWS", 3)
+        monkeypatch.setattr(sqlite_fts, "OPTIMIZE_EVERY_MERGES", 2)
+        commands = []
+        original = index._optimize_sync
+
+        def optimize(conn):
+            commands.append("optimize")
+            return original(conn)
+
+        monkeypatch.setattr(index, "_optimize_sync", optimize)
+        for i in range(12):
+            await index.append_messages("s", [LLMMessage(role="user", content=f"row {i}")])
+        assert index._merges == 4
+        assert commands == ["optimize", "optimize"]
+        assert len(await index.search("row", limit=20)) == 12
+
+    async def test_delete_session_resets_numbering(self, index):
+        await index.append_messages("s", [LLMMessage(role="user", content="gone")])
+        await index.delete_session("s")
+        await index.append_messages("s", [LLMMessage(role="user", content="fresh")])
+        hits = await index.search("fresh")
+        assert hits[0]["msg_idx"] == 0
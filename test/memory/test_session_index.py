@@ -0,0 +1,167 @@
+"""Unit tests for the session metadata index (.index.jsonl)."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from ouro.capabilities.memory.store import JournalMemoryStore, YamlFileMemoryStore
+from ouro.capabilities.memory.store.session_index import INDEX_FILE, SessionIndex
+from ouro.core.llm.message_types import LLMMessage
+
+
+@pytest.fixture
+def sessions_dir(tmp_path):
+    return str(tmp_path / "sessions")
+
+
+@pytest.fixture(params=[YamlFileMemoryStore, JournalMemoryStore])
+def store_cls(request):
+    return request.param
+
+
+def _index_lines(sessions_dir):
+    return [json.loads(line) for line in Path(sessions_dir, INDEX_FILE).read_text().splitlines()]
+
+
+class TestSessionIndex:
+    async def test_list_sessions_does_not_open_session_files(
+        self, store_cls, sessions_dir, monkeypatch
+    ):
+        store = store_cls(sessions_dir=sessions_dir)
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="system", content="sys"))
+        await store.save_message(session_id, LLMMessage(role="user", content="hello " * 40))
+        await store.save_messages(
+            session_id,
+            [
+                LLMMessage(role="assistant", content="hi"),
+                LLMMessage(role="user", content="later"),
+            ],
+        )
+
+        fresh = store_cls(sessions_dir=sessions_dir)
+
+        async def fail(dir_name):
+            raise AssertionError(f"opened {dir_name}")
+
+        monkeypatch.setattr(fresh, "_load_session_data", fail)
+        [session] = await fresh.list_sessions()
+        assert session["id"] == session_id
+        assert session["message_count"] == 3
+        assert session["system_message_count"] == 1
+        assert session["preview"] == ("hello " * 40)[:100]
+        assert "dir" not in session
+        assert await fresh.find_session_by_prefix(session_id[:8]) == session_id
+
+    async def test_matches_session_data_after_full_saves(self, store_cls, sessions_dir):
+        store = store_cls(sessions_dir=sessions_dir)
+        session_id = await store.create_session()
+        await store.save_memory(
+            session_id,
+            system_messages=[LLMMessage(role="system", content="sys")],
+            messages=[
+                LLMMessage(role="user", content="first"),
+                LLMMessage(role="assistant", content="answer"),
+            ],
+        )
+        await store.replace_messages(session_id, [LLMMessage(role="user", content="summary")])
+
+        [session] = await store.list_sessions()
+        stats = await store.get_session_stats(session_id)
+        assert session["message_count"] == stats["message_count"] == 1
+        assert session["system_message_count"] == 1
+        assert session["updated_at"] == stats["updated_at"]
+        assert session["preview"] == "summary"
+
+    async def test_pagination_and_prefix(self, sessions_dir):
+        store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        ids = [await store.create_session() for _ in range(5)]
+        for session_id in ids:
+            await store.save_message(session_id, LLMMessage(role="user", content=session_id))
+
+        newest_first = list(reversed(ids))
+        assert [s["id"] for s in await store.list_sessions(limit=2)] == newest_first[:2]
+        assert [s["id"] for s in await store.list_sessions(limit=2, offset=2)] == newest_first[2:4]
+        assert await store.list_sessions(limit=2, offset=10) == []
+        assert await store.find_session_by_prefix("") is None
+
+    async def test_delete_appends_tombstone(self, sessions_dir):
+        store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        kept = await store.create_session()
+        deleted = await store.create_session()
+        assert await store.delete_session(deleted)
+
+        assert _index_lines(sessions_dir)[-1] == {"id": deleted, "deleted": True}
+        fresh = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        assert [s["id"] for s in await fresh.list_sessions()] == [kept]
+        assert await fresh.load_session(deleted) is None
+
+    async def test_rebuilt_from_directories(self, store_cls, sessions_dir):
+        store = store_cls(sessions_dir=sessions_dir)
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="question"))
+        os.remove(os.path.join(sessions_dir, INDEX_FILE))
+        Path(sessions_dir, ".index.yaml").write_text(f"{session_id}: stale\n")
+
+        fresh = store_cls(sessions_dir=sessions_dir)
+        [session] = await fresh.list_sessions()
+        assert session["id"] == session_id
+        assert session["message_count"] == 1
+        assert session["preview"] == "question"
+        assert not os.path.exists(os.path.join(sessions_dir, ".index.yaml"))
+
+    async def test_rebuild_index_counts_sessions(self, sessions_dir):
+        store = JournalMemoryStore(sessions_dir=sessions_dir)
+        for _ in range(3):
+            await store.create_session()
+        assert await store.rebuild_index() == 3
+        assert len(_index_lines(sessions_dir)) == 3
+
+    async def test_compacted_on_load(self, sessions_dir):
+        store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        session_id = await store.create_session()
+        for i in range(100):
+            await store.save_message(session_id, LLMMessage(role="user", content=str(i)))
+        # As left by a process that wrote each update without compacting.
+        entry = _index_lines(sessions_dir)[-1]
+        index_path = Path(sessions_dir, INDEX_FILE)
+        index_path.write_text((json.dumps(entry) + "\n") * 101)
+
+        index = SessionIndex(sessions_dir)
+        entries = await index.load()
+        assert entries[session_id]["message_count"] == 100
+        assert len(_index_lines(sessions_dir)) == 1
+
+    async def test_compacted_while_writing(self, sessions_dir):
+        store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        session_id = await store.create_session()
+        for i in range(200):
+            await store.save_message(session_id, LLMMessage(role="user", content=str(i)))
+
+        lines = _index_lines(sessions_dir)
+        assert len(lines) <= SessionIndex.COMPACT_RATIO * 16
+        assert lines[-1]["message_count"] == 200
+        fresh = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        assert [s["message_count"] for s in await fresh.list_sessions()] == [200]
+
+    async def test_not_compacted_before_load(self, sessions_dir):
+        first = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        other_id = await first.create_session()
+        index = SessionIndex(sessions_dir)
+        for i in range(100):
+            await index.put({"id": "s", "dir": "d", "updated_at": str(i)})
+
+        # Never loaded: a rewrite from its entries would drop ``other_id``.
+        entries = await SessionIndex(sessions_dir).load()
+        assert set(entries) == {other_id, "s"}
+
+    async def test_skips_torn_line(self, sessions_dir):
+        store = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        session_id = await store.create_session()
+        index_path = Path(sessions_dir, INDEX_FILE)
+        index_path.write_text(index_path.read_text() + '{"id": "tor')
+
+        fresh = YamlFileMemoryStore(sessions_dir=sessions_dir)
+        assert [s["id"] for s in await fresh.list_sessions()] == [session_id]
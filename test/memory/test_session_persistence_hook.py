@@ -4,13 +4,18 @@ Verifies that the hook incrementally persists messages after every
 iteration, rather than waiting until the end of the turn.
 """
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
+from ouro.capabilities.compaction import CompactionHook, CompactionManager
+from ouro.capabilities.compaction.types import CompactionPlan
 from ouro.capabilities.memory.hook import SessionPersistenceHook
 from ouro.capabilities.memory.manager import MemoryManager
 from ouro.core.llm.base import LLMMessage
+from ouro.core.loop import MessageListContext, NullProgressSink
+from ouro.core.loop.context import RunStatistic
 from ouro.core.loop.message_list import MessageList
 from ouro.core.loop.protocols import ContinueDecision, LoopContext
 
@@ -168,3 +173,86 @@ class TestSessionPersistenceHook:
         loaded = await memory._store.load_session(memory.session_id)
         assert len(loaded["messages"]) == 1
         assert loaded["messages"][0].content == "summary"
+
+
+def _count(message):
+    return len(message.content or "") // 4
+
+
+def _call_and_result(call_id: str) -> list[LLMMessage]:
+    return [
+        LLMMessage(
+            role="assistant",
+            content="checking",
+            tool_calls=[
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": "read_file", "arguments": "{}"},
+                }
+            ],
+        ),
+        LLMMessage(role="tool", content="contents", tool_call_id=call_id),
+    ]
+
+
+def _shape(messages):
+    return [(m.role, m.content, m.tool_call_id) for m in messages]
+
+
+class TestPersistenceAfterInPlaceCompaction:
+    """A small window summarized in place, then more appended than it removed."""
+
+    async def _persist_all(self, memory, messages, ctx):
+        hook = SessionPersistenceHook(memory)
+        await hook.on_iteration_end(ctx, messages, None, False)
+        return hook
+
+    async def test_keep_prefix_window(self, mock_llm, mock_loop_ctx):
+        memory = MemoryManager(mock_llm)
+        await memory._ensure_session()
+        context = MessageListContext(
+            detached=[LLMMessage(role="user", content=f"message {i}") for i in range(5)]
+        )
+        hook = await self._persist_all(memory, context.detached, mock_loop_ctx)
+
+        compaction = CompactionHook(CompactionManager(mock_llm, count_message=_count))
+        snap = context.detached.snapshot()
+        plan = CompactionPlan(mode="keep_prefix", keep=1, end=3)
+        await compaction._compact_window(
+            RunStatistic("t", NullProgressSink()), context, [], snap, plan
+        )
+        assert len(context.detached) == 4
+        context.detached.extend(_call_and_result("c9"))
+        await hook.on_iteration_end(mock_loop_ctx, context.detached, None, False)
+
+        loaded = await memory._store.load_session(memory.session_id)
+        assert _shape(loaded["messages"]) == _shape(context.detached)
+
+    async def test_background_swap(self, mock_llm, mock_loop_ctx, set_memory_config):
+        set_memory_config(
+            MEMORY_COMPRESSION_THRESHOLD=1000,
+            MEMORY_SHORT_TERM_MIN_SIZE=2,
+            MEMORY_BACKGROUND_COMPACTION_RATIO=0.5,
+        )
+        memory = MemoryManager(mock_llm)
+        await memory._ensure_session()
+        history = []
+        for i in range(2):
+            history.append(LLMMessage(role="user", content=f"question {i} " + "x" * 600))
+            history.append(LLMMessage(role="assistant", content=f"answer {i} " + "y" * 600))
+        context = MessageListContext(detached=history)
+        hook = await self._persist_all(memory, context.detached, mock_loop_ctx)
+
+        compaction = CompactionHook(CompactionManager(mock_llm, count_message=_count))
+        ctx = RunStatistic("t", NullProgressSink())
+        await compaction.on_iteration_start(ctx, context, [])
+        await asyncio.wait({compaction._background.task})
+        await compaction.on_iteration_start(ctx, context, [])
+        # The first exchange became one summary message.
+        assert len(context.detached) == 3
+        context.detached.extend(_call_and_result("c9"))
+        await hook.on_iteration_end(mock_loop_ctx, context.detached, None, False)
+
+        loaded = await memory._store.load_session(memory.session_id)
+        assert _shape(loaded["messages"]) == _shape(context.detached)
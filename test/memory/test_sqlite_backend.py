@@ -0,0 +1,219 @@
+"""Unit tests for SQLiteMemoryStore and the shared SQLite pool."""
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from ouro.capabilities.memory.recall import RecallIndex
+from ouro.capabilities.memory.sqlite_pool import SQLitePool, _apply_batch, get_sqlite_pool
+from ouro.capabilities.memory.store import (
+    JournalMemoryStore,
+    SQLiteMemoryStore,
+    create_memory_store,
+)
+from ouro.core.llm.message_types import LLMMessage
+
+
+@pytest.fixture
+def sessions_dir(tmp_path):
+    return str(tmp_path / "sessions")
+
+
+@pytest.fixture
+def store(sessions_dir):
+    store = SQLiteMemoryStore(sessions_dir=sessions_dir)
+    yield store
+    get_sqlite_pool().close(store.db_path)
+
+
+class TestSQLiteStore:
+    async def test_append_and_load(self, store):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="system", content="sys"))
+        await store.save_message(session_id, LLMMessage(role="user", content="hello"), tokens=4)
+        await store.save_messages(
+            session_id,
+            [
+                LLMMessage(
+                    role="assistant",
+                    content=None,
+                    tool_calls=[
+                        {
+                            "id": "call_1",
+                            "type": "function",
+                            "function": {"name": "read_file", "arguments": "{}"},
+                        }
+                    ],
+                ),
+                LLMMessage(role="tool", content="ok", tool_call_id="call_1", name="read_file"),
+            ],
+        )
+
+        loaded = await store.load_session(session_id)
+        assert [m.content for m in loaded["system_messages"]] == ["sys"]
+        assert [m.role for m in loaded["messages"]] == ["user", "assistant", "tool"]
+        assert loaded["messages"][1].tool_calls[0]["id"] == "call_1"
+        assert loaded["messages"][2].tool_call_id == "call_1"
+        assert loaded["token_stats"] is None
+
+        stats = await store.get_session_stats(session_id)
+        assert stats["message_count"] == 3
+        assert stats["system_message_count"] == 1
+        assert stats["total_message_tokens"] == 4
+
+    async def test_save_memory_and_replace_messages(self, store):
+        session_id = await store.create_session()
+        await store.save_message(session_id, LLMMessage(role="user", content="old"))
+
+        await store.save_memory(
+            session_id,
+            system_messages=[LLMMessage(role="system", content="sys")],
+            messages=[
+                LLMMessage(role="user", content="a"),
+                LLMMessage(role="assistant", content="b"),
+            ],
+            token_stats={"total_input_tokens": 10, "compression_cost": 0.25},
+            summaries={"chunks": []},
+        )
+        await store.replace_messages(session_id, [LLMMessage(role="user", content="summary")])
+
+        loaded = await store.load_session(session_id)
+        assert [m.content for m in loaded["system_messages"]] == ["sys"]
+        assert [m.content for m in loaded["messages"]] == ["summary"]
+        assert loaded["token_stats"]["total_input_tokens"] == 10
+        assert loaded["token_stats"]["compression_cost"] == 0.25
+        assert loaded["summaries"] == {"chunks": []}
+
+    async def test_list_sessions_prefix_and_delete(self, store):
+        first = await store.create_session()
+        await store.save_message(first, LLMMessage(role="user", content="first question"))
+        second = await store.create_session()
+        await store.save_message(second, LLMMessage(role="user", content="second question"))
+
+        sessions = await store.list_sessions()
+        assert [s["id"] for s in sessions] == [second, first]
+        assert sessions[0]["preview"] == "second question"
+        assert sessions[0]["message_count"] == 1
+        assert await store.find_latest_session() == second
+        assert await store.find_session_by_prefix(first[:8]) == first
+
+        # Prefixes work wherever an ID does, like the YAML store.
+        loaded = await store.load_session(first[:8])
+        assert loaded["messages"][0].content == "first question"
+
+        assert await store.delete_session(first)
+        assert not await store.delete_session(first)
+        assert [s["id"] for s in await store.list_sessions()] == [second]
+
+    async def test_missing_session(self, store):
+        await store.save_message("missing", LLMMessage(role="user", content="x"))
+        assert await store.load_session("missing") is None
+        assert await store.get_session_stats("missing") is None
+
+    async def test_concurrent_sessions_are_batched_and_ordered(self, store):
+        ids = [await store.create_session() for _ in range(5)]
+
+        async def converse(session_id):
+            for i in range(10):
+                await store.save_message(session_id, LLMMessage(role="user", content=str(i)))
+
+        await asyncio.gather(*(converse(sid) for sid in ids))
+
+        for session_id in ids:
+            loaded = await store.load_session(session_id)
+            assert [m.content for m in loaded["messages"]] == [str(i) for i in range(10)]
+
+    async def test_failing_write_does_not_roll_back_batch(self, store):
+        session_id = await store.create_session()
+
+        def broken(conn):
+            conn.execute("INSERT INTO no_such_table VALUES (1)")
+
+        results = await asyncio.gather(
+            store.save_message(session_id, LLMMessage(role="user", content="kept")),
+            store._submit(broken),
+            return_exceptions=True,
+        )
+        assert isinstance(results[1], sqlite3.OperationalError)
+
+        loaded = await store.load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["kept"]
+
+    async def test_stores_of_one_database_share_transactions(self, sessions_dir):
+        pool = SQLitePool()
+        first = SQLiteMemoryStore(sessions_dir=sessions_dir, pool=pool)
+        second = SQLiteMemoryStore(sessions_dir=sessions_dir, pool=pool)
+        ids = [await first.create_session(), await second.create_session()]
+        batches = []
+        write = pool.write
+
+        async def recording_write(path, fn, *args):
+            if fn is _apply_batch:
+                batches.append(len(args[0]))
+            return await write(path, fn, *args)
+
+        pool.write = recording_write
+        try:
+            await asyncio.gather(
+                first.save_message(ids[0], LLMMessage(role="user", content="from first")),
+                second.save_message(ids[1], LLMMessage(role="user", content="from second")),
+            )
+            # One conversation's store each, one transaction for both.
+            assert batches == [2]
+            loaded = await first.load_session(ids[1])
+            assert [m.content for m in loaded["messages"]] == ["from second"]
+        finally:
+            pool.close()
+
+    async def test_import_session_keeps_id_and_timestamps(self, store, sessions_dir):
+        source = JournalMemoryStore(sessions_dir=sessions_dir)
+        session_id = await source.create_session()
+        await source.save_memory(
+            session_id,
+            system_messages=[LLMMessage(role="system", content="sys")],
+            messages=[LLMMessage(role="user", content="from yaml")],
+            token_stats={"total_output_tokens": 3},
+        )
+        source_stats = await source.get_session_stats(session_id)
+
+        assert await store.import_session(source, session_id)
+        assert not await store.import_session(source, session_id)
+
+        loaded = await store.load_session(session_id)
+        assert [m.content for m in loaded["messages"]] == ["from yaml"]
+        assert loaded["token_stats"]["total_output_tokens"] == 3
+        stats = await store.get_session_stats(session_id)
+        assert stats["updated_at"] == source_stats["updated_at"]
+
+    def test_selected_by_config(self, set_memory_config, sessions_dir):
+        set_memory_config(MEMORY_STORE="sqlite")
+        assert isinstance(create_memory_store(sessions_dir), SQLiteMemoryStore)
+
+
+class TestSQLitePool:
+    async def test_writes_share_one_thread_and_connection(self, tmp_path):
+        pool = SQLitePool()
+        path = str(tmp_path / "a.db")
+        try:
+            seen = await asyncio.gather(*(pool.write(path, id) for _ in range(5)))
+            assert len(set(seen)) == 1
+            threads = await asyncio.gather(
+                pool.write(path, lambda conn: threading.get_ident()),
+                pool.write(str(tmp_path / "b.db"), lambda conn: threading.get_ident()),
+            )
+            assert threads[0] == threads[1]
+        finally:
+            pool.close()
+
+    async def test_recall_index_uses_shared_pool(self, tmp_path):
+        pool = SQLitePool()
+        index = RecallIndex(str(tmp_path), pool=pool)
+        try:
+            await index.reindex_session("s1", [LLMMessage(role="user", content="sqlite pooling")])
+            hits = await index.search("pooling")
+            assert [h["session_id"] for h in hits] == ["s1"]
+            assert any(path == index.db_path for _, path in pool._connections)
+        finally:
+            pool.close()
@@ -0,0 +1,165 @@
+"""Tests for hierarchical rolling summaries."""
+
+import asyncio
+
+from ouro.capabilities.compaction import CompactionHook, CompactionManager, SummaryHierarchy
+from ouro.capabilities.memory import MemoryManager
+from ouro.core.llm.message_types import LLMMessage
+from ouro.core.loop import MessageListContext, NullProgressSink
+from ouro.core.loop.context import RunStatistic
+
+
+def _hierarchy_with_chunks(texts, size=10):
+    hierarchy = SummaryHierarchy()
+    for text in texts:
+        hierarchy.add_chunk(text, size)
+    return hierarchy
+
+
+class TestSummaryHierarchy:
+    def test_chunks_get_consecutive_spans(self):
+        hierarchy = _hierarchy_with_chunks(["a", "b"], size=10)
+        assert [(n.start, n.end) for n in hierarchy.level(0)] == [(0, 10), (10, 20)]
+        assert hierarchy.next_start == 20
+
+    def test_rollup_due_after_fanout_chunks(self):
+        hierarchy = _hierarchy_with_chunks(["a", "b", "c"])
+        assert hierarchy.pending_rollup() is None
+
+        hierarchy.add_chunk("d", 10)
+        level, sources = hierarchy.pending_rollup()
+        assert level == 1
+        assert [n.text for n in sources] == ["a", "b", "c", "d"]
+
+        epoch = hierarchy.add_rollup(level, "epoch 1", sources)
+        assert (epoch.start, epoch.end) == (0, 40)
+        assert hierarchy.uncovered(0) == []
+        assert hierarchy.pending_rollup() is None
+
+    def test_session_rollup_replaces_previous_session_summary(self):
+        hierarchy = SummaryHierarchy()
+        for round_ in range(2):
+            for i in range(SummaryHierarchy.FANOUT):
+                for j in range(SummaryHierarchy.FANOUT):
+                    hierarchy.add_chunk(f"chunk {round_}.{i}.{j}", 1)
+                level, sources = hierarchy.pending_rollup()
+                hierarchy.add_rollup(level, f"epoch {round_}.{i}", sources)
+            level, sources = hierarchy.pending_rollup()
+            assert level == 2
+            hierarchy.add_rollup(level, f"session {round_}", sources)
+
+        (session,) = hierarchy.level(2)
+        assert session.text == "session 1"
+        assert (session.start, session.end) == (0, 32)
+        # Detail below the session summary is kept.
+        assert len(hierarchy.level(0)) == 32
+
+    def test_render_pulls_in_relevant_covered_chunks(self):
+        hierarchy = _hierarchy_with_chunks(
+            [
+                "Configured the nginx reverse proxy",
+                "Fixed flaky database migration",
+                "Wrote release notes",
+                "Bumped dependencies",
+            ]
+        )
+        level, sources = hierarchy.pending_rollup()
+        hierarchy.add_rollup(level, "Infrastructure and release work", sources)
+        hierarchy.add_chunk("Started the metrics dashboard", 10)
+
+        rendered = hierarchy.render("why does the database migration fail again?", budget=1000)
+
+        assert "Infrastructure and release work" in rendered
+        assert "Started the metrics dashboard" in rendered
+        assert "database migration" in rendered
+        assert "nginx" not in rendered
+        # Oldest span first.
+        assert rendered.index("database migration") < rendered.index("metrics dashboard")
+
+    def test_render_respects_budget(self):
+        hierarchy = _hierarchy_with_chunks(["x" * 400, "y" * 400, "z" * 400])
+        rendered = hierarchy.render("", budget=150)
+        assert "z" * 400 in rendered
+        assert "x" * 400 not in rendered
+
+    def test_round_trip(self):
+        hierarchy = _hierarchy_with_chunks(["a", "b"])
+        restored = SummaryHierarchy.from_dict(hierarchy.to_dict())
+        assert [(n.level, n.text, n.start, n.end) for n in restored.nodes] == [
+            (n.level, n.text, n.start, n.end) for n in hierarchy.nodes
+        ]
+
+
+class TestManagerSummaries:
+    def test_second_compaction_keeps_first_summary_verbatim(self, mock_llm, set_memory_config):
+        set_memory_config(MEMORY_SHORT_TERM_MIN_SIZE=2)
+        manager = CompactionManager(mock_llm)
+        first = manager.apply_compression(
+            "first summary",
+            [LLMMessage(role="user", content=f"m{i}") for i in range(6)],
+        )
+        second = manager.apply_compression(
+            "second summary",
+            first + [LLMMessage(role="user", content=f"n{i}") for i in range(6)],
+        )
+
+        content = second[0].content
+        assert content.startswith(manager.compressor.SUMMARY_PREFIX)
+        assert "first summary" in content and "second summary" in content
+        # The prior summary message is not counted as compacted history.
+        assert [(n.start, n.end) for n in manager.summaries.level(0)] == [(0, 6), (6, 12)]
+
+    async def test_roll_up_summaries(self, mock_llm):
+        manager = CompactionManager(mock_llm)
+        for i in range(SummaryHierarchy.FANOUT):
+            manager.summaries.add_chunk(f"chunk {i}", 5)
+
+        usage = await manager.roll_up_summaries(max_tokens=100)
+
+        assert mock_llm.call_count == 1
+        assert "chunk 3" in mock_llm.last_messages[0].content
+        (epoch,) = manager.summaries.level(1)
+        assert epoch.text == mock_llm.response_text
+        assert usage["input_tokens"] == 100
+
+    def test_reset_clears_summaries(self, mock_llm):
+        manager = CompactionManager(mock_llm)
+        manager.summaries.add_chunk("a", 1)
+        manager.reset()
+        assert len(manager.summaries) == 0
+
+    async def test_summaries_persist_with_session(self, mock_llm, tmp_path):
+        sessions_dir = str(tmp_path / "sessions")
+        memory = MemoryManager(mock_llm, sessions_dir=sessions_dir)
+        memory.compaction.summaries.add_chunk("persisted summary", 4)
+        context = MessageListContext(detached=[LLMMessage(role="user", content="hi")])
+        await memory.save_memory(context=context)
+
+        loaded, _ = await MemoryManager.from_session(
+            memory.session_id, mock_llm, sessions_dir=sessions_dir
+        )
+        (chunk,) = loaded.compaction.summaries.nodes
+        assert (chunk.text, chunk.start, chunk.end) == ("persisted summary", 0, 4)
+
+
+class TestHookRollup:
+    async def test_compaction_starts_rollup_and_accounts_usage(self, mock_llm, set_memory_config):
+        set_memory_config(MEMORY_COMPRESSION_THRESHOLD=100, MEMORY_SHORT_TERM_MIN_SIZE=2)
+        manager = CompactionManager(mock_llm, count_message=lambda m: len(m.content or "") // 4)
+        for i in range(SummaryHierarchy.FANOUT - 1):
+            manager.summaries.add_chunk(f"chunk {i}", 5)
+        hook = CompactionHook(manager)
+        context = MessageListContext(
+            detached=[LLMMessage(role="user", content="x" * 200) for _ in range(6)]
+        )
+        ctx = RunStatistic("t", NullProgressSink())
+
+        await hook.on_iteration_start(ctx, context, [])
+        assert hook._rollup is not None
+        await asyncio.wait({hook._rollup})
+        await hook.on_iteration_start(ctx, context, [])
+
+        assert len(manager.summaries.level(1)) == 1
+        # Compaction call + roll-up call.
+        assert mock_llm.call_count == 2
+        assert ctx.usage_total["input_tokens"] == 200
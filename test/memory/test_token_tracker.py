@@ -160,3 +160,63 @@ class TestCostTracking:
         savings = tracker.get_net_savings("gpt-4o")
         assert savings["net_tokens"] == 2500
         assert savings["savings_percentage"] > 0
+
+    def test_estimate_cost_uses_cache_pricing(self):
+        tracker = TokenTracker()
+        # claude-opus-4-6: input 5.00, output 25.00, cache_read 0.50, cache_write 6.25
+        cost = tracker.estimate_cost(
+            "claude-opus-4-6",
+            uncached=1_000_000,
+            cache_read=1_000_000,
+            cache_write=1_000_000,
+            output=1_000_000,
+        )
+        assert cost == 5.00 + 0.50 + 6.25 + 25.00
+
+    def test_total_cost_matches_estimate(self):
+        tracker = TokenTracker()
+        tracker.record_usage(
+            {
+                "input_tokens": 3000,
+                "output_tokens": 200,
+                "cache_read_tokens": 1000,
+                "cache_creation_tokens": 500,
+            }
+        )
+        assert tracker.get_total_cost("claude-opus-4-6") == tracker.estimate_cost(
+            "claude-opus-4-6", uncached=1500, cache_read=1000, cache_write=500, output=200
+        )
+
+    def test_hedge_loser_tokens_are_billed(self):
+        tracker = TokenTracker()
+        tracker.record_usage(
+            {
+                "input_tokens": 1000,
+                "output_tokens": 100,
+                "hedge_input_tokens": 1000,
+                "hedge_output_tokens": 20,
+            }
+        )
+        assert tracker.total_input_tokens == 2000
+        assert tracker.total_output_tokens == 120
+        assert tracker.run_input_tokens == 1000
+
+
+class TestCacheHitRatio:
+    """Test prompt-cache hit ratio reporting."""
+
+    def test_ratio_before_any_usage(self):
+        tracker = TokenTracker()
+        assert tracker.cache_hit_ratio() == 0.0
+        assert tracker.cache_hit_ratio(run=True) == 0.0
+
+    def test_session_and_run_ratios(self):
+        tracker = TokenTracker()
+        tracker.record_usage({"input_tokens": 1000, "cache_creation_tokens": 900})
+        tracker.start_run()
+        tracker.record_usage({"input_tokens": 1000, "cache_read_tokens": 900})
+        tracker.record_usage({"input_tokens": 1000, "cache_read_tokens": 700})
+
+        assert tracker.cache_hit_ratio() == 1600 / 3000
+        assert tracker.cache_hit_ratio(run=True) == 1600 / 2000
+        assert tracker.run_cache_creation_tokens == 0
@@ -0,0 +1,166 @@
+"""Tests for token-budgeted request assembly (MessageListContext.build_context)."""
+
+from ouro.capabilities.tools.executor import ToolExecutor
+from ouro.core.llm import LLMMessage, LLMResponse, StopReason
+from ouro.core.loop import Agent, MessageListContext, NullProgressSink
+from ouro.core.loop.budget import STUB_TEMPLATE, fit_to_budget
+
+
+def _count(message: LLMMessage) -> int:
+    return len(message.content or "") // 4 + 1
+
+
+def _is_stub(message: LLMMessage) -> bool:
+    return message.content.endswith("to fit the context budget]")
+
+
+def _tool_turn(call_id: str, path: str, size: int = 400) -> list[LLMMessage]:
+    return [
+        LLMMessage(
+            role="assistant",
+            content=f"Reading {path} " + "a" * size,
+            tool_calls=[
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {"name": "read_file", "arguments": f'{{"file_path": "{path}"}}'},
+                }
+            ],
+        ),
+        LLMMessage(role="tool", content="r" * size * 4, tool_call_id=call_id, name="read_file"),
+    ]
+
+
+def _history() -> list[LLMMessage]:
+    return [
+        LLMMessage(role="user", content="Fix the failing scheduler test"),
+        *_tool_turn("call_1", "src/scheduler.py"),
+        *_tool_turn("call_2", "src/utils.py"),
+        *_tool_turn("call_3", "docs/notes.md"),
+        LLMMessage(role="user", content="Now update src/scheduler.py to use zoneinfo"),
+    ]
+
+
+def test_fits_without_changes():
+    messages = _history()
+    assert fit_to_budget(messages, 100_000, _count) is messages
+
+
+def test_stubs_oldest_results_first_and_keeps_structure():
+    messages = _history()
+    total = sum(_count(m) for m in messages)
+
+    result = fit_to_budget(messages, total - 300, _count)
+
+    assert [m.role for m in result] == [m.role for m in messages]
+    assert [m.tool_call_id for m in result] == [m.tool_call_id for m in messages]
+    assert [m.tool_calls for m in result] == [m.tool_calls for m in messages]
+    # One result is enough: call_2 is the oldest unit not referenced by the turn.
+    stubbed = [i for i, m in enumerate(result) if m is not messages[i]]
+    assert stubbed == [4]
+    assert result[4].content == STUB_TEMPLATE.format(tokens=_count(messages[4]))
+    assert result[-1] is messages[-1]
+
+
+def test_referenced_units_go_last():
+    messages = _history()
+
+    result = fit_to_budget(messages, 50, _count)
+
+    # Over an unreachable budget everything before the current turn is stubbed.
+    assert all(_is_stub(m) for m in result[1:7])
+    assert result[-1] is messages[-1]
+    # With a reachable one, the unit sharing src/scheduler.py with the
+    # current turn survives while newer unrelated ones are stubbed.
+    order = fit_to_budget(messages, sum(_count(m) for m in messages) - 900, _count)
+    assert not _is_stub(order[2])
+    assert _is_stub(order[4]) and _is_stub(order[6])
+
+
+def test_build_context_leaves_history_untouched():
+    context = MessageListContext(
+        system_messages=[LLMMessage(role="system", content="sys")], detached=_history()
+    )
+
+    outgoing = context.build_context(token_budget=300, count_tokens=_count)
+
+    assert outgoing[0].content == "sys"
+    assert any(_is_stub(m) for m in outgoing[1:])
+    assert not any(_is_stub(m) for m in context.detached)
+    assert len(context.build_context()) == len(context.detached) + 1
+
+
+class _RecordingLLM:
+    def __init__(self) -> None:
+        self.requests: list[list[LLMMessage]] = []
+
+    async def call_async(self, **kwargs) -> LLMResponse:
+        self.requests.append(kwargs["messages"])
+        return LLMResponse(content="ok", stop_reason=StopReason.STOP)
+
+    def extract_text(self, response: LLMResponse) -> str:
+        return response.content or ""
+
+    def extract_tool_calls(self, response: LLMResponse) -> list:
+        return []
+
+
+async def test_agent_sends_budgeted_request():
+    llm = _RecordingLLM()
+    agent = Agent(
+        llm=llm,
+        tools=ToolExecutor([]),
+        progress=NullProgressSink(),
+        context_budget=300,
+        count_tokens=_count,
+    )
+    context = MessageListContext(detached=_history())
+
+    await agent.run("Now update src/scheduler.py to use zoneinfo", context=context)
+
+    sent = llm.requests[0]
+    assert any(_is_stub(m) for m in sent)
+    assert sum(_count(m) for m in sent) <= 300
+    assert not any(_is_stub(m) for m in context.detached)
+
+
+def _single_task(rounds: int) -> list[LLMMessage]:
+    messages = [LLMMessage(role="user", content="Fix the failing scheduler test")]
+    for i in range(rounds):
+        messages.extend(_tool_turn(f"call_{i}", f"src/module_{i}.py"))
+    return messages
+
+
+def test_single_user_message_stubs_earlier_rounds_of_the_turn():
+    messages = _single_task(6)
+
+    result = fit_to_budget(messages, 1000, _count)
+
+    assert sum(_count(m) for m in result) <= 1000
+    assert result[0] is messages[0]
+    # The last call and its result go out in full.
+    assert result[-2:] == messages[-2:]
+    assert _is_stub(result[2])
+
+
+def test_stubs_are_reused_across_builds():
+    context = MessageListContext(detached=_single_task(6))
+
+    first = context.build_context(token_budget=1000, count_tokens=_count)
+    context.detached.extend(_tool_turn("call_6", "src/module_6.py"))
+    second = context.build_context(token_budget=1000, count_tokens=_count)
+
+    # Every earlier stub is sent again as the same object.
+    for before, after in zip(first, second):
+        if _is_stub(before):
+            assert after is before
+    stubbed = sum(_is_stub(m) for m in second)
+    assert stubbed > sum(_is_stub(m) for m in first)
+
+    # Even with room to spare, earlier stubs stay.
+    roomy = context.build_context(token_budget=100_000, count_tokens=_count)
+    assert sum(_is_stub(m) for m in roomy) == stubbed
+
+    # A rewrite of the history starts over.
+    context.detached.replace(context.detached.snapshot())
+    assert not any(_is_stub(m) for m in context.build_context(token_budget=100_000))
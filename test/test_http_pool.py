@@ -0,0 +1,73 @@
+"""Tests for the shared keep-alive HTTP client pool."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from ouro.core.http_pool import HttpClientPool, _pool_key
+
+
+def _echo_transport() -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"set-cookie": "session=abc; Path=/"}, text=str(request.url)
+        )
+
+    return httpx.MockTransport(handler)
+
+
+def test_pool_key_reduces_to_origin():
+    assert _pool_key(None) == ""
+    assert _pool_key("https://API.example.com/v1/chat") == "https://api.example.com"
+    assert _pool_key("http://localhost:8080/v1") == "http://localhost:8080"
+    assert _pool_key("api.example.com/v1") == "https://api.example.com"
+
+
+async def test_same_origin_shares_client_and_counts_requests():
+    pool = HttpClientPool(transport=_echo_transport())
+    a = pool.get("https://api.example.com/v1")
+    b = pool.get("https://api.example.com/v2")
+    other = pool.get("https://other.example.com")
+    assert a is b
+    assert a is not other
+
+    await a.get("https://api.example.com/v1/models")
+    await b.get("https://api.example.com/v2/models")
+    stats = pool.stats()
+    assert stats["clients"] == 2
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["requests"] == {"https://api.example.com": 2}
+    await pool.aclose()
+
+
+async def test_clients_do_not_keep_cookies():
+    pool = HttpClientPool(transport=_echo_transport())
+    client = pool.get()
+    await client.get("https://example.com/")
+    assert len(client.cookies.jar) == 0
+    await pool.aclose()
+
+
+async def test_aclose_closes_clients_and_next_get_recreates():
+    pool = HttpClientPool(transport=_echo_transport())
+    client = pool.get("https://api.example.com")
+    await pool.aclose()
+    assert client.is_closed
+    assert pool.stats()["clients"] == 0
+    assert pool.get("https://api.example.com") is not client
+    await pool.aclose()
+
+
+def test_client_is_replaced_on_a_new_event_loop():
+    pool = HttpClientPool(transport=_echo_transport())
+
+    async def grab() -> httpx.AsyncClient:
+        return pool.get("https://api.example.com")
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+    assert pool.stats()["misses"] == 2
@@ -0,0 +1,49 @@
+"""Entry points must not import heavy optional dependencies up front."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import ouro.core
+import ouro.core.llm
+
+HEAVY = ("litellm", "ddgs", "trafilatura", "tree_sitter", "aiohttp")
+
+
+def _loaded_after(code: str, watch: tuple[str, ...]) -> list[str]:
+    """Run ``code`` in a fresh interpreter and report which ``watch`` modules got imported."""
+    script = (
+        "import json, sys\n"
+        f"{code}\n"
+        f"print(json.dumps([m for m in {list(watch)!r} if m in sys.modules]))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def test_cli_help_loads_nothing_heavy():
+    code = "from ouro.interfaces.cli.args import build_parser; build_parser().format_help()"
+    assert _loaded_after(code, (*HEAVY, "rich", "httpx", "prompt_toolkit", "yaml")) == []
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["ouro.core", "ouro.core.llm", "ouro.capabilities", "ouro.interfaces.cli.main"],
+)
+def test_import_does_not_load_heavy_dependencies(module):
+    assert _loaded_after(f"import {module}", HEAVY) == []
+
+
+@pytest.mark.parametrize("package", [ouro.core, ouro.core.llm])
+def test_lazy_exports_resolve(package):
+    for name in package.__all__:
+        assert getattr(package, name) is not None, name
+    assert set(package.__all__) <= set(dir(package))
+    with pytest.raises(AttributeError):
+        package.does_not_exist  # noqa: B018
@@ -1,5 +1,6 @@
 """Tests for LiteLLM adapter message conversion."""
 
+import asyncio
 import json
 import os
 import time
@@ -9,6 +10,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from ouro.config import Config
+from ouro.core.http_pool import get_http_client
 from ouro.core.llm.chatgpt_auth import ChatGPTLoginRequiredError
 from ouro.core.llm.content_utils import extract_text
 from ouro.core.llm.litellm_adapter import LiteLLMAdapter
@@ -182,6 +184,48 @@ class TestMessageConversion:
         assert result[3] == {"role": "user", "content": "Follow up"}
 
 
+class TestConversionCache:
+    """Memoized per-message conversion in LiteLLM adapter."""
+
+    def setup_method(self):
+        self.adapter = LiteLLMAdapter(model="gpt-3.5-turbo")
+
+    def test_only_new_messages_are_converted(self, monkeypatch):
+        history = [LLMMessage(role="user", content=f"m{i}") for i in range(5)]
+        first = self.adapter._convert_messages(history)
+
+        converted = []
+        original = self.adapter._convert_message
+
+        def counting(msg):
+            converted.append(msg)
+            return original(msg)
+
+        monkeypatch.setattr(self.adapter, "_convert_message", counting)
+        history.append(LLMMessage(role="assistant", content="reply"))
+        second = self.adapter._convert_messages(history)
+
+        assert converted == [history[-1]]
+        assert second[:5] == first
+        assert second[-1] == {"role": "assistant", "content": "reply"}
+
+    def test_invalidate_forces_reconversion(self, monkeypatch):
+        msg = LLMMessage(role="user", content="before")
+        self.adapter._convert_messages([msg])
+        msg.content = "after"
+        assert self.adapter._convert_messages([msg])[0]["content"] == "before"
+
+        self.adapter.invalidate_message_cache()
+        assert self.adapter._convert_messages([msg])[0]["content"] == "after"
+
+    def test_cache_drops_messages_that_left_history(self):
+        old = [LLMMessage(role="user", content=f"old{i}") for i in range(40)]
+        self.adapter._convert_messages(old)
+        new = [LLMMessage(role="user", content="new")]
+        self.adapter._convert_messages(new)
+        assert len(self.adapter._message_cache) == 1
+
+
 class TestToolConversion:
     """Test tool conversion in LiteLLM adapter."""
 
@@ -349,3 +393,111 @@ async def test_chatgpt_adapter_retries_transient_auth_refresh_errors(tmp_path, m
 
     assert calls["count"] >= 2
     assert result.content == "ok"
+
+
+def _stream_chunk(*, content=None, tool_calls=None, finish_reason=None, usage=None):
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls, reasoning_content=None)
+    choices = [SimpleNamespace(delta=delta, finish_reason=finish_reason)]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+def _tool_delta(index, *, call_id=None, name=None, arguments=None):
+    return SimpleNamespace(
+        index=index,
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=arguments),
+    )
+
+
+async def test_call_stream_async_reassembles_chunks_and_reports_finished_tool_calls(monkeypatch):
+    chunks = [
+        _stream_chunk(content="Let me look."),
+        _stream_chunk(tool_calls=[_tool_delta(0, call_id="call_a", name="read_file")]),
+        _stream_chunk(tool_calls=[_tool_delta(0, arguments='{"file_path": ')]),
+        _stream_chunk(tool_calls=[_tool_delta(0, arguments='"a.py"}')]),
+        _stream_chunk(tool_calls=[_tool_delta(1, call_id="call_b", name="grep_content")]),
+        _stream_chunk(tool_calls=[_tool_delta(1, arguments='{"pattern": "x"}')]),
+        _stream_chunk(finish_reason="tool_calls"),
+        SimpleNamespace(choices=[], usage={"prompt_tokens": 12, "completion_tokens": 5}),
+    ]
+    seen: list[tuple[str, int]] = []
+    received_chunks = {"count": 0}
+    captured: dict = {}
+
+    async def fake_stream():
+        for chunk in chunks:
+            received_chunks["count"] += 1
+            yield chunk
+
+    async def fake_acompletion(**kwargs):
+        captured.update(kwargs)
+        return fake_stream()
+
+    fake_litellm = SimpleNamespace(
+        acompletion=fake_acompletion,
+        drop_params=None,
+        set_verbose=None,
+        suppress_debug_info=None,
+    )
+    adapter = LiteLLMAdapter(model="openai/gpt-4o")
+    monkeypatch.setattr(adapter, "_get_litellm", lambda: fake_litellm)
+
+    response = await adapter.call_stream_async(
+        [LLMMessage(role="user", content="hi")],
+        on_tool_call=lambda block: seen.append((block["id"], received_chunks["count"])),
+    )
+
+    assert captured["stream"] is True
+    # call_a is reported when call_b starts streaming, before the stream ends.
+    assert seen == [("call_a", 5), ("call_b", len(chunks))]
+    assert response.content == "Let me look."
+    assert response.stop_reason == "tool_calls"
+    assert response.usage["input_tokens"] == 12
+    assert response.usage["output_tokens"] == 5
+    assert [tc.arguments for tc in adapter.extract_tool_calls(response)] == [
+        {"file_path": "a.py"},
+        {"pattern": "x"},
+    ]
+
+
+async def test_concurrent_adapters_use_their_own_pooled_client(monkeypatch):
+    response = MagicMock()
+    response.choices = [
+        SimpleNamespace(
+            message=SimpleNamespace(
+                content="ok", tool_calls=None, thinking_blocks=None, reasoning_content=None
+            ),
+            finish_reason="stop",
+        )
+    ]
+    response.usage = {"prompt_tokens": 1, "completion_tokens": 1}
+    seen: list[tuple[str, object, bool]] = []
+
+    async def fake_acompletion(**kwargs):
+        await asyncio.sleep(0)  # let the other adapter's call start
+        seen.append((kwargs["api_base"], kwargs["client"], kwargs["drop_params"]))
+        return response
+
+    fake_litellm = SimpleNamespace(
+        acompletion=fake_acompletion, aclient_session=None, set_verbose=None
+    )
+    a = LiteLLMAdapter(model="openai/gpt-4o", api_key="sk-a", api_base="https://a.example/v1")
+    b = LiteLLMAdapter(
+        model="openai/gpt-4o", api_key="sk-b", api_base="https://b.example/v1", drop_params=False
+    )
+    for adapter in (a, b):
+        monkeypatch.setattr(adapter, "_get_litellm", lambda: fake_litellm)
+
+    messages = [LLMMessage(role="user", content="hi")]
+    await asyncio.gather(a.call_async(messages), b.call_async(messages), a.call_async(messages))
+
+    clients = {base: client for base, client, _ in seen}
+    assert len(seen) == 3 and len(clients) == 2
+    for base, client, drop_params in seen:
+        assert client is clients[base]  # reused across calls
+        assert client._client is get_http_client(base)
+        assert str(client.base_url).startswith(base)
+        assert drop_params is (base == "https://a.example/v1")
+    # Nothing per-adapter is left in LiteLLM's module state.
+    assert fake_litellm.aclient_session is None
+    assert not hasattr(fake_litellm, "drop_params")
@@ -0,0 +1,237 @@
+"""Tests for hedged / fail-over routing across model profiles."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ouro.core.llm import (
+    LLMMessage,
+    LLMResponse,
+    ModelManager,
+    RoutingAdapter,
+    ToolCallBlock,
+    create_routed_adapter,
+)
+from ouro.core.llm.routing import LatencyWindow
+
+
+class FakeAdapter:
+    def __init__(
+        self,
+        model: str,
+        delay: float = 0.0,
+        error: Exception | None = None,
+        usage: dict[str, int] | None = None,
+    ):
+        self.model = model
+        self.usage = usage
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.cancelled = 0
+        self.invalidated = 0
+        self.tool_calls: list[ToolCallBlock] = []
+
+    async def call_async(self, messages, tools=None, max_tokens=None, **kwargs) -> LLMResponse:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return LLMResponse(content=self.model, usage=self.usage)
+
+    async def call_stream_async(
+        self, messages, tools=None, max_tokens=None, *, on_tool_call=None, **kwargs
+    ) -> LLMResponse:
+        self.calls += 1
+        if on_tool_call is not None:
+            for block in self.tool_calls:
+                on_tool_call(block)
+                await asyncio.sleep(0)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return LLMResponse(content=self.model)
+
+    def extract_text(self, response: LLMResponse) -> str:
+        return response.content or ""
+
+    def invalidate_message_cache(self) -> None:
+        self.invalidated += 1
+
+
+MESSAGES = [LLMMessage(role="user", content="hi")]
+
+
+def _router(primary, *backups, **kwargs) -> RoutingAdapter:
+    kwargs.setdefault("hedge_min_delay", 0.02)
+    kwargs.setdefault("hedge_initial_delay", 0.02)
+    return RoutingAdapter(primary, list(backups), **kwargs)
+
+
+async def test_fast_primary_is_not_hedged():
+    primary, backup = FakeAdapter("a"), FakeAdapter("b")
+    router = _router(primary, backup)
+    response = await router.call_async(MESSAGES)
+    assert response.content == "a"
+    assert backup.calls == 0
+    assert len(router.latencies) == 1
+
+
+async def test_slow_primary_is_hedged_and_loser_cancelled():
+    primary, backup = FakeAdapter("a", delay=1.0), FakeAdapter("b")
+    router = _router(primary, backup)
+    response = await router.call_async(MESSAGES)
+    assert response.content == "b"
+    assert primary.cancelled == 1
+    assert router.routing_stats() == {"calls": 1, "hedged": 1, "hedge_wins": 1, "failovers": 0}
+    # The cancelled primary still counts as a (lower-bound) latency sample.
+    assert len(router.latencies) == 1
+
+
+async def test_hedge_disabled_waits_for_primary():
+    primary, backup = FakeAdapter("a", delay=0.05), FakeAdapter("b")
+    router = _router(primary, backup, hedge_percentile=0)
+    assert (await router.call_async(MESSAGES)).content == "a"
+    assert backup.calls == 0
+
+
+async def test_error_fails_over_in_order():
+    primary = FakeAdapter("a", error=RuntimeError("503 service unavailable"))
+    second = FakeAdapter("b", error=RuntimeError("connection reset"))
+    third = FakeAdapter("c")
+    router = _router(primary, second, third, hedge_percentile=0)
+    response = await router.call_async(MESSAGES)
+    assert response.content == "c"
+    assert router.routing_stats()["failovers"] == 2
+    # Usage is attributed to the model that answered.
+    assert response.model == "c"
+    assert router.model == "c"
+
+
+async def test_all_routes_failing_raises_primary_error():
+    primary = FakeAdapter("a", error=TimeoutError("primary timeout"))
+    backup = FakeAdapter("b", error=RuntimeError("backup 502"))
+    router = _router(primary, backup, hedge_percentile=0)
+    with pytest.raises(TimeoutError, match="primary"):
+        await router.call_async(MESSAGES)
+
+
+async def test_request_errors_do_not_fail_over():
+    primary = FakeAdapter("a", error=ValueError("context length exceeded"))
+    backup = FakeAdapter("b")
+    router = _router(primary, backup, hedge_percentile=0)
+    with pytest.raises(ValueError, match="context length"):
+        await router.call_async(MESSAGES)
+    assert backup.calls == 0
+    assert router.routing_stats()["failovers"] == 0
+    assert router.model == "a"
+
+
+async def test_hedge_loser_usage_is_counted():
+    primary = FakeAdapter("a", delay=1.0, usage={"input_tokens": 90, "output_tokens": 5})
+    backup = FakeAdapter("b", usage={"input_tokens": 100, "output_tokens": 10})
+    router = _router(primary, backup)
+
+    response = await router.call_async(MESSAGES)
+
+    assert response.model == "b"
+    # The cancelled primary was sent the prompt: billed about the winner's input.
+    assert response.usage == {
+        "input_tokens": 100,
+        "output_tokens": 10,
+        "hedge_input_tokens": 100,
+        "hedge_output_tokens": 0,
+    }
+
+
+async def test_stream_commits_to_first_attempt_reporting_tool_calls():
+    block = ToolCallBlock(id="t1", name="read_file", input={})
+    primary = FakeAdapter("a", delay=0.1)
+    primary.tool_calls = [block]
+    backup = FakeAdapter("b")
+    seen: list[ToolCallBlock] = []
+    router = _router(primary, backup)
+    response = await router.call_stream_async(MESSAGES, on_tool_call=seen.append)
+    # Committed to the primary once it reported a tool call: no hedge.
+    assert response.content == "a"
+    assert seen == [block]
+    assert backup.calls == 0
+
+
+def test_hedge_delay_tracks_percentile():
+    router = _router(FakeAdapter("a"), FakeAdapter("b"), min_samples=4, hedge_initial_delay=30)
+    assert router.hedge_delay() == 30
+    for seconds in (1.0, 2.0, 3.0, 10.0):
+        router.latencies.add(seconds)
+    assert router.hedge_delay() == 10.0
+    router.hedge_percentile = 50
+    assert router.hedge_delay() == 2.0
+
+
+def test_latency_window_is_bounded():
+    window = LatencyWindow(size=3)
+    for seconds in (5.0, 1.0, 2.0, 3.0):
+        window.add(seconds)
+    assert len(window) == 3
+    assert window.percentile(100) == 3.0
+
+
+def test_invalidate_and_attributes_delegate():
+    primary, backup = FakeAdapter("a"), FakeAdapter("b")
+    router = _router(primary, backup)
+    router.invalidate_message_cache()
+    assert (primary.invalidated, backup.invalidated) == (1, 1)
+    assert router.model == "a"
+    assert router.delay == 0.0
+
+
+def test_create_routed_adapter_uses_fallback_list(tmp_path):
+    config_path = tmp_path / "models.yaml"
+    config_path.write_text(
+        "\n".join(
+            [
+                "models:",
+                "  openai/gpt-4o:",
+                "    api_key: sk-test",
+                "  anthropic/claude-sonnet-4-5:",
+                "    api_key: sk-ant-test",
+                "  ollama/llama3: {}",
+                "default: openai/gpt-4o",
+                "fallback:",
+                "  - openai/gpt-4o",
+                "  - missing/model",
+                "  - ollama/llama3",
+                "  - anthropic/claude-sonnet-4-5",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    manager = ModelManager(config_path=str(config_path))
+    assert manager.fallback_model_ids == [
+        "openai/gpt-4o",
+        "ollama/llama3",
+        "anthropic/claude-sonnet-4-5",
+    ]
+
+    primary = manager.get_current_model()
+    llm = create_routed_adapter(manager, primary)
+    assert isinstance(llm, RoutingAdapter)
+    assert [b.model for b in llm.backups] == ["ollama/llama3", "anthropic/claude-sonnet-4-5"]
+
+    # The fallback list survives a save.
+    manager.switch_model("ollama/llama3")
+    assert ModelManager(config_path=str(config_path)).fallback_model_ids == (
+        manager.fallback_model_ids
+    )
+
+    manager.fallback_model_ids = []
+    assert not isinstance(create_routed_adapter(manager, primary), RoutingAdapter)
@@ -1,5 +1,6 @@
-from ouro.core.llm import LLMMessage
-from ouro.core.loop import MessageList
+from ouro.capabilities.tools.executor import ToolExecutor
+from ouro.core.llm import LLMMessage, LLMResponse, StopReason
+from ouro.core.loop import Agent, MessageList, MessageListContext, NullProgressSink
 
 
 def test_message_list_append_extend_replace_range_snapshot_clear():
@@ -27,3 +28,88 @@ def test_message_list_append_extend_replace_range_snapshot_clear():
 
     ml.clear()
     assert len(ml) == 0
+
+
+def test_message_list_generation_ignores_appends():
+    ml = MessageList([LLMMessage(role="user", content="u1")])
+    start = ml.generation
+
+    ml.append(LLMMessage(role="assistant", content="a1"))
+    ml.extend([LLMMessage(role="user", content="u2")])
+    assert ml.generation == start
+
+    ml.replace(ml.snapshot()[:1])
+    assert ml.generation == start + 1
+    ml.replace_range(0, 1, [])
+    ml.clear()
+    assert ml.generation == start + 3
+
+
+class _CachingLLM:
+    def __init__(self) -> None:
+        self.invalidations = 0
+
+    async def call_async(self, **kwargs) -> LLMResponse:
+        return LLMResponse(content="ok", stop_reason=StopReason.STOP)
+
+    def invalidate_message_cache(self) -> None:
+        self.invalidations += 1
+
+    def extract_text(self, response: LLMResponse) -> str:
+        return response.content or ""
+
+    def extract_tool_calls(self, response: LLMResponse) -> list:
+        return []
+
+
+async def test_agent_invalidates_adapter_cache_only_after_replace():
+    llm = _CachingLLM()
+    agent = Agent(llm=llm, tools=ToolExecutor([]), hooks=(), progress=NullProgressSink())
+    context = MessageListContext()
+
+    await agent.run("first", context=context)
+    await agent.run("second", context=context)
+    assert llm.invalidations == 0
+
+    context.detached.replace(context.detached.snapshot()[-2:])
+    await agent.run("third", context=context)
+    assert llm.invalidations == 1
+
+
+def test_message_list_token_ledger_counts_only_new_messages():
+    counted: list[LLMMessage] = []
+
+    def counter(message: LLMMessage) -> int:
+        counted.append(message)
+        return len(message.content or "")
+
+    m1 = LLMMessage(role="user", content="aaaa")
+    m2 = LLMMessage(role="assistant", content="bb")
+    ml = MessageList([m1, m2])
+
+    assert ml.token_count(counter) == 6
+    assert ml.token_count(counter) == 6
+    assert counted == [m1, m2]
+
+    m3 = LLMMessage(role="user", content="ccc")
+    ml.append(m3)
+    assert ml.token_count(counter) == 9
+    assert counted == [m1, m2, m3]
+
+    # A rewrite drops counts from the first replaced position on.
+    m4 = LLMMessage(role="assistant", content="d")
+    ml.replace_range(1, 2, [m4])
+    counted.clear()
+    assert ml.token_count(counter) == 8
+    assert counted == [m4, m3]
+
+    ml.replace([m3])
+    assert ml.token_count(counter) == 3
+    ml.clear()
+    assert ml.token_count(counter) == 0
+
+
+def test_message_list_token_ledger_restarts_for_a_new_counter():
+    ml = MessageList([LLMMessage(role="user", content="abc")])
+    assert ml.token_count(lambda m: 1) == 1
+    assert ml.token_count(lambda m: 10) == 10
@@ -0,0 +1,71 @@
+"""Tests for the slotted LLMMessage representation."""
+
+import copy
+import pickle
+import sys
+
+import pytest
+
+from ouro.core.llm.message_types import LLMMessage, ToolResult
+
+
+def _tool_call(name: str) -> dict:
+    return {"id": "call_1", "type": "function", "function": {"name": name, "arguments": "{}"}}
+
+
+def test_message_has_no_instance_dict():
+    msg = LLMMessage(role="user", content="hi")
+    assert not hasattr(msg, "__dict__")
+    with pytest.raises(AttributeError):
+        msg.extra = 1  # type: ignore[attr-defined]
+
+
+def test_role_and_tool_names_are_interned():
+    role = "".join(["assis", "tant"])
+    name = "".join(["read_", "file"])
+    fn_name = "".join(["grep_", "content"])
+
+    a = LLMMessage(role=role, tool_calls=[_tool_call(fn_name)])  # type: ignore[arg-type]
+    b = ToolResult(tool_call_id="call_1", content="ok", name=name).to_message()
+
+    assert a.role is sys.intern("assistant")
+    assert b.name is sys.intern("read_file")
+    assert a.tool_calls[0]["function"]["name"] is sys.intern("grep_content")
+
+
+def test_to_dict_is_cached_until_a_field_is_reassigned():
+    msg = LLMMessage(role="tool", content="x", tool_call_id="call_1", name="read_file")
+    first = msg.to_dict()
+    assert msg.to_dict() is first
+
+    msg.content = "y"
+    second = msg.to_dict()
+    assert second is not first
+    assert second == {"role": "tool", "content": "y", "tool_call_id": "call_1", "name": "read_file"}
+
+
+def test_equality_and_repr_ignore_dict_cache():
+    a = LLMMessage(role="user", content="hi")
+    b = LLMMessage(role="user", content="hi")
+    a.to_dict()
+    assert a == b
+    assert "_dict_cache" not in repr(a)
+
+
+def test_copy_and_pickle_roundtrip():
+    msg = LLMMessage(role="assistant", content=None, tool_calls=[_tool_call("shell")])
+    msg.to_dict()
+
+    for clone in (copy.copy(msg), copy.deepcopy(msg), pickle.loads(pickle.dumps(msg))):
+        assert clone == msg
+        assert clone.to_dict() == msg.to_dict()
+
+
+def test_from_dict_roundtrip():
+    data = {
+        "role": "user",
+        "content": [{"type": "image_url", "image_url": {"url": "data:image/png;base64,AAAA"}}],
+    }
+    msg = LLMMessage.from_dict(data)
+    assert msg.content is data["content"]
+    assert msg.to_dict() == data
@@ -5,6 +5,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from ouro.capabilities.tools.builtins.multi_task import MultiTaskTool, TaskExecutionResult
+from ouro.capabilities.tools.executor import ToolExecutor
 
 
 class TestMultiTaskTool:
@@ -175,6 +176,19 @@ class TestMultiTaskTool:
         assert "read_file" in names
         assert "shell" in names
 
+    def test_subtask_registry_shares_parent_limits(self):
+        agent = MagicMock()
+        tool = MultiTaskTool(agent)
+        sink = MagicMock()
+        agent.tool_executor = ToolExecutor([tool], max_concurrency=2, progress=sink)
+
+        registry = tool._build_subtask_registry()
+
+        assert registry.tools == {}
+        assert registry._global_slots is agent.tool_executor._global_slots
+        assert registry._tool_buckets is agent.tool_executor._tool_buckets
+        assert registry._progress is sink
+
     # ------------------------------------------------------------------
     # Context building
     # ------------------------------------------------------------------
@@ -216,3 +216,43 @@ async def test_call_async_formats_codex_request_errors(monkeypatch) -> None:
     assert "https://chatgpt.com/backend-api/codex/responses" in message
     assert "proxy/VPN" in message
     assert isinstance(exc_info.value.__cause__, httpx.ConnectError)
+
+
+async def test_call_stream_async_reports_tool_calls_as_they_finish(monkeypatch) -> None:
+    adapter = OpenAICodexAdapter("openai-codex/gpt-5.5")
+    token = _jwt({"https://api.openai.com/auth": {"chatgpt_account_id": "acct_123"}})
+    item = {
+        "type": "function_call",
+        "id": "fc_1",
+        "call_id": "call_1",
+        "name": "read_file",
+        "arguments": '{"file_path": "a.py"}',
+    }
+    events = [
+        {"type": "response.output_item.added", "item": item},
+        {"type": "response.output_item.done", "item": item},
+        {"type": "response.completed", "response": {"status": "completed"}},
+    ]
+    seen: list[str] = []
+
+    async def fake_access_token() -> str:
+        return token
+
+    async def fake_request_events(*, on_event=None, **_kwargs):
+        for event in events:
+            if on_event is not None:
+                on_event(event)
+        return events
+
+    monkeypatch.setattr(adapter, "_ensure_access_token", fake_access_token)
+    monkeypatch.setattr(adapter, "_request_events", fake_request_events)
+
+    response = await adapter.call_stream_async(
+        [LLMMessage(role="user", content="hello")],
+        on_tool_call=lambda block: seen.append(block["id"]),
+    )
+
+    assert seen == ["call_1|fc_1"]
+    assert response.stop_reason == StopReason.TOOL_CALLS
+    assert response.tool_calls is not None
+    assert response.tool_calls[0]["id"] == "call_1|fc_1"
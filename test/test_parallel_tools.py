@@ -10,6 +10,7 @@ from ouro.capabilities.tools.base import BaseTool
 from ouro.capabilities.tools.executor import ToolExecutor
 from ouro.core.llm import ToolCall
 from ouro.core.loop import Agent, NullProgressSink, RunStatistic
+from ouro.core.loop.agent import _split_at_barriers
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -181,67 +182,77 @@ def test_executor_conflict_keys_passes_arguments_through():
 
 
 # ---------------------------------------------------------------------------
-# Agent._build_batches: prefix-greedy grouping
+# Agent._build_dependencies: conflict DAG
 # ---------------------------------------------------------------------------
 
 
-def test_build_batches_all_readonly_one_parallel_batch():
+def test_build_dependencies_all_readonly_independent():
     agent = _make_agent_with_tools([ReadonlyStubTool("a"), ReadonlyStubTool("b")])
     tcs = [_make_tool_call("a"), _make_tool_call("b")]
-    assert agent._build_batches(tcs) == [[0, 1]]
+    assert agent._build_dependencies(tcs) == [set(), set()]
 
 
-def test_build_batches_unknown_scope_runs_alone():
-    # A non-readonly tool with no conflict_keys override returns None,
-    # so it must run alone and split surrounding readonly calls.
+def test_build_dependencies_unknown_scope_is_a_barrier():
+    # A non-readonly tool with no conflict_keys override returns None, so it
+    # waits for everything before it and everything after it waits for it.
     agent = _make_agent_with_tools([ReadonlyStubTool("ro"), WritableStubTool("wr")])
     tcs = [_make_tool_call("ro", "1"), _make_tool_call("wr", "2"), _make_tool_call("ro", "3")]
-    assert agent._build_batches(tcs) == [[0], [1], [2]]
+    deps = agent._build_dependencies(tcs)
+    assert deps == [set(), {0}, {1}]
+    assert _split_at_barriers(deps) == [[0], [1], [2]]
 
 
-def test_build_batches_disjoint_scoped_writes_parallel():
+def test_build_dependencies_disjoint_scoped_writes_independent():
     agent = _make_agent_with_tools([ScopedWritableStubTool("wr")])
     tcs = [
         _make_tool_call("wr", "1", path="/a"),
         _make_tool_call("wr", "2", path="/b"),
     ]
-    assert agent._build_batches(tcs) == [[0, 1]]
+    assert agent._build_dependencies(tcs) == [set(), set()]
 
 
-def test_build_batches_overlapping_scoped_writes_split():
+def test_build_dependencies_overlapping_scoped_writes_ordered():
     agent = _make_agent_with_tools([ScopedWritableStubTool("wr")])
     tcs = [
         _make_tool_call("wr", "1", path="/a"),
         _make_tool_call("wr", "2", path="/a"),
     ]
-    assert agent._build_batches(tcs) == [[0], [1]]
+    deps = agent._build_dependencies(tcs)
+    assert deps == [set(), {0}]
+    assert _split_at_barriers(deps) == [[0], [1]]
 
 
-def test_build_batches_readonly_joins_scoped_write_batch():
-    # readonly's empty key set is disjoint with anything; it should join.
+def test_build_dependencies_readonly_does_not_wait_for_scoped_write():
+    # readonly's empty key set is disjoint with anything.
     agent = _make_agent_with_tools([ReadonlyStubTool("ro"), ScopedWritableStubTool("wr")])
     tcs = [
         _make_tool_call("ro", "1"),
         _make_tool_call("wr", "2", path="/a"),
         _make_tool_call("ro", "3"),
     ]
-    assert agent._build_batches(tcs) == [[0, 1, 2]]
+    deps = agent._build_dependencies(tcs)
+    assert deps == [set(), set(), set()]
+    assert _split_at_barriers(deps) == [[0, 1, 2]]
 
 
-def test_build_batches_single_tool_one_singleton_batch():
-    agent = _make_agent_with_tools([ReadonlyStubTool("a")])
-    tcs = [_make_tool_call("a")]
-    assert agent._build_batches(tcs) == [[0]]
-
-
-def test_build_batches_preserves_emit_order_across_batches():
+def test_build_dependencies_only_real_predecessors():
+    # Unlike prefix batching, call 3 does not wait for the /a chain.
     agent = _make_agent_with_tools([ScopedWritableStubTool("wr"), ReadonlyStubTool("ro")])
     tcs = [
         _make_tool_call("wr", "1", path="/a"),
-        _make_tool_call("wr", "2", path="/a"),  # conflicts with #1
-        _make_tool_call("ro", "3"),  # joins batch 2
+        _make_tool_call("wr", "2", path="/a"),
+        _make_tool_call("wr", "3", path="/b"),
+        _make_tool_call("ro", "4"),
     ]
-    assert agent._build_batches(tcs) == [[0], [1, 2]]
+    deps = agent._build_dependencies(tcs)
+    assert deps == [set(), {0}, set(), set()]
+    assert _split_at_barriers(deps) == [[0, 1, 2, 3]]
+
+
+def test_build_dependencies_single_tool():
+    agent = _make_agent_with_tools([ReadonlyStubTool("a")])
+    assert agent._build_dependencies([_make_tool_call("a")]) == [set()]
+    assert _split_at_barriers([set()]) == [[0]]
 
 
 # ---------------------------------------------------------------------------
@@ -408,6 +419,36 @@ async def test_dispatch_runs_disjoint_writes_in_one_parallel_batch():
     assert elapsed < delay * 2  # parallel, not sequential
 
 
+@pytest.mark.asyncio
+async def test_dispatch_does_not_hold_independent_calls_behind_a_conflict_chain():
+    """A call starts once its own predecessors finish, not the whole prefix."""
+    delay = 0.05
+    log: list[str] = []
+
+    class LoggedScopedWrite(ScopedWritableStubTool):
+        async def execute(self, **kwargs) -> str:
+            await asyncio.sleep(delay)
+            log.append(kwargs["path"])
+            return self._result
+
+    agent = _make_agent_with_tools([LoggedScopedWrite("wr", result="ok")])
+    tcs = [
+        _make_tool_call("wr", "1", path="/a"),
+        _make_tool_call("wr", "2", path="/a"),
+        _make_tool_call("wr", "3", path="/b"),
+    ]
+
+    start = asyncio.get_event_loop().time()
+    results = await agent._dispatch_tools(_make_ctx(), tcs)
+    elapsed = asyncio.get_event_loop().time() - start
+
+    assert [r.tool_call_id for r in results] == ["1", "2", "3"]
+    # /b finished alongside the first /a; the second /a ran after the first.
+    assert log[:2] in (["/a", "/b"], ["/b", "/a"])
+    assert log[2] == "/a"
+    assert elapsed < delay * 3
+
+
 @pytest.mark.asyncio
 async def test_dispatch_preserves_order_across_split_batches():
     agent = _make_agent_with_tools([ScopedWritableStubTool("wr"), ReadonlyStubTool("ro")])
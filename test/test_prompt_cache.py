@@ -0,0 +1,119 @@
+"""Tests for prompt-cache breakpoint planning."""
+
+from __future__ import annotations
+
+import copy
+
+from ouro.core.llm.litellm_adapter import LiteLLMAdapter
+from ouro.core.llm.message_types import LLMMessage
+from ouro.core.llm.prompt_cache import (
+    EPHEMERAL,
+    apply_cache_breakpoints,
+    plan_breakpoints,
+    supports_cache_control,
+)
+
+TOOLS = [
+    {"name": "read_file", "description": "Read", "input_schema": {"type": "object"}},
+    {"name": "shell", "description": "Run", "input_schema": {"type": "object"}},
+]
+
+
+def _conversation() -> list[dict]:
+    return [
+        {"role": "system", "content": "You are ouro."},
+        {"role": "user", "content": "fix the bug"},
+        {"role": "assistant", "content": None, "tool_calls": [{"id": "c1"}]},
+        {"role": "tool", "content": "file body", "tool_call_id": "c1"},
+        {"role": "assistant", "content": None, "tool_calls": [{"id": "c2"}]},
+        {"role": "tool", "content": [{"type": "text", "text": "ok"}], "tool_call_id": "c2"},
+    ]
+
+
+def _markers(messages: list[dict]) -> list[int]:
+    found = []
+    for i, msg in enumerate(messages):
+        content = msg.get("content")
+        in_block = isinstance(content, list) and "cache_control" in content[-1]
+        if "cache_control" in msg or in_block:
+            found.append(i)
+    return found
+
+
+def test_supports_cache_control():
+    assert supports_cache_control("anthropic/claude-sonnet-4-5")
+    assert supports_cache_control("bedrock/anthropic.claude-3-5-sonnet")
+    assert supports_cache_control("openrouter/anthropic/claude-opus-4")
+    assert not supports_cache_control("openai/gpt-4o")
+    assert not supports_cache_control("deepseek/deepseek-chat")
+    assert not supports_cache_control("claude-without-provider")
+
+
+def test_breakpoints_on_system_previous_tail_and_tail():
+    assert plan_breakpoints(_conversation()) == [0, 3, 5]
+
+
+def test_first_turn_marks_system_and_user():
+    assert plan_breakpoints(_conversation()[:2]) == [0, 1]
+
+
+def test_apply_marks_copies_and_leaves_input_untouched():
+    messages = _conversation()
+    tools = [{"type": "function", "function": {"name": t["name"]}} for t in TOOLS]
+    before = copy.deepcopy((messages, tools))
+
+    marked, marked_tools = apply_cache_breakpoints(messages, tools)
+
+    assert (messages, tools) == before
+    assert _markers(marked) == [0, 3, 5]
+    assert marked[5]["content"][-1]["cache_control"] == EPHEMERAL
+    assert "cache_control" not in marked[5]
+    assert marked_tools is not None
+    assert marked_tools[-1]["cache_control"] == EPHEMERAL
+    assert "cache_control" not in marked_tools[0]
+
+
+def _strip(messages: list[dict]) -> list[dict]:
+    stripped = []
+    for msg in messages:
+        msg = {k: v for k, v in msg.items() if k != "cache_control"}
+        if isinstance(msg.get("content"), list):
+            msg["content"] = [
+                {k: v for k, v in block.items() if k != "cache_control"} for block in msg["content"]
+            ]
+        stripped.append(msg)
+    return stripped
+
+
+def test_previous_tail_matches_last_write():
+    """Call N+1 reads the prefix that call N wrote, byte for byte."""
+    convo = _conversation()
+    first, _ = apply_cache_breakpoints(convo[:4])
+    second, _ = apply_cache_breakpoints(convo)
+    assert 3 in _markers(first) and 3 in _markers(second)
+    # Markers move, but the content up to the shared breakpoint is identical.
+    assert _strip(first[:4]) == _strip(second[:4])
+
+
+def test_adapter_marks_claude_requests_only():
+    messages = [
+        LLMMessage(role="system", content="sys"),
+        LLMMessage(role="user", content="hi"),
+    ]
+    claude = LiteLLMAdapter(model="anthropic/claude-sonnet-4-5", prompt_cache=True)
+    _, params = claude._build_call_params(messages, TOOLS, None)
+    assert _markers(params["messages"]) == [0, 1]
+    assert params["tools"][-1]["cache_control"] == EPHEMERAL
+
+    # The adapter's conversion cache still holds unmarked dicts.
+    _, again = claude._build_call_params(messages, TOOLS, None)
+    assert again["messages"] == params["messages"]
+    assert "cache_control" not in claude._convert_messages(messages)[0]
+
+    gpt = LiteLLMAdapter(model="openai/gpt-4o", prompt_cache=True)
+    _, params = gpt._build_call_params(messages, TOOLS, None)
+    assert _markers(params["messages"]) == []
+
+    off = LiteLLMAdapter(model="anthropic/claude-sonnet-4-5", prompt_cache=False)
+    _, params = off._build_call_params(messages, TOOLS, None)
+    assert _markers(params["messages"]) == []
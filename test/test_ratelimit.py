@@ -0,0 +1,183 @@
+"""Tests for the shared adaptive rate limiter and rate-limit-aware retry."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ouro.config import Config
+from ouro.core.llm.retry import error_headers, is_rate_limit_error, with_retry
+from ouro.core.ratelimit import (
+    PACED_MIN_RATE,
+    PACED_START_RATE,
+    AdaptiveRateLimiter,
+    get_rate_limiter,
+    parse_reset,
+    reset_rate_limiters,
+    retry_after_seconds,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RateLimited(Exception):
+    def __init__(self, headers=None) -> None:
+        super().__init__("Too many requests")
+        self.status_code = 429
+        self.headers = headers or {}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters(monkeypatch):
+    reset_rate_limiters()
+    monkeypatch.setattr(Config, "RETRY_INITIAL_DELAY", 0.01)
+    monkeypatch.setattr(Config, "RETRY_MAX_DELAY", 0.05)
+    yield
+    reset_rate_limiters()
+
+
+def test_retry_after_header_forms():
+    assert retry_after_seconds({"Retry-After": "3"}) == 3.0
+    assert retry_after_seconds({"retry-after-ms": "250"}) == 0.25
+    assert retry_after_seconds({"llm_provider-retry-after": "2"}) == 2.0
+    assert retry_after_seconds({"retry-after": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0
+    assert retry_after_seconds({"retry-after": "soon"}) is None
+    assert retry_after_seconds(None) is None
+
+
+def test_parse_reset_durations():
+    assert parse_reset("12") == 12.0
+    assert parse_reset("1m30s") == 90.0
+    assert parse_reset("250ms") == pytest.approx(0.25)
+    assert parse_reset("2020-01-01T00:00:00Z") == 0.0
+    assert parse_reset("later") is None
+
+
+def test_parse_reset_epoch_timestamps(monkeypatch):
+    monkeypatch.setattr("ouro.core.ratelimit.time.time", lambda: 1_800_000_000.0)
+    assert parse_reset("1800000030") == 30.0
+    assert parse_reset("1800000030000") == 30.0
+    assert parse_reset("1799999990") == 0.0
+
+
+def test_rate_limited_uses_retry_after_and_starts_pacing():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(max_delay=30.0, clock=clock)
+    assert limiter.rate is None
+
+    assert limiter.on_rate_limited(retry_after=5.0) == 5.0
+    assert limiter.cooldown_remaining() == 5.0
+    assert limiter.rate == PACED_START_RATE
+
+    # A server hint is still capped by max_delay.
+    clock.now += 10
+    assert limiter.on_rate_limited(retry_after=120.0) == 30.0
+
+
+def test_hits_during_cooldown_count_as_one_strike():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(base_delay=1.0, clock=clock)
+    limiter.on_rate_limited()
+    for _ in range(5):
+        limiter.on_rate_limited()
+    assert limiter.rate == PACED_START_RATE
+    assert limiter.cooldown_remaining() <= 1.0
+
+
+def test_backoff_without_hint_is_jittered_and_grows():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(base_delay=1.0, max_delay=60.0, clock=clock)
+    first = limiter.on_rate_limited()
+    assert 0.5 <= first <= 1.0
+    clock.now += first
+    second = limiter.on_rate_limited()
+    assert 1.0 <= second <= 2.0
+    assert limiter.rate == PACED_START_RATE / 2
+
+
+def test_rate_floors_and_recovers_until_released():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(clock=clock)
+    for _ in range(10):
+        limiter.on_rate_limited(retry_after=0)
+    assert limiter.rate == PACED_MIN_RATE
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate is None
+
+
+def test_exhausted_window_blocks_until_reset():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(clock=clock)
+    limiter.observe_headers({"x-ratelimit-remaining-requests": "5"})
+    assert limiter.cooldown_remaining() == 0
+    limiter.observe_headers(
+        {"x-ratelimit-remaining-requests": "0", "x-ratelimit-reset-requests": "1m"}
+    )
+    assert limiter.cooldown_remaining() == 60.0
+
+
+def test_reset_header_block_is_capped():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(max_delay=30.0, clock=clock)
+    # A year away, whatever the header format says.
+    limiter.observe_headers({"x-ratelimit-remaining": "0", "x-ratelimit-reset": "31536000"})
+    assert limiter.cooldown_remaining() == 30.0
+
+
+async def test_paced_callers_leave_cooldown_one_at_a_time():
+    limiter = AdaptiveRateLimiter()
+    limiter.on_rate_limited(retry_after=0.02)
+    limiter._bucket.set_rate(50.0)  # 20ms apart keeps the test fast.
+    loop = asyncio.get_running_loop()
+    started: list[float] = []
+
+    async def call():
+        await limiter.acquire()
+        started.append(loop.time())
+
+    await asyncio.gather(*(call() for _ in range(4)))
+    gaps = [b - a for a, b in zip(started, started[1:])]
+    assert min(gaps) >= 0.015
+
+
+def test_error_headers_from_response_or_litellm():
+    class WithResponse(Exception):
+        response = type("R", (), {"headers": {"retry-after": "1"}, "status_code": 429})()
+
+    class WithLiteLLM(Exception):
+        litellm_response_headers = {"retry-after": "2"}
+
+    assert error_headers(WithResponse()) == {"retry-after": "1"}
+    assert is_rate_limit_error(WithResponse())
+    assert error_headers(WithLiteLLM()) == {"retry-after": "2"}
+    assert error_headers(ValueError("x")) is None
+
+
+async def test_with_retry_shares_limiter_per_key():
+    calls = {"n": 0}
+
+    class Client:
+        def __init__(self, model: str) -> None:
+            self.model = model
+
+        @with_retry(limiter_key=lambda self: self.model)
+        async def call(self) -> str:
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise RateLimited({"retry-after": "0.01"})
+            return "ok"
+
+    assert await Client("m1").call() == "ok"
+    assert calls["n"] == 2
+    limiter = get_rate_limiter("m1")
+    # One hit, then one success nudging the paced rate back up.
+    assert limiter.rate == pytest.approx(PACED_START_RATE + 0.25)
+    assert get_rate_limiter("m2").rate is None
@@ -0,0 +1,147 @@
+"""Tests for streaming LLM calls with early readonly tool dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from ouro.capabilities.tools.base import BaseTool
+from ouro.capabilities.tools.executor import ToolExecutor
+from ouro.core.llm import LLMResponse, StopReason, ToolCall
+from ouro.core.loop import Agent, MessageListContext, NullProgressSink
+
+
+class _RecordingTool(BaseTool):
+    def __init__(self, tool_name: str, log: list[str], *, readonly: bool) -> None:
+        self._name = tool_name
+        self._log = log
+        self.readonly = readonly
+        self.started = asyncio.Event()
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "stub"
+
+    @property
+    def parameters(self):
+        return {}
+
+    async def execute(self, **kwargs) -> str:
+        self._log.append(self._name)
+        self.started.set()
+        return f"{self._name} done"
+
+
+def _block(call_id: str, name: str) -> dict:
+    return {"id": call_id, "type": "function", "function": {"name": name, "arguments": "{}"}}
+
+
+class _StreamingLLM:
+    """Streams one tool-call response, then answers STOP."""
+
+    model = "stub-model"
+
+    def __init__(self, blocks: list[dict], *, wait_for: asyncio.Event | None = None) -> None:
+        self._blocks = blocks
+        self._wait_for = wait_for
+        self.calls = 0
+        self.stream_calls = 0
+
+    async def call_async(self, **kwargs) -> LLMResponse:
+        self.calls += 1
+        if self.calls > 1:
+            return LLMResponse(content="done", stop_reason=StopReason.STOP)
+        return LLMResponse(tool_calls=self._blocks, stop_reason=StopReason.TOOL_CALLS)
+
+    async def call_stream_async(self, *, on_tool_call=None, **kwargs) -> LLMResponse:
+        self.stream_calls += 1
+        if self.stream_calls > 1:
+            return LLMResponse(content="done", stop_reason=StopReason.STOP)
+        for block in self._blocks:
+            on_tool_call(block)
+        if self._wait_for is not None:
+            # Still "streaming": the prefetched call must run meanwhile.
+            await asyncio.wait_for(self._wait_for.wait(), timeout=1)
+        return LLMResponse(tool_calls=self._blocks, stop_reason=StopReason.TOOL_CALLS)
+
+    def extract_text(self, response: LLMResponse) -> str:
+        return response.content or ""
+
+    def extract_tool_calls(self, response: LLMResponse) -> list[ToolCall]:
+        return [
+            ToolCall(
+                id=tc["id"],
+                name=tc["function"]["name"],
+                arguments=json.loads(tc["function"]["arguments"]),
+            )
+            for tc in response.tool_calls or []
+        ]
+
+
+def _agent(llm, tools, *, stream: bool = True) -> Agent:
+    return Agent(
+        llm=llm,
+        tools=ToolExecutor(tools),
+        progress=NullProgressSink(),
+        stream_tool_calls=stream,
+    )
+
+
+async def test_readonly_call_starts_while_response_is_still_streaming():
+    log: list[str] = []
+    reader = _RecordingTool("read_file", log, readonly=True)
+    llm = _StreamingLLM([_block("c1", "read_file")], wait_for=reader.started)
+
+    result = await _agent(llm, [reader]).run("go")
+
+    assert result == "done"
+    # Executed exactly once: dispatch joined the prefetched task.
+    assert log == ["read_file"]
+
+
+async def test_prefetch_stops_at_first_non_readonly_call():
+    log: list[str] = []
+    writer = _RecordingTool("write_file", log, readonly=False)
+    reader = _RecordingTool("read_file", log, readonly=True)
+    llm = _StreamingLLM([_block("c1", "write_file"), _block("c2", "read_file")])
+
+    await _agent(llm, [writer, reader]).run("go")
+
+    # The read must not overtake the earlier write.
+    assert log == ["write_file", "read_file"]
+
+
+async def test_blocked_prefetched_call_result_is_discarded():
+    log: list[str] = []
+    reader = _RecordingTool("read_file", log, readonly=True)
+    llm = _StreamingLLM([_block("c1", "read_file")])
+    agent = _agent(llm, [reader])
+
+    class _BlockAll:
+        name = "block_all"
+
+        def before_toolcall(self, ctx, tool_call):
+            return "blocked"
+
+    agent.add_rule(_BlockAll())
+    context = MessageListContext()
+    await agent.run("go", context=context)
+
+    tool_messages = [m for m in context.detached if m.role == "tool"]
+    assert [m.content for m in tool_messages] == ["blocked"]
+
+
+async def test_streaming_disabled_uses_call_async():
+    log: list[str] = []
+    reader = _RecordingTool("read_file", log, readonly=True)
+    llm = _StreamingLLM([_block("c1", "read_file")])
+
+    await _agent(llm, [reader], stream=False).run("go")
+
+    assert llm.stream_calls == 0
+    assert llm.calls == 2
+    assert log == ["read_file"]
@@ -0,0 +1,198 @@
+"""Tests for per-model token estimate calibration."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from ouro.capabilities.compaction import CompactionHook, CompactionManager, TokenCalibrator
+from ouro.capabilities.tools.executor import ToolExecutor
+from ouro.core.llm import LLMMessage, LLMResponse, StopReason
+from ouro.core.loop import Agent, ContinueDecision, MessageListContext, NullProgressSink
+from ouro.core.loop.context import RunStatistic
+
+
+class _LLM:
+    model = "anthropic/claude-test"
+    provider_name = "anthropic"
+
+
+def test_correct_is_identity_until_enough_samples(tmp_path):
+    calibrator = TokenCalibrator(str(tmp_path / "cal.json"))
+    assert calibrator.correct("m", 1000) == 1000
+
+    calibrator.observe("m", 1000, 1300)
+    calibrator.observe("m", 1000, 1300)
+    assert calibrator.correct("m", 1000) == 1000
+
+    calibrator.observe("m", 1000, 1300)
+    assert calibrator.correct("m", 2000) == 2600
+
+
+def test_fits_slope_and_intercept_per_model(tmp_path):
+    calibrator = TokenCalibrator(str(tmp_path / "cal.json"))
+    for estimate in (1000, 2000, 4000, 8000):
+        calibrator.observe("m", estimate, int(estimate * 1.2) + 3000)
+
+    assert calibrator.correct("m", 10_000) == pytest.approx(15_000, rel=0.01)
+    assert calibrator.correct("other", 10_000) == 10_000
+
+
+def test_ignores_implausible_samples(tmp_path):
+    calibrator = TokenCalibrator(str(tmp_path / "cal.json"))
+    for _ in range(5):
+        calibrator.observe("m", 1000, 100_000)
+        calibrator.observe("m", 1000, 0)
+    assert calibrator.correct("m", 1000) == 1000
+
+
+def test_persists_and_reloads(tmp_path):
+    path = tmp_path / "sub" / "cal.json"
+    calibrator = TokenCalibrator(str(path))
+    for _ in range(3):
+        calibrator.observe("m", 1000, 1500)
+    assert not path.exists()
+
+    calibrator.save()
+    assert "m" in json.loads(path.read_text())["models"]
+    assert TokenCalibrator(str(path)).correct("m", 1000) == 1500
+
+
+async def test_saves_in_batches_off_the_event_loop(tmp_path, monkeypatch):
+    path = tmp_path / "cal.json"
+    calibrator = TokenCalibrator(str(path))
+    monkeypatch.setattr(TokenCalibrator, "SAVE_EVERY", 3)
+    threads = []
+    write = calibrator._write
+
+    def record(*args):
+        threads.append(threading.current_thread())
+        write(*args)
+
+    monkeypatch.setattr(calibrator, "_write", record)
+
+    for _ in range(2):
+        calibrator.observe("m", 1000, 1500)
+        await calibrator.save_async(force=False)
+    assert threads == []
+
+    calibrator.observe("m", 1000, 1500)
+    await calibrator.save_async(force=False)
+    await calibrator.save_async()  # nothing new to write
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
+    assert json.loads(path.read_text())["models"]["m"]["samples"] == 3
+
+
+async def test_hook_saves_calibration_at_run_end(tmp_path):
+    path = tmp_path / "cal.json"
+    calibrator = TokenCalibrator(str(path))
+    manager = CompactionManager(_LLM(), count_message=lambda m: 100, calibrator=calibrator)
+    hook = CompactionHook(manager)
+    ctx = RunStatistic("task", NullProgressSink())
+    context = MessageListContext(detached=[LLMMessage(role="user", content="hi")])
+
+    for _ in range(2):
+        await hook.on_iteration_start(ctx, context, [])
+        ctx.add_usage({"input_tokens": 150})
+    assert not path.exists()
+
+    await hook.on_run_end(ctx)
+    assert json.loads(path.read_text())["models"][_LLM.model]["samples"] == 1
+
+
+def test_unreadable_file_starts_empty(tmp_path):
+    path = tmp_path / "cal.json"
+    path.write_text("{not json")
+    assert TokenCalibrator(str(path)).correct("m", 1000) == 1000
+
+
+def test_manager_feeds_corrected_estimate_to_threshold(tmp_path, monkeypatch):
+    from ouro.config import Config
+
+    monkeypatch.setattr(Config, "MEMORY_COMPRESSION_THRESHOLD", 1200)
+    calibrator = TokenCalibrator(str(tmp_path / "cal.json"))
+    manager = CompactionManager(_LLM(), calibrator=calibrator)
+
+    assert manager.should_compress(manager.calibrated_tokens(1000))[0] is False
+    for _ in range(3):
+        manager.observe_usage(1000, 1500)
+    assert manager.should_compress(manager.calibrated_tokens(1000))[0] is True
+
+
+async def test_hook_pairs_estimate_with_next_call_usage(tmp_path):
+    calibrator = TokenCalibrator(str(tmp_path / "cal.json"))
+    manager = CompactionManager(_LLM(), count_message=lambda m: 100, calibrator=calibrator)
+    hook = CompactionHook(manager)
+    ctx = RunStatistic("task", NullProgressSink())
+    context = MessageListContext(detached=[LLMMessage(role="user", content="hi")])
+
+    for _ in range(4):
+        await hook.on_iteration_start(ctx, context, [])
+        ctx.add_usage({"input_tokens": 150})
+
+    # Three completed calls were observed, each billing 1.5x the estimate.
+    assert calibrator.correct(_LLM.model, 100) == 150
+
+    # A new run's context never pairs with the previous run's sample.
+    other = RunStatistic("task", NullProgressSink())
+    other.add_usage({"input_tokens": 10_000})
+    await hook.on_iteration_start(other, context, [])
+    assert calibrator.correct(_LLM.model, 100) == 150
+
+
+def _count(message: LLMMessage) -> int:
+    return len(message.content or "") // 4 + 1
+
+
+class _BilledLLM(_LLM):
+    """Bills 1.5x the estimate of the messages actually sent."""
+
+    async def call_async(self, messages, **kwargs):
+        billed = int(sum(_count(m) for m in messages) * 1.5)
+        return LLMResponse(
+            content="ok", stop_reason=StopReason.STOP, usage={"input_tokens": billed}
+        )
+
+    def extract_text(self, response):
+        return response.content or ""
+
+    def extract_tool_calls(self, response):
+        return []
+
+
+class _RetryHook:
+    def __init__(self, retries: int) -> None:
+        self.retries = retries
+
+    async def on_iteration_end(self, ctx, messages, response, finished):
+        if not self.retries:
+            return ContinueDecision.stop()
+        self.retries -= 1
+        return ContinueDecision.retry_with_feedback(LLMMessage(role="user", content="again"))
+
+
+@pytest.mark.parametrize("budget, expected", [(None, 150), (1200, 100)])
+async def test_trimmed_requests_are_not_sampled(tmp_path, budget, expected):
+    calibrator = TokenCalibrator(str(tmp_path / "cal.json"))
+    llm = _BilledLLM()
+    manager = CompactionManager(llm, count_message=_count, calibrator=calibrator)
+    agent = Agent(
+        llm=llm,
+        tools=ToolExecutor([]),
+        hooks=(CompactionHook(manager), _RetryHook(4)),
+        context_budget=budget,
+        count_tokens=_count,
+    )
+    history = [LLMMessage(role="user", content="read the logs")]
+    for i in range(6):
+        history.append(LLMMessage(role="assistant", content=f"reading part {i}"))
+        history.append(LLMMessage(role="user", content="l" * 1600))
+
+    await agent.run("read the logs", context=MessageListContext(detached=history))
+
+    # Without a budget the 1.5x billing is learned; with one, every request
+    # was trimmed below the history's estimate and no sample was taken.
+    assert calibrator.correct(_LLM.model, 100) == expected
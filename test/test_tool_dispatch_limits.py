@@ -0,0 +1,209 @@
+"""Tests for ToolExecutor concurrency caps, rate limits, and queue metrics."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ouro.capabilities.tools.base import BaseTool
+from ouro.capabilities.tools.executor import ToolExecutor
+from ouro.core.loop import ProgressEvent
+from ouro.core.ratelimit import TokenBucket
+
+
+class SlowTool(BaseTool):
+    """Records how many calls overlap."""
+
+    readonly = True
+
+    def __init__(self, tool_name: str, delay: float = 0.02, **limits):
+        self._name = tool_name
+        self._delay = delay
+        self.active = 0
+        self.peak = 0
+        self.started: list[float] = []
+        for key, value in limits.items():
+            setattr(self, key, value)
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return "stub"
+
+    @property
+    def parameters(self):
+        return {}
+
+    async def execute(self, **kwargs) -> str:
+        self.started.append(asyncio.get_running_loop().time())
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self._delay)
+        finally:
+            self.active -= 1
+        return "ok"
+
+
+class RecordingSink:
+    def __init__(self):
+        self.events: list[ProgressEvent] = []
+
+    def emit(self, event: ProgressEvent) -> None:
+        self.events.append(event)
+
+
+async def _run_many(executor: ToolExecutor, name: str, n: int) -> None:
+    await asyncio.gather(*(executor.execute_tool_call(name, {}) for _ in range(n)))
+
+
+async def test_per_tool_concurrency_from_class_attr():
+    tool = SlowTool("fetch", max_concurrency=2)
+    executor = ToolExecutor([tool])
+    await _run_many(executor, "fetch", 6)
+    assert tool.peak == 2
+
+
+async def test_override_beats_class_attr():
+    tool = SlowTool("fetch", max_concurrency=4)
+    executor = ToolExecutor([tool], tool_concurrency={"fetch": 1})
+    await _run_many(executor, "fetch", 3)
+    assert tool.peak == 1
+
+
+async def test_global_cap_spans_tools():
+    a = SlowTool("a")
+    b = SlowTool("b")
+    executor = ToolExecutor([a, b], max_concurrency=2)
+    overlap = 0
+
+    async def watch():
+        nonlocal overlap
+        while True:
+            overlap = max(overlap, a.active + b.active)
+            await asyncio.sleep(0.001)
+
+    watcher = asyncio.create_task(watch())
+    await asyncio.gather(
+        *(executor.execute_tool_call(name, {}) for name in ["a", "b", "a", "b", "a", "b"])
+    )
+    watcher.cancel()
+    assert overlap == 2
+
+
+async def test_zero_means_unlimited():
+    tool = SlowTool("fetch")
+    executor = ToolExecutor([tool], max_concurrency=0)
+    await _run_many(executor, "fetch", 5)
+    assert tool.peak == 5
+
+
+async def test_rate_limit_spaces_starts():
+    tool = SlowTool("search", delay=0, rate_limit=20.0)
+    executor = ToolExecutor([tool], tool_rate_limits={"search": 20.0})
+    await _run_many(executor, "search", 23)
+    # Burst of 20, then ~1/20s between the rest.
+    assert tool.started[-1] - tool.started[0] >= 0.1
+
+
+async def test_timeout_excludes_queue_wait(monkeypatch):
+    from ouro.config import Config
+
+    monkeypatch.setattr(Config, "TOOL_TIMEOUT", 0.05)
+    tool = SlowTool("fetch", delay=0.03, max_concurrency=1)
+    executor = ToolExecutor([tool])
+    results = await asyncio.gather(*(executor.execute_tool_call("fetch", {}) for _ in range(3)))
+    assert [r.content for r in results] == ["ok", "ok", "ok"]
+
+
+async def test_queue_events_and_stats():
+    sink = RecordingSink()
+    tool = SlowTool("fetch", max_concurrency=1)
+    executor = ToolExecutor([tool], progress=sink)
+    await _run_many(executor, "fetch", 3)
+
+    queue_events = [e for e in sink.events if e.kind == "tool_queue"]
+    assert queue_events
+    # The first call takes the slot straight away; the other two wait.
+    assert max(e.payload["queued"] for e in queue_events) == 2
+    assert max(e.payload["running"] for e in queue_events) == 1
+    assert queue_events[-1].payload == {"name": "fetch", "queued": 0, "running": 0}
+    assert executor.dispatch_stats() == {"queued": 0, "running": 0, "peak_queued": 2}
+
+
+async def test_cancelled_waiter_releases_queue_slot():
+    tool = SlowTool("fetch", delay=0.05, max_concurrency=1)
+    executor = ToolExecutor([tool])
+    first = asyncio.create_task(executor.execute_tool_call("fetch", {}))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(executor.execute_tool_call("fetch", {}))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert (await first).content == "ok"
+    assert executor.dispatch_stats()["queued"] == 0
+    assert (await executor.execute_tool_call("fetch", {})).content == "ok"
+
+
+async def test_token_bucket_waits_for_refill():
+    now = [0.0]
+    bucket = TokenBucket(2.0, capacity=1, clock=lambda: now[0])
+    assert await bucket.acquire() == 0.0
+    assert bucket.available == 0.0
+    now[0] = 0.5
+    assert bucket.available == pytest.approx(1.0)
+
+
+def test_token_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+async def test_child_shares_limits_and_sink():
+    sink = RecordingSink()
+    fetch = SlowTool("fetch", max_concurrency=2)
+    other = SlowTool("other")
+    parent = ToolExecutor([fetch, other], max_concurrency=3, progress=sink)
+    child = parent.child(exclude={"other"})
+
+    assert list(child.tools) == ["fetch"]
+    await asyncio.gather(_run_many(parent, "fetch", 3), _run_many(child, "fetch", 3))
+
+    # The per-tool cap holds across both executors, and so does the queue count.
+    assert fetch.peak == 2
+    assert child._global_slots is parent._global_slots
+    assert max(e.payload["queued"] for e in sink.events if e.kind == "tool_queue") == 4
+    assert parent.dispatch_stats() == {"queued": 0, "running": 0, "peak_queued": 4}
+
+
+class CallerTool(SlowTool):
+    """Calls ``inner`` through a child executor, as a sub-agent would."""
+
+    executor: ToolExecutor
+
+    async def execute(self, **kwargs) -> str:
+        child = self.executor.child(exclude={self.name})
+        results = await asyncio.gather(
+            child.execute_tool_call("inner", {}), child.execute_tool_call("inner", {})
+        )
+        return ",".join(r.content for r in results)
+
+
+async def test_nested_calls_do_not_deadlock_at_global_cap_one():
+    outer = CallerTool("outer")
+    inner = SlowTool("inner")
+    executor = ToolExecutor([outer, inner], max_concurrency=1)
+    outer.executor = executor
+
+    result = await asyncio.wait_for(executor.execute_tool_call("outer", {}), timeout=2)
+
+    assert result.content == "ok,ok"
+    # The nested calls still ran one at a time.
+    assert inner.peak == 1
+    # The slot the outer call gave up is not released twice.
+    assert executor._global_slots._value == 1
@@ -0,0 +1,91 @@
+"""Tests for spilling oversized tool outputs to disk."""
+
+import os
+import shlex
+import sys
+
+from ouro.capabilities.tools.builtins.file_ops import FileReadTool
+from ouro.capabilities.tools.builtins.shell import ShellTool
+from ouro.capabilities.tools.executor import ToolExecutor
+from ouro.capabilities.tools.spill import SpillStore, is_spill_handle
+
+
+def _handle(preview: str) -> str:
+    return next(word for word in preview.split() if is_spill_handle(word))
+
+
+class TestSpillStore:
+    async def test_content_addressed(self, tmp_path):
+        store = SpillStore(str(tmp_path))
+
+        first = await store.put("same output")
+        second = await store.put("same output")
+
+        assert first == second
+        assert first.startswith("spill:")
+        assert len(os.listdir(tmp_path)) == 1
+        assert (tmp_path / f"{first[len('spill:'):]}.txt").read_text() == "same output"
+
+    async def test_preview_keeps_head_and_tail_lines(self, tmp_path):
+        store = SpillStore(str(tmp_path))
+        output = "".join(f"line {i}\n" for i in range(20000))
+
+        preview = await store.spill("shell", output, max_tokens=1000)
+
+        assert "line 0\n" in preview
+        assert "line 19999" in preview
+        assert "line 10000\n" not in preview
+        assert len(preview) < 1000 * store.CHARS_PER_TOKEN + 500
+        assert _handle(preview) in preview
+
+    def test_rejects_foreign_handles(self, tmp_path):
+        store = SpillStore(str(tmp_path))
+        assert store.path_for("spill:../../etc/passwd") is None
+        assert store.path_for("spill:" + "0" * 32) is None
+        assert not is_spill_handle("/tmp/spill:abc")
+
+
+class TestToolsSpill:
+    async def test_shell_output_spills_and_pages_with_read_file(self, tmp_path):
+        store = SpillStore(str(tmp_path))
+        executor = ToolExecutor([ShellTool(), FileReadTool()], spill_store=store)
+        python_cmd = shlex.quote(sys.executable)
+        command = f"{python_cmd} -c \"print(''.join(f'row {{i}}\\n' for i in range(30000)))\""
+
+        preview = str(await executor.execute_tool_call("shell", {"command": command}))
+
+        assert "Error" not in preview
+        assert "row 0" in preview
+        handle = _handle(preview)
+        page = await executor.execute_tool_call(
+            "read_file", {"file_path": handle, "offset": 15000, "limit": 2}
+        )
+        assert page.content == "[Lines 15001-15002 of 30001]\nrow 15000\nrow 15001\n"
+
+    async def test_without_store_oversized_output_still_errors(self):
+        tool = ShellTool()
+        python_cmd = shlex.quote(sys.executable)
+
+        result = await tool.execute(f"{python_cmd} -c \"print('x' * 150000)\"")
+
+        assert "Error: Command output" in result
+
+    async def test_unknown_handle(self, tmp_path):
+        tool = FileReadTool()
+        tool.spill_store = SpillStore(str(tmp_path))
+
+        result = await tool.execute("spill:" + "a" * 32)
+
+        assert "not found" in result
+
+    async def test_executor_applies_per_tool_budgets(self, tmp_path):
+        store = SpillStore(str(tmp_path))
+        shell = ShellTool()
+        ToolExecutor([shell], spill_store=store, tool_output_budgets={"shell": 100})
+
+        result = await shell.execute(f"{shlex.quote(sys.executable)} -c \"print('y' * 1000)\"")
+
+        assert shell.MAX_TOKENS == 100
+        assert ShellTool.MAX_TOKENS == 25000
+        assert "budget 100" in result
+        assert shell.spill_store is store